@@ -0,0 +1,78 @@
+# app/application/services/change_feed_service.py
+from typing import Iterator, Optional
+from app.domain.entities.change import Change, ChangeBatch, ChangeOperation
+from app.domain.repositories.change_log_repository import ChangeLogRepository
+
+class ChangeFeedService:
+    """Lectura incremental del registro de cambios.
+
+    read_since() sirve a exportaciones y sincronizaciones que guardan su
+    cursor. poll() es para las vistas: consulta primero PRAGMA data_version
+    (no lee tablas) y solo si otra conexión (otra instancia, el servidor o el
+    hilo escritor) confirmó algo lee los cambios nuevos.
+    """
+
+    def __init__(self, change_log_repository: ChangeLogRepository, batch_size: int = 5000,
+                 max_changes: int = 5000):
+        self.change_log_repository = change_log_repository
+        self.batch_size = batch_size
+        self.max_changes = max_changes
+        self._data_version: Optional[int] = None
+
+    def current_cursor(self) -> int:
+        """Cursor actual: leer desde aquí devuelve solo los cambios futuros"""
+        return self.change_log_repository.get_cursor()
+
+    def read_since(self, cursor: int) -> ChangeBatch:
+        """Lee todos los cambios posteriores al cursor"""
+        batch = ChangeBatch(cursor)
+        for change in self.iter_since(cursor):
+            batch.changes.append(change)
+            batch.cursor = change.seq
+        return batch
+
+    def iter_since(self, cursor: int) -> Iterator[Change]:
+        """Recorre los cambios posteriores al cursor por bloques, sin cargarlos todos"""
+        while True:
+            changes = self.change_log_repository.get_since(cursor, self.batch_size)
+            yield from changes
+            if len(changes) < self.batch_size:
+                return
+            cursor = changes[-1].seq
+
+    def poll(self, cursor: int) -> Optional[ChangeBatch]:
+        """Devuelve los cambios nuevos de otras instancias, o None si el cursor no avanzó.
+
+        Los cambios que escribió esta misma instancia se saltan: sus vistas
+        ya los muestran (el lote puede volver vacío, solo para mover el
+        cursor). Con más de max_changes cambios ajenos, o tras una carga
+        masiva (cambio REFRESH), no se acumulan en memoria: se devuelve un
+        lote con full_refresh.
+        """
+        version = self.change_log_repository.get_data_version()
+        if version == self._data_version:
+            return None
+        self._data_version = version
+
+        repository = self.change_log_repository
+        batch = ChangeBatch(cursor)
+        while True:
+            # Un tramo escrito por esta instancia se salta sin leerlo
+            own_until = repository.last_own_change(batch.cursor + 1)
+            if own_until is not None:
+                batch.cursor = own_until
+                continue
+            changes = repository.get_since(batch.cursor, self.batch_size)
+            if changes:
+                batch.cursor = changes[-1].seq
+            batch.changes.extend(change for change in changes if repository.last_own_change(change.seq) is None)
+            if len(batch.changes) > self.max_changes or any(
+                    change.operation == ChangeOperation.REFRESH.value for change in batch.changes):
+                return ChangeBatch(self.current_cursor(), full_refresh=True)
+            if len(changes) < self.batch_size:
+                break
+        return batch if batch.cursor != cursor else None
+
+    def prune(self, up_to_seq: int) -> int:
+        """Elimina los cambios ya procesados por todos los consumidores"""
+        return self.change_log_repository.prune(up_to_seq)
@@ -0,0 +1,239 @@
+# app/application/services/flow_analytics_service.py
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.application.services.concurrency_analyzer import CongestedWindow, find_congested_windows
+from app.domain.entities.flow import RecurrenceType
+from app.domain.entities.schedule import CronExpression, ScheduledFlow
+from app.domain.repositories.flow_repository import FlowRepository
+
+MINUTES_PER_DAY = 24 * 60
+
+
+@dataclass
+class Occurrences:
+    """Ejecuciones esperadas: para cada una, el índice del flujo y el minuto desde el inicio"""
+    flow_index: np.ndarray
+    minute: np.ndarray
+
+    def __len__(self):
+        return len(self.minute)
+
+
+@dataclass
+class LoadTimeline:
+    """Carga esperada (ejecuciones por hora y por propietario) en un horizonte"""
+    start: datetime
+    hours: int
+    hourly_counts: np.ndarray
+    owners: List[str]
+    owner_hourly_counts: np.ndarray  # forma (propietarios, horas)
+    peak_minute: Optional[datetime]
+    peak_minute_runs: int
+
+    @property
+    def total_runs(self) -> int:
+        return int(self.hourly_counts.sum())
+
+    @property
+    def peak_hour(self) -> Tuple[Optional[datetime], int]:
+        """Hora con más ejecuciones y su cantidad"""
+        if not self.total_runs:
+            return None, 0
+        index = int(self.hourly_counts.argmax())
+        return self.start + timedelta(hours=index), int(self.hourly_counts[index])
+
+    def owner_totals(self) -> Dict[str, int]:
+        """Ejecuciones totales por propietario"""
+        totals = self.owner_hourly_counts.sum(axis=1)
+        return {owner: int(total) for owner, total in zip(self.owners, totals)}
+
+    def owner_peak_hours(self) -> Dict[str, int]:
+        """Máximo de ejecuciones en una misma hora por propietario"""
+        if not self.owners:
+            return {}
+        peaks = self.owner_hourly_counts.max(axis=1)
+        return {owner: int(peak) for owner, peak in zip(self.owners, peaks)}
+
+
+def _calendar(first_day: datetime, days: int) -> Dict[str, np.ndarray]:
+    """Atributos de calendario de cada día del horizonte como arreglos"""
+    dates = np.datetime64(first_day.date(), 'D') + np.arange(days)
+    months = dates.astype('datetime64[M]')
+    return {
+        # 1970-01-01 fue jueves (3 en el formato de Python, 0 = lunes)
+        'weekday': (dates.astype(np.int64) + 3) % 7,
+        'month': months.astype(np.int64) % 12 + 1,
+        'month_day': (dates - months).astype(np.int64) + 1,
+        'month_length': ((months + 1).astype('datetime64[D]') - months).astype(np.int64),
+    }
+
+
+def _weekday_bits(weekdays: str) -> int:
+    """Convierte '0,3' en una máscara de bits de días de la semana (lunes por defecto)"""
+    bits = 0
+    for day in weekdays.split(','):
+        if day:
+            bits |= 1 << int(day)
+    return bits or 1
+
+
+def expand_occurrences(flows: Sequence[ScheduledFlow], start: datetime, end: datetime) -> Occurrences:
+    """Expande la programación de los flujos en ejecuciones concretas dentro de [start, end).
+
+    Las recurrencias diaria, semanal y mensual se resuelven con máscaras
+    flujos × días sobre el calendario del horizonte; las expresiones cron se
+    agrupan para calcular una sola vez los días y minutos de cada expresión.
+    """
+    start = start.replace(second=0, microsecond=0)
+    total_minutes = int((end - start).total_seconds() // 60)
+    if not flows or total_minutes <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return Occurrences(empty, empty)
+
+    days = (end - start.replace(hour=0, minute=0)).days + 1
+    calendar = _calendar(start, days)
+    # Minuto del inicio relativo a la medianoche del primer día
+    offset = start.hour * 60 + start.minute
+    day_starts = np.arange(days, dtype=np.int64) * MINUTES_PER_DAY - offset
+
+    recurrences = np.array([flow.recurrence for flow in flows])
+    minute_of_day = np.fromiter(
+        (int(flow.time_of_day[:2]) * 60 + int(flow.time_of_day[3:5]) for flow in flows),
+        dtype=np.int64,
+        count=len(flows)
+    )
+
+    flow_parts = []
+    minute_parts = []
+
+    def add_masked(indexes: np.ndarray, mask: np.ndarray):
+        flow_pos, day_pos = np.nonzero(mask)
+        flow_parts.append(indexes[flow_pos])
+        minute_parts.append(day_starts[day_pos] + minute_of_day[indexes[flow_pos]])
+
+    # Diaria: todos los días del horizonte
+    daily = np.flatnonzero(recurrences == RecurrenceType.DAILY.value)
+    if len(daily):
+        flow_parts.append(np.repeat(daily, days))
+        minute_parts.append(
+            (day_starts[np.newaxis, :] + minute_of_day[daily, np.newaxis]).ravel()
+        )
+
+    # Semanal: días marcados en la máscara de bits
+    weekly = np.flatnonzero(recurrences == RecurrenceType.WEEKLY.value)
+    if len(weekly):
+        bits = np.array([_weekday_bits(flows[i].weekdays) for i in weekly], dtype=np.int64)
+        add_masked(weekly, ((bits[:, np.newaxis] >> calendar['weekday'][np.newaxis, :]) & 1).astype(bool))
+
+    # Mensual: el día indicado, o el último día en meses más cortos
+    monthly = np.flatnonzero(recurrences == RecurrenceType.MONTHLY.value)
+    if len(monthly):
+        month_days = np.array([flows[i].month_day or 1 for i in monthly], dtype=np.int64)
+        target = np.minimum(month_days[:, np.newaxis], calendar['month_length'][np.newaxis, :])
+        add_masked(monthly, calendar['month_day'][np.newaxis, :] == target)
+
+    # Personalizada: agrupada por expresión cron
+    custom = np.flatnonzero(recurrences == RecurrenceType.CUSTOM.value)
+    groups: Dict[str, List[int]] = {}
+    for i in custom:
+        if flows[i].cron:
+            groups.setdefault(flows[i].cron, []).append(int(i))
+
+    for expression, indexes in groups.items():
+        try:
+            cron = CronExpression(expression)
+        except ValueError:
+            continue
+
+        month_ok = np.isin(calendar['month'], cron.months)
+        month_day_ok = np.isin(calendar['month_day'], cron.month_days)
+        weekday_ok = np.isin(calendar['weekday'], cron.weekdays)
+        if cron.month_day_restricted and cron.weekday_restricted:
+            day_ok = month_ok & (month_day_ok | weekday_ok)
+        else:
+            day_ok = month_ok & month_day_ok & weekday_ok
+
+        minutes = (
+            np.array(cron.hours, dtype=np.int64)[:, np.newaxis] * 60
+            + np.array(cron.minutes, dtype=np.int64)[np.newaxis, :]
+        ).ravel()
+        base = (day_starts[day_ok][:, np.newaxis] + minutes[np.newaxis, :]).ravel()
+        base = base[(base >= 0) & (base < total_minutes)]
+
+        flow_parts.append(np.repeat(np.array(indexes, dtype=np.int64), len(base)))
+        minute_parts.append(np.tile(base, len(indexes)))
+
+    if not flow_parts:
+        empty = np.empty(0, dtype=np.int64)
+        return Occurrences(empty, empty)
+
+    flow_index = np.concatenate(flow_parts)
+    minute = np.concatenate(minute_parts)
+    in_range = (minute >= 0) & (minute < total_minutes)
+    return Occurrences(flow_index[in_range], minute[in_range])
+
+
+def build_load_timeline(flows: Sequence[ScheduledFlow], start: datetime, days: int = 30) -> LoadTimeline:
+    """Calcula los histogramas de carga por hora y por propietario"""
+    start = start.replace(minute=0, second=0, microsecond=0)
+    hours = days * 24
+    occurrences = expand_occurrences(flows, start, start + timedelta(days=days))
+
+    hour_index = occurrences.minute // 60
+    hourly_counts = np.bincount(hour_index, minlength=hours)
+
+    owners, owner_of_flow = np.unique(
+        np.array([flow.owner for flow in flows], dtype=str),
+        return_inverse=True
+    )
+    owner_hourly_counts = np.bincount(
+        owner_of_flow[occurrences.flow_index] * hours + hour_index,
+        minlength=len(owners) * hours
+    ).reshape(len(owners), hours)
+
+    peak_minute, peak_minute_runs = None, 0
+    if len(occurrences):
+        minute_counts = np.bincount(occurrences.minute)
+        index = int(minute_counts.argmax())
+        peak_minute = start + timedelta(minutes=index)
+        peak_minute_runs = int(minute_counts[index])
+
+    return LoadTimeline(
+        start=start,
+        hours=hours,
+        hourly_counts=hourly_counts,
+        owners=[str(owner) for owner in owners],
+        owner_hourly_counts=owner_hourly_counts,
+        peak_minute=peak_minute,
+        peak_minute_runs=peak_minute_runs
+    )
+
+
+class FlowAnalyticsService:
+    """Servicio de análisis de la carga esperada de los flujos"""
+
+    def __init__(self, flow_repository: FlowRepository):
+        self.flow_repository = flow_repository
+
+    def get_load_timeline(self, start: Optional[datetime] = None, days: int = 30) -> LoadTimeline:
+        """Calcula la carga esperada de todos los flujos activos en los próximos días"""
+        flows = self.flow_repository.get_active_schedules()
+        return build_load_timeline(flows, start or datetime.now(), days)
+
+    def get_congested_windows(self, group_by: str = 'owner', start: Optional[datetime] = None,
+                              days: int = 7, threshold: int = 5,
+                              top_k: int = 10) -> Tuple[List[CongestedWindow], List[ScheduledFlow]]:
+        """Busca los intervalos de mayor concurrencia en los próximos días.
+
+        Devuelve también los flujos analizados para resolver los nombres de
+        los flujos involucrados en cada intervalo.
+        """
+        start = (start or datetime.now()).replace(second=0, microsecond=0)
+        flows = self.flow_repository.get_active_schedules()
+        occurrences = expand_occurrences(flows, start, start + timedelta(days=days))
+        windows = find_congested_windows(flows, occurrences, start, group_by, threshold, top_k)
+        return windows, flows
@@ -0,0 +1,67 @@
+# app/application/services/flow_dependency_service.py
+from typing import List, Optional, Sequence, Tuple
+from app.domain.entities.flow_dependency import (
+    DependencyKind, DependencyOrder, FlowDependency, FlowImpact, topological_order
+)
+from app.domain.repositories.flow_dependency_repository import FlowDependencyRepository
+from app.domain.repositories.flow_repository import FlowRepository
+
+class FlowDependencyService:
+    """Servicio para las dependencias entre flujos y el análisis de impacto"""
+
+    def __init__(self, dependency_repository: FlowDependencyRepository, flow_repository: FlowRepository):
+        self.dependency_repository = dependency_repository
+        self.flow_repository = flow_repository
+        # (revisión del grafo, orden calculado): se recalcula solo si el grafo cambió
+        self._order_cache: Optional[Tuple[int, DependencyOrder]] = None
+
+    def add_dependency(self, source_flow_id: int, target_flow_id: int,
+                       kind: DependencyKind = DependencyKind.CHILD_FLOW,
+                       description: str = "") -> bool:
+        """Registra que un flujo desencadena o alimenta a otro.
+
+        Devuelve False si la dependencia ya existía.
+        """
+        if source_flow_id == target_flow_id:
+            raise ValueError("Un flujo no puede depender de sí mismo")
+        for flow_id in (source_flow_id, target_flow_id):
+            if not self.flow_repository.get_by_id(flow_id):
+                raise ValueError(f"No se encontró el flujo con ID {flow_id}")
+        return self.dependency_repository.add_many([
+            FlowDependency(source_flow_id, target_flow_id, kind, description.strip())
+        ]) > 0
+
+    def add_dependencies(self, dependencies: Sequence[FlowDependency]) -> int:
+        """Registra varias dependencias (p. ej. las detectadas al importar) en una transacción"""
+        return self.dependency_repository.add_many(
+            [dependency for dependency in dependencies
+             if dependency.source_flow_id != dependency.target_flow_id]
+        )
+
+    def remove_dependency(self, source_flow_id: int, target_flow_id: int,
+                          kind: Optional[DependencyKind] = None) -> bool:
+        """Elimina una dependencia"""
+        return self.dependency_repository.remove(source_flow_id, target_flow_id, kind)
+
+    def get_dependencies(self, flow_ids: Sequence[int]) -> List[FlowDependency]:
+        """Obtiene las dependencias que entran o salen de los flujos indicados"""
+        return self.dependency_repository.get_for_flows(flow_ids)
+
+    def get_impact(self, flow_id: int) -> FlowImpact:
+        """Analiza qué flujos afectan a un flujo y a cuáles afecta él, directa o indirectamente"""
+        return FlowImpact(
+            flow_id=flow_id,
+            upstream=self.dependency_repository.get_upstream([flow_id]),
+            downstream=self.dependency_repository.get_downstream([flow_id])
+        )
+
+    def get_topological_order(self) -> DependencyOrder:
+        """Obtiene el orden topológico y los ciclos del grafo.
+
+        El resultado se guarda junto con la revisión del grafo y solo se
+        recalcula cuando esta cambia (cualquier alta o baja de dependencias).
+        """
+        revision = self.dependency_repository.get_revision()
+        if self._order_cache is None or self._order_cache[0] != revision:
+            self._order_cache = (revision, topological_order(self.dependency_repository.get_edges()))
+        return self._order_cache[1]
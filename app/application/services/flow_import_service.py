@@ -0,0 +1,130 @@
+# app/application/services/flow_import_service.py
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.domain.entities.flow_dependency import DependencyKind, FlowDependency
+from app.domain.entities.flow_package import FlowPackage
+from app.domain.repositories.flow_definition_repository import FlowDefinitionRepository
+from app.domain.repositories.flow_repository import FlowRepository
+from app.domain.repositories.project_repository import ProjectRepository
+
+# Flujos por transacción al guardar un paquete
+IMPORT_BATCH_SIZE = 500
+
+# A partir de cuántos archivos conviene repartir la lectura en procesos
+PARALLEL_THRESHOLD = 4
+
+PackageReader = Callable[[str], List[FlowPackage]]
+
+@dataclass
+class PackageImportSummary:
+    """Resultado de una importación de paquetes"""
+    files: int = 0
+    projects: int = 0
+    flows_created: int = 0
+    flows_updated: int = 0
+    errors: List[str] = field(default_factory=list)
+
+class FlowImportService:
+    """Servicio para importar proyectos y flujos desde paquetes exportados"""
+
+    def __init__(self, project_repository: ProjectRepository, flow_repository: FlowRepository,
+                 definition_repository: FlowDefinitionRepository, package_reader: PackageReader,
+                 inventory_service: Optional[FlowInventoryService] = None,
+                 dependency_service: Optional[FlowDependencyService] = None):
+        self.project_repository = project_repository
+        self.flow_repository = flow_repository
+        self.definition_repository = definition_repository
+        # Si se indica, el inventario de conectores se actualiza con cada lote
+        self.inventory_service = inventory_service
+        # Si se indica, se registran las llamadas a flujos secundarios
+        self.dependency_service = dependency_service
+        # Debe ser una función de nivel de módulo para poder usarse en otros procesos
+        self.package_reader = package_reader
+
+    def _read_packages(self, paths: Sequence[str],
+                       workers: Optional[int]) -> Iterator[Tuple[str, Optional[List[FlowPackage]], Optional[Exception]]]:
+        """Lee los archivos, en paralelo si son muchos, entregando cada uno al terminar"""
+        if workers is None:
+            workers = min(len(paths), os.cpu_count() or 1)
+
+        if workers <= 1 or len(paths) < PARALLEL_THRESHOLD:
+            for path in paths:
+                try:
+                    yield path, self.package_reader(path), None
+                except Exception as e:
+                    yield path, None, e
+            return
+
+        # La lectura y el parseo ocurren en los procesos; el guardado en este,
+        # a medida que llegan los resultados, mientras los demás siguen leyendo
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.package_reader, path): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], None, e
+
+    def import_packages(self, paths: Sequence[str], workers: Optional[int] = None,
+                        batch_size: int = IMPORT_BATCH_SIZE) -> PackageImportSummary:
+        """Importa los proyectos y flujos de uno o varios archivos exportados.
+
+        Los proyectos y flujos ya importados (mismo external_id) se actualizan
+        en lugar de duplicarse. Un archivo con errores no detiene el resto.
+        """
+        summary = PackageImportSummary()
+        for path, packages, error in self._read_packages(list(paths), workers):
+            summary.files += 1
+            if error is not None:
+                summary.errors.append(f"{os.path.basename(path)}: {error}")
+                continue
+            for package in packages:
+                self._save_package(package, batch_size, summary)
+        return summary
+
+    def _save_package(self, package: FlowPackage, batch_size: int,
+                      summary: PackageImportSummary) -> None:
+        """Guarda un paquete: el proyecto y luego sus flujos en lotes.
+        
+        Las definiciones se guardan antes que cada lote de flujos, que solo
+        conserva su hash; luego se registra la versión de cada flujo. Al final
+        se registran las llamadas entre flujos del paquete.
+        """
+        project = self.project_repository.upsert_by_external_id(package.project)
+        summary.projects += 1
+
+        for flow in package.flows:
+            flow.project_id = project.id
+            flow.reschedule()
+
+        for start in range(0, len(package.flows), batch_size):
+            batch = package.flows[start:start + batch_size]
+            with_definition = [flow for flow in batch if flow.definition]
+            if with_definition:
+                hashes = self.definition_repository.save_many([flow.definition for flow in with_definition])
+                for flow, definition_hash in zip(with_definition, hashes):
+                    flow.definition_hash = definition_hash
+            
+            created = self.flow_repository.upsert_many(batch)
+            if with_definition:
+                self.definition_repository.add_versions(
+                    [(flow.id, flow.definition_hash) for flow in with_definition]
+                )
+                if self.inventory_service is not None:
+                    self.inventory_service.refresh(
+                        {flow.definition_hash: flow.definition for flow in with_definition}
+                    )
+            summary.flows_created += created
+            summary.flows_updated += len(batch) - created
+        
+        if package.child_flows and self.dependency_service is not None:
+            ids = {flow.external_id: flow.id for flow in package.flows}
+            self.dependency_service.add_dependencies([
+                FlowDependency(ids[parent], ids[child], DependencyKind.CHILD_FLOW)
+                for parent, child in package.child_flows
+                if parent in ids and child in ids
+            ])
@@ -0,0 +1,42 @@
+# app/application/services/flow_inventory_service.py
+import json
+from typing import List, Mapping, Optional, Tuple
+from app.domain.entities.flow_inventory import FlowComponent, extract_components
+from app.domain.repositories.flow_definition_repository import FlowDefinitionRepository
+from app.domain.repositories.flow_inventory_repository import FlowInventoryRepository
+
+# Definiciones por transacción al indexar
+INDEX_BATCH_SIZE = 500
+
+class FlowInventoryService:
+    """Servicio que mantiene el inventario de conectores a partir de las definiciones"""
+
+    def __init__(self, definition_repository: FlowDefinitionRepository,
+                 inventory_repository: FlowInventoryRepository):
+        self.definition_repository = definition_repository
+        self.inventory_repository = inventory_repository
+
+    def refresh(self, definitions: Optional[Mapping[str, str]] = None,
+                batch_size: int = INDEX_BATCH_SIZE) -> int:
+        """Indexa las definiciones en uso que aún no se analizaron.
+
+        Es incremental: cuando la definición de un flujo cambia, el flujo pasa
+        a apuntar a otro hash y solo ese hash se analiza (si es nuevo). Con
+        'definitions' (texto por hash, p. ej. las recién importadas) se
+        revisan solo esas y no se leen del almacén.
+        Devuelve la cantidad de definiciones indexadas.
+        """
+        known = definitions or {}
+        pending = self.inventory_repository.get_unindexed_definitions(
+            list(known) if definitions is not None else None
+        )
+        entries: List[Tuple[str, List[FlowComponent]]] = []
+        for definition_hash in pending:
+            text = known.get(definition_hash) or self.definition_repository.get(definition_hash)
+            entries.append((definition_hash, extract_components(json.loads(text)) if text else []))
+            if len(entries) >= batch_size:
+                self.inventory_repository.add_definitions(entries)
+                entries = []
+
+        self.inventory_repository.add_definitions(entries)
+        return len(pending)
@@ -0,0 +1,66 @@
+# app/application/services/flow_run_service.py
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Optional
+from app.domain.entities.flow_run import FlowRun, FlowHealth
+from app.domain.repositories.flow_repository import FlowRepository
+from app.domain.repositories.flow_run_repository import FlowRunRepository
+
+# Ejecuciones por transacción al importar un historial
+IMPORT_BATCH_SIZE = 5000
+
+@dataclass
+class RunImportSummary:
+    """Resultado de una importación de historial"""
+    imported: int = 0
+    skipped: int = 0
+    batches: int = 0
+
+class FlowRunService:
+    """Servicio para el historial de ejecuciones de los flujos"""
+    
+    def __init__(self, run_repository: FlowRunRepository, flow_repository: FlowRepository):
+        self.run_repository = run_repository
+        self.flow_repository = flow_repository
+    
+    def import_runs(self, runs: Iterable[FlowRun], project_id: int,
+                    default_flow_id: Optional[int] = None,
+                    batch_size: int = IMPORT_BATCH_SIZE) -> RunImportSummary:
+        """Importa ejecuciones en lotes, cada uno en su propia transacción.
+        
+        Las ejecuciones sin 'flow_id' se asignan por nombre a un flujo del
+        proyecto, o a 'default_flow_id' si se indica (historial de un solo
+        flujo). Las que no pertenecen a ningún flujo del proyecto se omiten.
+        """
+        flows = self.flow_repository.get_all_by_project(project_id)
+        ids = {flow.id for flow in flows}
+        by_name = {flow.name.strip().lower(): flow.id for flow in flows}
+        if default_flow_id is not None and default_flow_id not in ids:
+            raise ValueError("El flujo indicado no pertenece al proyecto")
+        
+        summary = RunImportSummary()
+        runs = iter(runs)
+        while True:
+            chunk = list(islice(runs, batch_size))
+            if not chunk:
+                return summary
+            
+            batch = []
+            for run in chunk:
+                if run.flow_id is None:
+                    run.flow_id = by_name.get(run.flow_name.lower(), default_flow_id)
+                if run.flow_id in ids:
+                    batch.append(run)
+                else:
+                    summary.skipped += 1
+            
+            if batch:
+                summary.imported += self.run_repository.add_runs(batch)
+                summary.batches += 1
+    
+    def get_project_health(self, project_id: int, days: int = 30,
+                           today: Optional[datetime] = None) -> Dict[int, FlowHealth]:
+        """Obtiene la salud de los flujos de un proyecto en los últimos días"""
+        today = (today or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.run_repository.get_project_health(project_id, today - timedelta(days=days - 1))
@@ -1,35 +1,75 @@
 # app/application/services/flow_service.py
-from typing import List, Optional
-from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+from typing import Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime
+from app.domain.entities.flow import Flow, FlowRecord, FlowStatus, RecurrenceType
+from app.domain.entities.schedule import Schedule
+from app.domain.entities.flow_definition import DefinitionVersion
+from app.domain.entities.flow_inventory import ComponentKind, ConnectorMatch, ConnectorUsage
 from app.domain.repositories.flow_repository import FlowRepository
+from app.domain.repositories.flow_definition_repository import FlowDefinitionRepository
+from app.domain.repositories.flow_inventory_repository import FlowInventoryRepository
+
+# Flujos que se leen y actualizan por bloque al recalcular las próximas ejecuciones
+SCHEDULE_REFRESH_BATCH = 1000
 
 class FlowService:
     """Servicio para gestionar flujos"""
     
-    def __init__(self, flow_repository: FlowRepository):
+    def __init__(self, flow_repository: FlowRepository,
+                 definition_repository: Optional[FlowDefinitionRepository] = None,
+                 inventory_repository: Optional[FlowInventoryRepository] = None):
         self.flow_repository = flow_repository
+        self.definition_repository = definition_repository
+        self.inventory_repository = inventory_repository
     
     def get_flows_by_project(self, project_id: int) -> List[Flow]:
         """Obtiene todos los flujos de un proyecto"""
         return self.flow_repository.get_all_by_project(project_id)
     
+    def get_flows_page(self, project_id: int, offset: int, limit: int) -> Tuple[List[Flow], int]:
+        """Obtiene una página de los flujos de un proyecto y el total"""
+        return self.flow_repository.get_page_by_project(project_id, offset, limit)
+    
     def get_flow_by_id(self, flow_id: int) -> Optional[Flow]:
         """Obtiene un flujo por su ID"""
         return self.flow_repository.get_by_id(flow_id)
     
-    def create_flow(self, project_id: int, name: str, recurrence: RecurrenceType, owner: str) -> Flow:
+    def create_flow(self, project_id: int, name: str, recurrence: RecurrenceType, owner: str,
+                    schedule: Optional[Schedule] = None, connection: str = "",
+                    estimated_duration: int = 5) -> Flow:
         """Crea un nuevo flujo"""
         flow = Flow(
             project_id=project_id,
             name=name,
             recurrence=recurrence,
+            created_at=datetime.now(),
             owner=owner,
-            status=FlowStatus.ACTIVE
+            status=FlowStatus.ACTIVE,
+            schedule=schedule or Schedule(),
+            connection=connection,
+            estimated_duration=estimated_duration
         )
+        
+        # Sin días explícitos, los flujos semanales/mensuales se ejecutan el día de creación
+        if recurrence == RecurrenceType.WEEKLY and not flow.schedule.weekdays:
+            flow.schedule.weekdays = [flow.created_at.weekday()]
+        if recurrence == RecurrenceType.MONTHLY and flow.schedule.month_day is None:
+            flow.schedule.month_day = flow.created_at.day
+        
+        if flow.estimated_duration < 1:
+            raise ValueError("La duración estimada debe ser de al menos 1 minuto")
+        if recurrence == RecurrenceType.CUSTOM and not flow.schedule.cron:
+            raise ValueError("La recurrencia personalizada requiere una expresión cron")
+        flow.schedule.validate()
+        flow.reschedule(flow.created_at)
         return self.flow_repository.create(flow)
     
     def update_flow(self, flow: Flow) -> Flow:
         """Actualiza un flujo existente"""
+        if flow.estimated_duration < 1:
+            raise ValueError("La duración estimada debe ser de al menos 1 minuto")
+        flow.schedule.validate()
+        flow.reschedule()
         return self.flow_repository.update(flow)
     
     def delete_flow(self, flow_id: int) -> bool:
@@ -47,4 +87,86 @@ class FlowService:
         else:
             flow.activate()
             
-        return self.flow_repository.update(flow)
\ No newline at end of file
+        return self.update_flow(flow)
+    
+    def iter_flow_records(self, project_id: Optional[int] = None,
+                          status: Optional[FlowStatus] = None) -> Iterator[FlowRecord]:
+        """Recorre los flujos sin cargarlos todos en memoria (exportaciones y procesos por lotes)"""
+        return self.flow_repository.iter_records(project_id, status)
+    
+    def set_flows_status(self, active: bool, flow_ids: Optional[Sequence[int]] = None,
+                         project_id: Optional[int] = None) -> int:
+        """Activa o desactiva en bloque varios flujos o todos los de un proyecto.
+        
+        Devuelve la cantidad de flujos que cambiaron de estado.
+        """
+        status = FlowStatus.ACTIVE if active else FlowStatus.INACTIVE
+        return self.flow_repository.set_status(status, flow_ids, project_id)
+    
+    def refresh_next_runs(self, now: Optional[datetime] = None,
+                          batch_size: int = SCHEDULE_REFRESH_BATCH) -> int:
+        """Recalcula la próxima ejecución de los flujos vencidos o sin calcular.
+        
+        Se llama antes de cada consulta por fechas: si la próxima ejecución más
+        cercana todavía no pasó no hay nada que recalcular, y si no se leen solo
+        las columnas de la programación, por bloques de batch_size flujos.
+        Devuelve la cantidad de flujos actualizados.
+        """
+        now = now or datetime.now()
+        if not self.flow_repository.has_pending_schedule(now):
+            return 0
+        
+        updated = 0
+        after_id = 0
+        while True:
+            flows = self.flow_repository.get_pending_schedule(now, after_id, batch_size)
+            if not flows:
+                break
+            self.flow_repository.update_next_runs([
+                (flow.id, flow.to_schedule().next_after(flow.recurrence, now)) for flow in flows
+            ])
+            updated += len(flows)
+            if len(flows) < batch_size:
+                break
+            after_id = flows[-1].id
+        return updated
+    
+    def get_flows_due_between(self, start: datetime, end: datetime) -> List[Flow]:
+        """Obtiene los flujos que se ejecutan entre dos fechas"""
+        self.refresh_next_runs(start)
+        return self.flow_repository.get_due_between(start, end)
+    
+    def get_flow_definition(self, flow_id: int) -> Optional[str]:
+        """Obtiene la definición importada de un flujo (se descomprime solo al pedirla)"""
+        flow = self.get_flow_by_id(flow_id)
+        if not flow:
+            raise ValueError(f"No se encontró el flujo con ID {flow_id}")
+        if not flow.has_definition or self.definition_repository is None:
+            return None
+        return self.definition_repository.get(flow.definition_hash)
+    
+    def get_definition_versions(self, flow_id: int) -> List[DefinitionVersion]:
+        """Obtiene las versiones importadas de la definición de un flujo"""
+        if self.definition_repository is None:
+            return []
+        return self.definition_repository.get_versions(flow_id)
+    
+    def _require_inventory(self) -> FlowInventoryRepository:
+        if self.inventory_repository is None:
+            raise ValueError("El inventario de conectores no está disponible")
+        return self.inventory_repository
+    
+    def find_by_connector(self, connector: str, operation: Optional[str] = None,
+                          kind: Optional[ComponentKind] = None, project_id: Optional[int] = None,
+                          limit: Optional[int] = None) -> List[ConnectorMatch]:
+        """Busca los flujos que usan un conector (p. ej. 'sharepointonline'), y opcionalmente
+        una operación ('PostMessageToConversation') o solo como desencadenador/acción"""
+        return self._require_inventory().find_flows(connector, operation, kind, project_id, limit)
+    
+    def get_connector_counts(self) -> List[ConnectorUsage]:
+        """Obtiene cuántos flujos usan cada conector"""
+        return self._require_inventory().count_by_connector()
+    
+    def get_connector_operations(self, connector: str) -> List[Tuple[str, str, int]]:
+        """Obtiene las operaciones usadas de un conector con la cantidad de flujos de cada una"""
+        return self._require_inventory().get_operations(connector)
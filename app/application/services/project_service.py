@@ -1,5 +1,5 @@
 # app/application/services/project_service.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.domain.entities.project import Project, ProjectStatus
 from app.domain.repositories.project_repository import ProjectRepository
 
@@ -13,6 +13,10 @@ class ProjectService:
         """Obtiene todos los proyectos"""
         return self.project_repository.get_all()
     
+    def get_projects_page(self, offset: int, limit: int) -> Tuple[List[Project], int]:
+        """Obtiene una página de proyectos y el total"""
+        return self.project_repository.get_page(offset, limit)
+    
     def get_project_by_id(self, project_id: int) -> Optional[Project]:
         """Obtiene un proyecto por su ID"""
         return self.project_repository.get_by_id(project_id)
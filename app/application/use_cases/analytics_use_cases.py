@@ -0,0 +1,55 @@
+# app/application/use_cases/analytics_use_cases.py
+from typing import Dict, Any, List
+from app.application.services.flow_analytics_service import FlowAnalyticsService
+
+class AnalyticsUseCases:
+    """Casos de uso para el análisis de carga de los flujos"""
+    
+    def __init__(self, analytics_service: FlowAnalyticsService):
+        self.analytics_service = analytics_service
+    
+    def get_load_summary(self, days: int = 30, top_owners: int = 10) -> Dict[str, Any]:
+        """Resumen de ejecuciones esperadas por hora y por propietario"""
+        timeline = self.analytics_service.get_load_timeline(days=days)
+        peak_hour, peak_hour_runs = timeline.peak_hour
+        owner_totals = timeline.owner_totals()
+        owner_peaks = timeline.owner_peak_hours()
+        busiest = sorted(owner_totals.items(), key=lambda item: item[1], reverse=True)
+        
+        return {
+            'start': timeline.start.strftime('%d/%m/%Y %H:%M'),
+            'days': days,
+            'total_runs': timeline.total_runs,
+            'runs_per_day': round(timeline.total_runs / days, 1) if days else 0,
+            'peak_hour': peak_hour.strftime('%d/%m/%Y %H:00') if peak_hour else '',
+            'peak_hour_runs': peak_hour_runs,
+            'peak_minute': timeline.peak_minute.strftime('%d/%m/%Y %H:%M') if timeline.peak_minute else '',
+            'peak_minute_runs': timeline.peak_minute_runs,
+            'hourly_runs': timeline.hourly_counts.tolist(),
+            'owners': [
+                {'owner': owner, 'runs': runs, 'peak_hour_runs': owner_peaks[owner]}
+                for owner, runs in busiest[:top_owners]
+            ]
+        }
+    
+    def find_congested_windows(self, group_by: str = 'owner', days: int = 7,
+                               threshold: int = 5, top_k: int = 10) -> List[Dict[str, Any]]:
+        """Intervalos con más flujos ejecutándose a la vez por propietario, conexión o proyecto"""
+        windows, flows = self.analytics_service.get_congested_windows(
+            group_by=group_by, days=days, threshold=threshold, top_k=top_k
+        )
+        names = {flow.id: flow.name for flow in flows}
+        
+        return [
+            {
+                'group_by': window.group_by,
+                'key': window.key,
+                'start': window.start.strftime('%d/%m/%Y %H:%M'),
+                'end': window.end.strftime('%d/%m/%Y %H:%M'),
+                'peak_at': window.peak_at.strftime('%d/%m/%Y %H:%M'),
+                'peak_concurrency': window.peak_concurrency,
+                'flow_ids': window.flow_ids,
+                'flow_names': [names[flow_id] for flow_id in window.flow_ids]
+            }
+            for window in windows
+        ]
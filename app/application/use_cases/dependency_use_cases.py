@@ -0,0 +1,36 @@
+# app/application/use_cases/dependency_use_cases.py
+from typing import Any, Dict, List
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.domain.entities.flow import FlowStatus
+from app.domain.entities.flow_dependency import ImpactedFlow
+
+class DependencyUseCases:
+    """Casos de uso para las dependencias entre flujos"""
+
+    def __init__(self, dependency_service: FlowDependencyService):
+        self.dependency_service = dependency_service
+
+    @staticmethod
+    def _format_impacted(flow: ImpactedFlow) -> Dict[str, Any]:
+        return {
+            'id': flow.flow_id,
+            'project_id': flow.project_id,
+            'project_name': flow.project_name,
+            'name': flow.name,
+            'is_active': flow.status == FlowStatus.ACTIVE.value,
+            'direct': flow.direct
+        }
+
+    def get_flow_impact(self, flow_id: int) -> Dict[str, Any]:
+        """Obtener los flujos que afectan a un flujo y los afectados por él"""
+        impact = self.dependency_service.get_impact(flow_id)
+        cyclic = self.dependency_service.get_topological_order().cyclic_flows()
+        return {
+            'upstream': [self._format_impacted(flow) for flow in impact.upstream],
+            'downstream': [self._format_impacted(flow) for flow in impact.downstream],
+            'in_cycle': flow_id in cyclic
+        }
+
+    def list_cycles(self) -> List[List[int]]:
+        """Listar los ciclos de dependencias (flujos que se desencadenan entre sí)"""
+        return self.dependency_service.get_topological_order().cycles
@@ -0,0 +1,55 @@
+from typing import Dict, Any, Iterable, Optional
+from app.application.services.flow_run_service import FlowRunService
+from app.domain.entities.flow_run import FlowRun, FlowHealth
+
+HEALTH_LABELS = {
+    'healthy': "Saludable",
+    'warning': "Con fallos",
+    'critical': "Crítico",
+    'unknown': "Sin datos",
+}
+
+class FlowRunUseCases:
+    """Casos de uso para el historial de ejecuciones"""
+    
+    def __init__(self, run_service: FlowRunService):
+        self.run_service = run_service
+    
+    def import_run_history(self, runs: Iterable[FlowRun], project_id: int,
+                           default_flow_id: Optional[int] = None) -> Dict[str, Any]:
+        """Importar un historial de ejecuciones"""
+        summary = self.run_service.import_runs(runs, project_id, default_flow_id)
+        return {
+            'imported': summary.imported,
+            'skipped': summary.skipped,
+            'batches': summary.batches
+        }
+    
+    def get_project_health(self, project_id: int, days: int = 30) -> Dict[int, Dict[str, Any]]:
+        """Salud de cada flujo del proyecto, por ID de flujo"""
+        health = self.run_service.get_project_health(project_id, days)
+        return {flow_id: self._format_health(item) for flow_id, item in health.items()}
+    
+    @staticmethod
+    def _format_duration(milliseconds: int) -> str:
+        if milliseconds < 1000:
+            return f"{milliseconds} ms"
+        seconds = milliseconds / 1000
+        if seconds < 60:
+            return f"{seconds:.1f} s"
+        return f"{int(seconds // 60)} min {int(seconds % 60)} s"
+    
+    def _format_health(self, health: FlowHealth) -> Dict[str, Any]:
+        """Formatear la salud de un flujo para presentación"""
+        return {
+            'flow_id': health.flow_id,
+            'level': health.level,
+            'label': HEALTH_LABELS[health.level],
+            'runs': health.runs,
+            'failures': health.failures,
+            'success_rate': f"{health.success_rate:.0%}",
+            'avg_duration': self._format_duration(health.avg_duration_ms),
+            'p50_duration': self._format_duration(health.p50_duration_ms),
+            'p95_duration': self._format_duration(health.p95_duration_ms),
+            'last_run_at': health.last_run_at.strftime('%d/%m/%Y %H:%M') if health.last_run_at else ''
+        }
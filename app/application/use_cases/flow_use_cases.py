@@ -1,7 +1,15 @@
-from typing import List, Dict, Any, Optional
+import json
+from typing import List, Dict, Any, Iterator, Optional
+from datetime import datetime, time, timedelta
 from app.application.services.flow_service import FlowService
-from app.domain.entities.flow import Flow, RecurrenceType
+from app.domain.entities.flow import Flow, FlowRecord, FlowStatus, RecurrenceType
+from app.domain.entities.schedule import Schedule
+from app.utils.tracing import trace_methods
 
+# Columnas de la exportación de flujos (CSV y JSON Lines)
+FLOW_EXPORT_FIELDS = list(FlowRecord._fields)
+
+@trace_methods('use_case')
 class FlowUseCases:
     """Casos de uso para los flujos"""
     
@@ -13,6 +21,11 @@ class FlowUseCases:
         flows = self.flow_service.get_flows_by_project(project_id)
         return [self._format_flow(flow) for flow in flows]
     
+    def list_flows_page(self, project_id: int, offset: int, limit: int) -> Dict[str, Any]:
+        """Listar una página de los flujos de un proyecto, con el total para paginar"""
+        flows, total = self.flow_service.get_flows_page(project_id, offset, limit)
+        return {'items': [self._format_flow(flow) for flow in flows], 'total': total}
+    
     def get_flow_details(self, flow_id: int) -> Optional[Dict[str, Any]]:
         """Obtener detalles de un flujo"""
         flow = self.flow_service.get_flow_by_id(flow_id)
@@ -20,12 +33,58 @@ class FlowUseCases:
             return None
         return self._format_flow(flow)
     
-    def add_new_flow(self, project_id: int, name: str, recurrence: str, owner: str) -> Dict[str, Any]:
+    def add_new_flow(self, project_id: int, name: str, recurrence: str, owner: str,
+                     schedule: Optional[Dict[str, Any]] = None, connection: str = "",
+                     estimated_duration: int = 5) -> Dict[str, Any]:
         """Agregar un nuevo flujo"""
         recurrence_type = RecurrenceType(recurrence)
-        flow = self.flow_service.create_flow(project_id, name, recurrence_type, owner)
+        flow = self.flow_service.create_flow(
+            project_id, name, recurrence_type, owner, self.build_schedule(schedule),
+            connection, estimated_duration
+        )
         return self._format_flow(flow)
     
+    def list_upcoming_runs(self, hours: int = 1) -> List[Dict[str, Any]]:
+        """Listar los flujos que se ejecutan en las próximas horas"""
+        start = datetime.now()
+        flows = self.flow_service.get_flows_due_between(start, start + timedelta(hours=hours))
+        return [self._format_flow(flow) for flow in flows]
+    
+    @staticmethod
+    def build_schedule(data: Optional[Dict[str, Any]]) -> Optional[Schedule]:
+        """Construye una programación a partir de los datos de la vista.
+        
+        Acepta las claves 'time' ('HH:MM'), 'weekdays', 'month_day' y 'cron'.
+        """
+        if not data:
+            return None
+        return Schedule(
+            time_of_day=time.fromisoformat(data.get('time') or '00:00'),
+            weekdays=list(data.get('weekdays') or []),
+            month_day=data.get('month_day'),
+            cron=(data.get('cron') or '').strip()
+        )
+    
+    def get_flow_definition(self, flow_id: int) -> Optional[Dict[str, Any]]:
+        """Obtener la definición importada de un flujo, formateada para mostrarla"""
+        text = self.flow_service.get_flow_definition(flow_id)
+        if text is None:
+            return None
+        current = self.flow_service.get_flow_by_id(flow_id).definition_hash
+        return {
+            'hash': current,
+            'size': len(text.encode('utf-8')),
+            'definition': json.dumps(json.loads(text), indent=2, ensure_ascii=False),
+            'versions': [
+                {
+                    'hash': version.definition_hash,
+                    'recorded_at': version.recorded_at.strftime('%d/%m/%Y %H:%M'),
+                    'is_current': version.definition_hash == current
+                }
+                for version in self.flow_service.get_definition_versions(flow_id)
+            ]
+        }
+    
     def change_flow_status(self, flow_id: int) -> Dict[str, Any]:
         """Cambiar el estado de un flujo"""
         flow = self.flow_service.toggle_flow_status(flow_id)
@@ -35,6 +94,13 @@ class FlowUseCases:
         """Eliminar un flujo"""
         return self.flow_service.delete_flow(flow_id)
     
+    def export_flows(self, project_id: Optional[int] = None,
+                     active: Optional[bool] = None) -> Iterator[Dict[str, Any]]:
+        """Exportar flujos como registros planos (fechas ISO), de a uno"""
+        status = None if active is None else (FlowStatus.ACTIVE if active else FlowStatus.INACTIVE)
+        for record in self.flow_service.iter_flow_records(project_id, status):
+            yield record._asdict()
+    
     def _format_flow(self, flow: Flow) -> Dict[str, Any]:
         """Formatear un flujo para presentación"""
         return {
@@ -45,5 +111,16 @@ class FlowUseCases:
             'created_at': flow.created_at.strftime('%d/%m/%Y'),
             'owner': flow.owner,
             'status': flow.status.value,
-            'is_active': flow.is_active
+            'is_active': flow.is_active,
+            'schedule': {
+                'time': flow.schedule.time_of_day.strftime('%H:%M'),
+                'weekdays': list(flow.schedule.weekdays),
+                'month_day': flow.schedule.month_day,
+                'cron': flow.schedule.cron
+            },
+            'schedule_description': flow.schedule.describe(flow.recurrence.value),
+            'next_run_at': flow.next_run_at.strftime('%d/%m/%Y %H:%M') if flow.next_run_at else '',
+            'connection': flow.connection,
+            'estimated_duration': flow.estimated_duration,
+            'has_definition': flow.has_definition
         }
\ No newline at end of file
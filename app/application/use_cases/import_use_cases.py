@@ -0,0 +1,19 @@
+from typing import Dict, Any, List, Optional
+from app.application.services.flow_import_service import FlowImportService
+
+class ImportUseCases:
+    """Casos de uso para importar paquetes exportados de Power Automate"""
+    
+    def __init__(self, import_service: FlowImportService):
+        self.import_service = import_service
+    
+    def import_packages(self, paths: List[str], workers: Optional[int] = None) -> Dict[str, Any]:
+        """Importar proyectos y flujos desde archivos .zip exportados"""
+        summary = self.import_service.import_packages(paths, workers)
+        return {
+            'files': summary.files,
+            'projects': summary.projects,
+            'flows_created': summary.flows_created,
+            'flows_updated': summary.flows_updated,
+            'errors': summary.errors
+        }
@@ -0,0 +1,64 @@
+# app/application/use_cases/inventory_use_cases.py
+from typing import Any, Dict, List, Optional
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.application.services.flow_service import FlowService
+from app.domain.entities.flow import FlowStatus
+from app.domain.entities.flow_inventory import BUILTIN_CONNECTOR
+
+# Flujos mostrados por búsqueda (las coincidencias pueden ser decenas de miles)
+FLOW_PAGE_SIZE = 500
+
+KIND_LABELS = {
+    'trigger': "Desencadenador",
+    'action': "Acción",
+}
+
+class InventoryUseCases:
+    """Casos de uso para el inventario de conectores de los flujos"""
+
+    def __init__(self, flow_service: FlowService, inventory_service: FlowInventoryService):
+        self.flow_service = flow_service
+        self.inventory_service = inventory_service
+
+    @staticmethod
+    def connector_label(connector: str) -> str:
+        return "Integrado" if connector == BUILTIN_CONNECTOR else connector
+
+    def refresh_inventory(self) -> int:
+        """Indexa las definiciones importadas que aún no están en el inventario"""
+        return self.inventory_service.refresh()
+
+    def list_connectors(self) -> List[Dict[str, Any]]:
+        """Listar los conectores con la cantidad de flujos que los usan"""
+        return [
+            {
+                'connector': usage.connector,
+                'label': self.connector_label(usage.connector),
+                'flows': usage.flows,
+                'triggers': usage.triggers,
+                'actions': usage.actions
+            }
+            for usage in self.flow_service.get_connector_counts()
+        ]
+
+    def list_operations(self, connector: str) -> List[Dict[str, Any]]:
+        """Listar las operaciones usadas de un conector"""
+        return [
+            {'kind': kind, 'kind_label': KIND_LABELS.get(kind, kind), 'operation': operation, 'flows': flows}
+            for kind, operation, flows in self.flow_service.get_connector_operations(connector)
+        ]
+
+    def find_flows(self, connector: str, operation: Optional[str] = None,
+                   limit: int = FLOW_PAGE_SIZE) -> List[Dict[str, Any]]:
+        """Buscar los flujos que usan un conector o una de sus operaciones"""
+        return [
+            {
+                'id': match.flow_id,
+                'project_id': match.project_id,
+                'project_name': match.project_name,
+                'name': match.name,
+                'owner': match.owner,
+                'is_active': match.status == FlowStatus.ACTIVE.value
+            }
+            for match in self.flow_service.find_by_connector(connector, operation, limit=limit)
+        ]
@@ -2,7 +2,9 @@
 from typing import List, Dict, Any, Optional
 from app.application.services.project_service import ProjectService
 from app.domain.entities.project import Project
+from app.utils.tracing import trace_methods
 
+@trace_methods('use_case')
 class ProjectUseCases:
     """Casos de uso para los proyectos"""
     
@@ -15,6 +17,11 @@ class ProjectUseCases:
         projects = self.project_service.get_all_projects()
         return [self._format_project(project) for project in projects]
     
+    def list_projects_page(self, offset: int, limit: int) -> Dict[str, Any]:
+        """Listar una página de proyectos, con el total para paginar"""
+        projects, total = self.project_service.get_projects_page(offset, limit)
+        return {'items': [self._format_project(project) for project in projects], 'total': total}
+    
     def get_project_details(self, project_id: int) -> Optional[Dict[str, Any]]:
         """Obtener detalles de un proyecto"""
         project = self.project_service.get_project_by_id(project_id)
@@ -87,6 +94,7 @@ from typing import List, Dict, Any, Optional
 from app.application.services.flow_service import FlowService
 from app.domain.entities.flow import Flow, RecurrenceType
 
+@trace_methods('use_case')
 class FlowUseCases:
     """Casos de uso para los flujos"""
     
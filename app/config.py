@@ -14,6 +14,96 @@ DB_FILE = os.path.join(DATA_DIR, 'power_automate.db')
 # Configuración de la base de datos
 DATABASE = {
     'path': DB_FILE,
+    'profile': 'desktop',
+    # PRAGMA que se aplican a cada conexión según el perfil de uso.
+    # cache_size negativo está en KiB; mmap_size en bytes; busy_timeout en ms.
+    'profiles': {
+        # Equipo local: WAL para leer mientras escribe el hilo escritor
+        'desktop': {
+            'busy_timeout': 5000,
+            'journal_mode': 'wal',
+            'synchronous': 'normal',
+            'cache_size': -16000,
+            'mmap_size': 256 * 1024 * 1024,
+            'temp_store': 'memory',
+        },
+        # Base en una unidad compartida de red: WAL y mmap no son seguros sobre
+        # sistemas de archivos de red, y hay que esperar más a otros equipos
+        'shared': {
+            'busy_timeout': 30000,
+            'journal_mode': 'delete',
+            'synchronous': 'full',
+            'cache_size': -8000,
+            'mmap_size': 0,
+            'temp_store': 'memory',
+        },
+        # Importaciones masivas: sin esperar al disco en cada commit y con
+        # caché grande (un corte de energía puede perder el último lote)
+        'bulk-load': {
+            'busy_timeout': 60000,
+            'journal_mode': 'wal',
+            'synchronous': 'off',
+            'cache_size': -262144,
+            'mmap_size': 1024 * 1024 * 1024,
+            'temp_store': 'memory',
+        },
+    },
+}
+
+# Copias de seguridad en línea (python cli.py backup)
+BACKUP = {
+    'dir': os.path.join(DATA_DIR, 'backups'),
+    'keep': 7,                # Copias que se conservan al rotar
+    'interval_hours': 24,     # La aplicación hace una copia si la última es más antigua
+    'pages_per_step': 1024,   # Páginas copiadas por paso (4 MB con páginas de 4 KB)
+    'step_pause_ms': 5,       # Pausa entre pasos para ceder la base a los demás
+    'max_restarts': 3,        # Sin WAL: reinicios tolerados antes de copiar en un solo paso
+    'compress_level': 6,
+}
+
+# Trazas de rendimiento (PA_TRACE=1 python run.py): al salir se escribe la traza
+# en formato Chrome y se imprime un resumen de latencias por operación
+TRACING = {
+    'enabled': os.environ.get('PA_TRACE', '') not in ('', '0'),
+    'trace_file': os.environ.get('PA_TRACE_FILE', os.path.join(DATA_DIR, 'trace.json')),
+    'max_events': 200_000,    # Spans guardados para la traza (los más antiguos se descartan)
+}
+
+# Registro de consultas SQL (PA_QUERY_LOG=1 o desde el panel de diagnóstico)
+QUERY_LOG = {
+    'enabled': os.environ.get('PA_QUERY_LOG', '') not in ('', '0'),
+    'slow_ms': 20,            # A partir de este tiempo se guarda el EXPLAIN QUERY PLAN
+    'log_file': os.path.join(DATA_DIR, 'logs', 'queries.log'),
+    'max_bytes': 5 * 1024 * 1024,
+    'backup_count': 3,
+    'recent': 200,            # Consultas lentas que muestra el panel
+}
+
+# Informe de tiempos del arranque (PA_STARTUP_REPORT=1; PA_STARTUP_REPORT_FILE lo guarda en JSON)
+STARTUP = {
+    'report': os.environ.get('PA_STARTUP_REPORT', '') not in ('', '0'),
+    'report_file': os.environ.get('PA_STARTUP_REPORT_FILE', ''),
+}
+
+# Detector de bloqueos de la interfaz (PA_WATCHDOG=0 lo desactiva)
+RESPONSIVENESS = {
+    'enabled': os.environ.get('PA_WATCHDOG', '1') not in ('', '0'),
+    'interval_ms': 50,        # Latido del temporizador del hilo de la interfaz
+    'stall_ms': 250,          # Sin latido durante este tiempo se considera bloqueo
+    'check_ms': 50,           # Frecuencia con que el hilo monitor revisa el latido
+    'recent': 100,            # Bloqueos que se guardan con su pila
+    'stack_depth': 40,
+    'export_file': os.path.join(DATA_DIR, 'logs', 'stalls.json'),
+}
+
+# Servidor HTTP/JSON (python cli.py serve)
+API = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    'workers': 4,           # Hilos para las consultas a SQLite
+    'page_size': 50,
+    'max_page_size': 500,
+    'gzip_min_size': 1024,  # Bytes a partir de los cuales se comprime la respuesta
 }
 
 # Configuración de la interfaz de usuario
@@ -21,6 +111,21 @@ UI = {
     'app_name': "Flujos de Power Automate Yape",
     'min_width': 900,
     'min_height': 600,
+    'change_poll_ms': 2000,  # Consulta de cambios hechos por otras instancias
+    # Con más cambios pendientes que estos las vistas se recargan completas
+    # en vez de leerlos y aplicarlos uno a uno en el hilo de la interfaz
+    'change_poll_max_changes': 2000,
+    # Cambios que se conservan en change_log al podarlo (otras instancias y
+    # sincronizaciones con changes --since pueden estar leyendo los anteriores)
+    'change_log_keep': 10_000,
+    # Al arrancar, pintar el último listado de proyectos guardado mientras se lee el actual
+    'warm_start': os.environ.get('PA_WARM_START', '1') not in ('', '0'),
+    # Sombras de tarjetas y paneles: 'high' (siempre), 'low' (nunca) o 'auto'
+    # (se quitan en las listas que superan los límites: cada sombra se dibuja
+    # aparte y con desenfoque en cada repintado y desplazamiento)
+    'render_quality': os.environ.get('PA_RENDER_QUALITY', 'auto'),
+    'shadow_max_cards': 60,
+    'shadow_max_rows': 200,
 }
 
 # Asegurarse de que exista el directorio de datos
@@ -0,0 +1,58 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+class ChangeOperation(Enum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+    REFRESH = "refresh"  # carga masiva sin registro por fila: hay que releer todo
+
+class Change(NamedTuple):
+    """Fila del registro de cambios (change_log)"""
+    seq: int
+    entity: str          # 'project', 'flow' o '*' (REFRESH)
+    entity_id: int
+    project_id: int      # proyecto del flujo, o el propio proyecto
+    operation: str       # valor de ChangeOperation
+    changed_at: str
+
+def coalesce_changes(changes: Iterable[Change], entity: str) -> Dict[int, ChangeOperation]:
+    """Reduce varios cambios de una entidad a la operación neta por ID.
+
+    Un alta seguida de modificaciones sigue siendo un alta, y un alta
+    seguida de una baja desaparece (la vista nunca llegó a ver el registro).
+    """
+    result: Dict[int, ChangeOperation] = {}
+    for change in changes:
+        if change.entity != entity:
+            continue
+        operation = ChangeOperation(change.operation)
+        previous = result.get(change.entity_id)
+        if previous is ChangeOperation.INSERT and operation is ChangeOperation.DELETE:
+            del result[change.entity_id]
+        elif previous is ChangeOperation.INSERT:
+            continue
+        else:
+            result[change.entity_id] = operation
+    return result
+
+@dataclass
+class ChangeBatch:
+    """Cambios leídos desde un cursor; 'cursor' es el seq del último (para la próxima lectura).
+
+    full_refresh indica que había demasiados cambios para aplicarlos uno a
+    uno: 'changes' viene vacío y las vistas deben recargarse completas.
+    """
+    cursor: int
+    changes: List[Change] = field(default_factory=list)
+    full_refresh: bool = False
+
+    def projects(self) -> Dict[int, ChangeOperation]:
+        return coalesce_changes(self.changes, 'project')
+
+    def flows(self, project_id: Optional[int] = None) -> Dict[int, ChangeOperation]:
+        changes = self.changes if project_id is None else [
+            change for change in self.changes if change.project_id == project_id
+        ]
+        return coalesce_changes(changes, 'flow')
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
 from datetime import datetime
 from enum import Enum
 
+from app.domain.entities.schedule import Schedule
+
 class FlowStatus(Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
@@ -23,6 +25,18 @@ class Flow:
     created_at: datetime = datetime.now()
     owner: str = ""
     status: FlowStatus = FlowStatus.ACTIVE
+    schedule: Schedule = field(default_factory=Schedule)
+    next_run_at: Optional[datetime] = None
+    connection: str = ""
+    estimated_duration: int = 5  # minutos
+    external_id: str = ""  # GUID del flujo en Power Automate, si fue importado
+    definition_hash: str = ""  # hash de la definición importada (tabla definition_blobs)
+    # Texto canónico de la definición recién leída de un paquete; no se carga al leer flujos
+    definition: Optional[str] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def has_definition(self) -> bool:
+        return bool(self.definition_hash)
     
     @property
     def is_active(self) -> bool:
@@ -32,4 +46,37 @@ class Flow:
         self.status = FlowStatus.ACTIVE
     
     def deactivate(self) -> None:
-        self.status = FlowStatus.INACTIVE
\ No newline at end of file
+        self.status = FlowStatus.INACTIVE
+    
+    def next_run_after(self, after: datetime) -> Optional[datetime]:
+        """Calcula la siguiente ejecución del flujo posterior a 'after'"""
+        return self.schedule.next_after(self.recurrence.value, after)
+    
+    def reschedule(self, now: Optional[datetime] = None) -> None:
+        """Recalcula la próxima ejecución (los flujos inactivos no se ejecutan)"""
+        if not self.is_active:
+            self.next_run_at = None
+            return
+        self.next_run_at = self.next_run_after(now or datetime.now())
+
+class FlowRecord(NamedTuple):
+    """Fila de un flujo tal como está guardada (fechas ISO), para exportaciones masivas.
+
+    Evita construir entidades Flow al recorrer cientos de miles de flujos.
+    """
+    id: int
+    project_id: int
+    name: str
+    recurrence: str
+    created_at: str
+    owner: str
+    status: str
+    schedule_time: str  # 'HH:MM'
+    schedule_weekdays: str  # días separados por coma, 0 = lunes
+    schedule_month_day: Optional[int]
+    schedule_cron: str
+    next_run_at: Optional[str]
+    connection: str
+    estimated_duration: int
+    external_id: str
+    definition_hash: str
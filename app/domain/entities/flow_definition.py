@@ -0,0 +1,42 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict
+
+def canonical_definition(definition: Dict[str, Any]) -> str:
+    """Serializa una definición de forma canónica (claves ordenadas, sin espacios).
+
+    Dos definiciones iguales producen el mismo texto aunque el JSON original
+    difiera en el orden de las claves o en el formato.
+    """
+    return json.dumps(definition, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+def definition_hash(text: str) -> str:
+    """Hash SHA-256 (hex) del texto canónico de una definición"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+@dataclass
+class DefinitionVersion:
+    """Versión de la definición de un flujo, registrada al importarla"""
+    flow_id: int
+    definition_hash: str
+    recorded_at: datetime
+
+@dataclass
+class DefinitionStorageStats:
+    """Espacio ocupado por las definiciones guardadas"""
+    blobs: int = 0
+    references: int = 0  # flujos que apuntan a una definición
+    raw_bytes: int = 0  # tamaño sin comprimir de los blobs únicos
+    referenced_bytes: int = 0  # tamaño sin comprimir ni deduplicar (una copia por flujo)
+    stored_bytes: int = 0  # tamaño comprimido guardado
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 0.0
+
+    @property
+    def savings_ratio(self) -> float:
+        """Cuántas veces más ocuparían las definiciones sin deduplicar ni comprimir"""
+        return self.referenced_bytes / self.stored_bytes if self.stored_bytes else 0.0
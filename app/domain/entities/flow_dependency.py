@@ -0,0 +1,131 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from app.domain.entities.flow_inventory import walk_actions
+
+class DependencyKind(Enum):
+    CHILD_FLOW = "child_flow"    # acción "Ejecutar un flujo secundario"
+    HTTP = "http"                # llamada HTTP al desencadenador de otro flujo
+    SHARED_DATA = "shared_data"  # lista o tabla que un flujo escribe y otro lee
+
+@dataclass
+class FlowDependency:
+    """Dependencia entre dos flujos.
+
+    El sentido es el de la ejecución o de los datos: 'source' desencadena o
+    alimenta a 'target', así que un cambio en 'source' afecta a 'target'.
+    """
+    source_flow_id: int
+    target_flow_id: int
+    kind: DependencyKind = DependencyKind.CHILD_FLOW
+    description: str = ""
+    created_at: Optional[datetime] = None
+
+class ImpactedFlow(NamedTuple):
+    """Flujo alcanzado por un análisis de impacto (lectura liviana, sin la entidad completa)"""
+    flow_id: int
+    project_id: int
+    project_name: str
+    name: str
+    status: str
+    direct: bool  # unido por una dependencia directa (no a través de otros flujos)
+
+@dataclass
+class FlowImpact:
+    """Flujos de los que depende un flujo (upstream) y los que dependen de él (downstream)"""
+    flow_id: int
+    upstream: List[ImpactedFlow] = field(default_factory=list)
+    downstream: List[ImpactedFlow] = field(default_factory=list)
+
+@dataclass
+class DependencyOrder:
+    """Orden topológico del grafo de dependencias.
+
+    Cada flujo aparece después de todos los que lo desencadenan o alimentan.
+    Los flujos de un ciclo no tienen un orden válido: quedan juntos (en orden
+    de ID) y se informan en 'cycles'.
+    """
+    order: List[int] = field(default_factory=list)
+    cycles: List[List[int]] = field(default_factory=list)
+
+    @property
+    def has_cycles(self) -> bool:
+        return bool(self.cycles)
+
+    def cyclic_flows(self) -> set:
+        return {flow_id for cycle in self.cycles for flow_id in cycle}
+
+def child_flow_references(definition: Dict[str, Any]) -> List[str]:
+    """Identificadores (en minúsculas) de los flujos secundarios que llama una definición"""
+    references = []
+    for action in walk_actions(definition.get('actions')):
+        if str(action.get('type', '')).lower() != 'workflow':
+            continue
+        inputs = action.get('inputs')
+        host = inputs.get('host') if isinstance(inputs, dict) else None
+        reference = host.get('workflowReferenceName') if isinstance(host, dict) else None
+        if reference:
+            references.append(str(reference).strip('{}').lower())
+    return list(dict.fromkeys(references))
+
+def topological_order(edges: Iterable[Tuple[int, int]]) -> DependencyOrder:
+    """Ordena los flujos de un grafo de dependencias (source, target) y detecta sus ciclos.
+
+    Usa el algoritmo de Tarjan (iterativo, O(V + E)): las componentes
+    fuertemente conexas salen en orden topológico inverso, y las de más de
+    un flujo (o con una dependencia de un flujo consigo mismo) son ciclos.
+    """
+    adjacency: Dict[int, List[int]] = {}
+    self_loops = set()
+    for source, target in edges:
+        adjacency.setdefault(source, []).append(target)
+        adjacency.setdefault(target, [])
+        if source == target:
+            self_loops.add(source)
+
+    index: Dict[int, int] = {}
+    low: Dict[int, int] = {}
+    stack: List[int] = []
+    on_stack = set()
+    components: List[List[int]] = []
+
+    for root in sorted(adjacency):
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(sorted(adjacency[root])))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(sorted(adjacency[child]))))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+    components.reverse()
+    return DependencyOrder(
+        order=[flow_id for component in components for flow_id in component],
+        cycles=[component for component in components
+                if len(component) > 1 or component[0] in self_loops]
+    )
@@ -0,0 +1,98 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple
+
+# Conector asignado a los desencadenadores y acciones integrados (Recurrence, Compose, Http...)
+BUILTIN_CONNECTOR = "builtin"
+
+_SHARED_PREFIX = re.compile(r'^shared_')
+_REFERENCE_SUFFIX = re.compile(r'_\d+$')
+_CONNECTION_PARAMETER = re.compile(r"\['([^']+)'\]")
+
+class ComponentKind(Enum):
+    TRIGGER = "trigger"
+    ACTION = "action"
+
+@dataclass(frozen=True)
+class FlowComponent:
+    """Desencadenador o acción de un flujo, por conector y operación"""
+    kind: ComponentKind
+    connector: str
+    operation: str
+    occurrences: int = 1
+
+@dataclass
+class ConnectorUsage:
+    """Uso de un conector en los flujos indexados"""
+    connector: str
+    flows: int = 0
+    triggers: int = 0  # flujos que lo usan como desencadenador
+    actions: int = 0  # acciones que lo usan, sumando todos los flujos
+
+class ConnectorMatch(NamedTuple):
+    """Flujo encontrado al buscar por conector (lectura liviana, sin la entidad completa)"""
+    flow_id: int
+    project_id: int
+    project_name: str
+    name: str
+    owner: str
+    status: str
+
+def normalize_connector(name: str) -> str:
+    """Nombre canónico de un conector: 'shared_teams_1' -> 'teams'"""
+    name = name.strip().lower().rsplit('/', 1)[-1]
+    return _REFERENCE_SUFFIX.sub('', _SHARED_PREFIX.sub('', name))
+
+def _component_of(step: Dict[str, Any]) -> Tuple[str, str]:
+    """Conector y operación de un desencadenador o acción.
+
+    Las acciones de conector indican la API en inputs.host (apiId o
+    connectionName en soluciones; connection.name con la expresión
+    $connections en paquetes antiguos). El resto son integradas y su
+    operación es el tipo (Compose, Http, If...).
+    """
+    inputs = step.get('inputs')
+    host = inputs.get('host') if isinstance(inputs, dict) else None
+    if not isinstance(host, dict):
+        return BUILTIN_CONNECTOR, str(step.get('type') or 'Unknown')
+
+    connector = host.get('apiId') or host.get('connectionName') or ''
+    if not connector:
+        connection = host.get('connection')
+        match = _CONNECTION_PARAMETER.search(connection.get('name', '')) if isinstance(connection, dict) else None
+        connector = match.group(1) if match else ((host.get('api') or {}).get('runtimeUrl') or '')
+    operation = host.get('operationId') or str(step.get('type') or 'Unknown')
+    return normalize_connector(connector) or BUILTIN_CONNECTOR, operation
+
+def walk_actions(actions: Any) -> Iterator[Dict[str, Any]]:
+    """Recorre las acciones, incluidas las anidadas en ámbitos, condiciones, bucles y switch"""
+    pending = [actions]
+    while pending:
+        current = pending.pop()
+        if not isinstance(current, dict):
+            continue
+        for action in current.values():
+            if not isinstance(action, dict):
+                continue
+            yield action
+            pending.append(action.get('actions'))
+            pending.append((action.get('else') or {}).get('actions'))
+            pending.append((action.get('default') or {}).get('actions'))
+            for case in (action.get('cases') or {}).values():
+                if isinstance(case, dict):
+                    pending.append(case.get('actions'))
+
+def extract_components(definition: Dict[str, Any]) -> List[FlowComponent]:
+    """Extrae los conectores y operaciones de los desencadenadores y acciones de una definición"""
+    counts: Counter = Counter()
+    for trigger in (definition.get('triggers') or {}).values():
+        if isinstance(trigger, dict):
+            counts[(ComponentKind.TRIGGER, *_component_of(trigger))] += 1
+    for action in walk_actions(definition.get('actions')):
+        counts[(ComponentKind.ACTION, *_component_of(action))] += 1
+    return [
+        FlowComponent(kind=kind, connector=connector, operation=operation, occurrences=occurrences)
+        for (kind, connector, operation), occurrences in counts.items()
+    ]
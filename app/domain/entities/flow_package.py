@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import List, Tuple
+from app.domain.entities.project import Project
+from app.domain.entities.flow import Flow
+
+@dataclass
+class FlowPackage:
+    """Proyecto y flujos leídos de un paquete exportado de Power Automate"""
+    project: Project
+    flows: List[Flow] = field(default_factory=list)
+    source: str = ""  # archivo (o archivo/miembro) de donde se leyó
+    # Llamadas a flujos secundarios: (external_id del flujo, external_id del secundario)
+    child_flows: List[Tuple[str, str]] = field(default_factory=list)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import List, Optional
+
+class RunStatus(Enum):
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    RUNNING = "running"
+
+@dataclass
+class FlowRun:
+    """Entidad que representa una ejecución registrada de un flujo.
+
+    'flow_id' puede faltar al leer un historial exportado; en ese caso el flujo
+    se resuelve por 'flow_name' dentro del proyecto al importar.
+    """
+    flow_id: Optional[int] = None
+    started_at: datetime = None
+    duration_ms: int = 0
+    status: RunStatus = RunStatus.SUCCEEDED
+    flow_name: str = ""
+
+    @property
+    def is_failure(self) -> bool:
+        return self.status == RunStatus.FAILED
+
+    @property
+    def day(self) -> str:
+        """Día de la ejecución ('YYYY-MM-DD'), clave de los resúmenes diarios"""
+        return self.started_at.strftime('%Y-%m-%d')
+
+    @property
+    def month(self) -> str:
+        """Mes de la ejecución ('YYYYMM'), clave de la partición donde se guarda"""
+        return self.started_at.strftime('%Y%m')
+
+@dataclass
+class FlowHealth:
+    """Salud de un flujo en un periodo, calculada a partir de los resúmenes diarios"""
+    flow_id: int
+    runs: int = 0
+    failures: int = 0
+    avg_duration_ms: int = 0
+    p50_duration_ms: int = 0
+    p95_duration_ms: int = 0
+    last_run_at: Optional[datetime] = None
+
+    @property
+    def success_rate(self) -> float:
+        if not self.runs:
+            return 0.0
+        return (self.runs - self.failures) / self.runs
+
+    @property
+    def level(self) -> str:
+        """Nivel de salud: 'unknown' sin ejecuciones, 'critical' con 20% o más de
+        fallos, 'warning' con 5% o más y 'healthy' en otro caso"""
+        if not self.runs:
+            return "unknown"
+        failure_rate = self.failures / self.runs
+        if failure_rate >= 0.2:
+            return "critical"
+        if failure_rate >= 0.05:
+            return "warning"
+        return "healthy"
+
+def duration_percentile(ordered: List[int], pct: float) -> int:
+    """Percentil por rango más cercano sobre una lista de duraciones ya ordenada"""
+    if not ordered:
+        return 0
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
@@ -15,6 +15,7 @@ class Project:
     name: str = ""
     created_at: datetime = datetime.now()
     status: ProjectStatus = ProjectStatus.ACTIVE
+    external_id: str = ""  # identificador de la solución o paquete importado
     
     @property
     def is_active(self) -> bool:
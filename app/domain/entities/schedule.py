@@ -0,0 +1,211 @@
+# app/domain/entities/schedule.py
+import calendar
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from typing import List, NamedTuple, Optional
+
+# Cantidad máxima de días que se revisan al buscar la siguiente ejecución de una
+# expresión cron (cubre expresiones como "0 0 29 2 *" que solo ocurren en bisiestos)
+CRON_SEARCH_DAYS = 366 * 8
+
+WEEKDAY_NAMES = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+class CronExpression:
+    """Expresión cron de 5 campos: minuto, hora, día del mes, mes y día de la semana.
+
+    Soporta '*', listas ('1,15'), rangos ('1-5') y pasos ('*/15', '8-18/2').
+    El día de la semana usa 0 o 7 para domingo, como cron estándar. Si se
+    restringen tanto el día del mes como el día de la semana, basta con que
+    coincida uno de los dos.
+    """
+
+    _FIELDS = (
+        ("minuto", 0, 59),
+        ("hora", 0, 23),
+        ("día del mes", 1, 31),
+        ("mes", 1, 12),
+        ("día de la semana", 0, 7),
+    )
+
+    def __init__(self, expression: str):
+        self.expression = " ".join(expression.split())
+        parts = self.expression.split(" ")
+        if len(parts) != 5:
+            raise ValueError(
+                f"Expresión cron no válida '{expression}': se esperan 5 campos"
+            )
+
+        values = []
+        for part, (name, low, high) in zip(parts, self._FIELDS):
+            values.append(self._parse_field(part, name, low, high))
+
+        self.minutes, self.hours, self.month_days, self.months, weekdays = values
+        # Normalizar el día de la semana al formato de Python (0 = lunes)
+        self.weekdays = sorted({(day - 1) % 7 for day in weekdays})
+        self.month_day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse_field(part: str, name: str, low: int, high: int) -> List[int]:
+        """Convierte un campo cron en la lista ordenada de valores que acepta"""
+        values = set()
+        for item in part.split(","):
+            step = 1
+            if "/" in item:
+                item, step_text = item.split("/", 1)
+                if not step_text.isdigit() or int(step_text) == 0:
+                    raise ValueError(f"Paso no válido en el campo {name}: '{part}'")
+                step = int(step_text)
+
+            if item == "*":
+                start, end = low, high
+            elif "-" in item:
+                start_text, end_text = item.split("-", 1)
+                if not start_text.isdigit() or not end_text.isdigit():
+                    raise ValueError(f"Rango no válido en el campo {name}: '{part}'")
+                start, end = int(start_text), int(end_text)
+            elif item.isdigit():
+                start = int(item)
+                end = high if step > 1 else start
+            else:
+                raise ValueError(f"Valor no válido en el campo {name}: '{part}'")
+
+            if start < low or end > high or start > end:
+                raise ValueError(
+                    f"Valor fuera de rango en el campo {name}: '{part}' ({low}-{high})"
+                )
+            values.update(range(start, end + 1, step))
+        return sorted(values)
+
+    def matches_day(self, day: datetime) -> bool:
+        """Indica si la expresión se ejecuta en algún momento de ese día"""
+        if day.month not in self.months:
+            return False
+
+        month_day_ok = day.day in self.month_days
+        weekday_ok = day.weekday() in self.weekdays
+        if self.month_day_restricted and self.weekday_restricted:
+            return month_day_ok or weekday_ok
+        return month_day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> Optional[datetime]:
+        """Calcula la primera ejecución estrictamente posterior a 'after'"""
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.replace(hour=0, minute=0)
+
+        for offset in range(CRON_SEARCH_DAYS):
+            current = day + timedelta(days=offset)
+            if not self.matches_day(current):
+                continue
+
+            # En el primer día solo cuentan las horas que aún no pasaron
+            min_hour, min_minute = (start.hour, start.minute) if offset == 0 else (0, 0)
+            index = bisect_left(self.hours, min_hour)
+            while index < len(self.hours):
+                hour = self.hours[index]
+                first_minute = min_minute if hour == min_hour else 0
+                minute_index = bisect_left(self.minutes, first_minute)
+                if minute_index < len(self.minutes):
+                    return current.replace(hour=hour, minute=self.minutes[minute_index])
+                index += 1
+        return None
+
+    def __eq__(self, other):
+        return isinstance(other, CronExpression) and self.expression == other.expression
+
+    def __repr__(self):
+        return f"CronExpression('{self.expression}')"
+
+
+@dataclass
+class Schedule:
+    """Programación de un flujo: cuándo se ejecuta según su recurrencia.
+
+    - Diaria: todos los días a 'time_of_day'.
+    - Semanal: los días de 'weekdays' (0 = lunes) a 'time_of_day'.
+    - Mensual: el día 'month_day' (o el último día si el mes es más corto) a 'time_of_day'.
+    - Personalizada: según la expresión 'cron'.
+    """
+    time_of_day: time = time(0, 0)
+    weekdays: List[int] = field(default_factory=list)
+    month_day: Optional[int] = None
+    cron: str = ""
+
+    def validate(self) -> None:
+        """Valida los valores de la programación"""
+        if any(day < 0 or day > 6 for day in self.weekdays):
+            raise ValueError("Los días de la semana deben estar entre 0 (lunes) y 6 (domingo)")
+        if self.month_day is not None and not 1 <= self.month_day <= 31:
+            raise ValueError("El día del mes debe estar entre 1 y 31")
+        if self.cron:
+            CronExpression(self.cron)
+
+    def next_after(self, recurrence: str, after: datetime) -> Optional[datetime]:
+        """Calcula la siguiente ejecución estrictamente posterior a 'after'.
+
+        'recurrence' es el valor de RecurrenceType (Diaria, Semanal, ...).
+        """
+        if recurrence == "Personalizada":
+            if not self.cron:
+                return None
+            return CronExpression(self.cron).next_after(after)
+
+        day = after.replace(hour=0, minute=0, second=0, microsecond=0)
+        for offset in range(63):
+            current = day + timedelta(days=offset)
+            if not self._runs_on(recurrence, current):
+                continue
+            candidate = datetime.combine(current.date(), self.time_of_day)
+            if candidate > after:
+                return candidate
+        return None
+
+    def _runs_on(self, recurrence: str, day: datetime) -> bool:
+        if recurrence == "Semanal":
+            return day.weekday() in (self.weekdays or [0])
+        if recurrence == "Mensual":
+            last_day = calendar.monthrange(day.year, day.month)[1]
+            return day.day == min(self.month_day or 1, last_day)
+        return True
+
+    def describe(self, recurrence: str) -> str:
+        """Descripción legible de la programación"""
+        at = self.time_of_day.strftime('%H:%M')
+        if recurrence == "Personalizada":
+            return f"Cron: {self.cron}" if self.cron else "Sin programación"
+        if recurrence == "Semanal":
+            days = ", ".join(WEEKDAY_NAMES[day] for day in (self.weekdays or [0]))
+            return f"Cada {days} a las {at}"
+        if recurrence == "Mensual":
+            return f"El día {self.month_day or 1} de cada mes a las {at}"
+        return f"Todos los días a las {at}"
+
+
+class ScheduledFlow(NamedTuple):
+    """Proyección liviana de un flujo con solo los datos de su programación.
+
+    Se usa para análisis masivos, donde construir entidades Flow completas
+    para cientos de miles de filas sería innecesariamente costoso.
+    """
+    id: int
+    project_id: int
+    owner: str
+    recurrence: str
+    time_of_day: str  # 'HH:MM'
+    weekdays: str  # días separados por coma, 0 = lunes
+    month_day: Optional[int]
+    cron: str
+    name: str = ""
+    connection: str = ""
+    estimated_duration: int = 5  # minutos
+
+    def to_schedule(self) -> Schedule:
+        """Convierte las columnas de la programación en un Schedule"""
+        return Schedule(
+            time_of_day=time.fromisoformat(self.time_of_day),
+            weekdays=[int(day) for day in self.weekdays.split(',') if day],
+            month_day=self.month_day,
+            cron=self.cron
+        )
@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.entities.change import Change
+
+class ChangeLogRepository(ABC):
+    """Interfaz para el registro de cambios de proyectos y flujos"""
+
+    @abstractmethod
+    def get_since(self, cursor: int, limit: int) -> List[Change]:
+        """Obtiene los cambios con seq mayor que el cursor, en orden, hasta 'limit'"""
+        pass
+
+    @abstractmethod
+    def get_cursor(self) -> int:
+        """Obtiene el seq del último cambio registrado (0 si no hay ninguno)"""
+        pass
+
+    @abstractmethod
+    def get_data_version(self) -> int:
+        """Valor de PRAGMA data_version de la conexión: cambia cuando otra conexión confirma escrituras"""
+        pass
+
+    @abstractmethod
+    def last_own_change(self, seq: int) -> Optional[int]:
+        """Si esta instancia escribió el cambio seq, devuelve el último seq escrito junto con él; si no, None"""
+        pass
+
+    @abstractmethod
+    def prune(self, up_to_seq: int) -> int:
+        """Elimina los cambios con seq <= up_to_seq (salvo el último); devuelve cuántos eliminó"""
+        pass
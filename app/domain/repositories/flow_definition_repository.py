@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+from app.domain.entities.flow_definition import DefinitionStorageStats, DefinitionVersion
+
+class FlowDefinitionRepository(ABC):
+    """Interfaz para el almacén de definiciones, direccionado por contenido"""
+
+    @abstractmethod
+    def save_many(self, definitions: Sequence[str]) -> List[str]:
+        """Guarda definiciones (texto canónico) y devuelve el hash de cada una.
+
+        Las definiciones ya guardadas no se vuelven a escribir.
+        """
+        pass
+
+    @abstractmethod
+    def get(self, definition_hash: str) -> Optional[str]:
+        """Obtiene el texto de una definición por su hash"""
+        pass
+
+    @abstractmethod
+    def add_versions(self, versions: Sequence[Tuple[int, str]]) -> None:
+        """Registra pares (flow_id, hash) en el historial de versiones de cada flujo"""
+        pass
+
+    @abstractmethod
+    def get_versions(self, flow_id: int) -> List[DefinitionVersion]:
+        """Obtiene las versiones de la definición de un flujo, de la más reciente a la más antigua"""
+        pass
+
+    @abstractmethod
+    def get_storage_stats(self) -> DefinitionStorageStats:
+        """Obtiene el espacio ocupado por las definiciones"""
+        pass
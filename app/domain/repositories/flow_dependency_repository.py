@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+from app.domain.entities.flow_dependency import DependencyKind, FlowDependency, ImpactedFlow
+
+class FlowDependencyRepository(ABC):
+    """Interfaz para el repositorio de dependencias entre flujos"""
+
+    @abstractmethod
+    def add_many(self, dependencies: Sequence[FlowDependency]) -> int:
+        """Agrega dependencias en una transacción, ignorando las que ya existen.
+
+        Devuelve la cantidad de dependencias nuevas.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, source_flow_id: int, target_flow_id: int,
+               kind: Optional[DependencyKind] = None) -> bool:
+        """Elimina la dependencia entre dos flujos (de un tipo o de todos)"""
+        pass
+
+    @abstractmethod
+    def get_for_flows(self, flow_ids: Sequence[int]) -> List[FlowDependency]:
+        """Obtiene las dependencias que entran o salen de alguno de los flujos"""
+        pass
+
+    @abstractmethod
+    def get_edges(self) -> List[Tuple[int, int]]:
+        """Obtiene todas las aristas (source, target) del grafo"""
+        pass
+
+    @abstractmethod
+    def get_downstream(self, flow_ids: Sequence[int]) -> List[ImpactedFlow]:
+        """Obtiene los flujos que dependen, directa o indirectamente, de los indicados"""
+        pass
+
+    @abstractmethod
+    def get_upstream(self, flow_ids: Sequence[int]) -> List[ImpactedFlow]:
+        """Obtiene los flujos de los que dependen, directa o indirectamente, los indicados"""
+        pass
+
+    @abstractmethod
+    def get_revision(self) -> int:
+        """Obtiene un número que cambia cada vez que se modifica el grafo"""
+        pass
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+from app.domain.entities.flow_inventory import ComponentKind, ConnectorMatch, ConnectorUsage, FlowComponent
+
+class FlowInventoryRepository(ABC):
+    """Interfaz para el índice de conectores, desencadenadores y acciones de los flujos.
+
+    El índice se guarda por definición (hash): los flujos que comparten una
+    definición comparten su inventario.
+    """
+
+    @abstractmethod
+    def get_unindexed_definitions(self, hashes: Optional[Sequence[str]] = None) -> List[str]:
+        """Obtiene los hashes de definiciones usadas por algún flujo que aún no se analizaron.
+
+        Con 'hashes' se limita la búsqueda a esas definiciones.
+        """
+        pass
+
+    @abstractmethod
+    def add_definitions(self, entries: Sequence[Tuple[str, List[FlowComponent]]]) -> None:
+        """Guarda en una transacción el inventario de cada (hash, componentes)"""
+        pass
+
+    @abstractmethod
+    def find_flows(self, connector: str, operation: Optional[str] = None,
+                   kind: Optional[ComponentKind] = None, project_id: Optional[int] = None,
+                   limit: Optional[int] = None) -> List[ConnectorMatch]:
+        """Obtiene los flujos que usan un conector (y opcionalmente una operación).
+
+        Con 'limit' se devuelven solo las primeras coincidencias.
+        """
+        pass
+
+    @abstractmethod
+    def count_by_connector(self) -> List[ConnectorUsage]:
+        """Obtiene el uso de cada conector, del más usado al menos usado"""
+        pass
+
+    @abstractmethod
+    def get_operations(self, connector: str) -> List[Tuple[str, str, int]]:
+        """Obtiene (tipo, operación, flujos) de las operaciones usadas de un conector"""
+        pass
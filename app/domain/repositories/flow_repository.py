@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from app.domain.entities.flow import Flow
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+from app.domain.entities.flow import Flow, FlowRecord, FlowStatus
+from app.domain.entities.schedule import ScheduledFlow
 
 class FlowRepository(ABC):
     """Interfaz para el repositorio de flujos"""
@@ -10,6 +12,11 @@ class FlowRepository(ABC):
         """Obtiene todos los flujos de un proyecto"""
         pass
     
+    @abstractmethod
+    def get_page_by_project(self, project_id: int, offset: int, limit: int) -> Tuple[List[Flow], int]:
+        """Obtiene una página de los flujos de un proyecto y el total de flujos del proyecto"""
+        pass
+    
     @abstractmethod
     def get_by_id(self, flow_id: int) -> Optional[Flow]:
         """Obtiene un flujo por su ID"""
@@ -28,4 +35,53 @@ class FlowRepository(ABC):
     @abstractmethod
     def delete(self, flow_id: int) -> bool:
         """Elimina un flujo por su ID"""
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    def get_due_between(self, start: datetime, end: datetime) -> List[Flow]:
+        """Obtiene los flujos activos cuya próxima ejecución está en [start, end)"""
+        pass
+    
+    @abstractmethod
+    def has_pending_schedule(self, now: datetime) -> bool:
+        """Indica si algún flujo activo no tiene próxima ejecución o la tiene vencida"""
+        pass
+    
+    @abstractmethod
+    def get_pending_schedule(self, now: datetime, after_id: int = 0,
+                             limit: int = 1000) -> List[ScheduledFlow]:
+        """Obtiene, en orden de ID, un bloque de flujos activos sin próxima ejecución o con una ya vencida"""
+        pass
+    
+    @abstractmethod
+    def update_next_runs(self, next_runs: List[Tuple[int, Optional[datetime]]]) -> None:
+        """Actualiza en bloque la próxima ejecución de varios flujos"""
+        pass
+    
+    @abstractmethod
+    def get_active_schedules(self) -> List[ScheduledFlow]:
+        """Obtiene la programación de todos los flujos activos (lectura masiva)"""
+        pass
+    
+    @abstractmethod
+    def upsert_many(self, flows: List[Flow]) -> int:
+        """Crea o actualiza (por proyecto y external_id) un lote de flujos en una transacción.
+        
+        Asigna el ID a cada flujo y devuelve cuántos eran nuevos.
+        """
+        pass
+    
+    @abstractmethod
+    def iter_records(self, project_id: Optional[int] = None, status: Optional[FlowStatus] = None,
+                     batch_size: int = 1000) -> Iterator[FlowRecord]:
+        """Recorre las filas de los flujos (opcionalmente de un proyecto o estado) leyéndolas por bloques"""
+        pass
+    
+    @abstractmethod
+    def set_status(self, status: FlowStatus, flow_ids: Optional[Sequence[int]] = None,
+                   project_id: Optional[int] = None) -> int:
+        """Cambia en bloque el estado de varios flujos o de todos los de un proyecto.
+        
+        Devuelve la cantidad de flujos modificados.
+        """
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Sequence
+from app.domain.entities.flow_run import FlowRun, FlowHealth
+
+class FlowRunRepository(ABC):
+    """Interfaz para el repositorio del historial de ejecuciones"""
+
+    @abstractmethod
+    def add_runs(self, runs: Sequence[FlowRun]) -> int:
+        """Guarda un lote de ejecuciones y actualiza sus resúmenes diarios.
+
+        Una ejecución ya registrada (mismo flujo e inicio) se reemplaza.
+        Devuelve la cantidad de ejecuciones guardadas.
+        """
+        pass
+
+    @abstractmethod
+    def get_runs(self, flow_id: int, start: datetime, end: datetime) -> List[FlowRun]:
+        """Obtiene las ejecuciones de un flujo iniciadas en [start, end)"""
+        pass
+
+    @abstractmethod
+    def get_project_health(self, project_id: int, since: datetime) -> Dict[int, FlowHealth]:
+        """Obtiene la salud de los flujos de un proyecto desde un día, por ID de flujo"""
+        pass
@@ -1,6 +1,6 @@
 # app/domain/repositories/project_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.domain.entities.project import Project
 
 class ProjectRepository(ABC):
@@ -11,6 +11,11 @@ class ProjectRepository(ABC):
         """Obtiene todos los proyectos"""
         pass
     
+    @abstractmethod
+    def get_page(self, offset: int, limit: int) -> Tuple[List[Project], int]:
+        """Obtiene una página de proyectos (mismo orden que get_all) y el total"""
+        pass
+    
     @abstractmethod
     def get_by_id(self, project_id: int) -> Optional[Project]:
         """Obtiene un proyecto por su ID"""
@@ -30,6 +35,11 @@ class ProjectRepository(ABC):
     def delete(self, project_id: int) -> bool:
         """Elimina un proyecto por su ID"""
         pass
+    
+    @abstractmethod
+    def upsert_by_external_id(self, project: Project) -> Project:
+        """Crea el proyecto o, si ya existe uno con el mismo external_id, actualiza su nombre"""
+        pass
 
 # app/domain/repositories/flow_repository.py
 from abc import ABC, abstractmethod
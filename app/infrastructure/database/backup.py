@@ -0,0 +1,224 @@
+# app/infrastructure/database/backup.py
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+from app.config import BACKUP
+
+_TIMESTAMP_FORMAT = '%Y%m%d-%H%M%S-%f'
+_SUFFIX = '.db.gz'
+
+
+class BackupInfo(NamedTuple):
+    """Copia de seguridad guardada"""
+    path: str
+    created_at: datetime
+    size: int  # bytes del archivo comprimido
+
+
+class BackupResult(NamedTuple):
+    """Resultado de una copia: dónde quedó y cuánto bloqueó la base"""
+    path: str
+    pages: int
+    steps: int
+    restarts: int
+    seconds: float
+    max_step_ms: float        # paso más largo (tiempo con la base tomada)
+    database_bytes: int
+    backup_bytes: int
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+class BackupManager:
+    """Copias de seguridad en línea con la API de backup de SQLite.
+
+    La copia avanza de a pages_per_step páginas con una pausa entre pasos,
+    así que ningún paso retiene la base más que unos milisegundos. En modo
+    WAL la conexión de origen mantiene abierta una transacción de lectura
+    durante toda la copia: la instantánea es consistente, las escrituras de
+    los demás siguen (WAL no bloquea a los escritores) y la copia no se
+    reinicia. Sin WAL (perfil 'shared') la lectura bloquearía a los
+    escritores, así que cada paso es una lectura corta; si otra conexión
+    escribe, SQLite reinicia la copia, y tras max_restarts reinicios se copia
+    lo que falta en un solo paso.
+
+    Las copias se verifican (PRAGMA quick_check), se comprimen con gzip, se
+    nombran con la fecha y se rotan conservando las 'keep' más recientes.
+    """
+
+    def __init__(self, db_path: str, backup_dir: str = BACKUP['dir'], keep: int = BACKUP['keep'],
+                 pages_per_step: int = BACKUP['pages_per_step'],
+                 step_pause_ms: float = BACKUP['step_pause_ms'],
+                 max_restarts: int = BACKUP['max_restarts'],
+                 compress_level: int = BACKUP['compress_level']):
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+        self.step_pause_ms = step_pause_ms
+        self.max_restarts = max_restarts
+        self.compress_level = compress_level
+        self.prefix = os.path.splitext(os.path.basename(db_path))[0] + '-'
+
+    # --- Copia ---
+
+    def create_backup(self) -> BackupResult:
+        """Copia la base en línea, la verifica, la comprime y rota las copias antiguas"""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        created_at = datetime.now()
+        path = os.path.join(self.backup_dir, f"{self.prefix}{created_at.strftime(_TIMESTAMP_FORMAT)}{_SUFFIX}")
+        snapshot = path[:-len('.gz')] + '.tmp'
+
+        started = time.perf_counter()
+        try:
+            pages, steps, restarts, max_step = self._copy(snapshot)
+            # Tamaño de la copia sin comprimir: el archivo principal no incluye lo que sigue en el WAL
+            database_bytes = os.path.getsize(snapshot)
+            self._verify(snapshot, 'quick_check')
+            self._compress(snapshot, path)
+        finally:
+            _remove(snapshot)
+        seconds = time.perf_counter() - started
+
+        self.rotate()
+        return BackupResult(
+            path=path,
+            pages=pages,
+            steps=steps,
+            restarts=restarts,
+            seconds=round(seconds, 3),
+            max_step_ms=round(max_step * 1000, 3),
+            database_bytes=database_bytes,
+            backup_bytes=os.path.getsize(path)
+        )
+
+    def _copy(self, snapshot: str):
+        source = sqlite3.connect(self.db_path, isolation_level=None)
+        target = sqlite3.connect(snapshot)
+        stats = {'steps': 0, 'restarts': 0, 'max_step': 0.0, 'pages': 0, 'remaining': None}
+        step_started = [time.perf_counter()]
+        pause = self.step_pause_ms / 1000
+
+        def progress(status, remaining, total):
+            stats['max_step'] = max(stats['max_step'], time.perf_counter() - step_started[0])
+            stats['steps'] += 1
+            stats['pages'] = total
+            if stats['remaining'] is not None and remaining > stats['remaining']:
+                stats['restarts'] += 1
+                if stats['restarts'] > self.max_restarts:
+                    raise _TooManyRestarts()
+            stats['remaining'] = remaining
+            if remaining:
+                time.sleep(pause)
+            step_started[0] = time.perf_counter()
+
+        try:
+            wal = source.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            if wal:
+                # Instantánea fija para toda la copia (no bloquea a los escritores en WAL)
+                source.execute('BEGIN')
+                source.execute('SELECT COUNT(*) FROM sqlite_master').fetchone()
+            try:
+                source.backup(target, pages=self.pages_per_step, progress=progress)
+            except _TooManyRestarts:
+                # Escrituras continuas: se copia todo en un paso (retiene la base durante la copia)
+                step_started[0] = time.perf_counter()
+                source.backup(target, pages=-1, progress=progress)
+            if wal:
+                source.execute('COMMIT')
+            # La instantánea queda como un archivo autónomo (sin -wal)
+            target.execute('PRAGMA journal_mode = DELETE')
+        finally:
+            source.close()
+            target.close()
+        return stats['pages'], stats['steps'], stats['restarts'], stats['max_step']
+
+    def _compress(self, snapshot: str, path: str) -> None:
+        partial = path + '.part'
+        try:
+            with open(snapshot, 'rb') as source, gzip.open(partial, 'wb', compresslevel=self.compress_level) as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            os.replace(partial, path)
+        finally:
+            _remove(partial)
+
+    # --- Listado y rotación ---
+
+    def list_backups(self) -> List[BackupInfo]:
+        """Copias de esta base, de la más reciente a la más antigua"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        backups = []
+        for name in os.listdir(self.backup_dir):
+            if not (name.startswith(self.prefix) and name.endswith(_SUFFIX)):
+                continue
+            try:
+                created_at = datetime.strptime(name[len(self.prefix):-len(_SUFFIX)], _TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+            path = os.path.join(self.backup_dir, name)
+            backups.append(BackupInfo(path, created_at, os.path.getsize(path)))
+        return sorted(backups, key=lambda backup: backup.created_at, reverse=True)
+
+    def rotate(self) -> List[str]:
+        """Elimina las copias que exceden 'keep'; devuelve las rutas eliminadas"""
+        removed = [backup.path for backup in self.list_backups()[self.keep:]]
+        for path in removed:
+            os.remove(path)
+        return removed
+
+    def is_due(self, interval_hours: float = BACKUP['interval_hours'], now: Optional[datetime] = None) -> bool:
+        """Indica si la última copia es más antigua que el intervalo (o si no hay ninguna)"""
+        backups = self.list_backups()
+        now = now or datetime.now()
+        return not backups or now - backups[0].created_at >= timedelta(hours=interval_hours)
+
+    # --- Restauración ---
+
+    def restore(self, backup_path: str, target_path: Optional[str] = None) -> None:
+        """Restaura una copia sobre la base (o sobre target_path) tras verificar su integridad.
+
+        La copia se descomprime al lado del destino y se revisa completa con
+        PRAGMA integrity_check; si está dañada no se toca la base. El
+        contenido se vuelca con la API de backup, así que las conexiones
+        abiertas ven la base restaurada sin reabrir el archivo.
+        """
+        target_path = target_path or self.db_path
+        restored = target_path + '.restore'
+        try:
+            with gzip.open(backup_path, 'rb') as source, open(restored, 'wb') as target:
+                shutil.copyfileobj(source, target, 1024 * 1024)
+            self._verify(restored, 'integrity_check')
+
+            source = sqlite3.connect(restored)
+            target = sqlite3.connect(target_path)
+            try:
+                source.backup(target, pages=self.pages_per_step)
+            finally:
+                source.close()
+                target.close()
+        except (OSError, EOFError, sqlite3.DatabaseError) as e:
+            raise ValueError(f"No se pudo restaurar la copia {os.path.basename(backup_path)}: {e}")
+        finally:
+            _remove(restored)
+
+    @staticmethod
+    def _verify(path: str, check: str) -> None:
+        connection = sqlite3.connect(path)
+        try:
+            rows = [row[0] for row in connection.execute(f'PRAGMA {check}')]
+        finally:
+            connection.close()
+        if rows != ['ok']:
+            raise ValueError(f"La copia no superó la verificación de integridad: {'; '.join(rows[:5])}")
+
+
+def _remove(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
@@ -1,11 +1,32 @@
 # app/infrastructure/database/connection.py
 import sqlite3
 import os
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Callable, Dict, List, Optional
+from app.config import DATABASE, QUERY_LOG
+from app.infrastructure.database.pragmas import apply_pragmas
+from app.infrastructure.database.query_log import QueryLog
+from app.infrastructure.database.writer import DatabaseWriter, WrittenChanges
+from app.utils.tracing import propagate, traced, tracer
+
+
+def _describe_query(self, query: str, *args, **kwargs) -> Dict[str, Any]:
+    # SQL de la consulta para la traza (solo con las trazas activadas)
+    return {'sql': ' '.join(query.split())[:300]}
+
 
 class Database:
-    """Clase para gestionar la conexión a la base de datos SQLite"""
+    """Clase para gestionar la conexión a la base de datos SQLite.
+    
+    Cada hilo usa su propia conexión (sqlite3 no permite compartirlas), así
+    que los repositorios pueden llamarse desde un pool de hilos. Las
+    escrituras de los repositorios pasan por write(), que las serializa en
+    un único hilo escritor con commits agrupados; execute() queda para el
+    DDL del esquema y las tareas de mantenimiento.
+    """
     
     _instance = None
     
@@ -16,10 +37,18 @@ class Database:
             cls._instance._initialized = False
         return cls._instance
     
-    def __init__(self, db_path: str = None):
-        """Inicializa la conexión a la base de datos"""
+    def __init__(self, db_path: str = None, profile: str = None):
+        """Inicializa la conexión a la base de datos.
+        
+        profile es uno de los perfiles de PRAGMA de config.DATABASE['profiles']
+        (por defecto DATABASE['profile']).
+        """
         if self._initialized:
             return
+        
+        profile = profile or DATABASE['profile']
+        if profile not in DATABASE['profiles']:
+            raise ValueError(f"Perfil de base de datos desconocido: {profile}")
             
         # Si no se proporciona una ruta, usamos una por defecto
         if db_path is None:
@@ -30,42 +59,132 @@ class Database:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self.db_path = db_path
-        self.connection = None
+        self.profile = profile
+        self.pragmas = DATABASE['profiles'][profile]
+        self._local = threading.local()
+        self._writer: Optional[DatabaseWriter] = None
+        self._writer_lock = threading.Lock()
+        # Cambios de change_log escritos por este proceso (sobrevive a los reinicios del escritor)
+        self.written_changes = WrittenChanges()
+        # Registro de consultas (opcional: PA_QUERY_LOG=1 o el panel de diagnóstico)
+        self.query_log: Optional[QueryLog] = QueryLog() if QUERY_LOG['enabled'] else None
         self._initialized = True
     
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """Conexión del hilo actual (None si todavía no se abrió)"""
+        return getattr(self._local, 'connection', None)
+    
+    @connection.setter
+    def connection(self, value: Optional[sqlite3.Connection]):
+        self._local.connection = value
+    
     def connect(self):
         """Establece la conexión a la base de datos"""
         if self.connection is None:
             self.connection = sqlite3.connect(self.db_path)
             self.connection.row_factory = sqlite3.Row
+            apply_pragmas(self.connection, self.pragmas)
         return self.connection
     
     def disconnect(self):
-        """Cierra la conexión a la base de datos"""
+        """Cierra la conexión del hilo actual y detiene el hilo escritor (se reinicia al volver a escribir)"""
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
         if self.connection:
             self.connection.close()
             self.connection = None
     
+    @property
+    def writer(self) -> DatabaseWriter:
+        """Hilo escritor de la base (se inicia con la primera escritura)"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = DatabaseWriter(self.db_path, self.pragmas, written_changes=self.written_changes,
+                                              query_log=lambda: self.query_log)
+            return self._writer
+    
+    def enable_query_log(self, query_log: Optional[QueryLog] = None) -> QueryLog:
+        """Empieza a registrar las consultas (con un QueryLog nuevo si no se indica uno)"""
+        if self.query_log is None or query_log is not None:
+            self.query_log = query_log or QueryLog()
+        return self.query_log
+    
+    def disable_query_log(self) -> None:
+        """Deja de registrar las consultas y cierra el log"""
+        if self.query_log is not None:
+            self.query_log.close()
+            self.query_log = None
+    
+    def write(self, job: Callable[..., Any], *args) -> Future:
+        """Encola job(conexión, *args) en el hilo escritor; el futuro se resuelve tras el commit"""
+        if tracer.enabled:
+            # En la traza, la escritura queda como hija del span que la pidió
+            job = propagate(job, 'Database.write_job', 'sqlite')
+        return self.writer.submit(job, *args)
+    
+    @traced(category='sqlite', describe=_describe_query)
     def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Ejecuta una consulta SQL"""
+        started = time.perf_counter()
+        cursor = self._execute(query, params)
+        if self.query_log is not None:
+            # En un SELECT las filas se leen después: rowcount es -1
+            self.query_log.record(self.connection, query, params, started,
+                                  cursor.rowcount if cursor.rowcount >= 0 else None)
+        return cursor
+    
+    def _execute(self, query: str, params: tuple) -> sqlite3.Cursor:
         connection = self.connect()
         cursor = connection.cursor()
         cursor.execute(query, params)
         connection.commit()
         return cursor
     
+    @traced(category='sqlite', describe=_describe_query)
+    def execute_many(self, query: str, params_list) -> sqlite3.Cursor:
+        """Ejecuta una consulta SQL para cada conjunto de parámetros en una sola transacción"""
+        connection = self.connect()
+        cursor = connection.cursor()
+        started = time.perf_counter()
+        cursor.executemany(query, params_list)
+        connection.commit()
+        if self.query_log is not None:
+            self.query_log.record_many(connection, query, params_list, started, cursor.rowcount)
+        return cursor
+    
+    @traced(category='sqlite', describe=_describe_query)
+    def fetch_tuples(self, query: str, params: tuple = ()) -> List[tuple]:
+        """Ejecuta una consulta y devuelve las filas como tuplas (sin convertir a diccionarios)"""
+        cursor = self.connect().cursor()
+        cursor.row_factory = None
+        started = time.perf_counter()
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        if self.query_log is not None:
+            self.query_log.record(self.connection, query, params, started, len(rows))
+        return rows
+    
+    @traced(category='sqlite', describe=_describe_query)
     def fetch_one(self, query: str, params: tuple = ()) -> Optional[Dict[str, Any]]:
         """Ejecuta una consulta y devuelve un solo resultado"""
-        cursor = self.execute(query, params)
-        result = cursor.fetchone()
+        started = time.perf_counter()
+        result = self._execute(query, params).fetchone()
+        if self.query_log is not None:
+            self.query_log.record(self.connection, query, params, started, 1 if result else 0)
         if result:
             return dict(result)
         return None
     
+    @traced(category='sqlite', describe=_describe_query)
     def fetch_all(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
         """Ejecuta una consulta y devuelve todos los resultados"""
-        cursor = self.execute(query, params)
-        results = cursor.fetchall()
+        started = time.perf_counter()
+        results = self._execute(query, params).fetchall()
+        if self.query_log is not None:
+            self.query_log.record(self.connection, query, params, started, len(results))
         return [dict(row) for row in results]
 
 # app/infrastructure/database/schema.py
@@ -0,0 +1,12 @@
+# app/infrastructure/database/pragmas.py
+import sqlite3
+from typing import Any, Dict
+
+
+def apply_pragmas(connection: sqlite3.Connection, pragmas: Dict[str, Any]) -> None:
+    """Aplica un perfil de PRAGMA (config.DATABASE['profiles']) a una conexión.
+    
+    busy_timeout va primero: cambiar journal_mode puede tener que esperar un bloqueo.
+    """
+    for name in sorted(pragmas, key=lambda name: name != 'busy_timeout'):
+        connection.execute(f"PRAGMA {name} = {pragmas[name]}")
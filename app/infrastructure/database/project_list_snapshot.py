@@ -0,0 +1,62 @@
+# app/infrastructure/database/project_list_snapshot.py
+import json
+import os
+from typing import Any, Dict, List, NamedTuple, Optional
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import SCHEMA_VERSION
+
+# Formato del archivo (subirlo si cambian los campos de los proyectos guardados)
+FORMAT_VERSION = 1
+
+
+class Snapshot(NamedTuple):
+    """Listado de proyectos guardado y la versión de los datos con que se leyó"""
+    change_seq: int
+    projects: List[Dict[str, Any]]
+
+
+class ProjectListSnapshot:
+    """Copia local del último listado de proyectos, para mostrarlo al arrancar sin consultar la base.
+
+    Se guarda junto a la base (<base>-project-list.json) con la versión del
+    esquema y el último seq del registro de cambios leído antes de la
+    consulta: si la base sigue en ese seq, la copia está al día; si no, sirve
+    para pintar de inmediato mientras se lee el listado actual. Una copia de
+    otro formato o de otra versión del esquema se ignora.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        db_path = db_path or Database().db_path
+        self.path = os.path.splitext(db_path)[0] + '-project-list.json'
+
+    def load(self) -> Optional[Snapshot]:
+        try:
+            with open(self.path, encoding='utf-8') as source:
+                data = json.load(source)
+        except (OSError, ValueError):
+            return None
+        if data.get('format') != FORMAT_VERSION or data.get('schema_version') != SCHEMA_VERSION:
+            return None
+        return Snapshot(data['change_seq'], data['projects'])
+
+    def save(self, projects: List[Dict[str, Any]], change_seq: int) -> None:
+        """Guarda el listado (se escribe en un temporal y se reemplaza: nunca queda a medias)"""
+        data = {
+            'format': FORMAT_VERSION,
+            'schema_version': SCHEMA_VERSION,
+            'change_seq': change_seq,
+            'projects': projects,
+        }
+        temporary = self.path + '.tmp'
+        try:
+            with open(temporary, 'w', encoding='utf-8') as output:
+                json.dump(data, output, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"No se pudo guardar el listado de proyectos: {e}")
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
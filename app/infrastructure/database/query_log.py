@@ -0,0 +1,201 @@
+# app/infrastructure/database/query_log.py
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+from app.config import QUERY_LOG
+
+# Sentencias a las que se les puede pedir EXPLAIN QUERY PLAN
+_EXPLAINABLE = ('SELECT', 'WITH', 'UPDATE', 'DELETE', 'INSERT', 'REPLACE')
+
+# Paso del plan que recorre una tabla completa ("SCAN flows", sin índice)
+_FULL_SCAN = re.compile(r'^SCAN (\w+)$')
+
+
+class QueryRecord(NamedTuple):
+    """Consulta lenta con su plan de ejecución"""
+    executed_at: datetime
+    sql: str
+    params: str               # forma de los parámetros (tipos, no valores)
+    ms: float
+    rows: Optional[int]       # filas devueltas o modificadas (None si no se sabe)
+    plan: List[str]
+    full_scans: List[str]     # tablas recorridas completas según el plan
+    thread: str
+
+
+class QueryStats:
+    """Acumulado de una sentencia (mismo texto SQL)"""
+
+    __slots__ = ('sql', 'count', 'total_ms', 'max_ms', 'rows', 'slow', 'full_scans')
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.full_scans: List[str] = []
+
+
+def normalize_sql(sql: str) -> str:
+    return ' '.join(sql.split())
+
+
+def params_shape(params: Any) -> str:
+    """Describe los parámetros por su tipo (los valores no se registran)"""
+    if not params:
+        return ''
+    if isinstance(params, dict):
+        return '{' + ', '.join(f"{key}: {type(value).__name__}" for key, value in params.items()) + '}'
+    return '(' + ', '.join(type(value).__name__ for value in params) + ')'
+
+
+class QueryLog:
+    """Registro opcional de las consultas que pasan por Database.
+
+    Por cada sentencia guarda el texto SQL, la forma de los parámetros, el
+    tiempo y las filas devueltas, acumulados por sentencia y escritos (una
+    línea JSON por sentencia) en un log rotativo. Las que tardan al menos
+    slow_ms se guardan además con su EXPLAIN QUERY PLAN, obtenido en la misma
+    conexión, y se marcan las tablas que el plan recorre completas: así se ve
+    enseguida una consulta sin índice. El plan se pide una vez por sentencia
+    (reset() lo descarta, por ejemplo después de crear un índice).
+    """
+
+    def __init__(self, slow_ms: float = QUERY_LOG['slow_ms'], log_file: Optional[str] = QUERY_LOG['log_file'],
+                 max_bytes: int = QUERY_LOG['max_bytes'], backup_count: int = QUERY_LOG['backup_count'],
+                 recent: int = QUERY_LOG['recent']):
+        self.slow_ms = slow_ms
+        self.log_file = log_file
+        self.slow_queries: deque = deque(maxlen=recent)
+        self.stats: Dict[str, QueryStats] = {}
+        self._plans: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+        self._logger: Optional[logging.Logger] = None
+        if log_file:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            self._handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                encoding='utf-8')
+            self._handler.setFormatter(logging.Formatter('%(message)s'))
+            self._logger = logging.getLogger(f"{__name__}.{id(self)}")
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+            self._logger.addHandler(self._handler)
+
+    def record(self, connection: sqlite3.Connection, sql: str, params: Any,
+               started: float, rows: Optional[int]) -> None:
+        """Registra una sentencia ejecutada en connection desde started (time.perf_counter)"""
+        ms = (time.perf_counter() - started) * 1000
+        key = normalize_sql(sql)
+        shape = params_shape(params)
+        slow = ms >= self.slow_ms
+        plan = full_scans = None
+        if slow:
+            plan = self._explain(connection, key, params)
+            full_scans = [match.group(1) for match in map(_FULL_SCAN.match, plan) if match]
+
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = QueryStats(key)
+            stats.count += 1
+            stats.total_ms += ms
+            stats.max_ms = max(stats.max_ms, ms)
+            stats.rows += rows or 0
+            if slow:
+                stats.slow += 1
+                stats.full_scans = full_scans
+                self.slow_queries.append(QueryRecord(
+                    datetime.now(), key, shape, round(ms, 3), rows, plan, full_scans,
+                    threading.current_thread().name
+                ))
+
+        if self._logger:
+            entry = {'sql': key, 'params': shape, 'ms': round(ms, 3), 'rows': rows}
+            if slow:
+                entry.update(slow=True, plan=plan, full_scans=full_scans)
+            self._logger.info(json.dumps(entry, ensure_ascii=False))
+
+    def record_many(self, connection: sqlite3.Connection, sql: str, params_list: Sequence,
+                    started: float, rows: Optional[int]) -> None:
+        """Registra un executemany (la forma es la del primer conjunto de parámetros)"""
+        params = params_list[0] if isinstance(params_list, (list, tuple)) and params_list else ()
+        self.record(connection, sql, params, started, rows)
+
+    def _explain(self, connection: sqlite3.Connection, sql: str, params: Any) -> List[str]:
+        if not sql.lstrip('(').upper().startswith(_EXPLAINABLE):
+            return []
+        with self._lock:
+            if sql in self._plans:
+                return self._plans[sql]
+        try:
+            cursor = connection.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute('EXPLAIN QUERY PLAN ' + sql, params or ()).fetchall()
+            plan = [row[3] for row in rows]
+        except sqlite3.Error as e:
+            plan = [f"(sin plan: {e})"]
+        with self._lock:
+            self._plans[sql] = plan
+        return plan
+
+    def top(self, limit: int = 50) -> List[QueryStats]:
+        """Sentencias con más tiempo acumulado"""
+        with self._lock:
+            stats = list(self.stats.values())
+        return sorted(stats, key=lambda item: item.total_ms, reverse=True)[:limit]
+
+    def recent_slow(self) -> List[QueryRecord]:
+        """Consultas lentas recientes, de la más nueva a la más antigua"""
+        with self._lock:
+            return list(reversed(self.slow_queries))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.slow_queries.clear()
+            self.stats = {}
+            self._plans = {}
+
+    def close(self) -> None:
+        if self._logger:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._logger = None
+
+
+class LoggedConnection:
+    """Conexión que registra en un QueryLog lo que se ejecuta con execute/executemany.
+
+    El hilo escritor se la pasa a las escrituras cuando el registro está
+    activo; el resto de atributos van a la conexión real.
+    """
+
+    def __init__(self, connection: sqlite3.Connection, query_log: QueryLog):
+        self._connection = connection
+        self._query_log = query_log
+
+    def execute(self, sql: str, params: Any = ()) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = self._connection.execute(sql, params)
+        # En un SELECT las filas se leen después: rowcount es -1
+        self._query_log.record(self._connection, sql, params, started,
+                               cursor.rowcount if cursor.rowcount >= 0 else None)
+        return cursor
+
+    def executemany(self, sql: str, params_list: Any) -> sqlite3.Cursor:
+        started = time.perf_counter()
+        cursor = self._connection.executemany(sql, params_list)
+        self._query_log.record_many(self._connection, sql, params_list, started, cursor.rowcount)
+        return cursor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
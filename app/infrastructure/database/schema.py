@@ -1,12 +1,32 @@
 from app.infrastructure.database.connection import Database
 
+# Versión del esquema que deja create_tables, guardada en PRAGMA user_version.
+# Subirla al cambiar create_tables: las bases con otra versión vuelven a pasar por el DDL
+SCHEMA_VERSION = 2
+
+# Columnas de flows que no generan un cambio en change_log al actualizarse:
+# next_run_at se recalcula sola (refresh_next_runs, reimportaciones) y no es
+# una edición que las otras instancias deban recargar
+CHANGE_LOG_IGNORED_COLUMNS = {'flows': ('next_run_at',)}
+
 class DatabaseSchema:
     """Clase para gestionar el esquema de la base de datos"""
     
+    @staticmethod
+    def schema_version() -> int:
+        """Versión del esquema guardada en la base (0 si nunca se creó con esta aplicación)"""
+        return Database().fetch_tuples('PRAGMA user_version')[0][0]
+    
     @staticmethod
     def create_tables():
-        """Crea las tablas necesarias en la base de datos"""
+        """Crea las tablas necesarias en la base de datos.
+        
+        Si la base ya tiene el esquema de SCHEMA_VERSION no ejecuta nada más
+        que la lectura de la versión (el arranque habitual).
+        """
         db = Database()
+        if DatabaseSchema.schema_version() == SCHEMA_VERSION:
+            return
         
         # Tabla de proyectos
         db.execute('''
@@ -14,7 +34,8 @@ class DatabaseSchema:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
                 created_at TIMESTAMP NOT NULL,
-                status TEXT NOT NULL
+                status TEXT NOT NULL,
+                external_id TEXT NOT NULL DEFAULT ''
             )
         ''')
         
@@ -28,18 +49,247 @@ class DatabaseSchema:
                 created_at TIMESTAMP NOT NULL,
                 owner TEXT NOT NULL,
                 status TEXT NOT NULL,
+                schedule_time TEXT NOT NULL DEFAULT '00:00',
+                schedule_weekdays TEXT NOT NULL DEFAULT '',
+                schedule_month_day INTEGER,
+                schedule_cron TEXT NOT NULL DEFAULT '',
+                next_run_at TIMESTAMP,
+                connection TEXT NOT NULL DEFAULT '',
+                estimated_duration INTEGER NOT NULL DEFAULT 5,
+                external_id TEXT NOT NULL DEFAULT '',
+                definition_hash TEXT NOT NULL DEFAULT '',
                 FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE
             )
         ''')
         
-        db.disconnect()
+        # Columnas agregadas después de la primera versión del esquema
+        DatabaseSchema._add_missing_columns(db, 'projects', {
+            'external_id': "TEXT NOT NULL DEFAULT ''",
+        })
+        DatabaseSchema._add_missing_columns(db, 'flows', {
+            'schedule_time': "TEXT NOT NULL DEFAULT '00:00'",
+            'schedule_weekdays': "TEXT NOT NULL DEFAULT ''",
+            'schedule_month_day': "INTEGER",
+            'schedule_cron': "TEXT NOT NULL DEFAULT ''",
+            'next_run_at': "TIMESTAMP",
+            'connection': "TEXT NOT NULL DEFAULT ''",
+            'estimated_duration': "INTEGER NOT NULL DEFAULT 5",
+            'external_id': "TEXT NOT NULL DEFAULT ''",
+            'definition_hash': "TEXT NOT NULL DEFAULT ''",
+        })
+        
+        # Flujos de un proyecto, ya ordenados por fecha (listados y páginas)
+        db.execute('CREATE INDEX IF NOT EXISTS idx_flows_project_created ON flows (project_id, created_at, id)')
+        
+        # Índice para consultar las próximas ejecuciones por rango de fechas
+        db.execute('CREATE INDEX IF NOT EXISTS idx_flows_next_run_at ON flows (next_run_at)')
+        
+        # Claves de los elementos importados desde Power Automate (para actualizar al reimportar)
+        db.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_projects_external_id
+            ON projects (external_id) WHERE external_id != ''
+        ''')
+        db.execute('''
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_flows_project_external_id
+            ON flows (project_id, external_id) WHERE external_id != ''
+        ''')
+        
+        # Definiciones importadas, comprimidas con zlib y direccionadas por su
+        # hash SHA-256: los flujos clonados de una plantilla comparten un blob.
+        # Queda fuera de 'flows' para que los recorridos de esa tabla no las lean
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS definition_blobs (
+                hash TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                data BLOB NOT NULL
+            )
+        ''')
+        
+        # Historial de definiciones de cada flujo (una fila por versión distinta)
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS flow_definition_versions (
+                flow_id INTEGER NOT NULL,
+                definition_hash TEXT NOT NULL,
+                recorded_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (flow_id, definition_hash)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Inventario de conectores, desencadenadores y acciones extraído de las
+        # definiciones. Se indexa por hash de definición: los flujos clonados
+        # comparten filas y una definición (inmutable) se analiza una sola vez.
+        # Las claves primarias empiezan por el conector para que las búsquedas
+        # y los conteos por conector se resuelvan solo con el índice
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS connectors (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+        ''')
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS definition_connectors (
+                connector_id INTEGER NOT NULL,
+                definition_hash TEXT NOT NULL,
+                is_trigger INTEGER NOT NULL DEFAULT 0,
+                actions INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (connector_id, definition_hash)
+            ) WITHOUT ROWID
+        ''')
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS definition_operations (
+                connector_id INTEGER NOT NULL,
+                operation TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                definition_hash TEXT NOT NULL,
+                occurrences INTEGER NOT NULL,
+                PRIMARY KEY (connector_id, operation, kind, definition_hash)
+            ) WITHOUT ROWID
+        ''')
+        # Definiciones ya analizadas (incluidas las que no usan conectores)
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS indexed_definitions (
+                definition_hash TEXT PRIMARY KEY
+            ) WITHOUT ROWID
+        ''')
+        
+        # Índice para resolver los flujos de cada definición y contarlos por definición
+        db.execute('CREATE INDEX IF NOT EXISTS idx_flows_definition_hash ON flows (definition_hash)')
+        
+        # Dependencias entre flujos (source desencadena o alimenta a target).
+        # La clave primaria resuelve los recorridos hacia abajo y el índice
+        # por target los recorridos hacia arriba
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS flow_dependencies (
+                source_flow_id INTEGER NOT NULL,
+                target_flow_id INTEGER NOT NULL,
+                kind TEXT NOT NULL,
+                description TEXT NOT NULL DEFAULT '',
+                created_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (source_flow_id, target_flow_id, kind)
+            ) WITHOUT ROWID
+        ''')
+        db.execute('''
+            CREATE INDEX IF NOT EXISTS idx_flow_dependencies_target
+            ON flow_dependencies (target_flow_id, source_flow_id)
+        ''')
+        
+        # Revisión del grafo: invalida el orden topológico guardado en memoria
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS dependency_graph_revision (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                revision INTEGER NOT NULL
+            )
+        ''')
+        db.execute('INSERT OR IGNORE INTO dependency_graph_revision (id, revision) VALUES (1, 0)')
+        for event in ('INSERT', 'DELETE'):
+            db.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_flow_dependencies_{event.lower()}
+                AFTER {event} ON flow_dependencies
+                BEGIN
+                    UPDATE dependency_graph_revision SET revision = revision + 1 WHERE id = 1;
+                END
+            ''')
+        # Las claves foráneas no se aplican: las dependencias se eliminan con el flujo
+        db.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_flows_delete_dependencies
+            AFTER DELETE ON flows
+            BEGIN
+                DELETE FROM flow_dependencies WHERE source_flow_id = OLD.id OR target_flow_id = OLD.id;
+            END
+        ''')
+        
+        # Particiones mensuales del historial de ejecuciones (flow_runs_YYYYMM).
+        # Las tablas de cada mes se crean al importar ejecuciones de ese mes
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS flow_run_partitions (
+                month TEXT PRIMARY KEY,
+                table_name TEXT NOT NULL
+            )
+        ''')
+        
+        # Resumen diario de ejecuciones por flujo, mantenido al importar
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS flow_run_daily (
+                flow_id INTEGER NOT NULL,
+                day TEXT NOT NULL,
+                runs INTEGER NOT NULL,
+                failures INTEGER NOT NULL,
+                total_duration_ms INTEGER NOT NULL,
+                p50_duration_ms INTEGER NOT NULL,
+                p95_duration_ms INTEGER NOT NULL,
+                last_started_at TIMESTAMP NOT NULL,
+                PRIMARY KEY (flow_id, day)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Registro de cambios de proyectos y flujos, solo de agregado. seq es
+        # creciente y sirve de cursor para leer "lo que cambió desde la última
+        # vez". Sin AUTOINCREMENT (que actualiza sqlite_sequence en cada fila):
+        # la poda conserva siempre el último cambio, así que seq no se reutiliza
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq INTEGER PRIMARY KEY,
+                entity TEXT NOT NULL,
+                entity_id INTEGER NOT NULL,
+                project_id INTEGER NOT NULL,
+                operation TEXT NOT NULL,
+                changed_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now'))
+            )
+        ''')
+        for table, entity, project_column in (('projects', 'project', 'id'), ('flows', 'flow', 'project_id')):
+            ignored = CHANGE_LOG_IGNORED_COLUMNS.get(table, ())
+            columns = [row['name'] for row in db.fetch_all(f'PRAGMA table_info({table})')]
+            changed = ' OR '.join(
+                f'OLD.{column} IS NOT NEW.{column}' for column in columns if column not in ignored
+            )
+            for event, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+                # Las actualizaciones se registran solo si cambia alguna columna no
+                # ignorada. Se recrean porque en la versión 1 no tenían condición
+                when = f'WHEN {changed}' if event == 'UPDATE' and ignored else ''
+                db.execute(f'DROP TRIGGER IF EXISTS trg_{table}_{event.lower()}_change_log')
+                db.execute(f'''
+                    CREATE TRIGGER trg_{table}_{event.lower()}_change_log
+                    AFTER {event} ON {table} {when}
+                    BEGIN
+                        INSERT INTO change_log (entity, entity_id, project_id, operation)
+                        VALUES ('{entity}', {row}.id, {row}.{project_column}, '{event.lower()}');
+                    END
+                ''')
+        
+        db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    
+    @staticmethod
+    def _add_missing_columns(db: Database, table: str, columns: dict):
+        """Agrega a una tabla existente las columnas que aún no tiene"""
+        existing = {row['name'] for row in db.fetch_all(f'PRAGMA table_info({table})')}
+        for name, definition in columns.items():
+            if name not in existing:
+                db.execute(f'ALTER TABLE {table} ADD COLUMN {name} {definition}')
         
     @staticmethod
     def drop_tables():
         """Elimina las tablas de la base de datos"""
         db = Database()
+        partitions = db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'flow\\_runs\\_%' ESCAPE '\\'"
+        )
+        for partition in partitions:
+            db.execute(f'DROP TABLE IF EXISTS {partition["name"]}')
+        db.execute('DROP VIEW IF EXISTS flow_runs')
+        db.execute('DROP TABLE IF EXISTS flow_run_partitions')
+        db.execute('DROP TABLE IF EXISTS flow_run_daily')
+        db.execute('DROP TABLE IF EXISTS change_log')
+        db.execute('DROP TABLE IF EXISTS flow_dependencies')
+        db.execute('DROP TABLE IF EXISTS dependency_graph_revision')
+        db.execute('DROP TABLE IF EXISTS flow_definition_versions')
+        db.execute('DROP TABLE IF EXISTS indexed_definitions')
+        db.execute('DROP TABLE IF EXISTS definition_operations')
+        db.execute('DROP TABLE IF EXISTS definition_connectors')
+        db.execute('DROP TABLE IF EXISTS connectors')
+        db.execute('DROP TABLE IF EXISTS definition_blobs')
         db.execute('DROP TABLE IF EXISTS flows')
         db.execute('DROP TABLE IF EXISTS projects')
+        db.execute('PRAGMA user_version = 0')
         db.disconnect()
         
     @staticmethod
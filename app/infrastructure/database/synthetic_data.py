@@ -0,0 +1,214 @@
+# app/infrastructure/database/synthetic_data.py
+"""Generador de datos sintéticos para pruebas de rendimiento.
+
+A diferencia de DatabaseSchema.init_demo_data (dos proyectos de ejemplo),
+genera millones de flujos con distribuciones ajustables y reproducibles a
+partir de una semilla:
+
+- flujos por proyecto según una ley de Zipf (pocos proyectos con muchos
+  flujos y muchos con pocos), igual que los propietarios;
+- mezcla de recurrencias y proporción de flujos y proyectos activos;
+- programación coherente con la recurrencia y próxima ejecución calculada.
+
+Todo se inserta en una sola transacción del hilo escritor, sin los triggers
+de change_log: en lugar de una fila por proyecto y por flujo se registra un
+único cambio REFRESH, que hace que los lectores del registro recarguen todo.
+"""
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from datetime import time as time_of_day
+from itertools import accumulate
+from typing import Any, Dict, List, Optional
+from app.domain.entities.change import ChangeOperation
+from app.domain.entities.schedule import Schedule
+from app.infrastructure.database.connection import Database
+
+_VERBS = ["Enviar", "Sincronizar", "Aprobar", "Notificar", "Actualizar", "Exportar", "Conciliar",
+          "Recordar", "Archivar", "Consolidar", "Validar", "Publicar"]
+_OBJECTS = ["reporte de ventas", "facturas", "pedidos", "tareas de Teams", "lista de SharePoint",
+            "respuestas de Forms", "Excel de cobranzas", "correos de soporte", "tickets", "altas de clientes",
+            "transferencias", "inventario"]
+_AREAS = ["Finanzas", "Ventas", "Operaciones", "Soporte", "Riesgos", "Marketing", "Legal", "Tesorería",
+          "Cobranzas", "Producto", "Seguridad", "Recursos Humanos"]
+_FIRST_NAMES = ["Ana", "Luis", "María", "Jorge", "Lucía", "Carlos", "Rosa", "Diego", "Elena", "Miguel",
+                "Sofía", "Pedro", "Valeria", "Andrés", "Camila", "Renzo"]
+_LAST_NAMES = ["García", "Rojas", "Quispe", "Flores", "Torres", "Vargas", "Mendoza", "Castillo", "Huamán",
+               "Ramírez", "Chávez", "Díaz", "Paredes", "Salazar", "Vega", "Romero"]
+_CONNECTIONS = ["Office 365 Outlook", "SharePoint", "Microsoft Teams", "Excel Online", "SQL Server",
+                "OneDrive", "Approvals", ""]
+_DURATIONS = [1, 2, 3, 5, 5, 5, 10, 10, 15, 30, 60]
+_WEEKDAY_PATTERNS = ["0", "0,2,4", "0,1,2,3,4", "4", "5,6", "1,3"]
+_CRONS = ["*/15 * * * *", "0 */2 * * *", "30 8-18 * * 1-5", "0 9 1,15 * *", "0 7 * * 1"]
+
+
+@dataclass
+class SyntheticDataSpec:
+    """Parámetros del conjunto de datos sintético"""
+    projects: int = 200
+    flows: int = 100_000
+    owners: int = 300
+    project_skew: float = 1.1      # exponente de Zipf de los flujos por proyecto (0 = uniforme)
+    owner_skew: float = 1.0        # exponente de Zipf de los flujos por propietario
+    recurrence_mix: Dict[str, float] = field(default_factory=lambda: {
+        "Diaria": 0.55, "Semanal": 0.25, "Mensual": 0.12, "Personalizada": 0.08
+    })
+    active_ratio: float = 0.8          # flujos activos
+    project_active_ratio: float = 0.9  # proyectos activos
+    seed: int = 42
+    # Fecha de referencia (fija para que la misma semilla dé los mismos datos)
+    reference: datetime = datetime(2025, 1, 1)
+
+
+def zipf_counts(total: int, buckets: int, skew: float) -> List[int]:
+    """Reparte total en buckets con pesos 1/rango^skew (resto mayor, suma exacta)"""
+    if buckets <= 0:
+        return []
+    weights = [1 / (rank ** skew) for rank in range(1, buckets + 1)]
+    scale = total / sum(weights)
+    exact = [weight * scale for weight in weights]
+    counts = [int(value) for value in exact]
+    remainders = sorted(range(buckets), key=lambda index: exact[index] - counts[index], reverse=True)
+    for index in remainders[:total - sum(counts)]:
+        counts[index] += 1
+    return counts
+
+
+def _owner_names(owners: int) -> List[str]:
+    names = [f"{first} {last}" for last in _LAST_NAMES for first in _FIRST_NAMES]
+    if owners <= len(names):
+        return names[:owners]
+    return [f"{names[index % len(names)]} {index // len(names) + 1}" if index >= len(names) else names[index]
+            for index in range(owners)]
+
+
+def generate_synthetic_data(spec: Optional[SyntheticDataSpec] = None) -> Dict[str, Any]:
+    """Inserta proyectos y flujos sintéticos según spec y devuelve un resumen"""
+    spec = spec or SyntheticDataSpec()
+    started = time.perf_counter()
+    rng = random.Random(spec.seed)
+    reference = spec.reference
+    history = 730 * 24 * 3600  # los flujos se crearon en los dos años previos
+
+    # Proyectos
+    project_rows = [
+        (f"{_AREAS[index % len(_AREAS)]} {index + 1}",
+         (reference - timedelta(seconds=history + rng.randrange(180 * 24 * 3600))).isoformat(),
+         'active' if rng.random() < spec.project_active_ratio else 'inactive')
+        for index in range(spec.projects)
+    ]
+    flows_per_project = zipf_counts(spec.flows, spec.projects, spec.project_skew)
+
+    # Propietarios con pesos de Zipf, mezclados para que el más cargado no sea siempre el primero
+    owners = _owner_names(spec.owners)
+    rng.shuffle(owners)
+    owner_weights = list(accumulate(1 / (rank ** spec.owner_skew) for rank in range(1, len(owners) + 1)))
+    recurrences = list(spec.recurrence_mix)
+    recurrence_weights = list(accumulate(spec.recurrence_mix[name] for name in recurrences))
+
+    # La próxima ejecución se calcula una vez por programación distinta
+    next_runs: Dict[tuple, Optional[str]] = {}
+
+    def next_run(key: tuple) -> Optional[str]:
+        value = next_runs.get(key, False)
+        if value is False:
+            recurrence, at, weekdays, month_day, cron = key
+            schedule = Schedule(time_of_day.fromisoformat(at),
+                                [int(day) for day in weekdays.split(',') if day], month_day, cron)
+            run = schedule.next_after(recurrence, reference)
+            value = next_runs[key] = run.isoformat() if run else None
+        return value
+
+    # Fechas de alta: un conjunto de instantes de los dos años previos (formatear
+    # una fecha por flujo es de lo más caro de la generación)
+    created_pool = [(reference - timedelta(seconds=rng.randrange(history))).isoformat()
+                    for _ in range(min(spec.flows, 100_000))]
+    times = [f"{hour:02d}:{minute:02d}" for hour in range(6, 22) for minute in (0, 15, 30, 45)]
+    month_days = list(range(1, 29))
+    statuses = ['active', 'inactive']
+    status_weights = [spec.active_ratio, 1.0]
+
+    def build_rows(project_ids: List[int]):
+        choices = rng.choices
+        number = 0
+        for project_id, count in zip(project_ids, flows_per_project):
+            if not count:
+                continue
+            # Cada columna se sortea de una vez para todos los flujos del proyecto
+            columns = zip(
+                choices(recurrences, cum_weights=recurrence_weights, k=count),
+                choices(owners, cum_weights=owner_weights, k=count),
+                choices(statuses, cum_weights=status_weights, k=count),
+                choices(times, k=count),
+                choices(created_pool, k=count),
+                choices(_VERBS, k=count),
+                choices(_OBJECTS, k=count),
+                choices(_CONNECTIONS, k=count),
+                choices(_DURATIONS, k=count),
+                choices(_WEEKDAY_PATTERNS, k=count),
+                choices(month_days, k=count),
+                choices(_CRONS, k=count),
+            )
+            for (recurrence, owner, status, at, created_at, verb, subject, connection, duration,
+                 weekdays, month_day, cron) in columns:
+                number += 1
+                if recurrence != "Semanal":
+                    weekdays = ''
+                if recurrence != "Mensual":
+                    month_day = None
+                if recurrence != "Personalizada":
+                    cron = ''
+                yield (
+                    project_id, f"{verb} {subject} {number}", recurrence, created_at, owner, status,
+                    at, weekdays, month_day, cron,
+                    next_run((recurrence, at, weekdays, month_day, cron)) if status == 'active' else None,
+                    connection, duration
+                )
+
+    def insert(conn) -> None:
+        # Los triggers de change_log se quitan durante la carga y se recrean igual
+        triggers = conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg\\_%\\_change\\_log' ESCAPE '\\'"
+        ).fetchall()
+        for name, _ in triggers:
+            conn.execute(f'DROP TRIGGER "{name}"')
+        project_ids = [
+            conn.execute("INSERT INTO projects (name, created_at, status) VALUES (?, ?, ?)", row).lastrowid
+            for row in project_rows
+        ]
+        # Con una carga grande es más rápido crear los índices de flows al final
+        # (una ordenación por índice) que mantenerlos fila por fila
+        existing = conn.execute("SELECT COUNT(*) FROM flows").fetchone()[0]
+        indexes = []
+        if spec.flows > existing:
+            indexes = conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'flows' AND sql IS NOT NULL"
+            ).fetchall()
+            for name, _ in indexes:
+                conn.execute(f'DROP INDEX "{name}"')
+        conn.executemany("""
+            INSERT INTO flows (
+                project_id, name, recurrence, created_at, owner, status,
+                schedule_time, schedule_weekdays, schedule_month_day, schedule_cron, next_run_at,
+                connection, estimated_duration
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, build_rows(project_ids))
+        for _, sql in indexes:
+            conn.execute(sql)
+        for _, sql in triggers:
+            conn.execute(sql)
+        if triggers:
+            conn.execute(
+                "INSERT INTO change_log (entity, entity_id, project_id, operation) VALUES ('*', 0, 0, ?)",
+                (ChangeOperation.REFRESH.value,)
+            )
+
+    Database().write(insert).result()
+    return {
+        'projects': spec.projects,
+        'flows': spec.flows,
+        'largest_project_flows': max(flows_per_project, default=0),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
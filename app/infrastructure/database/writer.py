@@ -0,0 +1,196 @@
+# app/infrastructure/database/writer.py
+import bisect
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.infrastructure.database.pragmas import apply_pragmas
+from app.infrastructure.database.query_log import LoggedConnection, QueryLog
+from app.utils.tracing import traced
+
+# Escritura pendiente: (futuro, función que recibe la conexión, argumentos)
+_Job = Tuple[Future, Callable[..., Any], tuple]
+
+
+class WrittenChanges:
+    """Tramos de seq de change_log escritos por el hilo escritor de este proceso.
+
+    Las vistas ya muestran lo que escribe la propia instancia; el registro de
+    cambios les sirve para enterarse de lo que escriben las demás. Los tramos
+    llegan en orden creciente (un solo escritor) y se conservan los últimos
+    max_ranges.
+    """
+
+    def __init__(self, max_ranges: int = 1024):
+        self.max_ranges = max_ranges
+        self._ranges: List[Tuple[int, int]] = []  # (primer seq, último seq)
+        self._lock = threading.Lock()
+
+    def add(self, first: int, last: int) -> None:
+        with self._lock:
+            self._ranges.append((first, last))
+            if len(self._ranges) > self.max_ranges:
+                del self._ranges[:len(self._ranges) - self.max_ranges]
+
+    def last_of_run(self, seq: int) -> Optional[int]:
+        """Último seq del tramo que contiene seq, o None si seq no lo escribió este proceso"""
+        with self._lock:
+            index = bisect.bisect_right(self._ranges, (seq, float('inf'))) - 1
+            if index >= 0 and self._ranges[index][1] >= seq:
+                return self._ranges[index][1]
+            return None
+
+    def __contains__(self, seq: int) -> bool:
+        return self.last_of_run(seq) is not None
+
+
+class DatabaseWriter:
+    """Hilo único de escritura con commits agrupados (group commit).
+
+    Todas las escrituras encoladas se ejecutan en un solo hilo con su propia
+    conexión, así que nunca compiten por el bloqueo de escritura de SQLite.
+    El hilo toma todas las escrituras pendientes (hasta max_batch) y las
+    confirma en una sola transacción: con muchos hilos escribiendo a la vez
+    se paga un commit por lote y no uno por escritura.
+
+    Cada escritura corre dentro de un SAVEPOINT: si falla se deshace solo
+    ella y su futuro recibe la excepción, sin afectar al resto del lote. Los
+    futuros se resuelven después del COMMIT, de modo que quien espera el
+    resultado ya puede leer los cambios desde su propia conexión.
+
+    La conexión usa el mismo perfil de PRAGMA que las de lectura. Con WAL
+    (perfiles 'desktop' y 'bulk-load') las conexiones de lectura de los demás
+    hilos no bloquean al escritor ni el escritor a ellas.
+
+    Cada lote anota en written_changes el tramo de change_log que escribió
+    (con BEGIN IMMEDIATE nadie más escribe entre la primera y la última
+    lectura de MAX(seq)).
+
+    query_log devuelve el QueryLog activo (o None): se consulta en cada lote
+    porque el registro puede activarse después de arrancar el hilo.
+    """
+
+    def __init__(self, db_path: str, pragmas: Optional[Dict[str, Any]] = None, max_batch: int = 256,
+                 written_changes: Optional[WrittenChanges] = None,
+                 query_log: Optional[Callable[[], Optional[QueryLog]]] = None):
+        self.db_path = db_path
+        self.pragmas = pragmas or {'journal_mode': 'wal'}
+        self.max_batch = max_batch
+        self.written_changes = written_changes if written_changes is not None else WrittenChanges()
+        self.query_log = query_log or (lambda: None)
+        self.jobs = 0
+        self.commits = 0
+        self._queue: "queue.SimpleQueue[Optional[_Job]]" = queue.SimpleQueue()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            # No se pudo abrir la conexión: el hilo ya terminó
+            raise self._startup_error
+
+    def submit(self, job: Callable[..., Any], *args) -> Future:
+        """Encola job(conexión, *args) y devuelve un futuro con su resultado"""
+        future = Future()
+        if threading.current_thread() is self._thread:
+            # Escritura anidada desde otra escritura: ya está dentro del lote actual
+            try:
+                future.set_result(job(self._job_connection(), *args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        self._queue.put((future, job, args))
+        return future
+
+    def close(self) -> None:
+        """Procesa las escrituras pendientes y detiene el hilo"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            # isolation_level=None: las transacciones se abren y cierran explícitamente
+            self._connection = sqlite3.connect(self.db_path, isolation_level=None)
+            self._connection.row_factory = sqlite3.Row
+            apply_pragmas(self._connection, self.pragmas)
+        except BaseException as e:
+            self._startup_error = e
+            if self._connection is not None:
+                self._connection.close()
+            return
+        finally:
+            self._ready.set()
+
+        running = True
+        while running:
+            batch: List[_Job] = []
+            item = self._queue.get()
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                running = False
+            if batch:
+                self._commit(batch)
+        self._connection.close()
+
+    @traced(category='sqlite', describe=lambda self, batch: {'jobs': len(batch)})
+    def _commit(self, batch: List[_Job]) -> None:
+        conn = self._connection
+        job_conn = self._job_connection()
+        outcomes = []
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            first_seq = self._last_change_seq(conn)
+            for future, job, args in batch:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute('SAVEPOINT job')
+                try:
+                    outcomes.append((future, job(job_conn, *args), None))
+                    conn.execute('RELEASE job')
+                except Exception as e:
+                    conn.execute('ROLLBACK TO job')
+                    conn.execute('RELEASE job')
+                    outcomes.append((future, None, e))
+            last_seq = self._last_change_seq(conn)
+            conn.execute('COMMIT')
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            for future, _, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.jobs += len(outcomes)
+        self.commits += 1
+        if first_seq is not None and last_seq is not None and last_seq > first_seq:
+            self.written_changes.add(first_seq + 1, last_seq)
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+
+    def _job_connection(self):
+        """Conexión que reciben las escrituras (con registro de consultas si está activo)"""
+        query_log = self.query_log()
+        return self._connection if query_log is None else LoggedConnection(self._connection, query_log)
+
+    @staticmethod
+    def _last_change_seq(conn: sqlite3.Connection) -> Optional[int]:
+        """MAX(seq) de change_log, o None si la tabla todavía no existe"""
+        try:
+            return conn.execute('SELECT COALESCE(MAX(seq), 0) FROM change_log').fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
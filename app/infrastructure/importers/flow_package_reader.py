@@ -0,0 +1,297 @@
+# app/infrastructure/importers/flow_package_reader.py
+"""Lectura de paquetes exportados de Power Automate sin extraerlos a disco.
+
+Formatos soportados:
+- Paquete de flujo (.zip con manifest.json y
+  Microsoft.Flow/flows/<id>/definition.json).
+- Solución (.zip con solution.xml, customizations.xml y Workflows/*.json).
+- Archivo que contiene otros paquetes .zip (por ejemplo, una exportación
+  de todo el tenant). Los paquetes anidados se abren desde el propio
+  archivo; las soluciones se convierten en proyectos propios y los flujos
+  de paquetes sueltos se agrupan en un proyecto con el nombre del archivo.
+
+Los miembros se leen de a uno como streams: cada definición JSON se
+decodifica por separado y los XML se recorren con iterparse. La
+definición de cada flujo (properties.definition) se conserva en forma
+canónica para guardarla en el almacén de definiciones. En las soluciones
+también se registran las llamadas a flujos secundarios (acciones Workflow).
+"""
+import io
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import datetime, time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+from app.domain.entities.flow_definition import canonical_definition
+from app.domain.entities.flow_dependency import child_flow_references
+from app.domain.entities.flow_inventory import normalize_connector
+from app.domain.entities.flow_package import FlowPackage
+from app.domain.entities.project import Project
+from app.domain.entities.schedule import Schedule
+from app.infrastructure.importers.run_history_reader import parse_timestamp
+
+DEFAULT_OWNER = "Sin asignar"
+
+_LEGACY_DEFINITION = re.compile(r'^Microsoft\.Flow/flows/([^/]+)/definition\.json$', re.IGNORECASE)
+_SOLUTION_WORKFLOW = re.compile(r'^Workflows/(.+)\.json$', re.IGNORECASE)
+_GUID_SUFFIX = re.compile(r'-([0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12})$')
+
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+}
+
+# En customizations.xml, StateCode 1 indica un flujo activado
+SOLUTION_ACTIVE_STATE = '1'
+
+
+def _local_name(tag: str) -> str:
+    """Nombre de una etiqueta XML sin el espacio de nombres"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def _load_json(archive: zipfile.ZipFile, name: str) -> Dict[str, Any]:
+    with archive.open(name) as member:
+        return json.load(io.TextIOWrapper(member, encoding='utf-8-sig'))
+
+
+def _int_list(values) -> List[int]:
+    if values is None:
+        return []
+    if not isinstance(values, list):
+        values = [values]
+    return [int(value) for value in values]
+
+
+def schedule_from_definition(definition: Dict[str, Any]) -> Tuple[RecurrenceType, Schedule]:
+    """Traduce el desencadenador de recurrencia de una definición a la programación del flujo.
+
+    Los flujos sin recurrencia (desencadenados por eventos) quedan como
+    personalizados sin expresión cron, es decir, sin próxima ejecución.
+    Las frecuencias por minuto u hora y los intervalos mayores a uno se
+    expresan como cron.
+    """
+    recurrence = None
+    for trigger in (definition.get('triggers') or {}).values():
+        if isinstance(trigger, dict) and isinstance(trigger.get('recurrence'), dict):
+            recurrence = trigger['recurrence']
+            break
+    if recurrence is None:
+        return RecurrenceType.CUSTOM, Schedule()
+
+    frequency = str(recurrence.get('frequency', '')).lower()
+    interval = int(recurrence.get('interval') or 1)
+    details = recurrence.get('schedule') or {}
+    start = parse_timestamp(recurrence['startTime']) if recurrence.get('startTime') else None
+
+    hours = _int_list(details.get('hours')) or [start.hour if start else 0]
+    minutes = _int_list(details.get('minutes')) or [start.minute if start else 0]
+    weekdays = sorted({WEEKDAYS[day.lower()] for day in details.get('weekDays') or [] if day.lower() in WEEKDAYS})
+    month_days = _int_list(details.get('monthDays'))
+    single_time = len(hours) == 1 and len(minutes) == 1
+    at = time(hours[0], minutes[0])
+    cron_time = f"{','.join(map(str, minutes))} {','.join(map(str, hours))}"
+
+    if frequency in ('second', 'minute'):
+        step = max(1, interval // 60) if frequency == 'second' else interval
+        return RecurrenceType.CUSTOM, Schedule(cron=f"*/{step} * * * *" if step > 1 else "* * * * *")
+    if frequency == 'hour':
+        minute = minutes[0]
+        return RecurrenceType.CUSTOM, Schedule(cron=f"{minute} */{interval} * * *" if interval > 1 else f"{minute} * * * *")
+    if frequency == 'day':
+        if interval == 1 and single_time:
+            return RecurrenceType.DAILY, Schedule(time_of_day=at)
+        day_field = f"*/{interval}" if interval > 1 else "*"
+        return RecurrenceType.CUSTOM, Schedule(cron=f"{cron_time} {day_field} * *")
+    if frequency == 'week':
+        if not weekdays:
+            weekdays = [start.weekday()] if start else [0]
+        if interval == 1 and single_time:
+            return RecurrenceType.WEEKLY, Schedule(time_of_day=at, weekdays=weekdays)
+        # Cron no expresa "cada N semanas": se conserva el patrón semanal
+        cron_days = ','.join(str((day + 1) % 7) for day in weekdays)
+        return RecurrenceType.CUSTOM, Schedule(cron=f"{cron_time} * * {cron_days}")
+    if frequency == 'month':
+        if not month_days:
+            month_days = [start.day if start else 1]
+        if interval == 1 and single_time and len(month_days) == 1:
+            return RecurrenceType.MONTHLY, Schedule(time_of_day=at, month_day=month_days[0])
+        month_field = f"*/{interval}" if interval > 1 else "*"
+        return RecurrenceType.CUSTOM, Schedule(cron=f"{cron_time} {','.join(map(str, month_days))} {month_field} *")
+    return RecurrenceType.CUSTOM, Schedule()
+
+
+def connection_name(connection_references: Optional[Dict[str, Any]]) -> str:
+    """Nombre del primer conector referenciado (p. ej. 'sharepointonline')"""
+    for key, reference in (connection_references or {}).items():
+        reference = reference or {}
+        api = (reference.get('api') or {}).get('name') or reference.get('apiName') or \
+            (reference.get('id') or '').rsplit('/', 1)[-1] or key
+        return normalize_connector(api)
+    return ""
+
+
+def _build_flow(external_id: str, name: str, properties: Dict[str, Any], active: bool,
+                owner: str, created_at: Optional[datetime]) -> Flow:
+    definition = properties.get('definition') or {}
+    recurrence, schedule = schedule_from_definition(definition)
+    return Flow(
+        name=name.strip() or external_id,
+        recurrence=recurrence,
+        created_at=created_at or datetime.now(),
+        owner=owner,
+        status=FlowStatus.ACTIVE if active else FlowStatus.INACTIVE,
+        schedule=schedule,
+        connection=connection_name(properties.get('connectionReferences')),
+        external_id=external_id.lower(),
+        # Se serializa aquí (en el proceso lector) para que el guardado solo calcule hashes
+        definition=canonical_definition(definition) if definition else None
+    )
+
+
+def _read_legacy_flows(archive: zipfile.ZipFile, names: List[str], owner: str) -> List[Flow]:
+    """Flujos de un paquete de flujo (Microsoft.Flow/flows/<id>/definition.json)"""
+    flows = []
+    for name in names:
+        match = _LEGACY_DEFINITION.match(name)
+        if not match:
+            continue
+        data = _load_json(archive, name)
+        properties = data.get('properties') or {}
+        created = properties.get('createdTime')
+        flows.append(_build_flow(
+            external_id=data.get('name') or match.group(1),
+            name=properties.get('displayName') or '',
+            properties=properties,
+            active=str(properties.get('state', 'Started')).lower() == 'started',
+            owner=owner,
+            created_at=parse_timestamp(created) if created else None
+        ))
+    return flows
+
+
+def _read_solution(archive: zipfile.ZipFile, names: Dict[str, str], source: str) -> FlowPackage:
+    """Proyecto y flujos de una solución (solution.xml, customizations.xml, Workflows/*.json)"""
+    unique_name, display_name = '', ''
+    with archive.open(names['solution.xml']) as member:
+        for _, element in ET.iterparse(member):
+            tag = _local_name(element.tag)
+            if tag == 'UniqueName' and not unique_name:
+                unique_name = (element.text or '').strip()
+            elif tag == 'LocalizedName' and not display_name:
+                display_name = element.get('description', '').strip()
+            elif tag == 'SolutionManifest':
+                break
+
+    # Metadatos de cada flujo: nombre visible y estado, por archivo JSON
+    workflows: Dict[str, Tuple[str, str, bool]] = {}
+    if 'customizations.xml' in names:
+        with archive.open(names['customizations.xml']) as member:
+            for _, element in ET.iterparse(member):
+                if _local_name(element.tag) != 'Workflow':
+                    continue
+                fields = {_local_name(child.tag): (child.text or '').strip() for child in element}
+                json_file = fields.get('JsonFileName', '').lstrip('/').lower()
+                if json_file:
+                    workflows[json_file] = (
+                        element.get('WorkflowId', '').strip('{}'),
+                        element.get('Name', ''),
+                        fields.get('StateCode', SOLUTION_ACTIVE_STATE) == SOLUTION_ACTIVE_STATE
+                    )
+                element.clear()
+
+    flows = []
+    child_flows: List[Tuple[str, str]] = []
+    for lower_name, name in names.items():
+        match = _SOLUTION_WORKFLOW.match(name)
+        if not match:
+            continue
+        file_stem = match.group(1)
+        guid = _GUID_SUFFIX.search(file_stem)
+        workflow_id, display, active = workflows.get(
+            lower_name,
+            (guid.group(1) if guid else file_stem, _GUID_SUFFIX.sub('', file_stem), True)
+        )
+        data = _load_json(archive, name)
+        properties = data.get('properties') or {}
+        flow = _build_flow(
+            external_id=workflow_id,
+            name=display,
+            properties=properties,
+            active=active,
+            owner=DEFAULT_OWNER,
+            created_at=None
+        )
+        flows.append(flow)
+        # Los flujos secundarios solo pueden llamarse dentro de una solución
+        child_flows.extend(
+            (flow.external_id, child)
+            for child in child_flow_references(properties.get('definition') or {})
+        )
+
+    project = Project(
+        name=display_name or unique_name or source,
+        created_at=datetime.now(),
+        external_id=f"solution:{unique_name or source}"
+    )
+    return FlowPackage(project=project, flows=flows, source=source, child_flows=child_flows)
+
+
+def _read_archive(archive: zipfile.ZipFile, source: str) -> Tuple[List[FlowPackage], List[Flow], Dict[str, Any]]:
+    """Lee un archivo y sus paquetes anidados.
+
+    Devuelve las soluciones encontradas, los flujos de paquetes sueltos y el
+    manifest.json del propio archivo (vacío si no es un paquete de flujo).
+    """
+    names = {name.lower(): name for name in archive.namelist()}
+    packages: List[FlowPackage] = []
+    loose_flows: List[Flow] = []
+    manifest: Dict[str, Any] = {}
+
+    if 'solution.xml' in names:
+        packages.append(_read_solution(archive, names, source))
+    elif 'manifest.json' in names:
+        manifest = _load_json(archive, names['manifest.json'])
+        creator = (manifest.get('details') or {}).get('creator') or ''
+        owner = creator if creator and creator.upper() != 'N/A' else DEFAULT_OWNER
+        loose_flows.extend(_read_legacy_flows(archive, list(names.values()), owner))
+
+    for lower_name, name in names.items():
+        if not lower_name.endswith('.zip'):
+            continue
+        # Los miembros de un zip admiten seek, así que se abren sin extraerlos
+        with archive.open(name) as member, zipfile.ZipFile(member) as inner:
+            inner_packages, inner_flows, _ = _read_archive(inner, f"{source}/{name}")
+        packages.extend(inner_packages)
+        loose_flows.extend(inner_flows)
+
+    return packages, loose_flows, manifest
+
+
+def read_flow_packages(path: str) -> List[FlowPackage]:
+    """Lee un archivo exportado y devuelve un paquete por proyecto encontrado.
+
+    Función de nivel de módulo para poder ejecutarse en un pool de procesos.
+    """
+    source = os.path.basename(path)
+    with zipfile.ZipFile(path) as archive:
+        packages, loose_flows, manifest = _read_archive(archive, source)
+
+    if loose_flows:
+        details = manifest.get('details') or {}
+        stem = os.path.splitext(source)[0]
+        package_id = details.get('packageTelemetryId') or stem
+        packages.append(FlowPackage(
+            project=Project(
+                name=details.get('displayName') or stem,
+                created_at=datetime.now(),
+                external_id=f"package:{package_id}"
+            ),
+            flows=loose_flows,
+            source=source
+        ))
+    return packages
@@ -0,0 +1,222 @@
+# app/infrastructure/importers/run_history_reader.py
+"""Lectura en streaming de historiales de ejecución exportados.
+
+Formatos soportados:
+- CSV con encabezado (exportación de Power Automate o planilla propia).
+- JSON Lines (.jsonl / .ndjson): un objeto por línea.
+- JSON (.json): un arreglo de objetos, o un objeto con la lista en 'value'
+  (forma de la API de Power Automate).
+
+Cada fila necesita inicio, duración (o fin) y estado; el flujo se indica con
+'flow_id' o con su nombre. Las filas se leen de a una, sin cargar el archivo
+completo en memoria (salvo la forma {'value': [...]}).
+"""
+import csv
+import json
+import os
+import re
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator
+
+from app.domain.entities.flow_run import FlowRun, RunStatus
+
+# Nombres de columna aceptados (normalizados: minúsculas y '_' en lugar de espacios)
+START_KEYS = ('start', 'start_time', 'started_at', 'starttime', 'inicio')
+END_KEYS = ('end', 'end_time', 'ended_at', 'endtime', 'fin')
+DURATION_KEYS = ('duration', 'duration_ms', 'duration_seconds', 'duracion')
+STATUS_KEYS = ('status', 'estado')
+FLOW_ID_KEYS = ('flow_id',)
+FLOW_NAME_KEYS = ('flow', 'flow_name', 'flow_display_name', 'flujo')
+
+STATUS_ALIASES = {
+    'succeeded': RunStatus.SUCCEEDED,
+    'success': RunStatus.SUCCEEDED,
+    'exitoso': RunStatus.SUCCEEDED,
+    'failed': RunStatus.FAILED,
+    'failure': RunStatus.FAILED,
+    'timedout': RunStatus.FAILED,
+    'fallido': RunStatus.FAILED,
+    'cancelled': RunStatus.CANCELLED,
+    'canceled': RunStatus.CANCELLED,
+    'cancelado': RunStatus.CANCELLED,
+    'running': RunStatus.RUNNING,
+    'waiting': RunStatus.RUNNING,
+    'en_ejecucion': RunStatus.RUNNING,
+}
+
+DATE_FORMATS = ('%d/%m/%Y %H:%M:%S', '%d/%m/%Y %H:%M', '%Y-%m-%d %H:%M:%S')
+
+_ISO_DURATION = re.compile(r'^P(?:T(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?)$')
+
+# Tamaño de los bloques leídos al recorrer un arreglo JSON
+JSON_CHUNK_SIZE = 64 * 1024
+
+_SEPARATOR = re.compile(r'[\s,]*')
+
+
+@lru_cache(maxsize=256)
+def _normalize_key(key: str) -> str:
+    return key.strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def _first(row: Dict[str, Any], keys) -> Any:
+    for key in keys:
+        value = row.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Convierte una fecha ISO 8601 (con o sin zona) o dd/mm/aaaa a hora local sin zona"""
+    text = str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        for date_format in DATE_FORMATS:
+            try:
+                return datetime.strptime(text, date_format)
+            except ValueError:
+                continue
+        raise ValueError(f"Fecha no válida: '{value}'")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def parse_duration_ms(value: Any, key: str = 'duration') -> int:
+    """Convierte una duración en milisegundos.
+
+    Acepta números (segundos, o milisegundos si la columna es 'duration_ms'),
+    'HH:MM:SS(.fff)' e ISO 8601 ('PT1M3.5S').
+    """
+    if isinstance(value, (int, float)):
+        return int(round(value if key == 'duration_ms' else value * 1000))
+
+    text = str(value).strip()
+    match = _ISO_DURATION.match(text.upper())
+    if match and any(match.groups()):
+        hours, minutes, seconds = (float(part) if part else 0.0 for part in match.groups())
+        return int(round((hours * 3600 + minutes * 60 + seconds) * 1000))
+
+    if ':' in text:
+        parts = text.split(':')
+        try:
+            seconds = 0.0
+            for part in parts:
+                seconds = seconds * 60 + float(part)
+        except ValueError:
+            raise ValueError(f"Duración no válida: '{value}'")
+        return int(round(seconds * 1000))
+
+    try:
+        number = float(text)
+    except ValueError:
+        raise ValueError(f"Duración no válida: '{value}'")
+    return int(round(number if key == 'duration_ms' else number * 1000))
+
+
+def parse_status(value: Any) -> RunStatus:
+    status = STATUS_ALIASES.get(_normalize_key(str(value)))
+    if status is None:
+        raise ValueError(f"Estado no válido: '{value}'")
+    return status
+
+
+def row_to_run(row: Dict[str, Any]) -> FlowRun:
+    """Convierte una fila (CSV u objeto JSON) en una ejecución"""
+    # Forma de la API: {'name': ..., 'properties': {'startTime', 'endTime', 'status'}}
+    if isinstance(row.get('properties'), dict):
+        row = {**row, **row['properties']}
+    row = {_normalize_key(key): value for key, value in row.items()}
+
+    start = _first(row, START_KEYS)
+    if start is None:
+        raise ValueError("Falta la fecha de inicio")
+    started_at = parse_timestamp(start)
+
+    duration_key = next((key for key in DURATION_KEYS if row.get(key) not in (None, '')), None)
+    end = _first(row, END_KEYS)
+    if duration_key:
+        duration_ms = parse_duration_ms(row[duration_key], duration_key)
+    elif end is not None:
+        duration_ms = int((parse_timestamp(end) - started_at) / timedelta(milliseconds=1))
+    else:
+        duration_ms = 0
+
+    status = _first(row, STATUS_KEYS)
+    if status is None:
+        raise ValueError("Falta el estado")
+
+    flow_id = _first(row, FLOW_ID_KEYS)
+    return FlowRun(
+        flow_id=int(flow_id) if flow_id is not None else None,
+        started_at=started_at,
+        duration_ms=max(0, duration_ms),
+        status=parse_status(status),
+        flow_name=str(_first(row, FLOW_NAME_KEYS) or '').strip()
+    )
+
+
+def _read_csv(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        yield from csv.DictReader(file)
+
+
+def _read_json_lines(path: str) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding='utf-8-sig') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_json(path: str) -> Iterator[Dict[str, Any]]:
+    """Recorre un arreglo JSON elemento por elemento con raw_decode sobre bloques"""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8-sig') as file:
+        buffer = file.read(JSON_CHUNK_SIZE).lstrip()
+        if buffer.startswith('{'):
+            # Objeto con la lista en 'value': se decodifica completo
+            data = json.loads(buffer + file.read())
+            yield from data.get('value', [])
+            return
+        if not buffer.startswith('['):
+            raise ValueError("Se esperaba un arreglo JSON de ejecuciones")
+
+        position = 1
+        while True:
+            position = _SEPARATOR.match(buffer, position).end()
+            if buffer.startswith(']', position):
+                return
+            try:
+                item, position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Elemento incompleto: descartar lo ya leído y agregar otro bloque
+                chunk = file.read(JSON_CHUNK_SIZE)
+                if not chunk:
+                    raise ValueError("Arreglo JSON incompleto")
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            yield item
+
+
+def read_run_history(path: str) -> Iterator[FlowRun]:
+    """Lee un historial de ejecuciones en streaming según la extensión del archivo"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        rows = _read_csv(path)
+    elif extension in ('.jsonl', '.ndjson'):
+        rows = _read_json_lines(path)
+    elif extension == '.json':
+        rows = _read_json(path)
+    else:
+        raise ValueError(f"Formato de historial no soportado: '{extension}'")
+
+    for number, row in enumerate(rows, start=1):
+        try:
+            yield row_to_run(row)
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Registro {number} de {os.path.basename(path)}: {e}") from e
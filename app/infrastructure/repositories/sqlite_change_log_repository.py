@@ -0,0 +1,29 @@
+# app/infrastructure/repositories/sqlite_change_log_repository.py
+from typing import List, Optional
+from app.domain.entities.change import Change
+from app.domain.repositories.change_log_repository import ChangeLogRepository
+from app.infrastructure.database.connection import Database
+
+class SQLiteChangeLogRepository(ChangeLogRepository):
+    """Implementación SQLite del registro de cambios (tabla change_log, alimentada por triggers)"""
+
+    def __init__(self):
+        self.db = Database()
+
+    def get_since(self, cursor: int, limit: int) -> List[Change]:
+        query = f"SELECT {', '.join(Change._fields)} FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?"
+        return [Change._make(row) for row in self.db.fetch_tuples(query, (cursor, limit))]
+
+    def get_cursor(self) -> int:
+        return self.db.fetch_tuples("SELECT COALESCE(MAX(seq), 0) FROM change_log")[0][0]
+
+    def get_data_version(self) -> int:
+        return self.db.fetch_tuples("PRAGMA data_version")[0][0]
+
+    def last_own_change(self, seq: int) -> Optional[int]:
+        return self.db.written_changes.last_of_run(seq)
+
+    def prune(self, up_to_seq: int) -> int:
+        # El último cambio se conserva siempre: con la tabla vacía seq volvería a empezar
+        query = "DELETE FROM change_log WHERE seq <= ? AND seq < (SELECT MAX(seq) FROM change_log)"
+        return self.db.write(lambda conn: conn.execute(query, (up_to_seq,)).rowcount).result()
@@ -0,0 +1,99 @@
+# app/infrastructure/repositories/sqlite_flow_definition_repository.py
+import zlib
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.domain.entities.flow_definition import DefinitionStorageStats, DefinitionVersion, definition_hash
+from app.domain.repositories.flow_definition_repository import FlowDefinitionRepository
+from app.infrastructure.database.connection import Database
+
+# Nivel de zlib: las definiciones son JSON muy repetitivo y se comprimen una sola vez
+COMPRESSION_LEVEL = 6
+
+# Hashes por consulta al buscar los blobs ya guardados
+LOOKUP_CHUNK_SIZE = 500
+
+class SQLiteFlowDefinitionRepository(FlowDefinitionRepository):
+    """Implementación SQLite del almacén de definiciones (tabla definition_blobs)"""
+
+    def __init__(self):
+        self.db = Database()
+
+    def save_many(self, definitions: Sequence[str]) -> List[str]:
+        """Guarda definiciones y devuelve el hash de cada una.
+
+        Solo se comprimen las definiciones cuyo hash aún no está guardado,
+        así que reimportar o importar clones de una plantilla no escribe nada.
+        """
+        hashes = [definition_hash(text) for text in definitions]
+        pending: Dict[str, str] = dict(zip(hashes, definitions))
+        if not pending:
+            return hashes
+
+        candidates = list(pending)
+        for start in range(0, len(candidates), LOOKUP_CHUNK_SIZE):
+            chunk = candidates[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            for (stored,) in self.db.fetch_tuples(
+                f"SELECT hash FROM definition_blobs WHERE hash IN ({placeholders})", tuple(chunk)
+            ):
+                pending.pop(stored, None)
+        if not pending:
+            return hashes
+
+        # Se comprime fuera del hilo escritor; si otro hilo guardó la misma
+        # definición mientras tanto, INSERT OR IGNORE la deja como estaba
+        rows = []
+        for key, text in pending.items():
+            raw = text.encode('utf-8')
+            rows.append((key, len(raw), zlib.compress(raw, COMPRESSION_LEVEL)))
+        self.db.write(lambda conn: conn.executemany(
+            "INSERT OR IGNORE INTO definition_blobs (hash, size, data) VALUES (?, ?, ?)", rows
+        )).result()
+        return hashes
+
+    def get(self, definition_hash: str) -> Optional[str]:
+        """Obtiene y descomprime una definición por su hash"""
+        rows = self.db.fetch_tuples("SELECT data FROM definition_blobs WHERE hash = ?", (definition_hash,))
+        if not rows:
+            return None
+        return zlib.decompress(rows[0][0]).decode('utf-8')
+
+    def add_versions(self, versions: Sequence[Tuple[int, str]]) -> None:
+        """Registra las versiones nuevas; una versión ya registrada conserva su fecha"""
+        recorded_at = datetime.now().isoformat()
+        query = """
+            INSERT OR IGNORE INTO flow_definition_versions (flow_id, definition_hash, recorded_at)
+            VALUES (?, ?, ?)
+        """
+        params = [(flow_id, key, recorded_at) for flow_id, key in versions if key]
+        self.db.write(lambda conn: conn.executemany(query, params)).result()
+
+    def get_versions(self, flow_id: int) -> List[DefinitionVersion]:
+        """Obtiene las versiones de la definición de un flujo, de la más reciente a la más antigua"""
+        rows = self.db.fetch_tuples(
+            """
+            SELECT flow_id, definition_hash, recorded_at FROM flow_definition_versions
+            WHERE flow_id = ? ORDER BY recorded_at DESC
+            """,
+            (flow_id,)
+        )
+        return [
+            DefinitionVersion(flow_id=row[0], definition_hash=row[1], recorded_at=datetime.fromisoformat(row[2]))
+            for row in rows
+        ]
+
+    def get_storage_stats(self) -> DefinitionStorageStats:
+        """Obtiene el espacio ocupado por las definiciones sin descomprimirlas"""
+        blobs, raw_bytes, stored_bytes = self.db.fetch_tuples(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(data)), 0) FROM definition_blobs"
+        )[0]
+        references, referenced_bytes = self.db.fetch_tuples(
+            """
+            SELECT COUNT(*), COALESCE(SUM(b.size), 0)
+            FROM flows f JOIN definition_blobs b ON b.hash = f.definition_hash
+            """
+        )[0]
+        return DefinitionStorageStats(
+            blobs=blobs, references=references, raw_bytes=raw_bytes,
+            referenced_bytes=referenced_bytes, stored_bytes=stored_bytes
+        )
@@ -0,0 +1,116 @@
+# app/infrastructure/repositories/sqlite_flow_dependency_repository.py
+import json
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from app.domain.entities.flow_dependency import DependencyKind, FlowDependency, ImpactedFlow
+from app.domain.repositories.flow_dependency_repository import FlowDependencyRepository
+from app.infrastructure.database.connection import Database
+
+# Cierre transitivo con CTE recursiva. UNION (no UNION ALL) descarta los
+# flujos ya visitados, así que cada flujo se expande una sola vez y los
+# ciclos terminan. {near}/{far} eligen el sentido: hacia abajo se sigue la
+# clave primaria (source, target), hacia arriba el índice (target, source)
+_IMPACT_QUERY = """
+    WITH RECURSIVE
+        seeds(flow_id) AS (SELECT value FROM json_each(?)),
+        impact(flow_id) AS (
+            SELECT d.{far} FROM flow_dependencies d WHERE d.{near} IN (SELECT flow_id FROM seeds)
+            UNION
+            SELECT d.{far} FROM flow_dependencies d JOIN impact i ON d.{near} = i.flow_id
+        )
+    SELECT f.id, f.project_id, COALESCE(p.name, ''), f.name, f.status,
+           EXISTS (
+               SELECT 1 FROM flow_dependencies d
+               WHERE d.{far} = f.id AND d.{near} IN (SELECT flow_id FROM seeds)
+           ) AS direct
+    FROM impact i
+    JOIN flows f ON f.id = i.flow_id
+    LEFT JOIN projects p ON p.id = f.project_id
+    WHERE i.flow_id NOT IN (SELECT flow_id FROM seeds)
+    ORDER BY direct DESC, p.name, f.name
+"""
+
+class SQLiteFlowDependencyRepository(FlowDependencyRepository):
+    """Implementación SQLite del grafo de dependencias entre flujos"""
+
+    def __init__(self):
+        self.db = Database()
+
+    def _map_to_entity(self, row: tuple) -> FlowDependency:
+        source_flow_id, target_flow_id, kind, description, created_at = row
+        return FlowDependency(
+            source_flow_id=source_flow_id,
+            target_flow_id=target_flow_id,
+            kind=DependencyKind(kind),
+            description=description,
+            created_at=datetime.fromisoformat(created_at)
+        )
+
+    def add_many(self, dependencies: Sequence[FlowDependency]) -> int:
+        """Agrega dependencias en una sola transacción (las repetidas se ignoran)"""
+        if not dependencies:
+            return 0
+        now = datetime.now()
+        query = """
+            INSERT OR IGNORE INTO flow_dependencies
+                (source_flow_id, target_flow_id, kind, description, created_at)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        params = [
+            (dependency.source_flow_id, dependency.target_flow_id, dependency.kind.value,
+             dependency.description, (dependency.created_at or now).isoformat())
+            for dependency in dependencies
+        ]
+        return self.db.write(lambda conn: conn.executemany(query, params).rowcount).result()
+
+    def remove(self, source_flow_id: int, target_flow_id: int,
+               kind: Optional[DependencyKind] = None) -> bool:
+        """Elimina la dependencia entre dos flujos"""
+        query = "DELETE FROM flow_dependencies WHERE source_flow_id = ? AND target_flow_id = ?"
+        params: tuple = (source_flow_id, target_flow_id)
+        if kind is not None:
+            query += " AND kind = ?"
+            params += (kind.value,)
+        return self.db.write(lambda conn: conn.execute(query, params).rowcount).result() > 0
+
+    def get_for_flows(self, flow_ids: Sequence[int]) -> List[FlowDependency]:
+        """Obtiene las dependencias que entran o salen de los flujos indicados"""
+        seeds = json.dumps(list(flow_ids))
+        rows = self.db.fetch_tuples(
+            """
+            SELECT source_flow_id, target_flow_id, kind, description, created_at
+            FROM flow_dependencies WHERE source_flow_id IN (SELECT value FROM json_each(?))
+            UNION
+            SELECT source_flow_id, target_flow_id, kind, description, created_at
+            FROM flow_dependencies WHERE target_flow_id IN (SELECT value FROM json_each(?))
+            ORDER BY 1, 2, 3
+            """,
+            (seeds, seeds)
+        )
+        return [self._map_to_entity(row) for row in rows]
+
+    def get_edges(self) -> List[Tuple[int, int]]:
+        """Obtiene las aristas del grafo (una por par de flujos, sin importar el tipo)"""
+        return self.db.fetch_tuples("SELECT DISTINCT source_flow_id, target_flow_id FROM flow_dependencies")
+
+    def _impact(self, flow_ids: Sequence[int], near: str, far: str) -> List[ImpactedFlow]:
+        rows = self.db.fetch_tuples(
+            _IMPACT_QUERY.format(near=near, far=far), (json.dumps(list(flow_ids)),)
+        )
+        return [
+            ImpactedFlow(flow_id, project_id, project_name, name, status, bool(direct))
+            for flow_id, project_id, project_name, name, status, direct in rows
+        ]
+
+    def get_downstream(self, flow_ids: Sequence[int]) -> List[ImpactedFlow]:
+        """Obtiene los flujos alcanzables siguiendo las dependencias hacia adelante"""
+        return self._impact(flow_ids, near='source_flow_id', far='target_flow_id')
+
+    def get_upstream(self, flow_ids: Sequence[int]) -> List[ImpactedFlow]:
+        """Obtiene los flujos alcanzables siguiendo las dependencias hacia atrás"""
+        return self._impact(flow_ids, near='target_flow_id', far='source_flow_id')
+
+    def get_revision(self) -> int:
+        """Obtiene la revisión del grafo, incrementada por triggers en cada cambio"""
+        rows = self.db.fetch_tuples("SELECT revision FROM dependency_graph_revision WHERE id = 1")
+        return rows[0][0] if rows else 0
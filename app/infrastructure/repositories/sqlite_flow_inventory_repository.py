@@ -0,0 +1,174 @@
+# app/infrastructure/repositories/sqlite_flow_inventory_repository.py
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.domain.entities.flow_inventory import (
+    ComponentKind, ConnectorMatch, ConnectorUsage, FlowComponent, normalize_connector
+)
+from app.domain.repositories.flow_inventory_repository import FlowInventoryRepository
+from app.infrastructure.database.connection import Database
+
+# Hashes por consulta al filtrar por una lista de definiciones
+HASH_CHUNK_SIZE = 500
+
+# Flujos por definición, resuelto con el índice idx_flows_definition_hash
+_FLOWS_PER_DEFINITION = """
+    SELECT definition_hash, COUNT(*) AS flows FROM flows
+    WHERE definition_hash != '' GROUP BY definition_hash
+"""
+
+class SQLiteFlowInventoryRepository(FlowInventoryRepository):
+    """Implementación SQLite del inventario de conectores (definition_connectors y definition_operations)"""
+
+    def __init__(self):
+        self.db = Database()
+
+    def get_unindexed_definitions(self, hashes: Optional[Sequence[str]] = None) -> List[str]:
+        """Obtiene las definiciones referenciadas por flujos que no figuran en indexed_definitions"""
+        if hashes is None:
+            rows = self.db.fetch_tuples("""
+                SELECT DISTINCT f.definition_hash FROM flows f
+                WHERE f.definition_hash != ''
+                  AND NOT EXISTS (SELECT 1 FROM indexed_definitions i WHERE i.definition_hash = f.definition_hash)
+            """)
+            return [row[0] for row in rows]
+
+        candidates = list(dict.fromkeys(key for key in hashes if key))
+        unindexed = []
+        for start in range(0, len(candidates), HASH_CHUNK_SIZE):
+            chunk = candidates[start:start + HASH_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            indexed = {row[0] for row in self.db.fetch_tuples(
+                f"SELECT definition_hash FROM indexed_definitions WHERE definition_hash IN ({placeholders})",
+                tuple(chunk)
+            )}
+            unindexed.extend(key for key in chunk if key not in indexed)
+        return unindexed
+
+    def _connector_ids(self, conn, names) -> Dict[str, int]:
+        """IDs de los conectores, creando los que aún no existen"""
+        conn.executemany("INSERT OR IGNORE INTO connectors (name) VALUES (?)", [(name,) for name in names])
+        return {name: connector_id for connector_id, name in conn.execute("SELECT id, name FROM connectors")}
+
+    def add_definitions(self, entries: Sequence[Tuple[str, List[FlowComponent]]]) -> None:
+        """Guarda el inventario de varias definiciones en una sola transacción"""
+        if not entries:
+            return
+
+        def add(conn) -> None:
+            connector_ids = self._connector_ids(
+                conn, {component.connector for _, components in entries for component in components}
+            )
+
+            operations = []
+            # (hash, connector_id) -> [es desencadenador, acciones]
+            per_connector: Dict[Tuple[str, int], List[int]] = {}
+            for definition_hash, components in entries:
+                for component in components:
+                    connector_id = connector_ids[component.connector]
+                    operations.append((
+                        connector_id, component.operation, component.kind.value,
+                        definition_hash, component.occurrences
+                    ))
+                    usage = per_connector.setdefault((definition_hash, connector_id), [0, 0])
+                    if component.kind == ComponentKind.TRIGGER:
+                        usage[0] = 1
+                    else:
+                        usage[1] += component.occurrences
+
+            # Una definición no cambia nunca: si ya estaba indexada sus filas son iguales
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO definition_operations
+                    (connector_id, operation, kind, definition_hash, occurrences)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                operations
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO definition_connectors (connector_id, definition_hash, is_trigger, actions)
+                VALUES (?, ?, ?, ?)
+                """,
+                [(connector_id, definition_hash, is_trigger, actions)
+                 for (definition_hash, connector_id), (is_trigger, actions) in per_connector.items()]
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO indexed_definitions (definition_hash) VALUES (?)",
+                [(definition_hash,) for definition_hash, _ in entries]
+            )
+
+        self.db.write(add).result()
+
+    def find_flows(self, connector: str, operation: Optional[str] = None,
+                   kind: Optional[ComponentKind] = None, project_id: Optional[int] = None,
+                   limit: Optional[int] = None) -> List[ConnectorMatch]:
+        """Obtiene los flujos que usan un conector, agrupados por definición.
+
+        Primero se resuelven las definiciones que usan el conector (con la
+        clave de definition_connectors, o la de definition_operations si se
+        indica la operación) y luego sus flujos con idx_flows_definition_hash.
+        El orden es el del índice (hash, id), así que con 'limit' la consulta
+        se detiene en las primeras filas sin ordenar todas las coincidencias.
+        """
+        params: list = [normalize_connector(connector)]
+        if operation:
+            matches = """
+                SELECT definition_hash FROM definition_operations
+                WHERE connector_id = (SELECT id FROM connectors WHERE name = ?) AND operation = ?
+            """
+            params.append(operation)
+            if kind is not None:
+                matches += " AND kind = ?"
+                params.append(kind.value)
+        else:
+            matches = """
+                SELECT definition_hash FROM definition_connectors
+                WHERE connector_id = (SELECT id FROM connectors WHERE name = ?)
+            """
+            if kind == ComponentKind.TRIGGER:
+                matches += " AND is_trigger = 1"
+            elif kind == ComponentKind.ACTION:
+                matches += " AND actions > 0"
+
+        query = f"""
+            SELECT f.id, f.project_id, COALESCE(p.name, ''), f.name, f.owner, f.status
+            FROM flows f LEFT JOIN projects p ON p.id = f.project_id
+            WHERE f.definition_hash IN ({matches})
+        """
+        if project_id is not None:
+            query += " AND f.project_id = ?"
+            params.append(project_id)
+        query += " ORDER BY f.definition_hash, f.id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return [ConnectorMatch._make(row) for row in self.db.fetch_tuples(query, tuple(params))]
+
+    def count_by_connector(self) -> List[ConnectorUsage]:
+        """Obtiene el uso de cada conector sin leer las filas de flows (solo su índice por definición)"""
+        rows = self.db.fetch_tuples(f"""
+            SELECT n.name, SUM(d.flows), SUM(d.flows * c.is_trigger), SUM(d.flows * c.actions)
+            FROM ({_FLOWS_PER_DEFINITION}) d
+            JOIN definition_connectors c ON c.definition_hash = d.definition_hash
+            JOIN connectors n ON n.id = c.connector_id
+            GROUP BY c.connector_id
+            ORDER BY 2 DESC, n.name
+        """)
+        return [
+            ConnectorUsage(connector=name, flows=flows, triggers=triggers, actions=actions)
+            for name, flows, triggers, actions in rows
+        ]
+
+    def get_operations(self, connector: str) -> List[Tuple[str, str, int]]:
+        """Obtiene las operaciones de un conector con la cantidad de flujos que usan cada una"""
+        return self.db.fetch_tuples(
+            f"""
+            SELECT o.kind, o.operation, SUM(d.flows) AS flows
+            FROM definition_operations o
+            JOIN ({_FLOWS_PER_DEFINITION}) d ON d.definition_hash = o.definition_hash
+            WHERE o.connector_id = (SELECT id FROM connectors WHERE name = ?)
+            GROUP BY o.operation, o.kind
+            ORDER BY flows DESC, o.operation
+            """,
+            (normalize_connector(connector),)
+        )
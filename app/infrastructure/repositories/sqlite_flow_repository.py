@@ -1,11 +1,23 @@
 
 # app/infrastructure/repositories/sqlite_flow_repository.py
-from typing import List, Optional
-from datetime import datetime
-from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+import json
+from typing import Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, time
+from app.domain.entities.flow import Flow, FlowRecord, FlowStatus, RecurrenceType
+from app.domain.entities.schedule import Schedule, ScheduledFlow
 from app.domain.repositories.flow_repository import FlowRepository
 from app.infrastructure.database.connection import Database
+from app.utils.tracing import trace_methods
 
+# Flujos activos cuya próxima ejecución hay que (re)calcular. Los personalizados
+# sin cron (p. ej. importados con un desencadenador por evento) nunca tienen
+# una: con NULL quedarían pendientes para siempre y se reescribirían cada vez
+PENDING_SCHEDULE_CONDITION = f"""
+    status = '{FlowStatus.ACTIVE.value}'
+    AND NOT (recurrence = '{RecurrenceType.CUSTOM.value}' AND schedule_cron = '')
+"""
+
+@trace_methods('repository')
 class SQLiteFlowRepository(FlowRepository):
     """Implementación SQLite del repositorio de flujos"""
     
@@ -24,7 +36,31 @@ class SQLiteFlowRepository(FlowRepository):
             recurrence=RecurrenceType(data['recurrence']),
             created_at=datetime.fromisoformat(data['created_at']),
             owner=data['owner'],
-            status=FlowStatus(data['status'])
+            status=FlowStatus(data['status']),
+            schedule=Schedule(
+                time_of_day=time.fromisoformat(data['schedule_time']),
+                weekdays=[int(day) for day in data['schedule_weekdays'].split(',') if day],
+                month_day=data['schedule_month_day'],
+                cron=data['schedule_cron']
+            ),
+            next_run_at=datetime.fromisoformat(data['next_run_at']) if data['next_run_at'] else None,
+            connection=data['connection'],
+            estimated_duration=data['estimated_duration'],
+            external_id=data['external_id'],
+            definition_hash=data['definition_hash']
+        )
+    
+    def _schedule_values(self, flow: Flow) -> tuple:
+        """Convierte la programación y los datos de ejecución a valores de columnas"""
+        schedule = flow.schedule
+        return (
+            schedule.time_of_day.strftime('%H:%M'),
+            ','.join(str(day) for day in schedule.weekdays),
+            schedule.month_day,
+            schedule.cron,
+            flow.next_run_at.isoformat() if flow.next_run_at else None,
+            flow.connection,
+            flow.estimated_duration
         )
     
     def get_all_by_project(self, project_id: int) -> List[Flow]:
@@ -33,6 +69,17 @@ class SQLiteFlowRepository(FlowRepository):
         results = self.db.fetch_all(query, (project_id,))
         return [self._map_to_entity(data) for data in results]
     
+    def get_page_by_project(self, project_id: int, offset: int, limit: int) -> Tuple[List[Flow], int]:
+        """Obtiene una página de los flujos de un proyecto (mismo orden que get_all_by_project)"""
+        query = """
+        SELECT * FROM flows WHERE project_id = ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """
+        results = self.db.fetch_all(query, (project_id, limit, offset))
+        total = self.db.fetch_tuples("SELECT COUNT(*) FROM flows WHERE project_id = ?", (project_id,))[0][0]
+        return [self._map_to_entity(data) for data in results], total
+    
     def get_by_id(self, flow_id: int) -> Optional[Flow]:
         """Obtiene un flujo por su ID"""
         query = "SELECT * FROM flows WHERE id = ?"
@@ -42,21 +89,22 @@ class SQLiteFlowRepository(FlowRepository):
     def create(self, flow: Flow) -> Flow:
         """Crea un nuevo flujo"""
         query = """
-            INSERT INTO flows (project_id, name, recurrence, created_at, owner, status)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """
-        cursor = self.db.execute(
-            query, 
-            (
-                flow.project_id,
-                flow.name, 
-                flow.recurrence.value,
-                flow.created_at.isoformat(),
-                flow.owner,
-                flow.status.value
+            INSERT INTO flows (
+                project_id, name, recurrence, created_at, owner, status,
+                schedule_time, schedule_weekdays, schedule_month_day, schedule_cron, next_run_at,
+                connection, estimated_duration, external_id, definition_hash
             )
-        )
-        flow.id = cursor.lastrowid
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        params = (
+            flow.project_id,
+            flow.name,
+            flow.recurrence.value,
+            flow.created_at.isoformat(),
+            flow.owner,
+            flow.status.value
+        ) + self._schedule_values(flow) + (flow.external_id, flow.definition_hash)
+        flow.id = self.db.write(lambda conn: conn.execute(query, params).lastrowid).result()
         return flow
     
     def update(self, flow: Flow) -> Flow:
@@ -66,23 +114,204 @@ class SQLiteFlowRepository(FlowRepository):
             
         query = """
             UPDATE flows
-            SET name = ?, recurrence = ?, owner = ?, status = ?
+            SET name = ?, recurrence = ?, owner = ?, status = ?,
+                schedule_time = ?, schedule_weekdays = ?, schedule_month_day = ?,
+                schedule_cron = ?, next_run_at = ?, connection = ?, estimated_duration = ?
             WHERE id = ?
         """
-        self.db.execute(
-            query, 
-            (
-                flow.name,
-                flow.recurrence.value,
-                flow.owner,
-                flow.status.value,
-                flow.id
-            )
-        )
+        params = (
+            flow.name,
+            flow.recurrence.value,
+            flow.owner,
+            flow.status.value
+        ) + self._schedule_values(flow) + (flow.id,)
+        self.db.write(lambda conn: conn.execute(query, params)).result()
         return flow
     
     def delete(self, flow_id: int) -> bool:
         """Elimina un flujo por su ID"""
         query = "DELETE FROM flows WHERE id = ?"
-        cursor = self.db.execute(query, (flow_id,))
-        return cursor.rowcount > 0
\ No newline at end of file
+        return self.db.write(lambda conn: conn.execute(query, (flow_id,)).rowcount).result() > 0
+    
+    def get_due_between(self, start: datetime, end: datetime) -> List[Flow]:
+        """Obtiene los flujos activos cuya próxima ejecución está en [start, end)"""
+        query = """
+            SELECT * FROM flows
+            WHERE next_run_at >= ? AND next_run_at < ? AND status = ?
+            ORDER BY next_run_at
+        """
+        results = self.db.fetch_all(
+            query, (start.isoformat(), end.isoformat(), FlowStatus.ACTIVE.value)
+        )
+        return [self._map_to_entity(data) for data in results]
+    
+    def has_pending_schedule(self, now: datetime) -> bool:
+        """Indica si algún flujo activo no tiene próxima ejecución o la tiene vencida"""
+        # SQLite ordena los NULL primero: la primera fila es un flujo sin calcular
+        # o el MIN(next_run_at), y se obtiene recorriendo idx_flows_next_run_at
+        query = f"""
+            SELECT next_run_at FROM flows
+            WHERE {PENDING_SCHEDULE_CONDITION}
+            ORDER BY next_run_at
+            LIMIT 1
+        """
+        rows = self.db.fetch_tuples(query)
+        if not rows:
+            return False
+        earliest = rows[0][0]
+        return earliest is None or earliest <= now.isoformat()
+    
+    def get_pending_schedule(self, now: datetime, after_id: int = 0,
+                             limit: int = 1000) -> List[ScheduledFlow]:
+        """Obtiene, en orden de ID, un bloque de flujos activos sin próxima ejecución o con una ya vencida"""
+        query = f"""
+            SELECT id, project_id, owner, recurrence, schedule_time,
+                   schedule_weekdays, schedule_month_day, schedule_cron
+            FROM flows
+            WHERE (next_run_at IS NULL OR next_run_at <= ?) AND {PENDING_SCHEDULE_CONDITION} AND id > ?
+            ORDER BY id
+            LIMIT ?
+        """
+        rows = self.db.fetch_tuples(query, (now.isoformat(), after_id, limit))
+        return [ScheduledFlow(*row) for row in rows]
+    
+    def update_next_runs(self, next_runs: List[Tuple[int, Optional[datetime]]]) -> None:
+        """Actualiza en bloque la próxima ejecución de varios flujos"""
+        query = "UPDATE flows SET next_run_at = ? WHERE id = ?"
+        params = [
+            (next_run_at.isoformat() if next_run_at else None, flow_id)
+            for flow_id, next_run_at in next_runs
+        ]
+        self.db.write(lambda conn: conn.executemany(query, params)).result()
+    
+    def iter_records(self, project_id: Optional[int] = None, status: Optional[FlowStatus] = None,
+                     batch_size: int = 1000) -> Iterator[FlowRecord]:
+        """Recorre los flujos en orden de ID, por bloques y como tuplas (sin entidades ni diccionarios)"""
+        conditions, params = [], []
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status.value)
+        query = f"SELECT {', '.join(FlowRecord._fields)} FROM flows"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY id"
+        
+        cursor = self.db.connect().cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(query, tuple(params))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from map(FlowRecord._make, rows)
+        finally:
+            cursor.close()
+    
+    def set_status(self, status: FlowStatus, flow_ids: Optional[Sequence[int]] = None,
+                   project_id: Optional[int] = None) -> int:
+        """Cambia el estado de varios flujos en una sola transacción"""
+        if flow_ids is None and project_id is None:
+            raise ValueError("Indique los flujos o el proyecto")
+        
+        def update(conn) -> int:
+            changed = 0
+            if project_id is not None:
+                changed += conn.execute(
+                    "UPDATE flows SET status = ? WHERE project_id = ? AND status != ?",
+                    (status.value, project_id, status.value)
+                ).rowcount
+            if flow_ids:
+                changed += conn.executemany(
+                    "UPDATE flows SET status = ? WHERE id = ? AND status != ?",
+                    [(status.value, flow_id, status.value) for flow_id in flow_ids]
+                ).rowcount
+            return changed
+        
+        return self.db.write(update).result()
+    
+    def get_active_schedules(self) -> List[ScheduledFlow]:
+        """Obtiene la programación de todos los flujos activos (lectura masiva)"""
+        query = """
+            SELECT id, project_id, owner, recurrence, schedule_time,
+                   schedule_weekdays, schedule_month_day, schedule_cron,
+                   name, connection, estimated_duration
+            FROM flows
+            WHERE status = ?
+        """
+        rows = self.db.fetch_tuples(query, (FlowStatus.ACTIVE.value,))
+        return [ScheduledFlow._make(row) for row in rows]
+    
+    def upsert_many(self, flows: List[Flow]) -> int:
+        """Crea o actualiza un lote de flujos importados en una sola transacción.
+        
+        Al actualizar se conservan el propietario y la duración estimada, que
+        se gestionan desde la aplicación y no vienen en las definiciones.
+        """
+        if not flows:
+            return 0
+        
+        query = """
+            INSERT INTO flows (
+                project_id, name, recurrence, created_at, owner, status,
+                schedule_time, schedule_weekdays, schedule_month_day, schedule_cron, next_run_at,
+                connection, estimated_duration, external_id, definition_hash
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (project_id, external_id) WHERE external_id != ''
+            DO UPDATE SET
+                name = excluded.name,
+                recurrence = excluded.recurrence,
+                status = excluded.status,
+                schedule_time = excluded.schedule_time,
+                schedule_weekdays = excluded.schedule_weekdays,
+                schedule_month_day = excluded.schedule_month_day,
+                schedule_cron = excluded.schedule_cron,
+                next_run_at = excluded.next_run_at,
+                connection = excluded.connection,
+                definition_hash = CASE WHEN excluded.definition_hash != ''
+                    THEN excluded.definition_hash ELSE flows.definition_hash END
+        """
+        # Solo las claves del lote, buscadas por el índice (project_id, external_id)
+        ids_query = """
+            SELECT f.project_id, f.external_id, f.id
+            FROM json_each(?) AS k
+            JOIN flows AS f
+              ON f.project_id = json_extract(k.value, '$[0]')
+             AND f.external_id = json_extract(k.value, '$[1]')
+            WHERE f.external_id != ''
+        """
+        keys = (json.dumps([[flow.project_id, flow.external_id] for flow in flows]),)
+        
+        def upsert(conn):
+            existing = {
+                (project_id, external_id)
+                for project_id, external_id, _ in conn.execute(ids_query, keys)
+            }
+            conn.executemany(
+                query,
+                [
+                    (
+                        flow.project_id,
+                        flow.name,
+                        flow.recurrence.value,
+                        flow.created_at.isoformat(),
+                        flow.owner,
+                        flow.status.value
+                    ) + self._schedule_values(flow) + (flow.external_id, flow.definition_hash)
+                    for flow in flows
+                ]
+            )
+            ids = {
+                (project_id, external_id): flow_id
+                for project_id, external_id, flow_id in conn.execute(ids_query, keys)
+            }
+            return existing, ids
+        
+        existing, ids = self.db.write(upsert).result()
+        for flow in flows:
+            flow.id = ids.get((flow.project_id, flow.external_id), flow.id)
+        return sum(1 for flow in flows if (flow.project_id, flow.external_id) not in existing)
@@ -0,0 +1,203 @@
+# app/infrastructure/repositories/sqlite_flow_run_repository.py
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from typing import Dict, List, Sequence, Set, Tuple
+from app.domain.entities.flow_run import FlowRun, FlowHealth, RunStatus, duration_percentile
+from app.domain.repositories.flow_run_repository import FlowRunRepository
+from app.infrastructure.database.connection import Database
+
+PARTITION_PREFIX = "flow_runs_"
+
+class SQLiteFlowRunRepository(FlowRunRepository):
+    """Implementación SQLite del historial de ejecuciones.
+
+    Las ejecuciones se guardan en una tabla por mes (flow_runs_YYYYMM) con
+    clave primaria (flow_id, started_at), de modo que las consultas de un
+    flujo en un rango de fechas solo leen las particiones de esos meses. La
+    vista 'flow_runs' une todas las particiones para consultas ad hoc.
+
+    Los resúmenes diarios (flow_run_daily) se recalculan solo para los pares
+    flujo/día que toca cada lote, dentro de la misma escritura del hilo
+    escritor (Database.write).
+    """
+
+    def __init__(self):
+        self.db = Database()
+
+    @staticmethod
+    def _partition_name(month: str) -> str:
+        return f"{PARTITION_PREFIX}{month}"
+
+    @staticmethod
+    def _months_between(start: datetime, end: datetime) -> List[str]:
+        """Meses ('YYYYMM') que se solapan con [start, end)"""
+        months = []
+        current = start.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        while current < end:
+            months.append(current.strftime('%Y%m'))
+            current = (current + timedelta(days=32)).replace(day=1)
+        return months
+
+    def _existing_partitions(self, connection) -> Set[str]:
+        """Meses que ya tienen partición"""
+        rows = connection.execute("SELECT month FROM flow_run_partitions").fetchall()
+        return {row[0] for row in rows}
+
+    def _ensure_partitions(self, connection, months: Set[str]) -> None:
+        """Crea las particiones que falten y recrea la vista flow_runs si hubo nuevas"""
+        existing = self._existing_partitions(connection)
+        missing = months - existing
+        for month in missing:
+            connection.execute(f'''
+                CREATE TABLE IF NOT EXISTS {self._partition_name(month)} (
+                    flow_id INTEGER NOT NULL,
+                    started_at TIMESTAMP NOT NULL,
+                    duration_ms INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    PRIMARY KEY (flow_id, started_at)
+                ) WITHOUT ROWID
+            ''')
+            connection.execute(
+                "INSERT INTO flow_run_partitions (month, table_name) VALUES (?, ?)",
+                (month, self._partition_name(month))
+            )
+
+        if missing:
+            selects = " UNION ALL ".join(
+                f"SELECT flow_id, started_at, duration_ms, status FROM {self._partition_name(month)}"
+                for month in sorted(existing | missing)
+            )
+            connection.execute("DROP VIEW IF EXISTS flow_runs")
+            connection.execute(f"CREATE VIEW flow_runs AS {selects}")
+
+    def add_runs(self, runs: Sequence[FlowRun]) -> int:
+        """Guarda un lote de ejecuciones y actualiza sus resúmenes diarios"""
+        by_month: Dict[str, List[tuple]] = defaultdict(list)
+        touched: Dict[str, Set[Tuple[int, str]]] = defaultdict(set)
+        for run in runs:
+            # El mes y el día salen del texto ISO, más barato que strftime por fila
+            started_at = run.started_at.isoformat()
+            month = started_at[0:4] + started_at[5:7]
+            by_month[month].append((run.flow_id, started_at, run.duration_ms, run.status.value))
+            touched[month].add((run.flow_id, started_at[:10]))
+
+        if not by_month:
+            return 0
+
+        def add(connection) -> None:
+            self._ensure_partitions(connection, set(by_month))
+            for month, rows in by_month.items():
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO {self._partition_name(month)} "
+                    f"(flow_id, started_at, duration_ms, status) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._refresh_rollups(connection, month, touched[month])
+
+        self.db.write(add).result()
+        return sum(len(rows) for rows in by_month.values())
+
+    def _refresh_rollups(self, connection, month: str, touched: Set[Tuple[int, str]]) -> None:
+        """Recalcula el resumen de cada par flujo/día de un mes afectado por un lote.
+
+        Los pares se cargan en una tabla temporal y una sola consulta recorre,
+        por clave primaria, las ejecuciones de esos días en la partición.
+        """
+        connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS touched_days "
+            "(flow_id INTEGER, day TEXT, next_day TEXT, PRIMARY KEY (flow_id, day))"
+        )
+        connection.execute("DELETE FROM touched_days")
+        connection.executemany(
+            "INSERT INTO touched_days (flow_id, day, next_day) VALUES (?, ?, ?)",
+            [
+                (flow_id, day, (date.fromisoformat(day) + timedelta(days=1)).isoformat())
+                for flow_id, day in touched
+            ]
+        )
+        rows = connection.execute(f'''
+            SELECT t.flow_id, t.day, r.duration_ms, r.status, r.started_at
+            FROM touched_days t
+            JOIN {self._partition_name(month)} r
+              ON r.flow_id = t.flow_id AND r.started_at >= t.day AND r.started_at < t.next_day
+            ORDER BY t.flow_id, t.day
+        ''').fetchall()
+
+        failed = RunStatus.FAILED.value
+        rollups = []
+        for (flow_id, day), group in groupby(rows, key=lambda row: (row[0], row[1])):
+            group = list(group)
+            durations = sorted(row[2] for row in group)
+            rollups.append((
+                flow_id,
+                day,
+                len(group),
+                sum(1 for row in group if row[3] == failed),
+                sum(durations),
+                duration_percentile(durations, 50),
+                duration_percentile(durations, 95),
+                max(row[4] for row in group)
+            ))
+
+        connection.executemany('''
+            INSERT OR REPLACE INTO flow_run_daily
+            (flow_id, day, runs, failures, total_duration_ms, p50_duration_ms, p95_duration_ms, last_started_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rollups)
+
+    def get_runs(self, flow_id: int, start: datetime, end: datetime) -> List[FlowRun]:
+        """Obtiene las ejecuciones de un flujo iniciadas en [start, end)"""
+        existing = self._existing_partitions(self.db.connect())
+        runs = []
+        for month in self._months_between(start, end):
+            if month not in existing:
+                continue
+            rows = self.db.fetch_tuples(
+                f"SELECT started_at, duration_ms, status FROM {self._partition_name(month)} "
+                f"WHERE flow_id = ? AND started_at >= ? AND started_at < ? ORDER BY started_at",
+                (flow_id, start.isoformat(), end.isoformat())
+            )
+            runs.extend(
+                FlowRun(
+                    flow_id=flow_id,
+                    started_at=datetime.fromisoformat(started_at),
+                    duration_ms=duration_ms,
+                    status=RunStatus(status)
+                )
+                for started_at, duration_ms, status in rows
+            )
+        return runs
+
+    def get_project_health(self, project_id: int, since: datetime) -> Dict[int, FlowHealth]:
+        """Obtiene la salud de los flujos de un proyecto a partir de los resúmenes diarios.
+
+        La mediana del periodo se aproxima con el promedio de las medianas
+        diarias ponderado por ejecuciones, y el p95 con el mayor p95 diario.
+        """
+        query = '''
+            SELECT d.flow_id,
+                   SUM(d.runs) AS runs,
+                   SUM(d.failures) AS failures,
+                   SUM(d.total_duration_ms) AS total_duration_ms,
+                   SUM(d.p50_duration_ms * d.runs) AS weighted_p50,
+                   MAX(d.p95_duration_ms) AS p95_duration_ms,
+                   MAX(d.last_started_at) AS last_run_at
+            FROM flows f
+            JOIN flow_run_daily d ON d.flow_id = f.id
+            WHERE f.project_id = ? AND d.day >= ?
+            GROUP BY d.flow_id
+        '''
+        results = self.db.fetch_all(query, (project_id, since.strftime('%Y-%m-%d')))
+        return {
+            data['flow_id']: FlowHealth(
+                flow_id=data['flow_id'],
+                runs=data['runs'],
+                failures=data['failures'],
+                avg_duration_ms=data['total_duration_ms'] // data['runs'],
+                p50_duration_ms=data['weighted_p50'] // data['runs'],
+                p95_duration_ms=data['p95_duration_ms'],
+                last_run_at=datetime.fromisoformat(data['last_run_at'])
+            )
+            for data in results
+        }
@@ -1,10 +1,12 @@
 # app/infrastructure/repositories/sqlite_project_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from app.domain.entities.project import Project, ProjectStatus
 from app.domain.repositories.project_repository import ProjectRepository
 from app.infrastructure.database.connection import Database
+from app.utils.tracing import trace_methods
 
+@trace_methods('repository')
 class SQLiteProjectRepository(ProjectRepository):
     """Implementación SQLite del repositorio de proyectos"""
     
@@ -20,7 +22,8 @@ class SQLiteProjectRepository(ProjectRepository):
             id=data['id'],
             name=data['name'],
             created_at=datetime.fromisoformat(data['created_at']),
-            status=ProjectStatus(data['status'])
+            status=ProjectStatus(data['status']),
+            external_id=data['external_id']
         )
     
     def get_all(self) -> List[Project]:
@@ -29,6 +32,17 @@ class SQLiteProjectRepository(ProjectRepository):
         results = self.db.fetch_all(query)
         return [self._map_to_entity(data) for data in results]
     
+    def get_page(self, offset: int, limit: int) -> Tuple[List[Project], int]:
+        """Obtiene una página de proyectos (mismo orden que get_all) y el total"""
+        query = """
+        SELECT * FROM projects
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """
+        results = self.db.fetch_all(query, (limit, offset))
+        total = self.db.fetch_tuples("SELECT COUNT(*) FROM projects")[0][0]
+        return [self._map_to_entity(data) for data in results], total
+    
     def get_by_id(self, project_id: int) -> Optional[Project]:
         """Obtiene un proyecto por su ID"""
         query = "SELECT * FROM projects WHERE id = ?"
@@ -38,18 +52,16 @@ class SQLiteProjectRepository(ProjectRepository):
     def create(self, project: Project) -> Project:
         """Crea un nuevo proyecto"""
         query = """
-            INSERT INTO projects (name, created_at, status)
-            VALUES (?, ?, ?)
+            INSERT INTO projects (name, created_at, status, external_id)
+            VALUES (?, ?, ?, ?)
         """
-        cursor = self.db.execute(
-            query, 
-            (
-                project.name, 
-                project.created_at.isoformat(), 
-                project.status.value
-            )
+        params = (
+            project.name,
+            project.created_at.isoformat(),
+            project.status.value,
+            project.external_id
         )
-        project.id = cursor.lastrowid
+        project.id = self.db.write(lambda conn: conn.execute(query, params).lastrowid).result()
         return project
     
     def update(self, project: Project) -> Project:
@@ -59,12 +71,39 @@ class SQLiteProjectRepository(ProjectRepository):
         SET name = ?, status = ?
         WHERE id = ?
         """
-        with self.db.connection as conn:
-            conn.execute(query, (project.name, project.status.value, project.id))
+        params = (project.name, project.status.value, project.id)
+        self.db.write(lambda conn: conn.execute(query, params)).result()
         return project
     
     def delete(self, project_id: int) -> bool:
         """Elimina un proyecto por su ID"""
         query = "DELETE FROM projects WHERE id = ?"
-        cursor = self.db.execute(query, (project_id,))
-        return cursor.rowcount > 0
+        return self.db.write(lambda conn: conn.execute(query, (project_id,)).rowcount).result() > 0
+    
+    def upsert_by_external_id(self, project: Project) -> Project:
+        """Crea el proyecto o actualiza el nombre del que tiene el mismo external_id"""
+        if not project.external_id:
+            return self.create(project)
+        
+        query = """
+            INSERT INTO projects (name, created_at, status, external_id)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (external_id) WHERE external_id != ''
+            DO UPDATE SET name = excluded.name
+        """
+        params = (
+            project.name,
+            project.created_at.isoformat(),
+            project.status.value,
+            project.external_id
+        )
+        
+        def upsert(conn) -> int:
+            conn.execute(query, params)
+            # Sin RETURNING (requiere SQLite 3.35): el ID se lee en la misma transacción
+            return conn.execute(
+                "SELECT id FROM projects WHERE external_id = ?", (project.external_id,)
+            ).fetchone()[0]
+        
+        project.id = self.db.write(upsert).result()
+        return project
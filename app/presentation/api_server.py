@@ -0,0 +1,331 @@
+# app/presentation/api_server.py
+"""Servidor HTTP/JSON local que expone los casos de uso de proyectos y flujos.
+
+Usa solo asyncio de la biblioteca estándar (HTTP/1.1 con conexiones
+persistentes) y no importa PyQt. El bucle de eventos solo atiende los
+sockets: cada petición se resuelve en un pool de hilos acotado, donde
+corren las consultas bloqueantes a SQLite (cada hilo con su conexión), la
+serialización a JSON y la compresión.
+
+- Los listados se paginan con ?page=N&page_size=M.
+- Las respuestas GET llevan un ETag (hash del cuerpo); si el cliente envía
+  If-None-Match con el mismo valor se responde 304 sin cuerpo.
+- Los cuerpos grandes se comprimen con gzip si el cliente lo acepta.
+
+Rutas:
+    GET    /api/health
+    GET    /api/projects                  POST /api/projects {"name"}
+    GET    /api/projects/{id}             DELETE /api/projects/{id}
+    POST   /api/projects/{id}/toggle
+    GET    /api/projects/{id}/flows       POST /api/projects/{id}/flows {"name", "recurrence", "owner", ...}
+    GET    /api/flows/{id}                DELETE /api/flows/{id}
+    POST   /api/flows/{id}/toggle
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from app.config import API
+
+MAX_BODY_SIZE = 1024 * 1024
+
+
+class HttpError(Exception):
+    """Error que se responde al cliente con el código indicado"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ApiRequest(NamedTuple):
+    """Petición ya interpretada, tal como la reciben los manejadores"""
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+    def json(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.body or b'{}')
+        except ValueError:
+            raise HttpError(400, "El cuerpo no es un JSON válido")
+        if not isinstance(data, dict):
+            raise HttpError(400, "El cuerpo debe ser un objeto JSON")
+        return data
+
+
+class ApiServer:
+    """Servidor HTTP/JSON sobre ProjectUseCases y FlowUseCases"""
+
+    def __init__(self, project_use_cases, flow_use_cases, workers: int = API['workers'],
+                 page_size: int = API['page_size'], max_page_size: int = API['max_page_size'],
+                 gzip_min_size: int = API['gzip_min_size']):
+        self.project_use_cases = project_use_cases
+        self.flow_use_cases = flow_use_cases
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.gzip_min_size = gzip_min_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='api-db')
+        # Limita las peticiones en curso al tamaño del pool: las demás esperan en el bucle
+        self._slots = asyncio.Semaphore(workers)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes: List[Tuple[re.Pattern, Dict[str, Callable]]] = [
+            (re.compile(pattern), handlers) for pattern, handlers in (
+                (r'/api/health', {'GET': self._health}),
+                (r'/api/projects', {'GET': self._list_projects, 'POST': self._create_project}),
+                (r'/api/projects/(\d+)', {'GET': self._get_project, 'DELETE': self._delete_project}),
+                (r'/api/projects/(\d+)/toggle', {'POST': self._toggle_project}),
+                (r'/api/projects/(\d+)/flows', {'GET': self._list_flows, 'POST': self._create_flow}),
+                (r'/api/flows/(\d+)', {'GET': self._get_flow, 'DELETE': self._delete_flow}),
+                (r'/api/flows/(\d+)/toggle', {'POST': self._toggle_flow}),
+            )
+        ]
+
+    # --- Ciclo de vida ---
+
+    async def start(self, host: str = API['host'], port: int = API['port']) -> Tuple[str, int]:
+        """Empieza a escuchar y devuelve la dirección real (port=0 elige uno libre)"""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=True)
+
+    # --- HTTP ---
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    writer.write(self._encode(431, {'error': "Encabezados demasiado grandes"}, keep_alive=False))
+                    break
+
+                try:
+                    request_line, *header_lines = head[:-4].decode('latin-1').split('\r\n')
+                    method, target, version = request_line.split(' ', 2)
+                    headers = {}
+                    for line in header_lines:
+                        name, _, value = line.partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    writer.write(self._encode(400, {'error': "Petición mal formada"}, keep_alive=False))
+                    break
+                if length > MAX_BODY_SIZE:
+                    writer.write(self._encode(413, {'error': "Cuerpo demasiado grande"}, keep_alive=False))
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+                url = urlsplit(target)
+                request = ApiRequest(method.upper(), url.path, parse_qs(url.query), headers, body)
+
+                async with self._slots:
+                    response = await asyncio.get_running_loop().run_in_executor(
+                        self._executor, self._process, request, keep_alive
+                    )
+                writer.write(response)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _process(self, request: ApiRequest, keep_alive: bool) -> bytes:
+        """Resuelve una petición completa (se ejecuta en el pool de hilos)"""
+        status = 200
+        try:
+            handler, params = self._route(request)
+            result = handler(request, *params)
+            if request.method == 'POST' and request.path.endswith(('/projects', '/flows')):
+                status = 201
+        except HttpError as e:
+            status, result = e.status, {'error': str(e)}
+        except KeyError as e:
+            status, result = 400, {'error': f"Falta el campo {e}"}
+        except ValueError as e:
+            status, result = 400, {'error': str(e)}
+        except Exception as e:
+            status, result = 500, {'error': str(e)}
+        return self._encode(status, result, request.headers, keep_alive, cacheable=request.method == 'GET')
+
+    def _route(self, request: ApiRequest) -> Tuple[Callable, List[int]]:
+        for pattern, handlers in self._routes:
+            match = pattern.fullmatch(request.path.rstrip('/') or '/')
+            if match:
+                if request.method not in handlers:
+                    raise HttpError(405, f"Método {request.method} no permitido en {request.path}")
+                return handlers[request.method], [int(group) for group in match.groups()]
+        raise HttpError(404, f"No existe la ruta {request.path}")
+
+    def _encode(self, status: int, payload: Any, request_headers: Optional[Dict[str, str]] = None,
+                keep_alive: bool = True, cacheable: bool = False) -> bytes:
+        """Arma la respuesta HTTP completa: JSON, ETag/304 y gzip"""
+        request_headers = request_headers or {}
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+
+        if cacheable and status == 200:
+            # ETag débil: identifica el contenido con o sin gzip
+            etag = 'W/"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            headers['ETag'] = etag
+            headers['Cache-Control'] = 'no-cache'
+            if _etag_matches(request_headers.get('if-none-match', ''), etag):
+                status, body = 304, b''
+
+        if status != 304:
+            headers['Vary'] = 'Accept-Encoding'
+            if len(body) >= self.gzip_min_size and _accepts_gzip(request_headers.get('accept-encoding', '')):
+                body = gzip.compress(body, compresslevel=5, mtime=0)
+                headers['Content-Encoding'] = 'gzip'
+            headers['Content-Length'] = str(len(body))
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+    # --- Manejadores (corren en el pool de hilos) ---
+
+    def _page(self, request: ApiRequest) -> Tuple[int, int]:
+        try:
+            page = int(request.query.get('page', ['1'])[0])
+            page_size = int(request.query.get('page_size', [str(self.page_size)])[0])
+        except ValueError:
+            raise HttpError(400, "page y page_size deben ser enteros")
+        if page < 1 or not 1 <= page_size <= self.max_page_size:
+            raise HttpError(400, f"page debe ser >= 1 y page_size entre 1 y {self.max_page_size}")
+        return page, page_size
+
+    @staticmethod
+    def _paginated(items: List[Dict[str, Any]], total: int, page: int, page_size: int) -> Dict[str, Any]:
+        return {
+            'items': items,
+            'page': page,
+            'page_size': page_size,
+            'total': total,
+            'pages': (total + page_size - 1) // page_size
+        }
+
+    def _health(self, request: ApiRequest) -> Dict[str, Any]:
+        return {'status': 'ok'}
+
+    def _list_projects(self, request: ApiRequest) -> Dict[str, Any]:
+        page, page_size = self._page(request)
+        result = self.project_use_cases.list_projects_page((page - 1) * page_size, page_size)
+        return self._paginated(result['items'], result['total'], page, page_size)
+
+    def _get_project(self, request: ApiRequest, project_id: int) -> Dict[str, Any]:
+        project = self.project_use_cases.get_project_details(project_id)
+        if project is None:
+            raise HttpError(404, f"No existe el proyecto {project_id}")
+        return project
+
+    def _create_project(self, request: ApiRequest) -> Dict[str, Any]:
+        return self.project_use_cases.add_new_project(request.json()['name'])
+
+    def _toggle_project(self, request: ApiRequest, project_id: int) -> Dict[str, Any]:
+        self._get_project(request, project_id)
+        return self.project_use_cases.change_project_status(project_id)
+
+    def _delete_project(self, request: ApiRequest, project_id: int) -> Dict[str, Any]:
+        return {'deleted': self.project_use_cases.remove_project(project_id)}
+
+    def _list_flows(self, request: ApiRequest, project_id: int) -> Dict[str, Any]:
+        page, page_size = self._page(request)
+        self._get_project(request, project_id)
+        result = self.flow_use_cases.list_flows_page(project_id, (page - 1) * page_size, page_size)
+        return self._paginated(result['items'], result['total'], page, page_size)
+
+    def _create_flow(self, request: ApiRequest, project_id: int) -> Dict[str, Any]:
+        data = request.json()
+        self._get_project(request, project_id)
+        return self.flow_use_cases.add_new_flow(
+            project_id, data['name'], data['recurrence'], data.get('owner', ''), data.get('schedule'),
+            data.get('connection', ''), data.get('estimated_duration', 5)
+        )
+
+    def _get_flow(self, request: ApiRequest, flow_id: int) -> Dict[str, Any]:
+        flow = self.flow_use_cases.get_flow_details(flow_id)
+        if flow is None:
+            raise HttpError(404, f"No existe el flujo {flow_id}")
+        return flow
+
+    def _toggle_flow(self, request: ApiRequest, flow_id: int) -> Dict[str, Any]:
+        self._get_flow(request, flow_id)
+        return self.flow_use_cases.change_flow_status(flow_id)
+
+    def _delete_flow(self, request: ApiRequest, flow_id: int) -> Dict[str, Any]:
+        return {'deleted': self.flow_use_cases.remove_flow(flow_id)}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Comparación débil de If-None-Match (acepta listas y '*')"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(',')]
+    return '*' in candidates or any(
+        _strip_weak(candidate) == _strip_weak(etag) for candidate in candidates
+    )
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith('W/') else etag
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        if coding.strip().lower() in ('gzip', '*'):
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+def create_api_server(**options) -> ApiServer:
+    """Crea el servidor con los repositorios SQLite (la base ya debe estar abierta)"""
+    from app.application.services.flow_service import FlowService
+    from app.application.services.project_service import ProjectService
+    from app.application.use_cases.flow_use_cases import FlowUseCases
+    from app.application.use_cases.project_use_cases import ProjectUseCases
+    from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+    from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+    project_repository = SQLiteProjectRepository()
+    return ApiServer(
+        ProjectUseCases(ProjectService(project_repository), project_repository),
+        FlowUseCases(FlowService(SQLiteFlowRepository())),
+        **options
+    )
+
+
+async def run_server(host: str, port: int, **options) -> None:
+    """Ejecuta el servidor hasta que se interrumpa el proceso"""
+    server = create_api_server(**options)
+    address = await server.start(host, port)
+    print(f"Escuchando en http://{address[0]}:{address[1]}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.stop()
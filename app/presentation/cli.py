@@ -0,0 +1,298 @@
+# app/presentation/cli.py
+"""Interfaz de línea de comandos para tareas por lotes, sin la interfaz gráfica.
+
+No importa PyQt: usa directamente los servicios y casos de uso, así que
+puede ejecutarse en tareas programadas o en servidores sin pantalla. Los
+listados se escriben de a un registro (JSON Lines o CSV) a medida que se
+leen de la base, sin cargarlos todos en memoria.
+
+Los módulos de cada comando se importan al ejecutarlo para que el
+arranque solo pague lo que el comando usa.
+
+Ejemplos:
+    python cli.py projects
+    python cli.py flows --project 3 --format csv --output flujos.csv
+    python cli.py deactivate --project 3
+    python cli.py changes --since 1520
+    python cli.py import exportacion.zip otra.zip
+    python cli.py --profile bulk-load import exportacion_grande.zip
+    python cli.py diagram 3
+    python cli.py serve --port 8765
+    python cli.py backup
+    python cli.py --db /tmp/carga.db generate --flows 1000000 --projects 500
+    python cli.py restore data/backups/power_automate-20240101-120000-000000.db.gz
+"""
+import argparse
+import csv
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+PROJECT_FIELDS = ['id', 'name', 'created_at', 'status', 'external_id']
+
+
+def _write_records(records: Iterable[Dict[str, Any]], fields: List[str],
+                   output_format: str, output: TextIO) -> int:
+    """Escribe los registros a medida que llegan; devuelve cuántos se escribieron"""
+    count = 0
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=fields, extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+            count += 1
+    else:
+        for record in records:
+            output.write(json.dumps(record, ensure_ascii=False))
+            output.write('\n')
+            count += 1
+    return count
+
+
+def _flow_use_cases():
+    from app.application.services.flow_service import FlowService
+    from app.application.use_cases.flow_use_cases import FlowUseCases
+    from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+    return FlowUseCases(FlowService(SQLiteFlowRepository()))
+
+
+def _cmd_projects(args, output: TextIO) -> int:
+    from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+    records = (
+        {
+            'id': project.id,
+            'name': project.name,
+            'created_at': project.created_at.isoformat(),
+            'status': project.status.value,
+            'external_id': project.external_id
+        }
+        for project in SQLiteProjectRepository().get_all()
+    )
+    _write_records(records, PROJECT_FIELDS, args.format, output)
+    return 0
+
+
+def _cmd_flows(args, output: TextIO) -> int:
+    from app.application.use_cases.flow_use_cases import FLOW_EXPORT_FIELDS
+    active = None if args.status is None else args.status == 'active'
+    records = _flow_use_cases().export_flows(args.project, active)
+    _write_records(records, FLOW_EXPORT_FIELDS, args.format, output)
+    return 0
+
+
+def _cmd_changes(args, output: TextIO) -> int:
+    from app.application.services.change_feed_service import ChangeFeedService
+    from app.domain.entities.change import Change
+    from app.infrastructure.repositories.sqlite_change_log_repository import SQLiteChangeLogRepository
+    feed = ChangeFeedService(SQLiteChangeLogRepository())
+    records = (change._asdict() for change in feed.iter_since(args.since))
+    _write_records(records, list(Change._fields), args.format, output)
+    return 0
+
+
+def _cmd_set_status(args, output: TextIO) -> int:
+    if not args.flow_ids and args.project is None:
+        raise ValueError("Indique los IDs de los flujos o --project")
+    changed = _flow_use_cases().flow_service.set_flows_status(
+        args.command == 'activate', args.flow_ids or None, args.project
+    )
+    _write_records([{'changed': changed}], ['changed'], args.format, output)
+    return 0
+
+
+def _cmd_import(args, output: TextIO) -> int:
+    from app.application.services.flow_dependency_service import FlowDependencyService
+    from app.application.services.flow_import_service import FlowImportService
+    from app.application.services.flow_inventory_service import FlowInventoryService
+    from app.application.use_cases.import_use_cases import ImportUseCases
+    from app.infrastructure.importers.flow_package_reader import read_flow_packages
+    from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+    from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
+    from app.infrastructure.repositories.sqlite_flow_inventory_repository import SQLiteFlowInventoryRepository
+    from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+    from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+    flow_repository = SQLiteFlowRepository()
+    definition_repository = SQLiteFlowDefinitionRepository()
+    import_service = FlowImportService(
+        SQLiteProjectRepository(), flow_repository, definition_repository, read_flow_packages,
+        FlowInventoryService(definition_repository, SQLiteFlowInventoryRepository()),
+        FlowDependencyService(SQLiteFlowDependencyRepository(), flow_repository)
+    )
+    summary = ImportUseCases(import_service).import_packages(args.paths, args.workers)
+    output.write(json.dumps(summary, ensure_ascii=False) + '\n')
+    return 1 if summary['errors'] else 0
+
+
+def _cmd_diagram(args, output: TextIO) -> int:
+    # graphviz solo se carga para este comando
+    from app.utils.diagram_generator import generate_project_diagram
+    path = generate_project_diagram(args.project_id, include_dependencies=not args.no_dependencies)
+    output.write(path + '\n')
+    return 0
+
+
+def _cmd_serve(args, output: TextIO) -> int:
+    import asyncio
+    from app.presentation.api_server import run_server
+    try:
+        asyncio.run(run_server(args.host, args.port, workers=args.workers))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _cmd_generate(args, output: TextIO) -> int:
+    from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data
+    spec = SyntheticDataSpec(
+        projects=args.projects, flows=args.flows, owners=args.owners, project_skew=args.skew,
+        active_ratio=args.active_ratio, seed=args.seed
+    )
+    output.write(json.dumps(generate_synthetic_data(spec), ensure_ascii=False) + '\n')
+    return 0
+
+
+def _backup_manager(args):
+    from app.config import BACKUP
+    from app.infrastructure.database.backup import BackupManager
+    from app.infrastructure.database.connection import Database
+    return BackupManager(Database().db_path, args.dir or BACKUP['dir'])
+
+
+def _cmd_backup(args, output: TextIO) -> int:
+    manager = _backup_manager(args)
+    if args.list:
+        records = (
+            {'path': backup.path, 'created_at': backup.created_at.isoformat(), 'size': backup.size}
+            for backup in manager.list_backups()
+        )
+        _write_records(records, ['path', 'created_at', 'size'], args.format, output)
+        return 0
+    if args.keep is not None:
+        manager.keep = args.keep
+    result = manager.create_backup()
+    output.write(json.dumps(result._asdict(), ensure_ascii=False) + '\n')
+    return 0
+
+
+def _cmd_restore(args, output: TextIO) -> int:
+    _backup_manager(args).restore(args.path)
+    output.write(json.dumps({'restored': args.path}, ensure_ascii=False) + '\n')
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from app.config import API, BACKUP, DATABASE
+    from app.infrastructure.database.synthetic_data import SyntheticDataSpec
+
+    def add_common_options(target: argparse.ArgumentParser, default: Any) -> None:
+        target.add_argument('--db', default=default,
+                            help="Ruta de la base de datos (por defecto data/power_automate.db)")
+        target.add_argument('--profile', choices=list(DATABASE['profiles']), default=default,
+                            help=f"Perfil de PRAGMA de SQLite (por defecto {DATABASE['profile']}; "
+                                 "bulk-load acelera las importaciones)")
+        target.add_argument('--output', '-o', default=default,
+                            help="Archivo de salida (por defecto, la salida estándar)")
+        target.add_argument('--format', '-f', choices=['jsonl', 'csv'],
+                            default='jsonl' if default is None else default, help="Formato de los listados")
+
+    parser = argparse.ArgumentParser(
+        prog='cli.py',
+        description="Operaciones por lotes sobre proyectos y flujos, sin interfaz gráfica"
+    )
+    add_common_options(parser, None)
+    # Las opciones comunes también se aceptan después del comando, sin pisar las anteriores
+    common = argparse.ArgumentParser(add_help=False)
+    add_common_options(common, argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_command(name: str, help_text: str) -> argparse.ArgumentParser:
+        return commands.add_parser(name, help=help_text, parents=[common])
+
+    projects = add_command('projects', "Lista los proyectos")
+    projects.set_defaults(handler=_cmd_projects)
+
+    flows = add_command('flows', "Exporta los flujos")
+    flows.add_argument('--project', type=int, help="Solo los flujos de este proyecto")
+    flows.add_argument('--status', choices=['active', 'inactive'], help="Solo los flujos con este estado")
+    flows.set_defaults(handler=_cmd_flows)
+
+    changes = add_command('changes', "Lista los cambios de proyectos y flujos posteriores a un cursor")
+    changes.add_argument('--since', type=int, default=0,
+                         help="Último seq ya procesado (se listan los posteriores)")
+    changes.set_defaults(handler=_cmd_changes)
+
+    for name, verb in (('activate', "Activa"), ('deactivate', "Desactiva")):
+        command = add_command(name, f"{verb} flujos en bloque")
+        command.add_argument('flow_ids', type=int, nargs='*', help="IDs de los flujos")
+        command.add_argument('--project', type=int, help="Todos los flujos de este proyecto")
+        command.set_defaults(handler=_cmd_set_status)
+
+    importer = add_command('import', "Importa paquetes exportados de Power Automate")
+    importer.add_argument('paths', nargs='+', help="Archivos .zip")
+    importer.add_argument('--workers', type=int, help="Procesos de lectura (por defecto, uno por CPU)")
+    importer.set_defaults(handler=_cmd_import)
+
+    diagram = add_command('diagram', "Genera el diagrama SVG de un proyecto")
+    diagram.add_argument('project_id', type=int)
+    diagram.add_argument('--no-dependencies', action='store_true',
+                         help="No dibujar las dependencias entre flujos")
+    diagram.set_defaults(handler=_cmd_diagram)
+
+    serve = add_command('serve', "Inicia el servidor HTTP/JSON para otros equipos")
+    serve.add_argument('--host', default=API['host'], help=f"Dirección (por defecto {API['host']})")
+    serve.add_argument('--port', type=int, default=API['port'], help=f"Puerto (por defecto {API['port']})")
+    serve.add_argument('--workers', type=int, default=API['workers'],
+                       help=f"Hilos para las consultas a la base (por defecto {API['workers']})")
+    serve.set_defaults(handler=_cmd_serve)
+
+    defaults = SyntheticDataSpec()
+    generate = add_command('generate', "Genera proyectos y flujos sintéticos para pruebas de rendimiento")
+    generate.add_argument('--projects', type=int, default=defaults.projects)
+    generate.add_argument('--flows', type=int, default=defaults.flows)
+    generate.add_argument('--owners', type=int, default=defaults.owners)
+    generate.add_argument('--skew', type=float, default=defaults.project_skew,
+                          help="Exponente de Zipf de los flujos por proyecto (0 = reparto uniforme)")
+    generate.add_argument('--active-ratio', type=float, default=defaults.active_ratio,
+                          help="Proporción de flujos activos")
+    generate.add_argument('--seed', type=int, default=defaults.seed)
+    generate.set_defaults(handler=_cmd_generate)
+
+    backup = add_command('backup', "Hace una copia de seguridad en línea de la base (comprimida y rotada)")
+    backup.add_argument('--dir', help=f"Carpeta de las copias (por defecto {BACKUP['dir']})")
+    backup.add_argument('--keep', type=int, help=f"Copias que se conservan (por defecto {BACKUP['keep']})")
+    backup.add_argument('--list', action='store_true', help="Lista las copias existentes sin hacer una nueva")
+    backup.set_defaults(handler=_cmd_backup)
+
+    restore = add_command('restore', "Restaura una copia de seguridad tras verificar su integridad")
+    restore.add_argument('path', help="Archivo .db.gz de la copia")
+    restore.add_argument('--dir', help=argparse.SUPPRESS)
+    restore.set_defaults(handler=_cmd_restore)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ejecuta un comando y devuelve el código de salida"""
+    args = build_parser().parse_args(argv)
+
+    from app.config import TRACING
+    if TRACING['enabled']:
+        from app.utils.tracing import enable_tracing
+        enable_tracing(TRACING['trace_file'])
+
+    from app.infrastructure.database.connection import Database
+    from app.infrastructure.database.schema import DatabaseSchema
+    Database(args.db, args.profile)
+    DatabaseSchema.create_tables()
+
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        return args.handler(args, output)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+        Database().disconnect()
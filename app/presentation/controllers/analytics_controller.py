@@ -0,0 +1,41 @@
+from PyQt6.QtWidgets import QMessageBox
+from app.application.services.flow_analytics_service import FlowAnalyticsService
+from app.application.use_cases.analytics_use_cases import AnalyticsUseCases
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+
+class AnalyticsController:
+    """Controlador para el análisis de carga de los flujos"""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        
+        # Repositorios y servicios
+        self.flow_repository = SQLiteFlowRepository()
+        self.analytics_service = FlowAnalyticsService(self.flow_repository)
+        self.use_cases = AnalyticsUseCases(self.analytics_service)
+    
+    def get_load_summary(self, days=30):
+        """Obtiene el resumen de carga esperada"""
+        try:
+            return self.use_cases.get_load_summary(days=days)
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudo calcular la carga esperada: {str(e)}"
+            )
+            return None
+    
+    def find_congested_windows(self, group_by, days, threshold, top_k):
+        """Obtiene los intervalos de mayor concurrencia"""
+        try:
+            return self.use_cases.find_congested_windows(
+                group_by=group_by, days=days, threshold=threshold, top_k=top_k
+            )
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudo analizar la concurrencia: {str(e)}"
+            )
+            return []
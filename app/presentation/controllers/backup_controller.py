@@ -0,0 +1,42 @@
+import threading
+from PyQt6.QtCore import QObject, QTimer
+from app.config import BACKUP
+from app.infrastructure.database.backup import BackupManager
+from app.infrastructure.database.connection import Database
+
+class BackupController(QObject):
+    """Hace la copia de seguridad programada mientras la aplicación está abierta.
+
+    Cada hora revisa si la última copia es más antigua que
+    BACKUP['interval_hours'] y, si lo es, la hace en un hilo aparte: la copia
+    avanza por pasos cortos, así que ni la interfaz ni las escrituras esperan.
+    """
+
+    def __init__(self, parent=None, check_interval_ms: int = 60 * 60 * 1000):
+        super().__init__(parent)
+        self.backup_manager = BackupManager(Database().db_path)
+        self._thread = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(check_interval_ms)
+        self.timer.timeout.connect(self.backup_if_due)
+
+    def start(self):
+        self.timer.start()
+        # Primera revisión al volver al bucle de eventos, para no demorar el arranque
+        QTimer.singleShot(0, self.backup_if_due)
+
+    def stop(self):
+        self.timer.stop()
+
+    def backup_if_due(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name='db-backup', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        try:
+            if self.backup_manager.is_due(BACKUP['interval_hours']):
+                self.backup_manager.create_backup()
+        except Exception as e:
+            print(f"Error al hacer la copia de seguridad: {e}")
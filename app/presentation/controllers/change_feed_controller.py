@@ -0,0 +1,66 @@
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from app.application.services.change_feed_service import ChangeFeedService
+from app.config import UI
+from app.infrastructure.repositories.sqlite_change_log_repository import SQLiteChangeLogRepository
+
+class ChangeFeedController(QObject):
+    """Consulta periódicamente el registro de cambios y avisa a las vistas.
+
+    Detecta las ediciones hechas por otras instancias que comparten la base
+    (y las del servidor HTTP). Cada consulta cuesta un PRAGMA data_version
+    cuando no hubo cambios. Los cambios de esta misma instancia no se
+    emiten (las vistas ya los muestran) y, si se acumulan más de
+    UI['change_poll_max_changes'], se emite un lote con full_refresh en vez
+    de leerlos todos en el hilo de la interfaz.
+
+    También poda el registro, que solo crece: al iniciar y cada vez que el
+    cursor avanza otros 'keep' cambios, elimina los anteriores a los últimos
+    'keep' (UI['change_log_keep']).
+    """
+
+    changes_available = pyqtSignal(object)  # ChangeBatch
+
+    def __init__(self, parent=None, interval_ms: int = UI['change_poll_ms'],
+                 keep: int = UI['change_log_keep'], max_changes: int = UI['change_poll_max_changes']):
+        super().__init__(parent)
+        self.change_feed_service = ChangeFeedService(SQLiteChangeLogRepository(), max_changes=max_changes)
+        # Los cambios anteriores al inicio ya están en lo que muestran las vistas
+        self.cursor = self.change_feed_service.current_cursor()
+        self.keep = keep
+        self.pruned_up_to = 0
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.prune()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def poll(self):
+        """Lee los cambios nuevos y los emite (sin diálogos: corre en segundo plano)"""
+        try:
+            batch = self.change_feed_service.poll(self.cursor)
+        except Exception as e:
+            print(f"Error al consultar los cambios: {e}")
+            return
+        if batch is not None:
+            self.cursor = batch.cursor
+            if batch.changes or batch.full_refresh:
+                self.changes_available.emit(batch)
+            if self.cursor - self.pruned_up_to >= 2 * self.keep:
+                self.prune()
+
+    def prune(self):
+        """Elimina del registro los cambios anteriores a los últimos 'keep'"""
+        up_to = self.cursor - self.keep
+        if up_to <= self.pruned_up_to:
+            return
+        try:
+            self.change_feed_service.prune(up_to)
+        except Exception as e:
+            print(f"Error al podar el registro de cambios: {e}")
+            return
+        self.pruned_up_to = up_to
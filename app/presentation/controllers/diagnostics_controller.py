@@ -0,0 +1,78 @@
+from app.config import RESPONSIVENESS
+from app.infrastructure.database.connection import Database
+from app.utils.event_loop_watchdog import watchdog
+
+class DiagnosticsController:
+    """Controlador del panel de diagnóstico: registro de consultas de la base y bloqueos de la interfaz"""
+
+    def __init__(self, parent):
+        self.parent = parent
+        self.db = Database()
+        self.watchdog = watchdog
+
+    def is_logging(self):
+        return self.db.query_log is not None
+
+    def set_logging(self, enabled):
+        """Activa o desactiva el registro de consultas"""
+        if enabled:
+            self.db.enable_query_log()
+        else:
+            self.db.disable_query_log()
+
+    def load_statements(self, limit=100):
+        """Sentencias con más tiempo acumulado"""
+        query_log = self.db.query_log
+        if query_log is None:
+            return []
+        return [
+            {
+                'sql': stats.sql,
+                'count': stats.count,
+                'total_ms': round(stats.total_ms, 1),
+                'mean_ms': round(stats.total_ms / stats.count, 2),
+                'max_ms': round(stats.max_ms, 1),
+                'rows': stats.rows,
+                'slow': stats.slow,
+                'full_scans': list(stats.full_scans),
+            }
+            for stats in query_log.top(limit)
+        ]
+
+    def load_slow_queries(self):
+        """Consultas lentas recientes con su plan"""
+        query_log = self.db.query_log
+        return query_log.recent_slow() if query_log is not None else []
+
+    def clear(self):
+        if self.db.query_log is not None:
+            self.db.query_log.reset()
+
+    def load_stall_summary(self):
+        """Latencia del bucle de eventos y total de bloqueos"""
+        return self.watchdog.summary()
+
+    def load_stall_actions(self, limit=50):
+        """Acciones con más tiempo de interfaz bloqueada"""
+        return [
+            {
+                'action': stats.action or '(desconocida)',
+                'count': stats.count,
+                'total_ms': round(stats.total_ms, 1),
+                'max_ms': round(stats.max_ms, 1),
+            }
+            for stats in self.watchdog.top_actions(limit)
+        ]
+
+    def load_stalls(self):
+        """Bloqueos recientes con la pila del hilo de la interfaz"""
+        return self.watchdog.recent_stalls()
+
+    def export_stalls(self, path=None):
+        """Exporta las estadísticas de bloqueos a JSON y devuelve la ruta"""
+        path = path or RESPONSIVENESS['export_file']
+        self.watchdog.export(path)
+        return path
+
+    def clear_stalls(self):
+        self.watchdog.reset()
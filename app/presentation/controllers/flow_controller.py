@@ -1,9 +1,20 @@
 from PyQt6.QtWidgets import QMessageBox
 from app.application.services.flow_service import FlowService
 from app.application.use_cases.flow_use_cases import FlowUseCases
+from app.application.services.flow_run_service import FlowRunService
+from app.application.use_cases.flow_run_use_cases import FlowRunUseCases
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.application.use_cases.dependency_use_cases import DependencyUseCases
 from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_run_repository import SQLiteFlowRunRepository
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
+from app.infrastructure.importers.run_history_reader import read_run_history
 from app.domain.entities.flow import RecurrenceType, FlowStatus
+from app.domain.entities.schedule import CronExpression
+from app.utils.tracing import trace_methods
 
+@trace_methods('controller')
 class FlowController:
     """Controlador para gestionar flujos"""
     
@@ -12,9 +23,19 @@ class FlowController:
         
         # Repositorios y servicios
         self.flow_repository = SQLiteFlowRepository()
-        self.flow_service = FlowService(self.flow_repository)
+        self.definition_repository = SQLiteFlowDefinitionRepository()
+        self.flow_service = FlowService(self.flow_repository, self.definition_repository)
         self.flow_use_cases = FlowUseCases(self.flow_service)
         
+        # Historial de ejecuciones
+        self.run_repository = SQLiteFlowRunRepository()
+        self.run_service = FlowRunService(self.run_repository, self.flow_repository)
+        self.run_use_cases = FlowRunUseCases(self.run_service)
+        
+        # Dependencias entre flujos
+        self.dependency_service = FlowDependencyService(SQLiteFlowDependencyRepository(), self.flow_repository)
+        self.dependency_use_cases = DependencyUseCases(self.dependency_service)
+        
         # Conectar eventos
         self._connect_events()
     
@@ -49,7 +70,32 @@ class FlowController:
             )
             return None
     
-    def add_flow(self, project_id, name, recurrence, owner):
+    def get_flow_definition(self, flow_id):
+        """Obtiene la definición importada de un flujo"""
+        try:
+            return self.flow_use_cases.get_flow_definition(flow_id)
+        except Exception as e:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                f"No se pudo cargar la definición del flujo: {str(e)}"
+            )
+            return None
+    
+    def get_flow_impact(self, flow_id):
+        """Obtiene los flujos de los que depende un flujo y los que dependen de él"""
+        try:
+            return self.dependency_use_cases.get_flow_impact(flow_id)
+        except Exception as e:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                f"No se pudo analizar el impacto del flujo: {str(e)}"
+            )
+            return None
+    
+    def add_flow(self, project_id, name, recurrence, owner, schedule=None,
+                 connection=None, estimated_duration=None):
         """Agrega un nuevo flujo"""
         try:
             if not name.strip():
@@ -63,9 +109,19 @@ class FlowController:
                 RecurrenceType(recurrence)
             except ValueError:
                 raise ValueError("Tipo de recurrencia no válido")
+            
+            self._validate_schedule(recurrence, schedule)
                 
+            # Solo se envían los datos opcionales que la vista proporcionó
+            extras = {
+                key: value for key, value in (
+                    ('schedule', schedule),
+                    ('connection', connection),
+                    ('estimated_duration', estimated_duration)
+                ) if value is not None
+            }
             flow = self.flow_use_cases.add_new_flow(
-                project_id, name, recurrence, owner
+                project_id, name, recurrence, owner, **extras
             )
             return flow
         except Exception as e:
@@ -76,7 +132,8 @@ class FlowController:
             )
             return None
     
-    def update_flow(self, flow_id, name, recurrence, owner, is_active):
+    def update_flow(self, flow_id, name, recurrence, owner, is_active, schedule=None,
+                    connection=None, estimated_duration=None):
         """Actualiza un flujo existente"""
         try:
             if not name.strip():
@@ -91,6 +148,8 @@ class FlowController:
             except ValueError:
                 raise ValueError("Tipo de recurrencia no válido")
             
+            self._validate_schedule(recurrence, schedule)
+            
             # Obtener el flujo actual
             flow = self.flow_service.get_flow_by_id(flow_id)
             if not flow:
@@ -101,6 +160,12 @@ class FlowController:
             flow.recurrence = RecurrenceType(recurrence)
             flow.owner = owner
             flow.status = FlowStatus.ACTIVE if is_active else FlowStatus.INACTIVE
+            if schedule is not None:
+                flow.schedule = self.flow_use_cases.build_schedule(schedule)
+            if connection is not None:
+                flow.connection = connection
+            if estimated_duration is not None:
+                flow.estimated_duration = estimated_duration
             
             # Guardar los cambios
             updated_flow = self.flow_service.update_flow(flow)
@@ -115,6 +180,15 @@ class FlowController:
             )
             return None
     
+    def _validate_schedule(self, recurrence, schedule):
+        """Valida la programación ingresada para la recurrencia elegida"""
+        cron = (schedule or {}).get('cron', '').strip()
+        if RecurrenceType(recurrence) == RecurrenceType.CUSTOM and not cron:
+            raise ValueError("La recurrencia personalizada requiere una expresión cron")
+        if cron:
+            # Lanza ValueError con el detalle si la expresión no es válida
+            CronExpression(cron)
+    
     def toggle_flow_status(self, flow_id):
         """Cambia el estado de un flujo"""
         try:
@@ -151,4 +225,30 @@ class FlowController:
                 "Error",
                 f"No se pudo eliminar el flujo: {str(e)}"
             )
-            return False
\ No newline at end of file
+            return False
+    
+    def load_flows_health(self, project_id, days=30):
+        """Carga la salud de los flujos de un proyecto a partir de los resúmenes diarios"""
+        try:
+            return self.run_use_cases.get_project_health(project_id, days)
+        except Exception as e:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                f"No se pudo cargar la salud de los flujos: {str(e)}"
+            )
+            return {}
+    
+    def import_run_history(self, project_id, file_path, flow_id=None):
+        """Importa un historial de ejecuciones exportado (CSV, JSON o JSON Lines)"""
+        try:
+            return self.run_use_cases.import_run_history(
+                read_run_history(file_path), project_id, flow_id
+            )
+        except Exception as e:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                f"No se pudo importar el historial: {str(e)}"
+            )
+            return None
@@ -0,0 +1,45 @@
+from PyQt6.QtWidgets import QMessageBox
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.application.services.flow_import_service import FlowImportService
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.application.use_cases.import_use_cases import ImportUseCases
+from app.infrastructure.importers.flow_package_reader import read_flow_packages
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
+from app.infrastructure.repositories.sqlite_flow_inventory_repository import SQLiteFlowInventoryRepository
+
+class ImportController:
+    """Controlador para importar paquetes exportados de Power Automate"""
+    
+    def __init__(self, parent):
+        self.parent = parent
+        
+        # Repositorios y servicios
+        self.project_repository = SQLiteProjectRepository()
+        self.flow_repository = SQLiteFlowRepository()
+        self.definition_repository = SQLiteFlowDefinitionRepository()
+        self.inventory_service = FlowInventoryService(
+            self.definition_repository, SQLiteFlowInventoryRepository()
+        )
+        self.dependency_service = FlowDependencyService(
+            SQLiteFlowDependencyRepository(), self.flow_repository
+        )
+        self.import_service = FlowImportService(
+            self.project_repository, self.flow_repository, self.definition_repository,
+            read_flow_packages, self.inventory_service, self.dependency_service
+        )
+        self.use_cases = ImportUseCases(self.import_service)
+    
+    def import_packages(self, paths):
+        """Importa los archivos seleccionados"""
+        try:
+            return self.use_cases.import_packages(paths)
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudieron importar los paquetes: {str(e)}"
+            )
+            return None
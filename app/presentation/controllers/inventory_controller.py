@@ -0,0 +1,60 @@
+from PyQt6.QtWidgets import QMessageBox
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.application.services.flow_service import FlowService
+from app.application.use_cases.inventory_use_cases import InventoryUseCases
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_inventory_repository import SQLiteFlowInventoryRepository
+
+class InventoryController:
+    """Controlador para el inventario de conectores"""
+
+    def __init__(self, parent):
+        self.parent = parent
+
+        # Repositorios y servicios
+        self.flow_repository = SQLiteFlowRepository()
+        self.definition_repository = SQLiteFlowDefinitionRepository()
+        self.inventory_repository = SQLiteFlowInventoryRepository()
+        self.flow_service = FlowService(
+            self.flow_repository, self.definition_repository, self.inventory_repository
+        )
+        self.inventory_service = FlowInventoryService(self.definition_repository, self.inventory_repository)
+        self.use_cases = InventoryUseCases(self.flow_service, self.inventory_service)
+
+    def load_connectors(self):
+        """Actualiza el inventario (solo definiciones nuevas) y carga los conectores"""
+        try:
+            self.use_cases.refresh_inventory()
+            return self.use_cases.list_connectors()
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudo cargar el inventario de conectores: {str(e)}"
+            )
+            return []
+
+    def load_operations(self, connector):
+        """Carga las operaciones usadas de un conector"""
+        try:
+            return self.use_cases.list_operations(connector)
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudieron cargar las operaciones: {str(e)}"
+            )
+            return []
+
+    def find_flows(self, connector, operation=None):
+        """Busca los flujos que usan un conector u operación"""
+        try:
+            return self.use_cases.find_flows(connector, operation)
+        except Exception as e:
+            QMessageBox.critical(
+                self.parent,
+                "Error",
+                f"No se pudieron buscar los flujos: {str(e)}"
+            )
+            return []
@@ -2,7 +2,9 @@ from PyQt6.QtWidgets import QMessageBox
 from app.application.services.project_service import ProjectService
 from app.application.use_cases.project_use_cases import ProjectUseCases
 from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.utils.tracing import trace_methods
 
+@trace_methods('controller')
 class ProjectController:
     """Controlador para gestionar proyectos"""
     
@@ -0,0 +1,25 @@
+from PyQt6.QtCore import QObject, QTimer, Qt
+from app.utils.event_loop_watchdog import watchdog
+
+class ResponsivenessController(QObject):
+    """Latido del bucle de eventos para el detector de bloqueos (app/utils/event_loop_watchdog.py).
+
+    El temporizador es de precisión para que la latencia medida sea la del
+    bucle de eventos y no el redondeo de un temporizador aproximado.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.watchdog = watchdog
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(int(watchdog.interval_ms))
+        self.timer.timeout.connect(watchdog.beat)
+
+    def start(self):
+        self.watchdog.start()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.watchdog.stop()
@@ -1,15 +1,23 @@
 # app/presentation/main.py
 import sys
 from PyQt6.QtWidgets import QApplication
+from app.config import TRACING
 from app.presentation.controllers.main_controller import MainController
+from app.utils.startup_timing import startup
+from app.utils.tracing import enable_tracing
 
 def start_app():
     """Inicia la aplicación"""
+    startup.mark('imports')
+    if TRACING['enabled']:
+        enable_tracing(TRACING['trace_file'])
+    
     # Crear la aplicación Qt
     app = QApplication(sys.argv)
     
     # Configurar algunos estilos globales si es necesario
     app.setStyle("Fusion")
+    startup.mark('qt_application')
     
     # Crear el controlador principal
     controller = MainController()
@@ -0,0 +1,120 @@
+# app/presentation/theme.py
+"""Tema de la interfaz.
+
+Toda la aplicación usa una sola hoja de estilos (assets/styles.qss) que se
+aplica una vez a la QApplication. Las vistas no llaman a setStyleSheet: cada
+widget se distingue por su nombre de objeto (QPushButton#backButton) o por una
+propiedad dinámica (QLabel[role="subtitle"]), y la hoja se compila una sola
+vez reemplazando los colores @nombre por los de PALETTE.
+
+Un setStyleSheet por widget obliga a Qt a interpretar esa hoja y a crear un
+estilo propio para el widget y sus hijos cada vez que se construye (p. ej.
+cada tarjeta de proyecto).
+"""
+import os
+import re
+from functools import lru_cache
+from typing import Any, Optional
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QGraphicsDropShadowEffect, QWidget
+from app.config import UI
+
+STYLE_FILE = os.path.join(os.path.dirname(__file__), 'assets', 'styles.qss')
+
+# Colores de la aplicación (en la hoja de estilos: @nombre)
+PALETTE = {
+    'text': '#333333',
+    'text_secondary': '#555555',
+    'text_muted': '#666666',
+    'text_hint': '#888888',
+    'text_disabled': '#999999',
+    'background': '#f5f5f5',
+    'surface': '#ffffff',
+    'surface_alt': '#f9f9f9',
+    'border': '#e0e0e0',
+    'border_input': '#cccccc',
+    'border_hover': '#bbbbbb',
+    'primary': '#4a86e8',
+    'primary_hover': '#3b78e7',
+    'primary_pressed': '#3367d6',
+    'secondary': '#9c27b0',
+    'secondary_hover': '#8e24aa',
+    'secondary_pressed': '#7b1fa2',
+    'success': '#4caf50',
+    'success_hover': '#43a047',
+    'success_pressed': '#388e3c',
+    'danger': '#d32f2f',
+    'danger_hover': '#c62828',
+    'danger_pressed': '#b71c1c',
+    'error': '#f44336',
+    'neutral': '#f0f0f0',
+    'neutral_hover': '#e6e6e6',
+    'neutral_border': '#dddddd',
+    'selection': '#e3f2fd',
+    'selection_text': '#2196f3',
+}
+
+_TOKEN = re.compile(r'@([a-z_]+)')
+
+
+def compile_stylesheet(source: str) -> str:
+    """Reemplaza los colores @nombre de una hoja de estilos (un nombre desconocido es un error)"""
+    return _TOKEN.sub(lambda match: PALETTE[match.group(1)], source)
+
+
+@lru_cache(maxsize=None)
+def stylesheet() -> str:
+    """Hoja de estilos de la aplicación, compilada una sola vez"""
+    with open(STYLE_FILE, encoding='utf-8') as source:
+        return compile_stylesheet(source.read())
+
+
+def apply(app: QApplication) -> None:
+    """Aplica el tema a toda la aplicación"""
+    try:
+        app.setStyleSheet(stylesheet())
+    except OSError as e:
+        print(f"Error al cargar los estilos: {e}")
+
+
+def set_state(widget: QWidget, name: str, value: Any) -> None:
+    """Cambia una propiedad usada en los selectores y vuelve a aplicar el estilo del widget.
+
+    Qt evalúa los selectores al pulir el widget: sin volver a pulirlo, el
+    cambio de propiedad no se vería.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def use_shadows(count: int = 0, limit: Optional[int] = None) -> bool:
+    """Indica si se dibujan sombras en una lista de count elementos según UI['render_quality'].
+
+    Una sombra (QGraphicsDropShadowEffect) hace que el widget y sus hijos se
+    dibujen en una imagen aparte y se desenfoquen en cada repintado: con
+    cientos de tarjetas, desplazarse por la lista deja de ser fluido.
+    """
+    quality = UI['render_quality']
+    if quality == 'low':
+        return False
+    if quality == 'auto' and limit is not None and count > limit:
+        return False
+    return True
+
+
+def set_shadow(widget: QWidget, enabled: bool) -> None:
+    """Pone o quita la sombra de un widget"""
+    if not enabled:
+        if widget.graphicsEffect() is not None:
+            widget.setGraphicsEffect(None)
+        return
+    if widget.graphicsEffect() is None:
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(15)
+        shadow.setColor(QColor(0, 0, 0, 30))
+        shadow.setOffset(0, 3)
+        widget.setGraphicsEffect(shadow)
@@ -1,9 +1,9 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QLineEdit, QGroupBox, QFormLayout, QMessageBox,
-    QComboBox, QDateEdit
+    QComboBox, QDateEdit, QTimeEdit, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QTime
 from datetime import datetime
 
 from app.domain.entities.flow import RecurrenceType
@@ -57,15 +57,35 @@ class AddFlowView(QWidget):
             self.recurrence_combo.addItem(recurrence_type.value, recurrence_type.value)
         form_layout.addRow("Recurrencia:", self.recurrence_combo)
         
+        # Hora de ejecución
+        self.time_input = QTimeEdit()
+        self.time_input.setDisplayFormat("HH:mm")
+        self.time_input.setTime(QTime(8, 0))
+        form_layout.addRow("Hora:", self.time_input)
+        
+        # Expresión cron (solo para recurrencia personalizada)
+        self.cron_input = QLineEdit()
+        self.cron_input.setPlaceholderText("Ej.: */15 8-18 * * 1-5 (minuto hora día mes día-semana)")
+        form_layout.addRow("Cron:", self.cron_input)
+        self.recurrence_combo.currentIndexChanged.connect(self._on_recurrence_changed)
+        self._on_recurrence_changed()
+        
         # Campo de propietario
         self.owner_input = QLineEdit()
         self.owner_input.setPlaceholderText("Ingrese el nombre del propietario")
         form_layout.addRow("Propietario:", self.owner_input)
         
-        for i in range(form_layout.rowCount()):
-            item = form_layout.itemAt(i, QFormLayout.ItemRole.LabelRole)
-            if item and item.widget():
-                item.widget().setStyleSheet("color: #333333;")
+        # Conexión principal (para detectar saturación por conexión)
+        self.connection_input = QLineEdit()
+        self.connection_input.setPlaceholderText("Ej.: SharePoint - cuenta de servicio")
+        form_layout.addRow("Conexión:", self.connection_input)
+        
+        # Duración estimada de cada ejecución
+        self.duration_input = QSpinBox()
+        self.duration_input.setRange(1, 24 * 60)
+        self.duration_input.setValue(5)
+        self.duration_input.setSuffix(" min")
+        form_layout.addRow("Duración estimada:", self.duration_input)
         
         self.layout.addWidget(form_group)
         
@@ -87,6 +107,12 @@ class AddFlowView(QWidget):
         # Espacio adicional
         self.layout.addStretch()
     
+    def _on_recurrence_changed(self):
+        """Habilita los campos de programación según la recurrencia"""
+        is_custom = self.recurrence_combo.currentData() == RecurrenceType.CUSTOM.value
+        self.cron_input.setEnabled(is_custom)
+        self.time_input.setEnabled(not is_custom)
+    
     def set_project(self, project_id, project_name):
         """Establece el proyecto actual"""
         self.current_project_id = project_id
@@ -120,7 +146,13 @@ class AddFlowView(QWidget):
                 self.current_project_id,
                 name,
                 recurrence,
-                owner
+                owner,
+                {
+                    'time': self.time_input.time().toString("HH:mm"),
+                    'cron': self.cron_input.text().strip()
+                },
+                self.connection_input.text().strip(),
+                self.duration_input.value()
             )
             if flow:
                 self.flow_added.emit(self.current_project_id)
@@ -136,4 +168,8 @@ class AddFlowView(QWidget):
         """Limpia el formulario"""
         self.name_input.clear()
         self.recurrence_combo.setCurrentIndex(0)
-        self.owner_input.clear()
\ No newline at end of file
+        self.time_input.setTime(QTime(8, 0))
+        self.cron_input.clear()
+        self.owner_input.clear()
+        self.connection_input.clear()
+        self.duration_input.setValue(5)
\ No newline at end of file
@@ -0,0 +1,148 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QSpinBox, QFrame
+)
+from PyQt6.QtCore import pyqtSignal
+
+from app.presentation.controllers.analytics_controller import AnalyticsController
+
+# Opciones de agrupación: (texto visible, criterio)
+GROUP_OPTIONS = [
+    ("Propietario", "owner"),
+    ("Conexión", "connection"),
+    ("Proyecto", "project"),
+]
+
+class ConcurrencyView(QWidget):
+    """Vista de análisis de concurrencia de los flujos programados"""
+    
+    back_requested = pyqtSignal()
+    
+    def __init__(self):
+        super().__init__()
+        
+        # Controlador
+        self.analytics_controller = AnalyticsController(self)
+        
+        # Layout principal
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(30, 30, 30, 30)
+        self.layout.setSpacing(20)
+        
+        # Header con título y botón regresar
+        header_container = QHBoxLayout()
+        
+        self.back_button = QPushButton("Regresar")
+        self.back_button.setObjectName("backButton")
+        self.back_button.setMinimumWidth(120)
+        self.back_button.clicked.connect(self.back_requested.emit)
+        header_container.addWidget(self.back_button)
+        
+        title_container = QVBoxLayout()
+        title_container.setContentsMargins(15, 0, 0, 0)
+        title_container.setSpacing(5)
+        
+        title = QLabel("Análisis de carga")
+        title.setProperty("role", "heading")
+        title_container.addWidget(title)
+        
+        subtitle = QLabel("Intervalos con más flujos ejecutándose a la vez")
+        subtitle.setProperty("role", "subtitle")
+        title_container.addWidget(subtitle)
+        
+        header_container.addLayout(title_container, 1)
+        self.layout.addLayout(header_container)
+        
+        # Línea separadora
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        separator.setProperty("role", "separator")
+        self.layout.addWidget(separator)
+        
+        # Filtros del análisis
+        filters = QHBoxLayout()
+        
+        filters.addWidget(QLabel("Agrupar por:"))
+        self.group_combo = QComboBox()
+        for text, value in GROUP_OPTIONS:
+            self.group_combo.addItem(text, value)
+        filters.addWidget(self.group_combo)
+        
+        filters.addWidget(QLabel("Días:"))
+        self.days_input = QSpinBox()
+        self.days_input.setRange(1, 90)
+        self.days_input.setValue(7)
+        filters.addWidget(self.days_input)
+        
+        filters.addWidget(QLabel("Concurrencia mínima:"))
+        self.threshold_input = QSpinBox()
+        self.threshold_input.setRange(1, 10000)
+        self.threshold_input.setValue(5)
+        filters.addWidget(self.threshold_input)
+        
+        filters.addWidget(QLabel("Resultados:"))
+        self.top_k_input = QSpinBox()
+        self.top_k_input.setRange(1, 500)
+        self.top_k_input.setValue(10)
+        filters.addWidget(self.top_k_input)
+        
+        filters.addStretch()
+        
+        self.analyze_button = QPushButton("Analizar")
+        self.analyze_button.setObjectName("successButton")
+        self.analyze_button.setMinimumWidth(120)
+        self.analyze_button.clicked.connect(self.refresh)
+        filters.addWidget(self.analyze_button)
+        
+        self.layout.addLayout(filters)
+        
+        # Resumen de carga esperada
+        self.summary_label = QLabel("")
+        self.summary_label.setWordWrap(True)
+        self.summary_label.setProperty("role", "summary")
+        self.layout.addWidget(self.summary_label)
+        
+        # Tabla de intervalos congestionados
+        self.windows_table = QTableWidget(0, 5)
+        self.windows_table.setHorizontalHeaderLabels(
+            ["Grupo", "Desde", "Hasta", "Concurrencia", "Flujos"]
+        )
+        self.windows_table.verticalHeader().setVisible(False)
+        self.windows_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = self.windows_table.horizontalHeader()
+        for column in range(4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        self.layout.addWidget(self.windows_table, 1)
+    
+    def refresh(self):
+        """Recalcula el resumen de carga y los intervalos congestionados"""
+        days = self.days_input.value()
+        
+        summary = self.analytics_controller.get_load_summary(days)
+        if summary:
+            self.summary_label.setText(
+                f"{summary['total_runs']} ejecuciones esperadas en {days} días "
+                f"({summary['runs_per_day']} por día). "
+                f"Hora pico: {summary['peak_hour'] or '-'} ({summary['peak_hour_runs']} ejecuciones)."
+            )
+        
+        windows = self.analytics_controller.find_congested_windows(
+            self.group_combo.currentData(),
+            days,
+            self.threshold_input.value(),
+            self.top_k_input.value()
+        )
+        
+        self.windows_table.setRowCount(len(windows))
+        for row, window in enumerate(windows):
+            self.windows_table.setItem(row, 0, QTableWidgetItem(window['key']))
+            self.windows_table.setItem(row, 1, QTableWidgetItem(window['start']))
+            self.windows_table.setItem(row, 2, QTableWidgetItem(window['end']))
+            
+            peak_item = QTableWidgetItem(str(window['peak_concurrency']))
+            peak_item.setToolTip(f"Pico a las {window['peak_at']}")
+            self.windows_table.setItem(row, 3, peak_item)
+            
+            self.windows_table.setItem(row, 4, QTableWidgetItem(", ".join(window['flow_names'])))
@@ -0,0 +1,303 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QCheckBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFrame, QSplitter, QPlainTextEdit,
+    QTabWidget, QMessageBox
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from app.config import QUERY_LOG, RESPONSIVENESS
+from app.presentation.controllers.diagnostics_controller import DiagnosticsController
+
+# Fondo de las sentencias cuyo plan recorre tablas completas
+FULL_SCAN_COLOR = QColor("#fdecea")
+
+class DiagnosticsView(QWidget):
+    """Panel de diagnóstico: consultas más costosas, consultas lentas y sus planes,
+    y bloqueos del bucle de eventos de la interfaz"""
+
+    back_requested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+
+        # Controlador
+        self.diagnostics_controller = DiagnosticsController(self)
+
+        # Layout principal
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(30, 30, 30, 30)
+        self.layout.setSpacing(20)
+
+        # Header con título y botón regresar
+        header_container = QHBoxLayout()
+
+        self.back_button = QPushButton("Regresar")
+        self.back_button.setObjectName("backButton")
+        self.back_button.setMinimumWidth(120)
+        self.back_button.clicked.connect(self.back_requested.emit)
+        header_container.addWidget(self.back_button)
+
+        title_container = QVBoxLayout()
+        title_container.setContentsMargins(15, 0, 0, 0)
+        title_container.setSpacing(5)
+
+        title = QLabel("Diagnóstico")
+        title.setProperty("role", "heading")
+        title_container.addWidget(title)
+
+        subtitle = QLabel(
+            f"Sentencias SQL que superan {QUERY_LOG['slow_ms']} ms con su plan de ejecución, "
+            f"y bloqueos de la interfaz de más de {RESPONSIVENESS['stall_ms']} ms"
+        )
+        subtitle.setProperty("role", "subtitle")
+        title_container.addWidget(subtitle)
+
+        header_container.addLayout(title_container, 1)
+        self.layout.addLayout(header_container)
+
+        # Línea separadora
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        separator.setProperty("role", "separator")
+        self.layout.addWidget(separator)
+
+        self.tabs = QTabWidget()
+        self.layout.addWidget(self.tabs, 1)
+
+        # Pestaña de consultas
+        queries_tab = QWidget()
+        queries_layout = QVBoxLayout(queries_tab)
+        queries_layout.setContentsMargins(0, 10, 0, 0)
+
+        # Controles del registro
+        controls = QHBoxLayout()
+        self.logging_checkbox = QCheckBox("Registrar consultas")
+        self.logging_checkbox.toggled.connect(self._on_logging_toggled)
+        controls.addWidget(self.logging_checkbox)
+        controls.addStretch(1)
+        refresh_button = QPushButton("Actualizar")
+        refresh_button.clicked.connect(self.refresh)
+        controls.addWidget(refresh_button)
+        clear_button = QPushButton("Limpiar")
+        clear_button.clicked.connect(self._on_clear)
+        controls.addWidget(clear_button)
+        queries_layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        # Sentencias ordenadas por tiempo acumulado
+        self.statements_table = QTableWidget(0, 7)
+        self.statements_table.setHorizontalHeaderLabels(
+            ["Sentencia", "Ejecuciones", "Total ms", "Media ms", "Máx ms", "Filas", "Recorridos completos"]
+        )
+        self.statements_table.verticalHeader().setVisible(False)
+        self.statements_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.statements_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        header = self.statements_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 7):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        splitter.addWidget(self.statements_table)
+
+        # Consultas lentas recientes y el plan de la seleccionada
+        slow_panel = QWidget()
+        slow_layout = QHBoxLayout(slow_panel)
+        slow_layout.setContentsMargins(0, 10, 0, 0)
+
+        self.slow_table = QTableWidget(0, 5)
+        self.slow_table.setHorizontalHeaderLabels(["Hora", "ms", "Filas", "Parámetros", "Sentencia"])
+        self.slow_table.verticalHeader().setVisible(False)
+        self.slow_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.slow_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.slow_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        slow_header = self.slow_table.horizontalHeader()
+        for column in range(4):
+            slow_header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        slow_header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        self.slow_table.itemSelectionChanged.connect(self._on_slow_query_selected)
+        slow_layout.addWidget(self.slow_table, 3)
+
+        self.plan_text = QPlainTextEdit()
+        self.plan_text.setReadOnly(True)
+        self.plan_text.setPlaceholderText("Seleccione una consulta lenta para ver su plan")
+        self.plan_text.setProperty("role", "code")
+        slow_layout.addWidget(self.plan_text, 2)
+
+        splitter.addWidget(slow_panel)
+        queries_layout.addWidget(splitter, 1)
+        self.tabs.addTab(queries_tab, "Consultas")
+
+        self.tabs.addTab(self._create_stalls_tab(), "Interfaz")
+
+        self.slow_queries = []
+        self.stalls = []
+
+    def _create_stalls_tab(self):
+        """Pestaña de bloqueos del bucle de eventos"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setContentsMargins(0, 10, 0, 0)
+
+        controls = QHBoxLayout()
+        self.stall_summary_label = QLabel()
+        controls.addWidget(self.stall_summary_label)
+        controls.addStretch(1)
+        refresh_button = QPushButton("Actualizar")
+        refresh_button.clicked.connect(self.refresh)
+        controls.addWidget(refresh_button)
+        export_button = QPushButton("Exportar")
+        export_button.clicked.connect(self._on_export_stalls)
+        controls.addWidget(export_button)
+        clear_button = QPushButton("Limpiar")
+        clear_button.clicked.connect(self._on_clear_stalls)
+        controls.addWidget(clear_button)
+        layout.addLayout(controls)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        # Acciones ordenadas por tiempo bloqueado
+        self.actions_table = QTableWidget(0, 4)
+        self.actions_table.setHorizontalHeaderLabels(["Acción", "Bloqueos", "Total ms", "Máx ms"])
+        self.actions_table.verticalHeader().setVisible(False)
+        self.actions_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.actions_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        header = self.actions_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        splitter.addWidget(self.actions_table)
+
+        # Bloqueos recientes y la pila del seleccionado
+        stalls_panel = QWidget()
+        stalls_layout = QHBoxLayout(stalls_panel)
+        stalls_layout.setContentsMargins(0, 10, 0, 0)
+
+        self.stalls_table = QTableWidget(0, 3)
+        self.stalls_table.setHorizontalHeaderLabels(["Hora", "ms", "Acción"])
+        self.stalls_table.verticalHeader().setVisible(False)
+        self.stalls_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.stalls_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.stalls_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        stalls_header = self.stalls_table.horizontalHeader()
+        for column in range(2):
+            stalls_header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        stalls_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        self.stalls_table.itemSelectionChanged.connect(self._on_stall_selected)
+        stalls_layout.addWidget(self.stalls_table, 2)
+
+        self.stack_text = QPlainTextEdit()
+        self.stack_text.setReadOnly(True)
+        self.stack_text.setPlaceholderText("Seleccione un bloqueo para ver la pila del hilo de la interfaz")
+        self.stack_text.setProperty("role", "code")
+        stalls_layout.addWidget(self.stack_text, 3)
+
+        splitter.addWidget(stalls_panel)
+        layout.addWidget(splitter, 1)
+        return tab
+
+    def refresh(self):
+        """Muestra el estado actual del registro de consultas"""
+        self.logging_checkbox.blockSignals(True)
+        self.logging_checkbox.setChecked(self.diagnostics_controller.is_logging())
+        self.logging_checkbox.blockSignals(False)
+
+        statements = self.diagnostics_controller.load_statements()
+        self.statements_table.setRowCount(len(statements))
+        for row, statement in enumerate(statements):
+            self.statements_table.setItem(row, 0, QTableWidgetItem(statement['sql']))
+            for column, key in enumerate(('count', 'total_ms', 'mean_ms', 'max_ms', 'rows'), start=1):
+                item = QTableWidgetItem(str(statement[key]))
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.statements_table.setItem(row, column, item)
+            self.statements_table.setItem(row, 6, QTableWidgetItem(', '.join(statement['full_scans'])))
+            if statement['full_scans']:
+                for column in range(7):
+                    self.statements_table.item(row, column).setBackground(FULL_SCAN_COLOR)
+
+        self.slow_queries = self.diagnostics_controller.load_slow_queries()
+        self.slow_table.setRowCount(len(self.slow_queries))
+        for row, query in enumerate(self.slow_queries):
+            values = (query.executed_at.strftime('%H:%M:%S'), f"{query.ms:.1f}",
+                      '' if query.rows is None else str(query.rows), query.params, query.sql)
+            for column, value in enumerate(values):
+                self.slow_table.setItem(row, column, QTableWidgetItem(value))
+            if query.full_scans:
+                for column in range(5):
+                    self.slow_table.item(row, column).setBackground(FULL_SCAN_COLOR)
+        self.plan_text.clear()
+
+        self._refresh_stalls()
+
+    def _refresh_stalls(self):
+        """Muestra la latencia del bucle de eventos y los bloqueos registrados"""
+        summary = self.diagnostics_controller.load_stall_summary()
+        if summary['running']:
+            latency = summary['latency']
+            self.stall_summary_label.setText(
+                f"Latencia del bucle de eventos: p50 {latency['p50_ms']} ms · p99 {latency['p99_ms']} ms · "
+                f"máx {latency['max_ms']} ms   |   {summary['stalls']} bloqueos, {summary['stalled_ms']} ms en total"
+            )
+        else:
+            self.stall_summary_label.setText("El detector de bloqueos está desactivado (PA_WATCHDOG=0)")
+
+        actions = self.diagnostics_controller.load_stall_actions()
+        self.actions_table.setRowCount(len(actions))
+        for row, action in enumerate(actions):
+            self.actions_table.setItem(row, 0, QTableWidgetItem(action['action']))
+            for column, key in enumerate(('count', 'total_ms', 'max_ms'), start=1):
+                item = QTableWidgetItem(str(action[key]))
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.actions_table.setItem(row, column, item)
+
+        self.stalls = self.diagnostics_controller.load_stalls()
+        self.stalls_table.setRowCount(len(self.stalls))
+        for row, stall in enumerate(self.stalls):
+            values = (stall.started_at.strftime('%H:%M:%S'), f"{stall.duration_ms:.0f}",
+                      stall.action or '(desconocida)')
+            for column, value in enumerate(values):
+                self.stalls_table.setItem(row, column, QTableWidgetItem(value))
+        self.stack_text.clear()
+
+    def _on_logging_toggled(self, checked):
+        self.diagnostics_controller.set_logging(checked)
+        self.refresh()
+
+    def _on_clear(self):
+        self.diagnostics_controller.clear()
+        self.refresh()
+
+    def _on_slow_query_selected(self):
+        """Muestra el plan de ejecución de la consulta lenta seleccionada"""
+        rows = self.slow_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        query = self.slow_queries[rows[0].row()]
+        lines = [query.sql, '', 'Plan:'] + [f"  {step}" for step in query.plan]
+        if query.full_scans:
+            lines += ['', f"Recorre completas: {', '.join(query.full_scans)} (¿falta un índice?)"]
+        self.plan_text.setPlainText('\n'.join(lines))
+
+    def _on_stall_selected(self):
+        """Muestra la pila capturada durante el bloqueo seleccionado"""
+        rows = self.stalls_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        stall = self.stalls[rows[0].row()]
+        if stall.stack:
+            self.stack_text.setPlainText('\n'.join(stall.stack))
+        else:
+            self.stack_text.setPlainText("No se alcanzó a capturar la pila durante este bloqueo")
+
+    def _on_export_stalls(self):
+        try:
+            path = self.diagnostics_controller.export_stalls()
+        except OSError as e:
+            QMessageBox.warning(self, "Error", f"No se pudo exportar: {e}")
+            return
+        QMessageBox.information(self, "Exportado", f"Estadísticas de bloqueos guardadas en {path}")
+
+    def _on_clear_stalls(self):
+        self.diagnostics_controller.clear_stalls()
+        self.refresh()
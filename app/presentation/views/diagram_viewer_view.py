@@ -0,0 +1,480 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QLabel, QAbstractScrollArea
+)
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QObject, QRectF, QPointF, QByteArray
+)
+from PyQt6.QtGui import QImage, QPainter, QColor
+from PyQt6.QtSvg import QSvgRenderer
+
+# Tamaño (en píxeles) de cada tile rasterizado
+TILE_SIZE = 256
+
+# Niveles de zoom para los que se rasterizan tiles
+ZOOM_LEVELS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+# Límites del zoom continuo
+MIN_ZOOM = 0.05
+MAX_ZOOM = 8.0
+
+# Memoria máxima para la caché de tiles (en bytes)
+TILE_CACHE_BYTES = 128 * 1024 * 1024
+
+
+def level_for_zoom(zoom: float) -> float:
+    """Devuelve el nivel rasterizado más cercano que no pierde resolución"""
+    for level in ZOOM_LEVELS:
+        if level >= zoom:
+            return level
+    return ZOOM_LEVELS[-1]
+
+
+def visible_tiles(viewport: QRectF, zoom: float, level: float, doc_width: float, doc_height: float):
+    """Calcula los tiles (columna, fila) del nivel que cubren el viewport.
+
+    El viewport se expresa en píxeles de pantalla al zoom actual.
+    """
+    if doc_width <= 0 or doc_height <= 0:
+        return []
+
+    # Convertir el viewport a coordenadas del nivel rasterizado
+    scale = level / zoom
+    left = max(0.0, viewport.left() * scale)
+    top = max(0.0, viewport.top() * scale)
+    right = min(doc_width * level, viewport.right() * scale)
+    bottom = min(doc_height * level, viewport.bottom() * scale)
+    if right <= left or bottom <= top:
+        return []
+
+    first_col = int(left // TILE_SIZE)
+    first_row = int(top // TILE_SIZE)
+    last_col = int((right - 1) // TILE_SIZE)
+    last_row = int((bottom - 1) // TILE_SIZE)
+    return [
+        (col, row)
+        for row in range(first_row, last_row + 1)
+        for col in range(first_col, last_col + 1)
+    ]
+
+
+class TileCache:
+    """Caché LRU de tiles rasterizados, limitada por memoria"""
+
+    def __init__(self, max_bytes: int = TILE_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._tiles = OrderedDict()
+
+    def __len__(self):
+        return len(self._tiles)
+
+    def __contains__(self, key):
+        return key in self._tiles
+
+    def get(self, key):
+        """Obtiene un tile y lo marca como usado recientemente"""
+        image = self._tiles.get(key)
+        if image is not None:
+            self._tiles.move_to_end(key)
+        return image
+
+    def put(self, key, image) -> None:
+        """Guarda un tile, descartando los menos usados si se excede el límite"""
+        if key in self._tiles:
+            self.used_bytes -= self._tiles.pop(key).sizeInBytes()
+        self._tiles[key] = image
+        self.used_bytes += image.sizeInBytes()
+
+        while self.used_bytes > self.max_bytes and len(self._tiles) > 1:
+            _, evicted = self._tiles.popitem(last=False)
+            self.used_bytes -= evicted.sizeInBytes()
+
+    def clear(self) -> None:
+        """Vacía la caché"""
+        self._tiles.clear()
+        self.used_bytes = 0
+
+
+class _WorkerSignals(QObject):
+    """Señales emitidas desde los hilos de trabajo hacia el hilo de la GUI"""
+
+    document_loaded = pyqtSignal(int, object, float, float)  # doc_id, contenido, ancho, alto
+    document_failed = pyqtSignal(int, str)  # doc_id, mensaje
+    tile_ready = pyqtSignal(int, object, QImage)  # doc_id, (nivel, col, fila), imagen
+    tile_done = pyqtSignal(object, object)  # (nivel, col, fila), future (terminada, fallida o cancelada)
+
+
+# Cada hilo del pool mantiene su propio QSvgRenderer por documento
+_thread_state = threading.local()
+
+
+def _thread_renderer(doc_id: int, content: bytes) -> QSvgRenderer:
+    """Obtiene (o crea) el renderer del documento para el hilo actual"""
+    if getattr(_thread_state, 'doc_id', None) != doc_id:
+        _thread_state.doc_id = doc_id
+        _thread_state.renderer = QSvgRenderer(QByteArray(content))
+        _thread_state.view_box = _thread_state.renderer.viewBoxF()
+    return _thread_state.renderer
+
+
+def _load_document(doc_id: int, path: str, signals: _WorkerSignals) -> None:
+    """Lee y valida el SVG fuera del hilo de la GUI"""
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        renderer = QSvgRenderer(QByteArray(content))
+        if not renderer.isValid():
+            raise ValueError("El archivo no es un SVG válido")
+        size = renderer.defaultSize()
+        signals.document_loaded.emit(doc_id, content, float(size.width()), float(size.height()))
+    except Exception as e:
+        signals.document_failed.emit(doc_id, str(e))
+
+
+def _render_tile(doc_id: int, content: bytes, key: tuple, signals: _WorkerSignals) -> None:
+    """Rasteriza un tile del documento fuera del hilo de la GUI"""
+    level, col, row = key
+    renderer = _thread_renderer(doc_id, content)
+    view_box = _thread_state.view_box
+
+    # Región del documento (en unidades del viewBox) que cubre este tile
+    doc_scale = view_box.width() / renderer.defaultSize().width()
+    span = TILE_SIZE / level * doc_scale
+    renderer.setViewBox(QRectF(
+        view_box.left() + col * span,
+        view_box.top() + row * span,
+        span,
+        span
+    ))
+
+    image = QImage(TILE_SIZE, TILE_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    renderer.render(painter, QRectF(0, 0, TILE_SIZE, TILE_SIZE))
+    painter.end()
+
+    signals.tile_ready.emit(doc_id, key, image)
+
+
+class TiledSvgWidget(QAbstractScrollArea):
+    """Visor de SVG que pinta solo los tiles visibles a partir de una caché"""
+
+    document_loaded = pyqtSignal()
+    document_failed = pyqtSignal(str)
+    zoom_changed = pyqtSignal(float)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMouseTracking(False)
+        self.viewport().setCursor(Qt.CursorShape.OpenHandCursor)
+
+        # Pool propio para no competir con otras tareas de la aplicación.
+        # Se usan hilos de Python: QSvgRenderer.render falla bajo QThreadPool en PyQt6.
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(2, (os.cpu_count() or 2) - 1),
+            thread_name_prefix="diagram-tiles"
+        )
+
+        self._signals = _WorkerSignals()
+        self._signals.document_loaded.connect(self._on_document_loaded)
+        self._signals.document_failed.connect(self._on_document_failed)
+        self._signals.tile_ready.connect(self._on_tile_ready)
+        self._signals.tile_done.connect(self._on_tile_done)
+
+        self._cache = TileCache()
+        self._pending = {}
+        self._doc_id = 0
+        self._content = None
+        self._doc_width = 0.0
+        self._doc_height = 0.0
+        self._zoom = 1.0
+        self._drag_origin = None
+
+    @property
+    def zoom(self) -> float:
+        return self._zoom
+
+    def load(self, path: str) -> None:
+        """Carga un SVG de forma asíncrona"""
+        self._doc_id += 1
+        self._content = None
+        self._doc_width = self._doc_height = 0.0
+        self._reset_tiles()
+        self.viewport().update()
+        self._pool.submit(_load_document, self._doc_id, path, self._signals)
+
+    def set_zoom(self, zoom: float, anchor: QPointF = None) -> None:
+        """Cambia el zoom manteniendo fijo el punto de anclaje del viewport"""
+        zoom = max(MIN_ZOOM, min(MAX_ZOOM, zoom))
+        if zoom == self._zoom:
+            return
+
+        if anchor is None:
+            anchor = QPointF(self.viewport().width() / 2, self.viewport().height() / 2)
+
+        # Punto del documento bajo el anclaje antes de cambiar el zoom
+        doc_x = (self.horizontalScrollBar().value() + anchor.x()) / self._zoom
+        doc_y = (self.verticalScrollBar().value() + anchor.y()) / self._zoom
+
+        previous_level = level_for_zoom(self._zoom)
+        self._zoom = zoom
+        if level_for_zoom(zoom) != previous_level:
+            # Las tareas encoladas del nivel anterior ya no son útiles
+            self._cancel_pending()
+
+        self._update_scrollbars()
+        self.horizontalScrollBar().setValue(int(doc_x * zoom - anchor.x()))
+        self.verticalScrollBar().setValue(int(doc_y * zoom - anchor.y()))
+        self.viewport().update()
+        self.zoom_changed.emit(zoom)
+
+    def zoom_in(self):
+        self.set_zoom(self._zoom * 1.25)
+
+    def zoom_out(self):
+        self.set_zoom(self._zoom / 1.25)
+
+    def fit_to_window(self):
+        """Ajusta el zoom para que el diagrama completo quepa en el viewport"""
+        if self._doc_width <= 0 or self._doc_height <= 0:
+            return
+        zoom = min(
+            self.viewport().width() / self._doc_width,
+            self.viewport().height() / self._doc_height
+        )
+        self.set_zoom(zoom)
+
+    def shutdown(self) -> None:
+        """Cancela las tareas pendientes y espera a las que están en curso"""
+        self._cancel_pending()
+        self._pool.shutdown(wait=True)
+
+    def _cancel_pending(self):
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.cancel()
+
+    def _reset_tiles(self):
+        self._cancel_pending()
+        self._cache.clear()
+
+    def _update_scrollbars(self):
+        content_width = int(self._doc_width * self._zoom)
+        content_height = int(self._doc_height * self._zoom)
+        viewport = self.viewport()
+
+        self.horizontalScrollBar().setRange(0, max(0, content_width - viewport.width()))
+        self.horizontalScrollBar().setPageStep(viewport.width())
+        self.verticalScrollBar().setRange(0, max(0, content_height - viewport.height()))
+        self.verticalScrollBar().setPageStep(viewport.height())
+
+    def _request_tile(self, key):
+        if key in self._pending or self._content is None:
+            return
+        future = self._pool.submit(
+            _render_tile, self._doc_id, self._content, key, self._signals
+        )
+        self._pending[key] = future
+        # Se llama desde el hilo de trabajo: la señal lleva el aviso al hilo de la GUI
+        future.add_done_callback(lambda done: self._signals.tile_done.emit(key, done))
+
+    def _fallback_tile(self, level, col, row):
+        """Busca un tile de menor resolución ya cacheado que cubra la misma región"""
+        for other in reversed(ZOOM_LEVELS):
+            if other >= level:
+                continue
+            ratio = other / level
+            key = (other, int(col * ratio), int(row * ratio))
+            image = self._cache.get(key)
+            if image is not None:
+                # Subregión del tile de menor nivel correspondiente a este tile
+                size = TILE_SIZE * ratio
+                source = QRectF(
+                    (col * ratio - key[1]) * TILE_SIZE,
+                    (row * ratio - key[2]) * TILE_SIZE,
+                    size,
+                    size
+                )
+                return image, source
+        return None, None
+
+    def _on_document_loaded(self, doc_id, content, width, height):
+        if doc_id != self._doc_id:
+            return
+        self._content = content
+        self._doc_width = width
+        self._doc_height = height
+        self._update_scrollbars()
+        self.fit_to_window()
+        self.viewport().update()
+        self.document_loaded.emit()
+
+    def _on_document_failed(self, doc_id, message):
+        if doc_id == self._doc_id:
+            self.document_failed.emit(message)
+
+    def _on_tile_ready(self, doc_id, key, image):
+        if doc_id != self._doc_id:
+            return
+        self._pending.pop(key, None)
+        self._cache.put(key, image)
+
+        # Repintar solo el área que ocupa el tile en pantalla
+        level, col, row = key
+        if level == level_for_zoom(self._zoom):
+            scale = self._zoom / level
+            rect = QRectF(
+                col * TILE_SIZE * scale - self.horizontalScrollBar().value(),
+                row * TILE_SIZE * scale - self.verticalScrollBar().value(),
+                TILE_SIZE * scale,
+                TILE_SIZE * scale
+            )
+            self.viewport().update(rect.toAlignedRect().adjusted(-1, -1, 1, 1))
+
+    def _on_tile_done(self, key, future):
+        """Libera la clave del tile para que, si el render falló, se vuelva a pedir"""
+        if self._pending.get(key) is future:
+            del self._pending[key]
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), QColor("#f5f5f5"))
+
+        if self._content is None:
+            painter.setPen(QColor("#666666"))
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, "Cargando diagrama...")
+            return
+
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        offset_x = self.horizontalScrollBar().value()
+        offset_y = self.verticalScrollBar().value()
+        exposed = QRectF(event.rect()).translated(offset_x, offset_y)
+
+        level = level_for_zoom(self._zoom)
+        scale = self._zoom / level
+        for col, row in visible_tiles(exposed, self._zoom, level, self._doc_width, self._doc_height):
+            target = QRectF(
+                col * TILE_SIZE * scale - offset_x,
+                row * TILE_SIZE * scale - offset_y,
+                TILE_SIZE * scale,
+                TILE_SIZE * scale
+            )
+            key = (level, col, row)
+            image = self._cache.get(key)
+            if image is not None:
+                painter.drawImage(target, image)
+                continue
+
+            # Mientras se rasteriza, mostrar una versión escalada si existe
+            self._request_tile(key)
+            image, source = self._fallback_tile(level, col, row)
+            if image is not None:
+                painter.drawImage(target, image, source)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().scroll(dx, dy)
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.25 if event.angleDelta().y() > 0 else 1 / 1.25
+            self.set_zoom(self._zoom * factor, event.position())
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._drag_origin = event.position()
+            self.viewport().setCursor(Qt.CursorShape.ClosedHandCursor)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_origin is None:
+            return
+        delta = event.position() - self._drag_origin
+        self._drag_origin = event.position()
+        self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - int(delta.x()))
+        self.verticalScrollBar().setValue(self.verticalScrollBar().value() - int(delta.y()))
+
+    def mouseReleaseEvent(self, event):
+        self._drag_origin = None
+        self.viewport().setCursor(Qt.CursorShape.OpenHandCursor)
+
+
+class DiagramViewerView(QWidget):
+    """Vista para explorar el diagrama de un proyecto dentro de la aplicación"""
+
+    back_requested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+
+        # Layout principal
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(30, 30, 30, 30)
+        self.layout.setSpacing(20)
+
+        # Header con botón de volver, título y controles de zoom
+        header_layout = QHBoxLayout()
+
+        back_button = QPushButton("Regresar")
+        back_button.setMinimumWidth(120)
+        back_button.clicked.connect(self.back_requested.emit)
+        header_layout.addWidget(back_button)
+
+        self.title = QLabel("Diagrama del proyecto")
+        self.title.setObjectName("titleLabel")
+        header_layout.addWidget(self.title, 1)
+
+        zoom_out_button = QPushButton("-")
+        zoom_out_button.setFixedWidth(40)
+        header_layout.addWidget(zoom_out_button)
+
+        self.zoom_label = QLabel("100%")
+        self.zoom_label.setMinimumWidth(60)
+        self.zoom_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        header_layout.addWidget(self.zoom_label)
+
+        zoom_in_button = QPushButton("+")
+        zoom_in_button.setFixedWidth(40)
+        header_layout.addWidget(zoom_in_button)
+
+        fit_button = QPushButton("Ajustar")
+        header_layout.addWidget(fit_button)
+
+        self.layout.addLayout(header_layout)
+
+        # Visor de tiles
+        self.viewer = TiledSvgWidget()
+        self.layout.addWidget(self.viewer, 1)
+
+        self.status_label = QLabel("Ctrl + rueda para hacer zoom, arrastre para desplazarse")
+        self.status_label.setProperty("role", "hint")
+        self.layout.addWidget(self.status_label)
+
+        zoom_out_button.clicked.connect(self.viewer.zoom_out)
+        zoom_in_button.clicked.connect(self.viewer.zoom_in)
+        fit_button.clicked.connect(self.viewer.fit_to_window)
+        self.viewer.zoom_changed.connect(
+            lambda zoom: self.zoom_label.setText(f"{zoom * 100:.0f}%")
+        )
+        self.viewer.document_failed.connect(
+            lambda message: self.status_label.setText(f"No se pudo cargar el diagrama: {message}")
+        )
+
+    def set_diagram(self, diagram_path, project_name):
+        """Carga el diagrama de un proyecto"""
+        self.title.setText(f"Diagrama del proyecto {project_name}")
+        self.status_label.setText(os.path.abspath(diagram_path))
+        self.viewer.load(diagram_path)
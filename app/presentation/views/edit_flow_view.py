@@ -1,9 +1,9 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QLineEdit, QGroupBox, QFormLayout, QMessageBox,
-    QComboBox, QDateEdit, QSizePolicy
+    QComboBox, QDateEdit, QSizePolicy, QTimeEdit, QSpinBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate
+from PyQt6.QtCore import Qt, pyqtSignal, QTime
 from datetime import datetime
 
 from app.domain.entities.flow import RecurrenceType
@@ -35,29 +35,14 @@ class EditFlowView(QWidget):
         header_layout = QHBoxLayout()
         
         back_button = QPushButton("Regresar")
+        back_button.setObjectName("backButton")
         back_button.setMinimumWidth(120)
-        back_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4a86e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #3b78e7;
-            }
-            QPushButton:pressed {
-                background-color: #3367d6;
-            }
-        """)
         back_button.clicked.connect(self.back_requested.emit)
         header_layout.addWidget(back_button)
         
+        header_layout.addSpacing(15)
         self.title = QLabel("Editar Flujo")
-        self.title.setStyleSheet("font-size: 24px; font-weight: bold; color: #333333; margin-left: 15px;")
+        self.title.setProperty("role", "heading")
         header_layout.addWidget(self.title, 1)
         
         self.layout.addLayout(header_layout)
@@ -66,29 +51,11 @@ class EditFlowView(QWidget):
         separator = QWidget()
         separator.setFixedHeight(1)
         separator.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        separator.setStyleSheet("background-color: #e0e0e0;")
+        separator.setProperty("role", "separator")
         self.layout.addWidget(separator)
         
         # Formulario
         form_group = QGroupBox("Información del flujo")
-        form_group.setStyleSheet("""
-            QGroupBox {
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding: 15px;
-                background-color: white;
-                color: #333333;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 10px;
-                background-color: white;
-                font-weight: bold;
-                color: #333333;
-            }
-        """)
         form_layout = QFormLayout(form_group)
         form_layout.setSpacing(15)
         form_layout.setContentsMargins(20, 30, 20, 20)
@@ -97,88 +64,50 @@ class EditFlowView(QWidget):
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("Ingrese el nombre del flujo")
         self.name_input.setMinimumHeight(40)
-        self.name_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 10px;
-                background-color: white;
-                color: #333333;
-            }
-            QLineEdit:focus {
-                border: 1px solid #2196f3;
-            }
-        """)
         form_layout.addRow("Nombre:", self.name_input)
         
         # Campo de recurrencia
         self.recurrence_combo = QComboBox()
         self.recurrence_combo.setMinimumHeight(40)
-        self.recurrence_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                color: #333333;
-            }
-            QComboBox:focus {
-                border: 1px solid #2196f3;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 20px;
-                border-left-width: 0px;
-                border-top-right-radius: 3px;
-                border-bottom-right-radius: 3px;
-            }
-        """)
         for recurrence_type in RecurrenceType:
             self.recurrence_combo.addItem(recurrence_type.value, recurrence_type.value)
         form_layout.addRow("Recurrencia:", self.recurrence_combo)
         
+        # Hora de ejecución
+        self.time_input = QTimeEdit()
+        self.time_input.setDisplayFormat("HH:mm")
+        self.time_input.setMinimumHeight(40)
+        form_layout.addRow("Hora:", self.time_input)
+        
+        # Expresión cron (solo para recurrencia personalizada)
+        self.cron_input = QLineEdit()
+        self.cron_input.setPlaceholderText("Ej.: */15 8-18 * * 1-5 (minuto hora día mes día-semana)")
+        self.cron_input.setMinimumHeight(40)
+        form_layout.addRow("Cron:", self.cron_input)
+        self.recurrence_combo.currentIndexChanged.connect(self._on_recurrence_changed)
+        
         # Campo de propietario
         self.owner_input = QLineEdit()
         self.owner_input.setPlaceholderText("Ingrese el nombre del propietario")
         self.owner_input.setMinimumHeight(40)
-        self.owner_input.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 10px;
-                background-color: white;
-                color: #333333;
-            }
-            QLineEdit:focus {
-                border: 1px solid #2196f3;
-            }
-        """)
         form_layout.addRow("Propietario:", self.owner_input)
         
+        # Conexión principal (para detectar saturación por conexión)
+        self.connection_input = QLineEdit()
+        self.connection_input.setPlaceholderText("Ej.: SharePoint - cuenta de servicio")
+        self.connection_input.setMinimumHeight(40)
+        form_layout.addRow("Conexión:", self.connection_input)
+        
+        # Duración estimada de cada ejecución
+        self.duration_input = QSpinBox()
+        self.duration_input.setRange(1, 24 * 60)
+        self.duration_input.setSuffix(" min")
+        self.duration_input.setMinimumHeight(40)
+        form_layout.addRow("Duración estimada:", self.duration_input)
+        
         # Estado
         self.status_combo = QComboBox()
         self.status_combo.setMinimumHeight(40)
-        self.status_combo.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                color: #333333;
-            }
-            QComboBox:focus {
-                border: 1px solid #2196f3;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: center right;
-                width: 20px;
-                border-left-width: 0px;
-                border-top-right-radius: 3px;
-                border-bottom-right-radius: 3px;
-            }
-        """)
         self.status_combo.addItem("Activo", "active")
         self.status_combo.addItem("Inactivo", "inactive")
         form_layout.addRow("Estado:", self.status_combo)
@@ -191,43 +120,14 @@ class EditFlowView(QWidget):
         buttons_layout.addStretch()
         
         cancel_button = QPushButton("Cancelar")
+        cancel_button.setObjectName("neutralButton")
         cancel_button.setMinimumSize(120, 40)
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #555555;
-                border: 1px solid #dddddd;
-                border-radius: 4px;
-                padding: 10px 15px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e6e6e6;
-                border: 1px solid #cccccc;
-            }
-        """)
         cancel_button.clicked.connect(self.back_requested.emit)
         buttons_layout.addWidget(cancel_button)
         
         save_button = QPushButton("Guardar Cambios")
+        save_button.setObjectName("successButton")
         save_button.setMinimumSize(150, 40)
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #43a047;
-            }
-            QPushButton:pressed {
-                background-color: #388e3c;
-            }
-        """)
         save_button.clicked.connect(self._on_save)
         buttons_layout.addWidget(save_button)
         
@@ -236,6 +136,12 @@ class EditFlowView(QWidget):
         # Espacio adicional
         self.layout.addStretch()
     
+    def _on_recurrence_changed(self):
+        """Habilita los campos de programación según la recurrencia"""
+        is_custom = self.recurrence_combo.currentData() == RecurrenceType.CUSTOM.value
+        self.cron_input.setEnabled(is_custom)
+        self.time_input.setEnabled(not is_custom)
+    
     def set_flow(self, flow_id, project_id):
         """Establece el flujo a editar"""
         self.current_flow_id = flow_id
@@ -258,13 +164,30 @@ class EditFlowView(QWidget):
                     break
             self.recurrence_combo.setCurrentIndex(recurrence_index)
             
+            # Establecer la programación
+            schedule = flow_data['schedule']
+            self.time_input.setTime(QTime.fromString(schedule['time'], "HH:mm"))
+            self.cron_input.setText(schedule['cron'])
+            self._on_recurrence_changed()
+            
             # Establecer el propietario
             self.owner_input.setText(flow_data['owner'])
             
+            # Establecer la conexión y la duración estimada
+            self.connection_input.setText(flow_data['connection'])
+            self.duration_input.setValue(flow_data['estimated_duration'])
+            
             # Establecer el estado
             status_index = 0 if flow_data['is_active'] else 1
             self.status_combo.setCurrentIndex(status_index)
     
+    def _schedule_data(self):
+        """Programación ingresada, conservando los días ya configurados"""
+        schedule = dict(self.current_flow_data['schedule']) if self.current_flow_data else {}
+        schedule['time'] = self.time_input.time().toString("HH:mm")
+        schedule['cron'] = self.cron_input.text().strip()
+        return schedule
+    
     def _on_save(self):
         """Manejador para guardar los cambios"""
         if not self.current_flow_id or not self.current_project_id:
@@ -294,7 +217,10 @@ class EditFlowView(QWidget):
                 name,
                 recurrence,
                 owner,
-                status == "active"
+                status == "active",
+                self._schedule_data(),
+                self.connection_input.text().strip(),
+                self.duration_input.value()
             )
             if flow:
                 QMessageBox.information(
@@ -0,0 +1,53 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QComboBox
+)
+from PyQt6.QtGui import QFont
+
+class FlowDefinitionDialog(QDialog):
+    """Diálogo de solo lectura con la definición importada de un flujo"""
+
+    def __init__(self, flow_name, definition, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Definición · {flow_name}")
+        self.resize(760, 620)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(10)
+
+        title = QLabel(flow_name)
+        title.setProperty("role", "sectionTitle")
+        layout.addWidget(title)
+
+        size_kb = definition['size'] / 1024
+        info = QLabel(f"SHA-256 {definition['hash'][:12]}… · {size_kb:.1f} KB sin comprimir")
+        info.setProperty("role", "note")
+        info.setToolTip(definition['hash'])
+        layout.addWidget(info)
+
+        # Versiones importadas (solo informativas: se muestra la actual)
+        versions = definition['versions']
+        if len(versions) > 1:
+            versions_row = QHBoxLayout()
+            versions_row.addWidget(QLabel("Versiones importadas:"))
+            combo = QComboBox()
+            for version in versions:
+                suffix = " (actual)" if version['is_current'] else ""
+                combo.addItem(f"{version['recorded_at']} · {version['hash'][:12]}{suffix}")
+            versions_row.addWidget(combo, 1)
+            layout.addLayout(versions_row)
+
+        text = QPlainTextEdit()
+        text.setReadOnly(True)
+        text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        text.setFont(QFont("Consolas", 10))
+        text.setPlainText(definition['definition'])
+        layout.addWidget(text, 1)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        close_button = QPushButton("Cerrar")
+        close_button.setMinimumWidth(100)
+        close_button.clicked.connect(self.accept)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
@@ -0,0 +1,74 @@
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PyQt6.QtGui import QColor
+
+class FlowImpactDialog(QDialog):
+    """Diálogo con los flujos de los que depende un flujo y los que dependen de él"""
+
+    def __init__(self, flow_name, impact, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Análisis de impacto · {flow_name}")
+        self.resize(720, 560)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(10)
+
+        title = QLabel(flow_name)
+        title.setProperty("role", "sectionTitle")
+        layout.addWidget(title)
+
+        if impact['in_cycle']:
+            warning = QLabel("Este flujo forma parte de un ciclo de dependencias")
+            warning.setProperty("role", "warning")
+            layout.addWidget(warning)
+
+        self._add_section(
+            layout, "Lo desencadenan o alimentan (upstream)", impact['upstream'],
+            "Ningún flujo desencadena ni alimenta a este flujo"
+        )
+        self._add_section(
+            layout, "Desencadena o alimenta (downstream)", impact['downstream'],
+            "Este flujo no desencadena ni alimenta a otros flujos"
+        )
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        close_button = QPushButton("Cerrar")
+        close_button.setMinimumWidth(100)
+        close_button.clicked.connect(self.accept)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+    def _add_section(self, layout, title, flows, empty_text):
+        """Agrega el título y la tabla de una dirección del análisis"""
+        direct = sum(1 for flow in flows if flow['direct'])
+        label = QLabel(f"{title} · {len(flows)} flujos ({direct} directos)" if flows else title)
+        label.setProperty("role", "fieldName")
+        layout.addWidget(label)
+
+        if not flows:
+            empty = QLabel(empty_text)
+            empty.setProperty("role", "note")
+            layout.addWidget(empty)
+            return
+
+        table = QTableWidget(len(flows), 4)
+        table.setHorizontalHeaderLabels(["Flujo", "Proyecto", "Relación", "Estado"])
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+
+        for row, flow in enumerate(flows):
+            table.setItem(row, 0, QTableWidgetItem(flow['name']))
+            table.setItem(row, 1, QTableWidgetItem(flow['project_name']))
+            table.setItem(row, 2, QTableWidgetItem("Directa" if flow['direct'] else "Indirecta"))
+            status_item = QTableWidgetItem("Activo" if flow['is_active'] else "Inactivo")
+            status_item.setForeground(QColor("#4caf50" if flow['is_active'] else "#f44336"))
+            table.setItem(row, 3, status_item)
+        layout.addWidget(table, 1)
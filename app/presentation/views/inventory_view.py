@@ -0,0 +1,173 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QFrame, QSplitter
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from app.presentation.controllers.inventory_controller import InventoryController
+
+class InventoryView(QWidget):
+    """Vista del inventario de conectores: qué flujos usan cada conector y operación"""
+
+    back_requested = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+
+        # Controlador
+        self.inventory_controller = InventoryController(self)
+
+        # Layout principal
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(30, 30, 30, 30)
+        self.layout.setSpacing(20)
+
+        # Header con título y botón regresar
+        header_container = QHBoxLayout()
+
+        self.back_button = QPushButton("Regresar")
+        self.back_button.setObjectName("backButton")
+        self.back_button.setMinimumWidth(120)
+        self.back_button.clicked.connect(self.back_requested.emit)
+        header_container.addWidget(self.back_button)
+
+        title_container = QVBoxLayout()
+        title_container.setContentsMargins(15, 0, 0, 0)
+        title_container.setSpacing(5)
+
+        title = QLabel("Inventario de conectores")
+        title.setProperty("role", "heading")
+        title_container.addWidget(title)
+
+        subtitle = QLabel("Conectores, desencadenadores y acciones de las definiciones importadas")
+        subtitle.setProperty("role", "subtitle")
+        title_container.addWidget(subtitle)
+
+        header_container.addLayout(title_container, 1)
+        self.layout.addLayout(header_container)
+
+        # Línea separadora
+        separator = QFrame()
+        separator.setFrameShape(QFrame.Shape.HLine)
+        separator.setFrameShadow(QFrame.Shadow.Sunken)
+        separator.setProperty("role", "separator")
+        self.layout.addWidget(separator)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Conectores con la cantidad de flujos que los usan
+        self.connectors_table = QTableWidget(0, 4)
+        self.connectors_table.setHorizontalHeaderLabels(
+            ["Conector", "Flujos", "Como desencadenador", "Acciones"]
+        )
+        self.connectors_table.verticalHeader().setVisible(False)
+        self.connectors_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.connectors_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.connectors_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        header = self.connectors_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 4):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        self.connectors_table.itemSelectionChanged.connect(self._on_connector_selected)
+        splitter.addWidget(self.connectors_table)
+
+        # Flujos del conector seleccionado, filtrables por operación
+        flows_panel = QWidget()
+        flows_layout = QVBoxLayout(flows_panel)
+        flows_layout.setContentsMargins(10, 0, 0, 0)
+
+        filters = QHBoxLayout()
+        filters.addWidget(QLabel("Operación:"))
+        self.operation_combo = QComboBox()
+        self.operation_combo.currentIndexChanged.connect(self._load_flows)
+        filters.addWidget(self.operation_combo, 1)
+        flows_layout.addLayout(filters)
+
+        self.results_label = QLabel("Seleccione un conector")
+        self.results_label.setProperty("role", "summary")
+        flows_layout.addWidget(self.results_label)
+
+        self.flows_table = QTableWidget(0, 4)
+        self.flows_table.setHorizontalHeaderLabels(["Flujo", "Proyecto", "Propietario", "Estado"])
+        self.flows_table.verticalHeader().setVisible(False)
+        self.flows_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        flows_header = self.flows_table.horizontalHeader()
+        flows_header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, 4):
+            flows_header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        flows_layout.addWidget(self.flows_table, 1)
+
+        splitter.addWidget(flows_panel)
+        splitter.setStretchFactor(0, 2)
+        splitter.setStretchFactor(1, 3)
+        self.layout.addWidget(splitter, 1)
+
+        self.current_connector = None
+        self.current_total = 0
+
+    def refresh(self):
+        """Actualiza el inventario y la lista de conectores"""
+        connectors = self.inventory_controller.load_connectors()
+
+        self.connectors_table.blockSignals(True)
+        self.connectors_table.setRowCount(len(connectors))
+        for row, connector in enumerate(connectors):
+            name_item = QTableWidgetItem(connector['label'])
+            name_item.setData(Qt.ItemDataRole.UserRole, connector['connector'])
+            self.connectors_table.setItem(row, 0, name_item)
+            for column, key in enumerate(('flows', 'triggers', 'actions'), start=1):
+                item = QTableWidgetItem(str(connector[key]))
+                item.setData(Qt.ItemDataRole.UserRole, connector[key])
+                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                self.connectors_table.setItem(row, column, item)
+        self.connectors_table.blockSignals(False)
+
+        if not connectors:
+            self.results_label.setText("No hay definiciones importadas. Importe paquetes desde la lista de proyectos.")
+        self.flows_table.setRowCount(0)
+        self.operation_combo.clear()
+
+    def _on_connector_selected(self):
+        """Carga las operaciones y los flujos del conector seleccionado"""
+        rows = self.connectors_table.selectionModel().selectedRows()
+        if not rows:
+            return
+        row = rows[0].row()
+        self.current_connector = self.connectors_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        self.current_total = self.connectors_table.item(row, 1).data(Qt.ItemDataRole.UserRole)
+
+        operations = self.inventory_controller.load_operations(self.current_connector)
+        self.operation_combo.blockSignals(True)
+        self.operation_combo.clear()
+        self.operation_combo.addItem("Todas las operaciones", None)
+        for operation in operations:
+            self.operation_combo.addItem(
+                f"{operation['operation']} ({operation['kind_label']}) · {operation['flows']} flujos",
+                (operation['operation'], operation['flows'])
+            )
+        self.operation_combo.blockSignals(False)
+        self._load_flows()
+
+    def _load_flows(self):
+        """Muestra los flujos que usan el conector (y la operación) seleccionados"""
+        if not self.current_connector:
+            return
+
+        selected = self.operation_combo.currentData()
+        operation, total = selected if selected else (None, self.current_total)
+        flows = self.inventory_controller.find_flows(self.current_connector, operation)
+
+        shown = len(flows)
+        self.results_label.setText(
+            f"{total} flujos" if shown >= total else f"Mostrando {shown} de {total} flujos"
+        )
+
+        self.flows_table.setRowCount(shown)
+        for row, flow in enumerate(flows):
+            self.flows_table.setItem(row, 0, QTableWidgetItem(flow['name']))
+            self.flows_table.setItem(row, 1, QTableWidgetItem(flow['project_name']))
+            self.flows_table.setItem(row, 2, QTableWidgetItem(flow['owner']))
+            status_item = QTableWidgetItem("Activo" if flow['is_active'] else "Inactivo")
+            status_item.setForeground(QColor("#4caf50" if flow['is_active'] else "#f44336"))
+            self.flows_table.setItem(row, 3, status_item)
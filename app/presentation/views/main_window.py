@@ -1,17 +1,18 @@
-import os
 from PyQt6.QtWidgets import (
-    QMainWindow, QStackedWidget, QVBoxLayout, 
+    QApplication, QMainWindow, QStackedWidget, QVBoxLayout, 
     QWidget, QLabel, QPushButton, QHBoxLayout
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon, QFontDatabase, QFont
 
+from app.presentation import theme
 from app.presentation.views.project_list_view import ProjectListView
-from app.presentation.views.project_detail_view import ProjectDetailView
-from app.presentation.views.add_project_view import AddProjectView
-from app.presentation.views.add_flow_view import AddFlowView
-from app.presentation.views.edit_flow_view import EditFlowView
-from app.presentation.views.edit_project_view import EditProjectView
+# Las demás vistas se importan al abrirlas por primera vez (acortan el arranque;
+# algunas arrastran numpy o los diálogos de definición de flujos)
+from app.presentation.controllers.change_feed_controller import ChangeFeedController
+from app.presentation.controllers.backup_controller import BackupController
+from app.presentation.controllers.responsiveness_controller import ResponsivenessController
+from app.config import RESPONSIVENESS
 
 class MainWindow(QMainWindow):
     """Ventana principal de la aplicación"""
@@ -50,23 +51,32 @@ class MainWindow(QMainWindow):
         self.add_flow_view = None
         self.edit_flow_view = None
         self.edit_project_view = None  # Agregar esta línea
+        self.diagram_viewer_view = None
+        self.concurrency_view = None
+        self.inventory_view = None
+        self.diagnostics_view = None
         
         # Iniciar con la vista de lista de proyectos
         self._initialize_views()
+        
+        # Cambios hechos por otras instancias que comparten la base
+        self.change_feed_controller = ChangeFeedController(self)
+        self.change_feed_controller.changes_available.connect(self._apply_changes)
+        self.change_feed_controller.start()
+        
+        # Copia de seguridad programada de la base
+        self.backup_controller = BackupController(self)
+        self.backup_controller.start()
+        
+        # Detector de bloqueos de la interfaz
+        self.responsiveness_controller = None
+        if RESPONSIVENESS['enabled']:
+            self.responsiveness_controller = ResponsivenessController(self)
+            self.responsiveness_controller.start()
     
     def _load_styles(self):
-        """Carga los estilos CSS de la aplicación"""
-        style_path = os.path.join(
-            os.path.dirname(os.path.dirname(__file__)), 
-            'assets', 
-            'styles.qss'
-        )
-        
-        try:
-            with open(style_path, 'r') as f:
-                self.setStyleSheet(f.read())
-        except Exception as e:
-            print(f"Error al cargar los estilos: {e}")
+        """Aplica el tema a toda la aplicación (una sola hoja de estilos, ver app/presentation/theme.py)"""
+        theme.apply(QApplication.instance())
     
     def _create_header(self):
         """Crea el header de la aplicación"""
@@ -80,6 +90,25 @@ class MainWindow(QMainWindow):
         title = QLabel("Flujos de Power Automate Yape")
         title.setObjectName("titleLabel")
         header_layout.addWidget(title)
+        header_layout.addStretch()
+        
+        # Acceso al análisis de carga
+        analysis_button = QPushButton("Análisis de carga")
+        analysis_button.setObjectName("secondaryButton")
+        analysis_button.clicked.connect(self.show_concurrency)
+        header_layout.addWidget(analysis_button)
+        
+        # Acceso al inventario de conectores
+        inventory_button = QPushButton("Conectores")
+        inventory_button.setObjectName("secondaryButton")
+        inventory_button.clicked.connect(self.show_inventory)
+        header_layout.addWidget(inventory_button)
+        
+        # Acceso al diagnóstico de consultas
+        diagnostics_button = QPushButton("Diagnóstico")
+        diagnostics_button.setObjectName("secondaryButton")
+        diagnostics_button.clicked.connect(self.show_diagnostics)
+        header_layout.addWidget(diagnostics_button)
         
         # Agregar el header al layout principal
         self.main_layout.addWidget(header)
@@ -100,6 +129,7 @@ class MainWindow(QMainWindow):
     def show_project_detail(self, project_id, project_name):
         """Muestra la vista de detalle de un proyecto"""
         if not self.project_detail_view:
+            from app.presentation.views.project_detail_view import ProjectDetailView
             self.project_detail_view = ProjectDetailView()
             self.stacked_widget.addWidget(self.project_detail_view)
             
@@ -111,6 +141,7 @@ class MainWindow(QMainWindow):
             self.project_detail_view.edit_flow_requested.connect(self.show_edit_flow)
             self.project_detail_view.project_updated.connect(self._refresh_project_list)
             self.project_detail_view.edit_project_requested.connect(self.show_edit_project)
+            self.project_detail_view.diagram_requested.connect(self.show_diagram)
         
         self.project_detail_view.set_project(project_id, project_name)
         self.stacked_widget.setCurrentWidget(self.project_detail_view)
@@ -118,6 +149,7 @@ class MainWindow(QMainWindow):
     def show_add_project(self):
         """Muestra la vista de agregar proyecto"""
         if not self.add_project_view:
+            from app.presentation.views.add_project_view import AddProjectView
             self.add_project_view = AddProjectView()
             self.stacked_widget.addWidget(self.add_project_view)
             
@@ -132,6 +164,7 @@ class MainWindow(QMainWindow):
     def show_add_flow(self, project_id, project_name):
         """Muestra la vista de agregar flujo"""
         if not self.add_flow_view:
+            from app.presentation.views.add_flow_view import AddFlowView
             self.add_flow_view = AddFlowView()
             self.stacked_widget.addWidget(self.add_flow_view)
             
@@ -148,6 +181,7 @@ class MainWindow(QMainWindow):
     def show_edit_flow(self, flow_id, project_id):
         """Muestra la vista de edición de flujo"""
         if not self.edit_flow_view:
+            from app.presentation.views.edit_flow_view import EditFlowView
             self.edit_flow_view = EditFlowView()
             self.stacked_widget.addWidget(self.edit_flow_view)
             
@@ -164,6 +198,7 @@ class MainWindow(QMainWindow):
     def show_edit_project(self, project_id, project_name):
         """Muestra la vista de edición de proyecto"""
         if not self.edit_project_view:
+            from app.presentation.views.edit_project_view import EditProjectView
             self.edit_project_view = EditProjectView()
             self.stacked_widget.addWidget(self.edit_project_view)
             
@@ -176,6 +211,66 @@ class MainWindow(QMainWindow):
         self.edit_project_view.set_project(project_id, project_name)
         self.stacked_widget.setCurrentWidget(self.edit_project_view)
     
+    def show_diagram(self, diagram_path, project_name):
+        """Muestra el visor de diagramas"""
+        if not self.diagram_viewer_view:
+            from app.presentation.views.diagram_viewer_view import DiagramViewerView
+            self.diagram_viewer_view = DiagramViewerView()
+            self.stacked_widget.addWidget(self.diagram_viewer_view)
+            
+            # Conectar señales
+            self.diagram_viewer_view.back_requested.connect(
+                lambda: self.stacked_widget.setCurrentWidget(self.project_detail_view)
+            )
+        
+        self.diagram_viewer_view.set_diagram(diagram_path, project_name)
+        self.stacked_widget.setCurrentWidget(self.diagram_viewer_view)
+    
+    def show_concurrency(self):
+        """Muestra la vista de análisis de concurrencia"""
+        if not self.concurrency_view:
+            from app.presentation.views.concurrency_view import ConcurrencyView
+            self.concurrency_view = ConcurrencyView()
+            self.stacked_widget.addWidget(self.concurrency_view)
+            
+            # Conectar señales
+            self.concurrency_view.back_requested.connect(
+                lambda: self.stacked_widget.setCurrentWidget(self.project_list_view)
+            )
+        
+        self.concurrency_view.refresh()
+        self.stacked_widget.setCurrentWidget(self.concurrency_view)
+    
+    def show_inventory(self):
+        """Muestra el inventario de conectores"""
+        if not self.inventory_view:
+            from app.presentation.views.inventory_view import InventoryView
+            self.inventory_view = InventoryView()
+            self.stacked_widget.addWidget(self.inventory_view)
+            
+            # Conectar señales
+            self.inventory_view.back_requested.connect(
+                lambda: self.stacked_widget.setCurrentWidget(self.project_list_view)
+            )
+        
+        self.inventory_view.refresh()
+        self.stacked_widget.setCurrentWidget(self.inventory_view)
+    
+    def show_diagnostics(self):
+        """Muestra el panel de diagnóstico de consultas y de bloqueos de la interfaz"""
+        if not self.diagnostics_view:
+            from app.presentation.views.diagnostics_view import DiagnosticsView
+            self.diagnostics_view = DiagnosticsView()
+            self.stacked_widget.addWidget(self.diagnostics_view)
+            
+            # Conectar señales
+            self.diagnostics_view.back_requested.connect(
+                lambda: self.stacked_widget.setCurrentWidget(self.project_list_view)
+            )
+        
+        self.diagnostics_view.refresh()
+        self.stacked_widget.setCurrentWidget(self.diagnostics_view)
+    
     def on_project_added(self):
         """Manejador para cuando se agrega un proyecto"""
         self.project_list_view.refresh_projects()
@@ -193,7 +288,27 @@ class MainWindow(QMainWindow):
             self.project_detail_view.refresh_flows()
             self.stacked_widget.setCurrentWidget(self.project_detail_view)
     
+    def _apply_changes(self, batch):
+        """Aplica en las vistas abiertas los cambios leídos del registro"""
+        self.project_list_view.apply_changes(batch)
+        if self.project_detail_view:
+            self.project_detail_view.apply_changes(batch)
+    
+    def closeEvent(self, event):
+        """Detiene la consulta de cambios, las copias programadas, el detector de bloqueos y los hilos del visor de diagramas antes de cerrar"""
+        self.change_feed_controller.stop()
+        self.backup_controller.stop()
+        if self.responsiveness_controller:
+            self.responsiveness_controller.stop()
+        if self.diagram_viewer_view:
+            self.diagram_viewer_view.viewer.shutdown()
+        super().closeEvent(event)
+    
     def _refresh_project_list(self, project_id=None):
-        """Actualiza la lista de proyectos"""
-        if self.project_list_view:
-            self.project_list_view.refresh_projects()
\ No newline at end of file
+        """Actualiza la lista de proyectos (solo la tarjeta del proyecto modificado, si se indica)"""
+        if not self.project_list_view:
+            return
+        if project_id is None:
+            self.project_list_view.refresh_projects()
+        else:
+            self.project_list_view.update_project(project_id)
\ No newline at end of file
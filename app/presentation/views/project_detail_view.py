@@ -2,13 +2,33 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QTableWidget, QTableWidgetItem, QHeaderView,
     QMenu, QMessageBox, QFrame, QSpacerItem, QSizePolicy,
-    QGraphicsDropShadowEffect, QWidgetAction
+    QWidgetAction, QFileDialog
 )
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QCursor, QColor, QIcon, QFont, QAction
 
+from app.config import UI
+from app.domain.entities.change import ChangeOperation
+from app.presentation import theme
 from app.presentation.controllers.project_controller import ProjectController
 from app.presentation.controllers.flow_controller import FlowController
+from app.presentation.views.flow_definition_view import FlowDefinitionDialog
+from app.presentation.views.flow_impact_view import FlowImpactDialog
+from app.utils.tracing import traced
+
+# Días considerados en la columna de salud de los flujos
+HEALTH_DAYS = 30
+
+# Dato de la celda de número que indica si el flujo tiene una definición importada
+FLOW_DEFINITION_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Color de la columna de salud según el nivel
+HEALTH_COLORS = {
+    'healthy': "#4caf50",
+    'warning': "#ff9800",
+    'critical': "#f44336",
+    'unknown': "#999999",
+}
 
 class ProjectDetailView(QWidget):
     """Vista de detalle de un proyecto"""
@@ -18,6 +38,7 @@ class ProjectDetailView(QWidget):
     edit_flow_requested = pyqtSignal(int, int)  # flow_id, project_id
     project_updated = pyqtSignal(int)  # project_id
     edit_project_requested = pyqtSignal(int, str)  # project_id, project_name
+    diagram_requested = pyqtSignal(str, str)  # diagram_path, project_name
     
     def __init__(self):
         super().__init__()
@@ -40,85 +61,38 @@ class ProjectDetailView(QWidget):
         
         # Botón Regresar
         self.back_button = QPushButton("Regresar")
+        self.back_button.setObjectName("backButton")
         self.back_button.setMinimumWidth(120)
-        self.back_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4a86e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 15px;
-                font-weight: bold;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #3b78e7;
-            }
-            QPushButton:pressed {
-                background-color: #3367d6;
-            }
-        """)
         self.back_button.clicked.connect(self.back_requested.emit)
         header_container.addWidget(self.back_button)
         
         # Título
         title_container = QVBoxLayout()
+        title_container.setContentsMargins(15, 0, 0, 0)
         title_container.setSpacing(5)
         
         self.project_title = QLabel("Flujos del proyecto")
-        self.project_title.setObjectName("titleLabel")
-        self.project_title.setStyleSheet("font-size: 24px; font-weight: bold; color: #333333; margin-left: 15px;")
+        self.project_title.setProperty("role", "heading")
         title_container.addWidget(self.project_title)
         
         self.project_subtitle = QLabel("Gestione los flujos de automatización para este proyecto")
-        self.project_subtitle.setStyleSheet("font-size: 14px; color: #666666; margin-left: 15px;")
+        self.project_subtitle.setProperty("role", "subtitle")
         title_container.addWidget(self.project_subtitle)
         
         header_container.addLayout(title_container, 1)
         
         # Botón Agregar Flujo
         self.add_flow_button = QPushButton("Agregar Flujo")
+        self.add_flow_button.setObjectName("secondaryButton")
+        self.add_flow_button.setProperty("large", True)
         self.add_flow_button.setMinimumWidth(150)
-        self.add_flow_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9c27b0;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8e24aa;
-            }
-            QPushButton:pressed {
-                background-color: #7b1fa2;
-            }
-        """)
         self.add_flow_button.clicked.connect(self._on_add_flow)
         header_container.addWidget(self.add_flow_button)
 
         # Botón Generar Diagrama
         self.generate_diagram_button = QPushButton("Generar Diagrama")
+        self.generate_diagram_button.setObjectName("successButton")
         self.generate_diagram_button.setMinimumWidth(150)
-        self.generate_diagram_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #43a047;
-            }
-            QPushButton:pressed {
-                background-color: #388e3c;
-            }
-        """)
         self.generate_diagram_button.clicked.connect(self._on_generate_diagram)
         header_container.addWidget(self.generate_diagram_button)
         
@@ -128,26 +102,16 @@ class ProjectDetailView(QWidget):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("background-color: #e0e0e0;")
+        separator.setProperty("role", "separator")
         self.layout.addWidget(separator)
         
         # Panel de información del proyecto
         info_panel = QFrame()
+        info_panel.setObjectName("infoPanel")
         info_panel.setFrameShape(QFrame.Shape.StyledPanel)
-        info_panel.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #e0e0e0;
-            }
-        """)
         
         # Aplicar sombra al panel
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 3)
-        info_panel.setGraphicsEffect(shadow)
+        theme.set_shadow(info_panel, theme.use_shadows())
         
         info_layout = QHBoxLayout(info_panel)
         info_layout.setContentsMargins(20, 15, 20, 15)
@@ -157,29 +121,15 @@ class ProjectDetailView(QWidget):
         status_container.setSpacing(10)
         
         self.project_status_label = QLabel("Estado:")
-        self.project_status_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #555555;")
+        self.project_status_label.setProperty("role", "fieldName")
         status_container.addWidget(self.project_status_label)
         
         self.project_status_value = QLabel("Activo")
-        self.project_status_value.setObjectName("activeStatus")
-        self.project_status_value.setStyleSheet("font-size: 14px; font-weight: bold; color: #4caf50;")
+        self.project_status_value.setProperty("status", "active")
         status_container.addWidget(self.project_status_value)
         
         self.toggle_status_button = QPushButton("Cambiar Estado")
-        self.toggle_status_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #555555;
-                border: 1px solid #dddddd;
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #e6e6e6;
-                border: 1px solid #cccccc;
-            }
-        """)
+        self.toggle_status_button.setObjectName("neutralButton")
         self.toggle_status_button.clicked.connect(self._on_toggle_project_status)
         status_container.addWidget(self.toggle_status_button)
         
@@ -191,7 +141,7 @@ class ProjectDetailView(QWidget):
         vseparator = QFrame()
         vseparator.setFrameShape(QFrame.Shape.VLine)
         vseparator.setFrameShadow(QFrame.Shadow.Sunken)
-        vseparator.setStyleSheet("background-color: #e0e0e0;")
+        vseparator.setProperty("role", "separator")
         info_layout.addWidget(vseparator)
         
         # Botón de eliminar proyecto
@@ -200,42 +150,10 @@ class ProjectDetailView(QWidget):
         
         self.delete_project_button = QPushButton("Eliminar Proyecto")
         self.delete_project_button.setObjectName("dangerButton")
-        self.delete_project_button.setStyleSheet("""
-            QPushButton {
-                background-color: #d32f2f;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #c62828;
-            }
-            QPushButton:pressed {
-                background-color: #b71c1c;
-            }
-        """)
         self.delete_project_button.clicked.connect(self._on_delete_project)
         delete_container.addWidget(self.delete_project_button)
 
         self.edit_project_button = QPushButton("Editar Proyecto")
-        self.edit_project_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4a86e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3b78e7;
-            }
-            QPushButton:pressed {
-                background-color: #3367d6;
-            }
-        """)
         self.edit_project_button.clicked.connect(self._on_edit_project)
         delete_container.addWidget(self.edit_project_button)
         
@@ -245,61 +163,37 @@ class ProjectDetailView(QWidget):
         
         # Título de la tabla
         table_header = QHBoxLayout()
+        table_header.setContentsMargins(0, 10, 0, 0)
         
         table_title = QLabel("Flujos de Trabajo")
-        table_title.setStyleSheet("font-size: 18px; font-weight: bold; color: #333333; margin-top: 10px;")
+        table_title.setProperty("role", "sectionTitle")
         table_header.addWidget(table_title)
         
         table_subtitle = QLabel("Haga clic derecho sobre un flujo para ver más opciones")
-        table_subtitle.setStyleSheet("font-size: 13px; color: #666666; margin-top: 10px;")
+        table_subtitle.setProperty("role", "hint")
         table_header.addStretch(1)
         table_header.addWidget(table_subtitle)
         
+        # Botón Importar Historial
+        self.import_history_button = QPushButton("Importar Historial")
+        self.import_history_button.setObjectName("neutralButton")
+        self.import_history_button.clicked.connect(lambda: self._on_import_history())
+        table_header.addWidget(self.import_history_button)
+        
         self.layout.addLayout(table_header)
         
         # Tabla de flujos mejorada
         self.flows_table = QTableWidget()
-        self.flows_table.setColumnCount(6)  # Añadimos una columna más para el número
-        self.flows_table.setHorizontalHeaderLabels(["#", "Nombre", "Recurrencia", "Creado", "Owner", "Estado"])
-        
-        # Estilo de la tabla
-        self.flows_table.setStyleSheet("""
-            QTableWidget {
-                background-color: white;
-                alternate-background-color: #f9f9f9;
-                border: 1px solid #e0e0e0;
-                border-radius: 8px;
-                gridline-color: #eeeeee;
-                selection-background-color: #e3f2fd;
-                selection-color: #2196f3;
-            }
-            QTableWidget::item {
-                padding: 10px;
-                border-bottom: 1px solid #f0f0f0;
-            }
-            QTableWidget::item:selected {
-                background-color: #e3f2fd;
-            }
-            QHeaderView::section {
-                background-color: #f5f5f5;
-                padding: 10px;
-                border: none;
-                border-right: 1px solid #e0e0e0;
-                border-bottom: 1px solid #e0e0e0;
-                font-weight: bold;
-            }
-            QTableCornerButton::section {
-                background-color: #f5f5f5;
-                border: none;
-            }
-        """)
-        
-        # Aplicar sombra a la tabla
-        table_shadow = QGraphicsDropShadowEffect()
-        table_shadow.setBlurRadius(15)
-        table_shadow.setColor(QColor(0, 0, 0, 30))
-        table_shadow.setOffset(0, 3)
-        self.flows_table.setGraphicsEffect(table_shadow)
+        self.flows_table.setColumnCount(8)  # Añadimos una columna más para el número
+        self.flows_table.setHorizontalHeaderLabels(
+            ["#", "Nombre", "Recurrencia", "Creado", "Owner", "Estado", "Próxima ejecución",
+             f"Salud ({HEALTH_DAYS} días)"]
+        )
+        
+        self.flows_table.setObjectName("flowsTable")
+        
+        # Aplicar sombra a la tabla (se quita al cargar muchos flujos, ver refresh_flows)
+        theme.set_shadow(self.flows_table, theme.use_shadows())
         
         # Configurar ancho de las columnas
         self.flows_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
@@ -321,10 +215,12 @@ class ProjectDetailView(QWidget):
         # Placeholder para tabla vacía
         self.empty_message = QLabel("No hay flujos para este proyecto. Haga clic en 'Agregar Flujo' para comenzar.")
         self.empty_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_message.setStyleSheet("font-size: 14px; color: #666666; margin: 40px 0;")
+        self.empty_message.setProperty("role", "subtitle")
+        self.empty_message.setContentsMargins(0, 40, 0, 40)
         self.empty_message.setVisible(False)
         self.layout.addWidget(self.empty_message)
     
+    @traced(category='qt')
     def set_project(self, project_id, project_name):
         """Establece el proyecto actual y actualiza la vista"""
         self.current_project_id = project_id
@@ -335,14 +231,11 @@ class ProjectDetailView(QWidget):
         project = self.project_controller.get_project(project_id)
         if project:
             # Actualizar estado del proyecto
-            is_active = project.get('is_active', True)
-            status_text = "Activo" if is_active else "Inactivo"
-            status_color = "#4caf50" if is_active else "#f44336"
-            self.project_status_value.setText(status_text)
-            self.project_status_value.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {status_color};")
+            self._show_project_status(project.get('is_active', True))
         
         self.refresh_flows()
     
+    @traced(category='qt')
     def refresh_flows(self):
         """Actualiza la lista de flujos del proyecto"""
         if not self.current_project_id:
@@ -351,8 +244,9 @@ class ProjectDetailView(QWidget):
         # Limpiar tabla
         self.flows_table.setRowCount(0)
         
-        # Obtener flujos
+        # Obtener flujos y su salud (desde los resúmenes diarios, sin leer ejecuciones)
         flows = self.flow_controller.load_flows(self.current_project_id)
+        health = self.flow_controller.load_flows_health(self.current_project_id, HEALTH_DAYS)
         
         # Mostrar mensaje si no hay flujos
         if not flows:
@@ -363,46 +257,130 @@ class ProjectDetailView(QWidget):
             self.flows_table.setVisible(True)
             self.empty_message.setVisible(False)
         
+        # La sombra obliga a redibujar y desenfocar la tabla completa en cada desplazamiento
+        theme.set_shadow(self.flows_table, theme.use_shadows(len(flows), UI['shadow_max_rows']))
+        
         # Añadir filas a la tabla
         for i, flow in enumerate(flows):
             self.flows_table.insertRow(i)
+            self._fill_flow_row(i, flow)
             
-            # Número de fila
-            item_num = QTableWidgetItem(str(i + 1))
-            item_num.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            item_num.setData(Qt.ItemDataRole.UserRole, flow['id'])  # Guardar ID del flujo
-            self.flows_table.setItem(i, 0, item_num)
-            
-            # Nombre
-            item_name = QTableWidgetItem(flow['name'])
-            self.flows_table.setItem(i, 1, item_name)
-            
-            # Recurrencia
-            item_recurrence = QTableWidgetItem(flow['recurrence'])
-            item_recurrence.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.flows_table.setItem(i, 2, item_recurrence)
-            
-            # Fecha de creación
-            item_date = QTableWidgetItem(flow['created_at'])
-            item_date.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.flows_table.setItem(i, 3, item_date)
-            
-            # Owner
-            item_owner = QTableWidgetItem(flow['owner'])
-            self.flows_table.setItem(i, 4, item_owner)
-            
-            # Estado
-            status_text = "Activo" if flow['is_active'] else "Inactivo"
-            item_status = QTableWidgetItem(status_text)
-            item_status.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            # Salud
+            self.flows_table.setItem(i, 7, self._health_item(health.get(flow['id'])))
+    
+    @traced(category='qt')
+    def _fill_flow_row(self, i, flow):
+        """Escribe los datos de un flujo en una fila de la tabla (salvo la salud)"""
+        # Número de fila
+        item_num = QTableWidgetItem(str(i + 1))
+        item_num.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        item_num.setData(Qt.ItemDataRole.UserRole, flow['id'])  # Guardar ID del flujo
+        item_num.setData(FLOW_DEFINITION_ROLE, flow['has_definition'])
+        self.flows_table.setItem(i, 0, item_num)
+        
+        # Nombre
+        item_name = QTableWidgetItem(flow['name'])
+        self.flows_table.setItem(i, 1, item_name)
+        
+        # Recurrencia
+        item_recurrence = QTableWidgetItem(flow['recurrence'])
+        item_recurrence.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        item_recurrence.setToolTip(flow['schedule_description'])
+        self.flows_table.setItem(i, 2, item_recurrence)
+        
+        # Fecha de creación
+        item_date = QTableWidgetItem(flow['created_at'])
+        item_date.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.flows_table.setItem(i, 3, item_date)
+        
+        # Owner
+        item_owner = QTableWidgetItem(flow['owner'])
+        self.flows_table.setItem(i, 4, item_owner)
+        
+        # Estado
+        status_text = "Activo" if flow['is_active'] else "Inactivo"
+        item_status = QTableWidgetItem(status_text)
+        item_status.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Color según estado
+        if flow['is_active']:
+            item_status.setForeground(QColor("#4caf50"))  # Verde para activo
+        else:
+            item_status.setForeground(QColor("#f44336"))  # Rojo para inactivo
             
-            # Color según estado
-            if flow['is_active']:
-                item_status.setForeground(QColor("#4caf50"))  # Verde para activo
-            else:
-                item_status.setForeground(QColor("#f44336"))  # Rojo para inactivo
-                
-            self.flows_table.setItem(i, 5, item_status)
+        self.flows_table.setItem(i, 5, item_status)
+        
+        # Próxima ejecución
+        item_next_run = QTableWidgetItem(flow['next_run_at'] or "-")
+        item_next_run.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.flows_table.setItem(i, 6, item_next_run)
+    
+    def apply_changes(self, batch):
+        """Aplica los cambios hechos fuera de esta vista (p. ej. por otra instancia).
+        
+        Las modificaciones se reescriben solo en sus filas; altas y bajas
+        cambian el orden y la numeración, así que recargan la tabla.
+        """
+        if not self.current_project_id:
+            return
+        
+        if batch.full_refresh:
+            project = self.project_controller.get_project(self.current_project_id)
+            project_change = ChangeOperation.UPDATE if project else ChangeOperation.DELETE
+        else:
+            project_change = batch.projects().get(self.current_project_id)
+        if project_change is ChangeOperation.DELETE:
+            self.current_project_id = None
+            if self.isVisible():
+                self.back_requested.emit()
+            return
+        if project_change is ChangeOperation.UPDATE:
+            project = self.project_controller.get_project(self.current_project_id)
+            if project:
+                self.current_project_name = project['name']
+                self.project_title.setText(f"Flujos del proyecto {project['name']}")
+                self._show_project_status(project.get('is_active', True))
+        
+        if batch.full_refresh:
+            self.refresh_flows()
+            return
+        changes = batch.flows(self.current_project_id)
+        if not changes:
+            return
+        rows = {
+            self.flows_table.item(row, 0).data(Qt.ItemDataRole.UserRole): row
+            for row in range(self.flows_table.rowCount())
+        }
+        if any(operation is not ChangeOperation.UPDATE or flow_id not in rows
+               for flow_id, operation in changes.items()):
+            self.refresh_flows()
+            return
+        for flow_id in changes:
+            flow = self.flow_controller.get_flow(flow_id)
+            if flow:
+                self._fill_flow_row(rows[flow_id], flow)
+    
+    def _show_project_status(self, is_active):
+        """Muestra el estado del proyecto en el encabezado"""
+        self.project_status_value.setText("Activo" if is_active else "Inactivo")
+        theme.set_state(self.project_status_value, "status", "active" if is_active else "inactive")
+    
+    def _health_item(self, health):
+        """Crea la celda de salud de un flujo"""
+        if not health:
+            item = QTableWidgetItem("Sin datos")
+            item.setForeground(QColor(HEALTH_COLORS['unknown']))
+            item.setToolTip("No hay ejecuciones importadas en este periodo")
+        else:
+            item = QTableWidgetItem(f"{health['label']} · {health['success_rate']}")
+            item.setForeground(QColor(HEALTH_COLORS[health['level']]))
+            item.setToolTip(
+                f"Ejecuciones: {health['runs']} ({health['failures']} fallidas)\n"
+                f"Duración p50: {health['p50_duration']} · p95: {health['p95_duration']}\n"
+                f"Última ejecución: {health['last_run_at']}"
+            )
+        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+        return item
     
     def _on_add_flow(self):
         """Manejador para agregar un nuevo flujo"""
@@ -417,11 +395,7 @@ class ProjectDetailView(QWidget):
         project = self.project_controller.toggle_project_status(self.current_project_id)
         if project:
             # Actualizar estado del proyecto en la interfaz
-            is_active = project.get('is_active', True)
-            status_text = "Activo" if is_active else "Inactivo"
-            status_color = "#4caf50" if is_active else "#f44336"
-            self.project_status_value.setText(status_text)
-            self.project_status_value.setStyleSheet(f"font-size: 14px; font-weight: bold; color: {status_color};")
+            self._show_project_status(project.get('is_active', True))
             
             # Emitir señal de actualización
             self.project_updated.emit(self.current_project_id)
@@ -455,36 +429,12 @@ class ProjectDetailView(QWidget):
         row = item.row()
         flow_id = self.flows_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         
-        # Estilo del menú contextual
-        menu_style = """
-            QMenu {
-                background-color: white;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 5px 25px 5px 25px;
-                border-radius: 3px;
-            }
-            QMenu::item:selected {
-                background-color: #e3f2fd;
-                color: #2196f3;
-            }
-            QMenu::separator {
-                height: 1px;
-                background-color: #e0e0e0;
-                margin: 3px 10px;
-            }
-        """
-        
         # Crear menú contextual
         context_menu = QMenu(self)
-        context_menu.setStyleSheet(menu_style)
         
         flow_name = self.flows_table.item(row, 1).text()
         title_widget = QLabel(f"  {flow_name}  ")
-        title_widget.setStyleSheet("font-weight: bold; color: #333333; padding: 3px;")
+        title_widget.setObjectName("menuTitle")
         
         # Crear acciones para el menú
         title_action = QWidgetAction(context_menu)
@@ -501,6 +451,19 @@ class ProjectDetailView(QWidget):
         toggle_status_action = context_menu.addAction("Cambiar Estado")
         toggle_status_action.triggered.connect(lambda: self._toggle_flow_status(flow_id, row))
         
+        # Opción para ver la definición importada (se descomprime al abrirla)
+        definition_action = context_menu.addAction("Ver Definición")
+        definition_action.setEnabled(bool(self.flows_table.item(row, 0).data(FLOW_DEFINITION_ROLE)))
+        definition_action.triggered.connect(lambda: self._show_definition(flow_id, flow_name))
+        
+        # Opción para ver qué flujos lo afectan y a cuáles afecta
+        impact_action = context_menu.addAction("Análisis de Impacto")
+        impact_action.triggered.connect(lambda: self._show_impact(flow_id, flow_name))
+        
+        # Opción para importar el historial de este flujo
+        import_action = context_menu.addAction("Importar Historial")
+        import_action.triggered.connect(lambda: self._on_import_history(flow_id))
+        
         # Opción para eliminar
         context_menu.addSeparator()
         delete_action = context_menu.addAction("Eliminar Flujo")
@@ -514,6 +477,18 @@ class ProjectDetailView(QWidget):
         if self.current_project_id:
             self.edit_flow_requested.emit(flow_id, self.current_project_id)
     
+    def _show_definition(self, flow_id, flow_name):
+        """Muestra la definición importada de un flujo"""
+        definition = self.flow_controller.get_flow_definition(flow_id)
+        if definition:
+            FlowDefinitionDialog(flow_name, definition, self).exec()
+    
+    def _show_impact(self, flow_id, flow_name):
+        """Muestra el análisis de impacto de un flujo"""
+        impact = self.flow_controller.get_flow_impact(flow_id)
+        if impact is not None:
+            FlowImpactDialog(flow_name, impact, self).exec()
+    
     def _toggle_flow_status(self, flow_id, row):
         """Cambia el estado de un flujo"""
         flow = self.flow_controller.toggle_flow_status(flow_id)
@@ -526,6 +501,8 @@ class ProjectDetailView(QWidget):
             item_status = self.flows_table.item(row, 5)
             item_status.setText(status_text)
             item_status.setForeground(QColor(status_color))
+            
+            self.flows_table.item(row, 6).setText(flow['next_run_at'] or "-")
     
     def _delete_flow(self, flow_id):
         """Elimina un flujo"""
@@ -533,6 +510,28 @@ class ProjectDetailView(QWidget):
         if success:
             self.refresh_flows()
 
+    def _on_import_history(self, flow_id=None):
+        """Importa un historial de ejecuciones para el proyecto o para un flujo"""
+        if not self.current_project_id:
+            return
+        
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Importar historial de ejecuciones",
+            "",
+            "Historial de ejecuciones (*.csv *.json *.jsonl *.ndjson)"
+        )
+        if not file_path:
+            return
+        
+        result = self.flow_controller.import_run_history(self.current_project_id, file_path, flow_id)
+        if result:
+            message = f"Se importaron {result['imported']} ejecuciones."
+            if result['skipped']:
+                message += f" Se omitieron {result['skipped']} que no corresponden a flujos del proyecto."
+            QMessageBox.information(self, "Historial importado", message)
+            self.refresh_flows()
+    
     def _on_generate_diagram(self):
         """Manejador para generar el diagrama de flujo"""
         if not self.current_project_id:
@@ -542,10 +541,6 @@ class ProjectDetailView(QWidget):
         try:
             from app.utils.diagram_generator import generate_project_diagram
             diagram_path = generate_project_diagram(self.current_project_id)
-            QMessageBox.information(
-                self,
-                "Diagrama Generado",
-                f"El diagrama se ha generado correctamente y se ha guardado en:\n{diagram_path}"
-            )
+            self.diagram_requested.emit(diagram_path, self.current_project_name)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"No se pudo generar el diagrama: {str(e)}")
\ No newline at end of file
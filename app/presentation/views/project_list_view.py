@@ -1,21 +1,44 @@
+import threading
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
     QLabel, QFrame, QScrollArea, QGridLayout, QSizePolicy,
-    QSpacerItem, QGraphicsDropShadowEffect
+    QSpacerItem, QFileDialog, QMessageBox,
+    QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QTimer
 from PyQt6.QtGui import QColor, QIcon, QFont
 
+from app.domain.entities.change import ChangeOperation
+from app.config import UI
+from app.presentation import theme
+from app.presentation.widget_pool import WidgetPool
+from app.infrastructure.database.project_list_snapshot import ProjectListSnapshot
+from app.infrastructure.repositories.sqlite_change_log_repository import SQLiteChangeLogRepository
 from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
 from app.application.services.project_service import ProjectService
 from app.application.use_cases.project_use_cases import ProjectUseCases
+from app.utils.startup_timing import startup
+from app.utils.tracing import traced
+
+# Columnas de la grilla de tarjetas
+MAX_COLUMNS = 3
+
+# Tarjetas que se crean por vuelta del bucle de eventos en la carga asíncrona
+CARD_BATCH = 24
+
+# Tarjetas quitadas de la grilla que se guardan para volver a usarlas
+CARD_POOL_LIMIT = 1000
 
 class ProjectCard(QFrame):
-    """Tarjeta para mostrar un proyecto"""
+    """Tarjeta para mostrar un proyecto.
+    
+    La tarjeta se puede volver a usar para otro proyecto con bind() (ver
+    WidgetPool en ProjectListView).
+    """
     
     clicked = pyqtSignal(int, str)  # ID del proyecto, nombre del proyecto
     
-    def __init__(self, project_data):
+    def __init__(self, project_data, shadow=True):
         super().__init__()
         self.project_data = project_data
         self.setObjectName("projectCard")
@@ -23,20 +46,14 @@ class ProjectCard(QFrame):
         self.setFrameShadow(QFrame.Shadow.Raised)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         
-        # Aplicar efecto de sombra
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        shadow.setOffset(0, 3)
-        self.setGraphicsEffect(shadow)
+        # Sombra (sin ella, la hoja de estilos marca el borde inferior)
+        theme.set_shadow(self, shadow)
+        self.setProperty("flat", not shadow)
         
         # Establecer tamaño mínimo para la tarjeta
         self.setMinimumSize(300, 200)
         self.setMaximumSize(400, 250)
         
-        # Hacer que la tarjeta sea clicable
-        self.mousePressEvent = self._on_click
-        
         # Layout principal
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -47,10 +64,10 @@ class ProjectCard(QFrame):
         top_container.setSpacing(10)
         
         # Nombre del proyecto
-        name_label = QLabel(self.project_data['name'])
-        name_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #333333;")
-        name_label.setWordWrap(True)
-        top_container.addWidget(name_label)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("projectName")
+        self.name_label.setWordWrap(True)
+        top_container.addWidget(self.name_label)
         
         # Indicador de estado (punto verde o rojo)
         status_indicator = QLabel()
@@ -58,17 +75,15 @@ class ProjectCard(QFrame):
         status_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         # Crear un widget circular para el indicador
-        indicator_widget = QWidget(status_indicator)
-        indicator_widget.setFixedSize(10, 10)  # Tamaño del punto
-        indicator_widget.setStyleSheet("""
-            background-color: %s;
-            border-radius: 5px;
-        """ % ('#4caf50' if self.project_data['is_active'] else '#f44336'))
+        self.status_dot = QWidget(status_indicator)
+        self.status_dot.setObjectName("statusDot")
+        self.status_dot.setProperty("active", bool(project_data['is_active']))
+        self.status_dot.setFixedSize(10, 10)  # Tamaño del punto
 
         # Centrar el indicador en su contenedor
         indicator_layout = QHBoxLayout(status_indicator)
         indicator_layout.setContentsMargins(3, 3, 3, 3)
-        indicator_layout.addWidget(indicator_widget)
+        indicator_layout.addWidget(self.status_dot)
 
         top_container.addWidget(status_indicator)
         
@@ -78,7 +93,7 @@ class ProjectCard(QFrame):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #e0e0e0;")
+        line.setProperty("role", "separator")
         main_layout.addWidget(line)
         
         # Contenedor de información
@@ -88,12 +103,12 @@ class ProjectCard(QFrame):
         # Estado del proyecto
         status_layout = QHBoxLayout()
         status_label = QLabel("Estado:")
-        status_label.setStyleSheet("font-weight: bold; color: #555555;")
+        status_label.setProperty("role", "fieldName")
         status_layout.addWidget(status_label)
 
-        status_text = QLabel("Activo" if self.project_data['is_active'] else "Inactivo")
-        status_text.setStyleSheet("font-size: 14px; color: #555555;")
-        status_layout.addWidget(status_text)
+        self.status_text = QLabel()
+        self.status_text.setProperty("role", "fieldValue")
+        status_layout.addWidget(self.status_text)
 
         status_layout.addStretch()
         info_container.addLayout(status_layout)
@@ -101,20 +116,35 @@ class ProjectCard(QFrame):
         # Fecha de creación
         date_layout = QHBoxLayout()
         date_label = QLabel("Creado:")
-        date_label.setStyleSheet("font-weight: bold; color: #555555;")
+        date_label.setProperty("role", "fieldName")
         date_layout.addWidget(date_label)
 
-        date_value = QLabel(self.project_data['created_at'])
-        date_value.setStyleSheet("font-size: 14px; color: #555555;")
-        date_layout.addWidget(date_value)
+        self.date_value = QLabel()
+        self.date_value.setProperty("role", "fieldValue")
+        date_layout.addWidget(self.date_value)
 
         date_layout.addStretch()
         info_container.addLayout(date_layout)
         
         main_layout.addLayout(info_container)
         main_layout.addStretch()
+        
+        self.bind(project_data)
     
-    def _on_click(self, event):
+    def bind(self, project_data):
+        """Muestra en la tarjeta los datos de un proyecto"""
+        self.project_data = project_data
+        self.name_label.setText(project_data['name'])
+        self.status_text.setText("Activo" if project_data['is_active'] else "Inactivo")
+        self.date_value.setText(project_data['created_at'])
+        theme.set_state(self.status_dot, "active", bool(project_data['is_active']))
+    
+    def set_shadow(self, enabled):
+        """Pone o quita la sombra de la tarjeta"""
+        theme.set_shadow(self, enabled)
+        theme.set_state(self, "flat", not enabled)
+    
+    def mousePressEvent(self, event):
         """Manejador del evento de clic"""
         self.clicked.emit(self.project_data['id'], self.project_data['name'])
 
@@ -124,6 +154,7 @@ class ProjectListView(QWidget):
     
     project_selected = pyqtSignal(int, str)  # ID del proyecto, nombre del proyecto
     add_project_requested = pyqtSignal()
+    _projects_loaded = pyqtSignal(int, object)  # número de carga, proyectos (o la excepción)
     
     def __init__(self):
         super().__init__()
@@ -132,6 +163,27 @@ class ProjectListView(QWidget):
         self.project_repository = SQLiteProjectRepository()
         self.project_service = ProjectService(self.project_repository)
         self.project_use_cases = ProjectUseCases(self.project_service, self.project_repository)
+        # El importador (lector de paquetes, servicios de inventario y dependencias)
+        # se crea al usarlo por primera vez
+        self._import_controller = None
+        
+        # Copia del último listado mostrado y versión de los datos (seq del registro de cambios)
+        self.snapshot = ProjectListSnapshot()
+        self.change_log_repository = SQLiteChangeLogRepository()
+        
+        # Proyectos mostrados y sus tarjetas por ID de proyecto; las tarjetas
+        # que se quitan se guardan para mostrar otros proyectos al recargar
+        self._projects = []
+        self._cards = {}
+        self._card_pool = WidgetPool(CARD_POOL_LIMIT)
+        # Con muchos proyectos las tarjetas van sin sombra (UI['render_quality'])
+        self._card_shadows = True
+        
+        # Cada carga lleva un número: una carga asíncrona que termina después de
+        # otra más reciente se descarta
+        self._load_generation = 0
+        self._projects_loaded.connect(self._on_projects_loaded)
+        self._after_paint = None
         
         # Layout principal
         self.layout = QVBoxLayout(self)
@@ -146,12 +198,11 @@ class ProjectListView(QWidget):
         title_container.setSpacing(5)
         
         title = QLabel("Proyectos")
-        title.setObjectName("titleLabel")
-        title.setStyleSheet("font-size: 24px; font-weight: bold; color: #333333;")
+        title.setProperty("role", "heading")
         title_container.addWidget(title)
         
         subtitle = QLabel("Gestione sus proyectos de automatización")
-        subtitle.setStyleSheet("font-size: 14px; color: #666666;")
+        subtitle.setProperty("role", "subtitle")
         title_container.addWidget(subtitle)
         
         header_layout.addLayout(title_container)
@@ -161,25 +212,16 @@ class ProjectListView(QWidget):
         # Botón de agregar mejorado
         add_button = QPushButton("Agregar Proyecto")
         add_button.setObjectName("secondaryButton")
+        add_button.setProperty("large", True)
         add_button.setMinimumSize(150, 40)
-        add_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9c27b0;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #8e24aa;
-            }
-            QPushButton:pressed {
-                background-color: #7b1fa2;
-            }
-        """)
         add_button.clicked.connect(self.add_project_requested.emit)
+        
+        # Botón de importar paquetes exportados de Power Automate
+        import_button = QPushButton("Importar Paquetes")
+        import_button.setObjectName("primaryButton")
+        import_button.setMinimumSize(150, 40)
+        import_button.clicked.connect(self._on_import_packages)
+        header_layout.addWidget(import_button)
         header_layout.addWidget(add_button)
         
         self.layout.addLayout(header_layout)
@@ -188,59 +230,152 @@ class ProjectListView(QWidget):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet("background-color: #e0e0e0;")
+        separator.setProperty("role", "separator")
         self.layout.addWidget(separator)
         
         # Área desplazable para las tarjetas de proyectos
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                background-color: #f5f5f5;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background-color: #f0f0f0;
-                width: 12px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background-color: #cccccc;
-                min-height: 30px;
-                border-radius: 6px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background-color: #bbbbbb;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        self.scroll_area.setObjectName("projectsScroll")
         
         self.projects_container = QWidget()
-        self.projects_container.setStyleSheet("background-color: #f5f5f5;")
+        self.projects_container.setObjectName("projectsContainer")
         self.projects_layout = QGridLayout(self.projects_container)
         self.projects_layout.setContentsMargins(10, 10, 10, 10)
         self.projects_layout.setSpacing(20)
         
-        scroll_area.setWidget(self.projects_container)
-        self.layout.addWidget(scroll_area)
+        self.scroll_area.setWidget(self.projects_container)
+        self.layout.addWidget(self.scroll_area)
         
-        # Cargar proyectos
-        self.refresh_projects()
+        # Cargar proyectos sin demorar la primera pintura de la ventana
+        self.load_projects_async()
+    
+    @property
+    def import_controller(self):
+        if self._import_controller is None:
+            from app.presentation.controllers.import_controller import ImportController
+            self._import_controller = ImportController(self)
+        return self._import_controller
+    
+    def load_projects_async(self):
+        """Muestra los proyectos sin esperar a la consulta.
+        
+        Si hay una copia del último listado se pinta enseguida y, si la base
+        cambió desde que se guardó, se concilia con el listado que se lee en
+        un hilo aparte. Sin copia se muestra un aviso mientras se lee.
+        """
+        self._load_generation += 1
+        self._clear_cards()
+        snapshot = self.snapshot.load() if UI['warm_start'] else None
+        if snapshot is not None:
+            self._start_cards(self._load_generation, snapshot.projects)
+            if snapshot.change_seq == self.change_log_repository.get_cursor():
+                return
+        else:
+            loading_label = QLabel("Cargando proyectos...")
+            loading_label.setProperty("role", "placeholder")
+            loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.projects_layout.addWidget(loading_label, 0, 0, 1, 3)
+        threading.Thread(
+            target=self._load_projects, args=(self._load_generation,), name='project-list-load', daemon=True
+        ).start()
+    
+    def _load_projects(self, generation):
+        # Hilo de carga: la base abre una conexión propia para este hilo.
+        # El seq se lee antes que los proyectos: la copia nunca queda marcada
+        # como más nueva que sus datos
+        try:
+            change_seq = self.change_log_repository.get_cursor()
+            projects = self.project_use_cases.list_projects()
+            if UI['warm_start']:
+                self.snapshot.save(projects, change_seq)
+        except Exception as e:
+            projects = e
+        self._projects_loaded.emit(generation, projects)
+    
+    def _on_projects_loaded(self, generation, projects):
+        if generation != self._load_generation:
+            return
+        if isinstance(projects, Exception):
+            QMessageBox.critical(self, "Error", f"No se pudieron cargar los proyectos: {projects}")
+            projects = []
+        
+        # Conciliación con lo que ya se muestra (la copia guardada): si están los
+        # mismos proyectos en el mismo orden solo se actualizan las tarjetas que
+        # cambiaron; las que faltan crear se crearán con los datos nuevos
+        if projects and [project['id'] for project in projects] == [project['id'] for project in self._projects]:
+            for index, (old, new) in enumerate(zip(self._projects, projects)):
+                if old != new:
+                    self._projects[index] = new
+                    if new['id'] in self._cards:
+                        self._replace_card(new['id'], new)
+            return
+        
+        self._load_generation += 1
+        self._clear_cards()
+        self._start_cards(self._load_generation, projects)
+    
+    def _start_cards(self, generation, projects):
+        """Muestra los proyectos: el primer lote de tarjetas ahora y el resto después de pintarlo"""
+        self._projects = list(projects)
+        self._card_shadows = theme.use_shadows(len(projects), UI['shadow_max_cards'])
+        if not projects:
+            self._show_projects(projects)
+            startup.mark('projects_loaded')
+            return
+        self._add_card_batch(generation, 0)
+    
+    def _add_card_batch(self, generation, start):
+        """Crea un lote de tarjetas de self._projects y deja el resto para después de pintar.
+        
+        Así la ventana se pinta con los primeros proyectos antes de crear los demás.
+        """
+        if generation != self._load_generation:
+            return
+        # El primer lote llena la parte visible; el resto se crea de una vez (cada
+        # vuelta intermedia repinta la grilla completa)
+        projects = self._projects
+        end = min(start + CARD_BATCH, len(projects)) if start == 0 else len(projects)
+        for index in range(start, end):
+            self._add_card(projects[index], index // MAX_COLUMNS, index % MAX_COLUMNS)
+        startup.mark('first_cards')
+        if end < len(projects):
+            # El resto, después de pintar el primer lote (un temporizador de 0 ms
+            # correría antes que la pintura)
+            self._after_paint = lambda: self._add_card_batch(generation, end)
+            self.update()
+        else:
+            startup.mark('projects_loaded')
     
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._after_paint is not None:
+            callback, self._after_paint = self._after_paint, None
+            QTimer.singleShot(0, callback)
+    
+    @traced(category='qt')
     def refresh_projects(self):
         """Actualiza la lista de proyectos"""
-        # Limpiar proyectos existentes
+        # Una carga asíncrona en curso quedaría desactualizada
+        self._load_generation += 1
+        self._clear_cards()
+        self._projects = self.project_use_cases.list_projects()
+        self._card_shadows = theme.use_shadows(len(self._projects), UI['shadow_max_cards'])
+        self._show_projects(self._projects)
+    
+    def _clear_cards(self):
+        """Quita las tarjetas (se guardan para volver a usarlas) y los mensajes de la grilla"""
+        self._cards = {}
         while self.projects_layout.count():
-            item = self.projects_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Obtener proyectos
-        projects = self.project_use_cases.list_projects()
-        
+            widget = self.projects_layout.takeAt(0).widget()
+            if isinstance(widget, ProjectCard):
+                self._card_pool.release(widget)
+            elif widget:
+                widget.deleteLater()
+    
+    def _show_projects(self, projects):
+        """Crea las tarjetas de los proyectos"""
         # Si no hay proyectos, mostrar mensaje
         if not projects:
             no_projects_container = QWidget()
@@ -248,17 +383,17 @@ class ProjectListView(QWidget):
             no_projects_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
             
             no_projects_icon = QLabel("📁")
-            no_projects_icon.setStyleSheet("font-size: 48px; color: #999999;")
+            no_projects_icon.setProperty("role", "emptyIcon")
             no_projects_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
             no_projects_layout.addWidget(no_projects_icon)
             
             no_projects_label = QLabel("No hay proyectos disponibles")
-            no_projects_label.setStyleSheet("font-size: 18px; font-weight: bold; color: #666666;")
+            no_projects_label.setProperty("role", "emptyTitle")
             no_projects_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             no_projects_layout.addWidget(no_projects_label)
             
             no_projects_sublabel = QLabel("Haga clic en 'Agregar Proyecto' para comenzar")
-            no_projects_sublabel.setStyleSheet("font-size: 14px; color: #999999;")
+            no_projects_sublabel.setProperty("role", "placeholder")
             no_projects_sublabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
             no_projects_layout.addWidget(no_projects_sublabel)
             
@@ -266,16 +401,94 @@ class ProjectListView(QWidget):
             return
         
         # Crear tarjetas de proyectos (3 columnas)
-        row, col = 0, 0
-        max_cols = 3
-        
-        for project in projects:
-            card = ProjectCard(project)
+        for index, project in enumerate(projects):
+            self._add_card(project, index // MAX_COLUMNS, index % MAX_COLUMNS)
+    
+    @traced(category='qt')
+    def _add_card(self, project, row, col):
+        card = self._card_pool.acquire()
+        if card is None:
+            card = ProjectCard(project, self._card_shadows)
             card.clicked.connect(self.project_selected.emit)
-            
-            self.projects_layout.addWidget(card, row, col)
-            
-            col += 1
-            if col >= max_cols:
-                col = 0
-                row += 1
\ No newline at end of file
+        else:
+            card.bind(project)
+            card.set_shadow(self._card_shadows)
+        self.projects_layout.addWidget(card, row, col)
+        self._cards[project['id']] = card
+    
+    def apply_changes(self, batch):
+        """Aplica los cambios de proyectos hechos fuera de esta vista (p. ej. por otra instancia).
+        
+        Solo se actualizan las tarjetas modificadas; altas y bajas cambian la
+        posición de las demás tarjetas, así que recargan la lista.
+        """
+        if batch.full_refresh:
+            self.refresh_projects()
+            return
+        changes = batch.projects()
+        if not changes:
+            return
+        if any(operation is not ChangeOperation.UPDATE or project_id not in self._cards
+               for project_id, operation in changes.items()):
+            self.refresh_projects()
+            return
+        for project_id in changes:
+            self._replace_card(project_id, self.project_use_cases.get_project_details(project_id))
+    
+    def _replace_card(self, project_id, project):
+        """Muestra los datos nuevos en la tarjeta de un proyecto (la quita si project es None)"""
+        if project:
+            self._cards[project_id].bind(project)
+            self._projects = [project if item['id'] == project_id else item for item in self._projects]
+            return
+        if len(self._cards) < len(self._projects) or len(self._projects) == 1:
+            # Quedan tarjetas por crear (o la lista queda vacía y lleva su mensaje): se recarga
+            self.refresh_projects()
+            return
+        index = [item['id'] for item in self._projects].index(project_id)
+        del self._projects[index]
+        card = self._cards.pop(project_id)
+        self.projects_layout.removeWidget(card)
+        self._card_pool.release(card)
+        # Las tarjetas siguientes retroceden una posición para no dejar un hueco en la grilla
+        following = [self._cards[item['id']] for item in self._projects[index:]]
+        for card in following:
+            self.projects_layout.removeWidget(card)
+        for position, card in enumerate(following, index):
+            self.projects_layout.addWidget(card, position // MAX_COLUMNS, position % MAX_COLUMNS)
+    
+    def update_project(self, project_id):
+        """Actualiza la tarjeta de un proyecto modificado desde otra vista"""
+        if project_id not in self._cards:
+            self.refresh_projects()
+            return
+        self._replace_card(project_id, self.project_use_cases.get_project_details(project_id))
+    
+    def _on_import_packages(self):
+        """Importa proyectos y flujos desde paquetes exportados (.zip)"""
+        paths, _ = QFileDialog.getOpenFileNames(
+            self,
+            "Importar paquetes de Power Automate",
+            "",
+            "Paquetes exportados (*.zip)"
+        )
+        if not paths:
+            return
+        
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            result = self.import_controller.import_packages(paths)
+        finally:
+            QApplication.restoreOverrideCursor()
+        if not result:
+            return
+        
+        message = (
+            f"Proyectos: {result['projects']}\n"
+            f"Flujos nuevos: {result['flows_created']}\n"
+            f"Flujos actualizados: {result['flows_updated']}"
+        )
+        if result['errors']:
+            message += "\n\nArchivos con errores:\n" + "\n".join(result['errors'][:10])
+        QMessageBox.information(self, "Importación finalizada", message)
+        self.refresh_projects()
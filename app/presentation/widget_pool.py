@@ -0,0 +1,45 @@
+# app/presentation/widget_pool.py
+from typing import Generic, List, Optional, TypeVar
+from PyQt6.QtWidgets import QWidget
+
+W = TypeVar('W', bound=QWidget)
+
+
+class WidgetPool(Generic[W]):
+    """Widgets que dejaron de mostrarse, para volver a usarlos con otros datos.
+
+    Recargar una lista quitando sus widgets (deleteLater) y creando otros
+    nuevos hace que Qt destruya y vuelva a construir, pulir y ubicar miles de
+    objetos; con el pool los widgets se ocultan al quitarlos y se vuelven a
+    mostrar con los datos nuevos (p. ej. ProjectCard.bind). Los widgets
+    guardados conservan su padre; pasado el límite se destruyen.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._free: List[W] = []
+
+    def acquire(self) -> Optional[W]:
+        """Devuelve un widget guardado (visible de nuevo) o None si no hay"""
+        if not self._free:
+            return None
+        widget = self._free.pop()
+        widget.show()
+        return widget
+
+    def release(self, widget: W) -> None:
+        """Guarda un widget que ya se quitó de su layout"""
+        widget.hide()
+        if len(self._free) < self.limit:
+            self._free.append(widget)
+        else:
+            widget.deleteLater()
+
+    def clear(self) -> None:
+        """Destruye los widgets guardados"""
+        for widget in self._free:
+            widget.deleteLater()
+        self._free = []
+
+    def __len__(self) -> int:
+        return len(self._free)
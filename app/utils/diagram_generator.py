@@ -1,9 +1,26 @@
 from graphviz import Digraph
+from app.domain.entities.flow_dependency import DependencyKind, topological_order
 from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
 from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
 
-def generate_project_diagram(project_id: int) -> str:
+# Etiqueta y estilo de línea de cada tipo de dependencia entre flujos
+DEPENDENCY_STYLES = {
+    DependencyKind.CHILD_FLOW: ("flujo secundario", "solid"),
+    DependencyKind.HTTP: ("HTTP", "dashed"),
+    DependencyKind.SHARED_DATA: ("datos compartidos", "dotted"),
+}
+
+def generate_project_diagram(project_id: int, include_dependencies: bool = True) -> str:
     """Genera un diagrama de flujo para un proyecto y lo guarda como archivo SVG."""
+    dot = build_project_diagram(project_id, include_dependencies)
+
+    # Guardar el diagrama (render agrega la extensión y devuelve la ruta final)
+    output_path = dot.render(f"diagrams/project_{project_id}_diagram", cleanup=True)
+    return output_path
+
+def build_project_diagram(project_id: int, include_dependencies: bool = True) -> Digraph:
+    """Construye el diagrama de un proyecto: sus flujos y, opcionalmente, las dependencias entre flujos."""
     project_repo = SQLiteProjectRepository()
     flow_repo = SQLiteFlowRepository()
 
@@ -70,7 +87,60 @@ def generate_project_diagram(project_id: int) -> str:
             penwidth="2"
         )
 
-    # Guardar el diagrama
-    output_path = f"diagrams/project_{project_id}_diagram.svg"
-    dot.render(output_path, cleanup=True)
-    return output_path
\ No newline at end of file
+    if include_dependencies:
+        _add_dependency_edges(dot, project_repo, flow_repo, [flow.id for flow in flows])
+
+    return dot
+
+def _add_dependency_edges(dot: Digraph, project_repo: SQLiteProjectRepository,
+                          flow_repo: SQLiteFlowRepository, flow_ids: list) -> None:
+    """Agrega las dependencias que entran o salen de los flujos del proyecto.
+
+    Los flujos de otros proyectos se dibujan como nodos punteados y las
+    dependencias que forman un ciclo, en rojo.
+    """
+    dependencies = SQLiteFlowDependencyRepository().get_for_flows(flow_ids)
+    if not dependencies:
+        return
+
+    own = set(flow_ids)
+    project_names = {}
+    for external_id in sorted({
+        flow_id for dependency in dependencies
+        for flow_id in (dependency.source_flow_id, dependency.target_flow_id)
+    } - own):
+        external = flow_repo.get_by_id(external_id)
+        if not external:
+            continue
+        if external.project_id not in project_names:
+            project = project_repo.get_by_id(external.project_id)
+            project_names[external.project_id] = project.name if project else ""
+        dot.node(
+            f"flow_{external.id}",
+            f"{external.name}\\n({project_names[external.project_id]})",
+            shape="ellipse",
+            style="dashed",
+            color="#9E9E9E",
+            fontcolor="#616161",
+            fontsize="11"
+        )
+
+    cycles = topological_order(
+        (dependency.source_flow_id, dependency.target_flow_id) for dependency in dependencies
+    ).cycles
+    cycle_of = {flow_id: index for index, cycle in enumerate(cycles) for flow_id in cycle}
+
+    for dependency in dependencies:
+        label, line_style = DEPENDENCY_STYLES[dependency.kind]
+        source_cycle = cycle_of.get(dependency.source_flow_id)
+        in_cycle = source_cycle is not None and source_cycle == cycle_of.get(dependency.target_flow_id)
+        dot.edge(
+            f"flow_{dependency.source_flow_id}",
+            f"flow_{dependency.target_flow_id}",
+            label=label,
+            style=line_style,
+            color="#F44336" if in_cycle else "#00897B",
+            fontcolor="#4B4453",
+            fontsize="9",
+            penwidth="1.5"
+        )
\ No newline at end of file
@@ -0,0 +1,213 @@
+# app/utils/event_loop_watchdog.py
+"""Detector de bloqueos del bucle de eventos de la interfaz.
+
+Un temporizador del hilo de la interfaz llama a beat() cada interval_ms; la
+diferencia entre el intervalo esperado y el real es la latencia del bucle de
+eventos (cuánto esperó un evento para ser atendido), que se acumula en un
+histograma. Un hilo monitor revisa cada check_ms cuánto hace del último
+latido: si supera stall_ms, el bucle está bloqueado y se captura la pila de
+Python del hilo de la interfaz, de la que se toma la acción del controlador
+que se estaba ejecutando. Cuando llega el siguiente latido se cierra el
+bloqueo con su duración total.
+
+No depende de Qt: la parte de Qt (el temporizador) está en
+presentation/controllers/responsiveness_controller.py.
+"""
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional
+from app.config import RESPONSIVENESS
+from app.utils.tracing import LatencyHistogram
+
+# Módulos cuyas funciones se consideran "acciones" al buscar qué se estaba ejecutando
+_ACTION_MODULES = ('app.presentation.controllers.', 'app.presentation.views.')
+
+
+class Stall(NamedTuple):
+    """Bloqueo del bucle de eventos"""
+    started_at: datetime
+    duration_ms: float
+    action: str           # función del controlador (o de la vista) en curso; '' si no se capturó
+    stack: List[str]      # pila del hilo de la interfaz al detectar el bloqueo
+
+
+class ActionStats:
+    """Acumulado de bloqueos de una acción"""
+
+    __slots__ = ('action', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self, action: str):
+        self.action = action
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{frame.f_globals.get('__name__', '?')}.{getattr(code, 'co_qualname', code.co_name)}"
+
+
+def find_action(frame) -> str:
+    """Acción más externa de un controlador en la pila (o de una vista si no hay controlador)"""
+    controller = view = ''
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith(_ACTION_MODULES[0]):
+            controller = _frame_label(frame)
+        elif module.startswith(_ACTION_MODULES[1]):
+            view = _frame_label(frame)
+        frame = frame.f_back
+    return controller or view
+
+
+class EventLoopWatchdog:
+    """Mide la latencia del bucle de eventos y registra los bloqueos"""
+
+    def __init__(self, interval_ms: float = RESPONSIVENESS['interval_ms'],
+                 stall_ms: float = RESPONSIVENESS['stall_ms'], check_ms: float = RESPONSIVENESS['check_ms'],
+                 recent: int = RESPONSIVENESS['recent'], stack_depth: int = RESPONSIVENESS['stack_depth']):
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.check_ms = check_ms
+        self.stack_depth = stack_depth
+        self.latency = LatencyHistogram()
+        self.stalls: deque = deque(maxlen=recent)
+        self.actions: Dict[str, ActionStats] = {}
+        self.stall_count = 0
+        self.stall_total_ms = 0.0
+        self._lock = threading.Lock()
+        self._last_beat: Optional[float] = None
+        self._pending = None          # (acción, pila) capturadas por el monitor durante el bloqueo actual
+        self._gui_thread: Optional[int] = None
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._monitor is not None and self._monitor.is_alive()
+
+    def start(self, gui_thread: Optional[int] = None) -> None:
+        """Empieza a vigilar; se llama desde el hilo de la interfaz (o se indica su ident)"""
+        if self.running:
+            return
+        self._gui_thread = gui_thread or threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._monitor = threading.Thread(target=self._watch, name='event-loop-watchdog', daemon=True)
+        self._monitor.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+        self._last_beat = None
+
+    def beat(self) -> None:
+        """Latido del temporizador del hilo de la interfaz"""
+        now = time.perf_counter()
+        with self._lock:
+            last, self._last_beat = self._last_beat, now
+            pending, self._pending = self._pending, None
+            if last is None:
+                return
+            gap_ms = (now - last) * 1000
+            self.latency.add(max(0.0, gap_ms - self.interval_ms))
+            if gap_ms < self.stall_ms and pending is None:
+                return
+            # El monitor puede no haber alcanzado a capturar la pila (por ejemplo,
+            # si el hilo de la interfaz no soltó el GIL); el bloqueo se cuenta igual
+            action, stack = pending or ('', [])
+            self._add_stall(Stall(datetime.now() - timedelta(milliseconds=gap_ms), round(gap_ms, 1),
+                                  action, stack))
+
+    def _add_stall(self, stall: Stall) -> None:
+        self.stalls.append(stall)
+        self.stall_count += 1
+        self.stall_total_ms += stall.duration_ms
+        stats = self.actions.get(stall.action)
+        if stats is None:
+            stats = self.actions[stall.action] = ActionStats(stall.action)
+        stats.count += 1
+        stats.total_ms += stall.duration_ms
+        stats.max_ms = max(stats.max_ms, stall.duration_ms)
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.check_ms / 1000):
+            with self._lock:
+                last = self._last_beat
+                if last is None or self._pending is not None:
+                    continue
+                if (time.perf_counter() - last) * 1000 < self.stall_ms:
+                    continue
+            frame = sys._current_frames().get(self._gui_thread)
+            if frame is None:
+                continue
+            action = find_action(frame)
+            stack = [line.rstrip('\n') for line in traceback.format_stack(frame, limit=self.stack_depth)]
+            del frame
+            with self._lock:
+                # Si el latido llegó mientras se capturaba, el bloqueo ya terminó
+                if self._last_beat == last:
+                    self._pending = (action, stack)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.latency = LatencyHistogram()
+            self.stalls.clear()
+            self.actions = {}
+            self.stall_count = 0
+            self.stall_total_ms = 0.0
+
+    def top_actions(self, limit: int = 50) -> List[ActionStats]:
+        """Acciones con más tiempo bloqueado"""
+        with self._lock:
+            stats = list(self.actions.values())
+        return sorted(stats, key=lambda item: item.total_ms, reverse=True)[:limit]
+
+    def recent_stalls(self) -> List[Stall]:
+        """Bloqueos recientes, del más nuevo al más antiguo"""
+        with self._lock:
+            return list(reversed(self.stalls))
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'running': self.running,
+                'stall_ms': self.stall_ms,
+                'stalls': self.stall_count,
+                'stalled_ms': round(self.stall_total_ms, 1),
+                'latency': self.latency.summary(),
+            }
+
+    def export(self, path: str) -> None:
+        """Escribe el resumen, las acciones y los bloqueos recientes como JSON"""
+        data = {
+            'exported_at': datetime.now().isoformat(timespec='seconds'),
+            **self.summary(),
+            'actions': [
+                {'action': stats.action, 'count': stats.count, 'total_ms': round(stats.total_ms, 1),
+                 'max_ms': round(stats.max_ms, 1)}
+                for stats in self.top_actions()
+            ],
+            'recent_stalls': [
+                {'started_at': stall.started_at.isoformat(timespec='milliseconds'),
+                 'duration_ms': stall.duration_ms, 'action': stall.action, 'stack': stall.stack}
+                for stall in self.recent_stalls()
+            ],
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(data, output, indent=2, ensure_ascii=False)
+
+
+watchdog = EventLoopWatchdog()
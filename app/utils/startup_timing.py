@@ -0,0 +1,84 @@
+# app/utils/startup_timing.py
+"""Tiempos del arranque de la aplicación por etapa.
+
+run.py importa este módulo antes que nada, así que el origen es el comienzo
+de las importaciones de la aplicación (el arranque del intérprete queda
+fuera). Cada etapa se marca al terminar con startup.mark(nombre); el informe
+muestra la duración de cada etapa y el tiempo acumulado. El arranque se da
+por completo cuando están marcadas todas las etapas de REQUIRED: la primera
+pintura de la ventana y los proyectos cargados, que ocurren en cualquier
+orden porque la carga es asíncrona.
+
+Con PA_STARTUP_REPORT=1 el informe se imprime por la salida de errores.
+"""
+import time
+
+_ORIGIN = time.perf_counter()
+
+import json
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from app.config import STARTUP
+
+# Etapas que cierran el arranque
+REQUIRED = ('first_paint', 'projects_loaded')
+
+
+class StartupTimer:
+    """Marcas de tiempo de las etapas del arranque"""
+
+    def __init__(self, origin: float):
+        self.origin = origin
+        self.marks: Dict[str, float] = {}
+        self._callbacks: List[Callable[[Dict[str, Any]], None]] = []
+        self.completed = False
+
+    def mark(self, stage: str) -> None:
+        """Marca el fin de una etapa (solo la primera vez)"""
+        if stage in self.marks:
+            return
+        self.marks[stage] = time.perf_counter()
+        if not self.completed and all(name in self.marks for name in REQUIRED):
+            self.completed = True
+            report = self.report()
+            for callback in self._callbacks:
+                callback(report)
+
+    def on_complete(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """Llama a callback con el informe cuando termine el arranque"""
+        if self.completed:
+            callback(self.report())
+        else:
+            self._callbacks.append(callback)
+
+    def report(self) -> Dict[str, Any]:
+        """Duración de cada etapa y tiempo acumulado (ms), en orden"""
+        stages = []
+        previous = self.origin
+        for stage, at in sorted(self.marks.items(), key=lambda item: item[1]):
+            stages.append({
+                'stage': stage,
+                'ms': round((at - previous) * 1000, 1),
+                'elapsed_ms': round((at - self.origin) * 1000, 1),
+            })
+            previous = at
+        return {'stages': stages, 'total_ms': stages[-1]['elapsed_ms'] if stages else 0.0}
+
+    def format_report(self, report: Optional[Dict[str, Any]] = None) -> str:
+        report = report or self.report()
+        lines = [f"{'etapa':<20} {'ms':>9} {'acumulado':>10}"]
+        for stage in report['stages']:
+            lines.append(f"{stage['stage']:<20} {stage['ms']:>9.1f} {stage['elapsed_ms']:>10.1f}")
+        return '\n'.join(lines)
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(startup.format_report(report), file=sys.stderr)
+    if STARTUP['report_file']:
+        with open(STARTUP['report_file'], 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+
+
+startup = StartupTimer(_ORIGIN)
+if STARTUP['report']:
+    startup.on_complete(_print_report)
@@ -0,0 +1,288 @@
+# app/utils/tracing.py
+"""Trazas livianas de las rutas calientes: controladores, casos de uso, repositorios y SQLite.
+
+Cada operación instrumentada abre un span; el span actual se propaga con
+contextvars, así que los spans anidados (controlador → caso de uso →
+repositorio → consulta) quedan enlazados con su padre, también cuando la
+escritura pasa al hilo escritor de la base.
+
+Desactivadas (lo normal), cada punto instrumentado cuesta una comprobación
+de un booleano. Se activan con la variable de entorno PA_TRACE=1 (ver
+config.TRACING): al salir se escribe la traza en formato Chrome trace-event
+(se abre en chrome://tracing o https://ui.perfetto.dev) y se imprime un
+resumen con el histograma de latencias de cada operación.
+
+    PA_TRACE=1 python run.py
+    PA_TRACE=1 PA_TRACE_FILE=/tmp/traza.json python cli.py flows --project 3
+"""
+import atexit
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from app.config import TRACING
+
+# Límites superiores (ms) de los intervalos del histograma; el último intervalo no tiene límite
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Span abierto en el contexto actual (su ID)
+_current_span: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar('current_span', default=None)
+
+
+class LatencyHistogram:
+    """Histograma de latencias con intervalos fijos (memoria constante)"""
+
+    __slots__ = ('counts', 'count', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pct: float) -> float:
+        """Límite superior del intervalo que contiene el percentil (acotado por el máximo)"""
+        if not self.count:
+            return 0.0
+        rank = self.count * pct / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return min(BUCKETS_MS[index], self.max_ms) if index < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        buckets = {}
+        for index, count in enumerate(self.counts):
+            if count:
+                label = f"<={BUCKETS_MS[index]}ms" if index < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}ms"
+                buckets[label] = count
+        return {
+            'count': self.count,
+            'total_ms': round(self.total_ms, 3),
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50), 3),
+            'p95_ms': round(self.percentile(95), 3),
+            'p99_ms': round(self.percentile(99), 3),
+            'max_ms': round(self.max_ms, 3),
+            'buckets': buckets,
+        }
+
+
+class Tracer:
+    """Guarda los spans terminados y los histogramas de latencia por operación.
+
+    Los eventos se guardan en un buffer circular de max_events (los más
+    antiguos se descartan); los histogramas cuentan todas las llamadas.
+    """
+
+    def __init__(self, max_events: int = TRACING['max_events']):
+        self.enabled = False
+        self.events: deque = deque(maxlen=max_events)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._threads: Dict[int, str] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.events.clear()
+            self.histograms = {}
+            self._threads = {}
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int,
+               span_id: int, parent_id: Optional[int], args: Optional[Dict[str, Any]]) -> None:
+        thread = threading.current_thread()
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.add((end_ns - start_ns) / 1e6)
+            self._threads[thread.ident] = thread.name
+            self.events.append((name, category, start_ns, end_ns - start_ns, thread.ident,
+                                span_id, parent_id, args))
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Eventos en formato Chrome trace-event (spans completos, tiempos en µs)"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        trace_events: List[Dict[str, Any]] = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': name}}
+            for tid, name in threads.items()
+        ]
+        for name, category, start_ns, duration_ns, tid, span_id, parent_id, args in events:
+            event_args = {'span_id': span_id, 'parent_id': parent_id}
+            if args:
+                event_args.update(args)
+            trace_events.append({
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start_ns - self._origin_ns) / 1000,
+                'dur': duration_ns / 1000,
+                'pid': 1,
+                'tid': tid,
+                'args': event_args,
+            })
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as output:
+            json.dump(self.chrome_trace(), output, ensure_ascii=False, default=str)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Resumen de latencias por operación, de mayor a menor tiempo total"""
+        with self._lock:
+            items = [(name, histogram.summary()) for name, histogram in self.histograms.items()]
+        return dict(sorted(items, key=lambda item: item[1]['total_ms'], reverse=True))
+
+    def format_summary(self) -> str:
+        lines = [f"{'operación':<50} {'llamadas':>9} {'total ms':>11} {'media':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'máx':>9}"]
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name[:50]:<50} {stats['count']:>9} {stats['total_ms']:>11.1f} {stats['mean_ms']:>9.3f} "
+                f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8} {stats['max_ms']:>9.3f}"
+            )
+        return '\n'.join(lines)
+
+
+class _Span:
+    __slots__ = ('tracer', 'name', 'category', 'args', 'span_id', 'parent_id', 'start_ns', '_token')
+
+    def __init__(self, tracer: Tracer, name: str, category: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.span_id = next(self.tracer._ids)
+        self.parent_id = _current_span.get()
+        self._token = _current_span.set(self.span_id)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        end_ns = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.args = {**(self.args or {}), 'error': exc_type.__name__}
+        self.tracer.record(self.name, self.category, self.start_ns, end_ns,
+                           self.span_id, self.parent_id, self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+tracer = Tracer()
+
+
+def span(name: str, category: str = 'app', **args):
+    """Context manager que mide un bloque (no hace nada si las trazas están desactivadas)"""
+    if not tracer.enabled:
+        return _NULL_SPAN
+    return _Span(tracer, name, category, args or None)
+
+
+def traced(name: Optional[str] = None, category: str = 'app',
+           describe: Optional[Callable[..., Dict[str, Any]]] = None):
+    """Decorador que mide cada llamada a la función.
+
+    name es por defecto el nombre calificado (Clase.método). describe recibe
+    los mismos argumentos que la función y devuelve los datos que se guardan
+    con el span; solo se llama con las trazas activadas.
+    """
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, label, category, describe(*args, **kwargs) if describe else None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def trace_methods(category: str):
+    """Decorador de clase: mide los métodos definidos en la clase.
+
+    Se omiten los métodos especiales y los generadores (su llamada solo crea
+    el iterador; el trabajo ocurre al recorrerlo).
+    """
+    def decorate(cls):
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith('__'):
+                continue
+            if isinstance(value, (staticmethod, classmethod)):
+                setattr(cls, attribute, type(value)(traced(category=category)(value.__func__)))
+            elif inspect.isfunction(value) and not inspect.isgeneratorfunction(value):
+                setattr(cls, attribute, traced(category=category)(value))
+        return cls
+    return decorate
+
+
+def propagate(func: Callable[..., Any], name: str, category: str = 'app') -> Callable[..., Any]:
+    """Envuelve func para ejecutarla en otro hilo como hija del span actual"""
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.run(_run_in_span, func, name, category, args, kwargs)
+    return run
+
+
+def _run_in_span(func, name, category, args, kwargs):
+    with _Span(tracer, name, category, None):
+        return func(*args, **kwargs)
+
+
+def enable_tracing(trace_file: Optional[str] = None) -> None:
+    """Activa las trazas; al salir escribe la traza en trace_file e imprime el resumen"""
+    tracer.enable()
+    if trace_file:
+        atexit.register(write_report, trace_file)
+
+
+def write_report(trace_file: str) -> None:
+    """Escribe la traza Chrome y muestra el resumen de latencias por la salida de errores"""
+    try:
+        tracer.export_chrome_trace(trace_file)
+    except OSError as e:
+        print(f"No se pudo escribir la traza: {e}", file=sys.stderr)
+        return
+    print(f"Traza escrita en {trace_file}", file=sys.stderr)
+    print(tracer.format_summary(), file=sys.stderr)
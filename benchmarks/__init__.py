@@ -0,0 +1,2 @@
+# Benchmarks de rendimiento. Se ejecutan como módulos desde la raíz del repositorio:
+#   python -m benchmarks.bench_flow_analytics
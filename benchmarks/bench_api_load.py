@@ -0,0 +1,188 @@
+# benchmarks/bench_api_load.py
+"""Prueba de carga del servidor HTTP/JSON: peticiones por segundo y latencias.
+
+Sin --url crea una base temporal con proyectos y flujos y levanta el
+servidor en otro proceso (python cli.py serve --port 0), para que el
+cliente no comparta el GIL con él. Con --url mide una instancia ya en
+marcha (solo lecturas).
+
+El cliente abre varias conexiones persistentes con asyncio y reparte las
+peticiones entre listados paginados de proyectos y flujos y detalles de
+flujos; una parte de ellas repite el ETag recibido (If-None-Match) como
+haría un cliente que revalida su caché.
+
+Uso:
+    python -m benchmarks.bench_api_load --requests 5000 --connections 16
+    python -m benchmarks.bench_api_load --url http://127.0.0.1:8765
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+from urllib.request import Request, urlopen
+
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from benchmarks.common import report, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, 'cli.py')
+
+
+def create_database(path: str, projects: int, flows: int) -> None:
+    Database._instance = None
+    db = Database(path)
+    DatabaseSchema.create_tables()
+    created_at = datetime(2024, 1, 1).isoformat()
+    db.execute_many(
+        "INSERT INTO projects (name, created_at, status) VALUES (?, ?, 'active')",
+        [(f"Proyecto {index}", created_at) for index in range(projects)]
+    )
+    db.execute_many(
+        """
+        INSERT INTO flows (project_id, name, recurrence, created_at, owner, status)
+        VALUES (?, ?, 'Diaria', ?, 'owner', 'active')
+        """,
+        [(index % projects + 1, f"Flujo {index}", created_at) for index in range(flows)]
+    )
+    db.disconnect()
+
+
+def start_server(db_path: str, workers: int):
+    """Levanta el servidor en otro proceso y devuelve (proceso, host, puerto)"""
+    process = subprocess.Popen(
+        [sys.executable, CLI, '--db', db_path, 'serve', '--port', '0', '--workers', str(workers)],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline()  # "Escuchando en http://host:puerto"
+    url = urlsplit(line.split()[-1])
+    return process, url.hostname, url.port
+
+
+async def _read_response(reader: asyncio.StreamReader):
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length') or 0)
+    body = await reader.readexactly(length) if length else b''
+    return status, headers, body
+
+
+async def run_load(host: str, port: int, paths, total: int, connections: int,
+                   revalidate: float, seed: int):
+    """Reparte 'total' peticiones entre conexiones persistentes; devuelve latencias y contadores"""
+    latencies, statuses, etags = [], {}, {}
+    remaining = [total]
+    rng = random.Random(seed)
+
+    async def worker():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                path = rng.choice(paths)
+                headers = f"Host: {host}\r\nAccept-Encoding: gzip\r\n"
+                if path in etags and rng.random() < revalidate:
+                    headers += f"If-None-Match: {etags[path]}\r\n"
+                started = time.perf_counter()
+                writer.write(f"GET {path} HTTP/1.1\r\n{headers}\r\n".encode('latin-1'))
+                status, response_headers, _ = await _read_response(reader)
+                latencies.append((time.perf_counter() - started) * 1000)
+                statuses[status] = statuses.get(status, 0) + 1
+                if 'etag' in response_headers:
+                    etags[path] = response_headers['etag']
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(connections)))
+    return time.perf_counter() - started, latencies, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help="Servidor ya en marcha (por defecto se levanta uno local)")
+    parser.add_argument('--projects', type=int, default=200)
+    parser.add_argument('--flows', type=int, default=50_000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--revalidate', type=float, default=0.5,
+                        help="Fracción de peticiones que envían If-None-Match")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        process = None
+        if args.url:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port
+        else:
+            db_path = os.path.join(temp_dir, 'bench.db')
+            create_database(db_path, args.projects, args.flows)
+            process, host, port = start_server(db_path, args.workers)
+
+        try:
+            base = f"http://{host}:{port}"
+            projects = _get_json(f"{base}/api/projects?page_size=500")
+            project_ids = [project['id'] for project in projects['items']]
+            flows_per_project = max(1, args.flows // max(1, len(project_ids)))
+            pages = max(1, flows_per_project // 50)
+            rng = random.Random(args.seed)
+            paths = (
+                [f"/api/projects?page={page}" for page in range(1, 4)]
+                + [f"/api/projects/{rng.choice(project_ids)}/flows?page={rng.randint(1, pages)}"
+                   for _ in range(200)]
+                + [f"/api/flows/{rng.randint(1, args.flows)}" for _ in range(200)]
+            )
+
+            sample = paths[3]
+            plain = _get_size(base + sample, {})
+            compressed = _get_size(base + sample, {'Accept-Encoding': 'gzip'})
+
+            elapsed, latencies, statuses = asyncio.run(run_load(
+                host, port, paths, args.requests, args.connections, args.revalidate, args.seed
+            ))
+            results = {
+                'server': base if args.url else f"local ({args.workers} hilos)",
+                'flows': None if args.url else args.flows,
+                'requests': len(latencies),
+                'connections': args.connections,
+                'seconds': round(elapsed, 3),
+                'requests_per_second': round(len(latencies) / elapsed, 1),
+                'latency': summarize(latencies),
+                'p99_ms': round(sorted(latencies)[int(len(latencies) * 0.99) - 1], 3),
+                'statuses': {str(status): count for status, count in sorted(statuses.items())},
+                'flow_page_bytes': plain,
+                'flow_page_gzip_bytes': compressed,
+            }
+            report('api_load', results)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+
+def _get_json(url: str):
+    import json
+    with urlopen(url, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def _get_size(url: str, headers) -> int:
+    with urlopen(Request(url, headers=headers), timeout=10) as response:
+        return len(response.read())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+# benchmarks/bench_backup.py
+"""Mide cuánto bloquean las copias de seguridad en línea a lectores y escritores.
+
+Genera una base del tamaño pedido (1 GB por defecto: proyectos y flujos
+reales más una tabla de relleno) y hace la copia con BackupManager mientras
+un hilo lee páginas de flujos y otro escribe con db.write cada pocos
+milisegundos. Informa:
+
+- el paso de copia más largo y la duración total, copiando por pasos y,
+  como comparación, en un solo paso (pages=-1);
+- la latencia de las lecturas y escrituras concurrentes en cada caso;
+- el tamaño comprimido y el tiempo de restauración verificada.
+
+Uso:
+    python -m benchmarks.bench_backup --size-mb 1024
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.backup import BackupManager
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import summarize, report
+
+ROW_BYTES = 8192
+
+
+def build_database(flows: int, size_mb: int):
+    db = Database()
+    project_ids = [SQLiteProjectRepository().create(Project(name=f"Proyecto {index}")).id
+                   for index in range(50)]
+    repository = SQLiteFlowRepository()
+    for start in range(0, flows, 5000):
+        repository.upsert_many([
+            Flow(project_id=project_ids[index % len(project_ids)], name=f"Flujo {index}",
+                 external_id=f"ext-{index}")
+            for index in range(start, min(start + 5000, flows))
+        ])
+
+    # Relleno hasta el tamaño pedido: mitad aleatorio, mitad texto repetitivo (se comprime)
+    rows = max(0, size_mb * 1024 * 1024 - os.path.getsize(db.db_path)) // ROW_BYTES
+
+    def fill(conn):
+        conn.execute("CREATE TABLE IF NOT EXISTS bench_payload (id INTEGER PRIMARY KEY, data BLOB, note TEXT)")
+        conn.execute(
+            "WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?) "
+            "INSERT INTO bench_payload (data, note) SELECT randomblob(?), printf('%.*c', ?, 'x') FROM n",
+            (rows, ROW_BYTES // 2, ROW_BYTES // 2)
+        )
+
+    if rows:
+        db.write(fill).result()
+    db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return project_ids
+
+
+def run_with_load(manager: BackupManager, project_ids, interval_ms: float):
+    """Hace una copia mientras un lector y un escritor trabajan; devuelve la copia y sus latencias"""
+    repository = SQLiteFlowRepository()
+    stop = threading.Event()
+    reads, writes = [], []
+
+    def reader():
+        index = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            repository.get_page_by_project(project_ids[index % len(project_ids)], 0, 50)
+            reads.append((time.perf_counter() - started) * 1000)
+            index += 1
+            time.sleep(interval_ms / 1000)
+
+    def writer():
+        index = 0
+        while not stop.is_set():
+            started = time.perf_counter()
+            repository.create(Flow(project_id=project_ids[0], name=f"Durante la copia {index}"))
+            writes.append((time.perf_counter() - started) * 1000)
+            index += 1
+            time.sleep(interval_ms / 1000)
+
+    threads = [threading.Thread(target=reader), threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    try:
+        result = manager.create_backup()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    return result, summarize(reads), summarize(writes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size-mb', type=int, default=1024)
+    parser.add_argument('--flows', type=int, default=100_000)
+    parser.add_argument('--pages-per-step', type=int, default=1024)
+    parser.add_argument('--step-pause-ms', type=float, default=5)
+    parser.add_argument('--interval-ms', type=float, default=5,
+                        help="Pausa entre las lecturas y escrituras concurrentes")
+    parser.add_argument('--profile', default=None,
+                        help="Perfil de PRAGMA (con 'shared', sin WAL, la copia sí compite con los escritores)")
+    parser.add_argument('--skip-single-step', action='store_true',
+                        help="No medir la copia en un solo paso")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'), args.profile)
+        DatabaseSchema.create_tables()
+        started = time.perf_counter()
+        project_ids = build_database(args.flows, args.size_mb)
+        results = {
+            'profile': db.profile,
+            'database_mb': round(os.path.getsize(db.db_path) / 1024 / 1024),
+            'build_seconds': round(time.perf_counter() - started, 1),
+        }
+
+        modes = [('stepped', args.pages_per_step, args.step_pause_ms)]
+        if not args.skip_single_step:
+            modes.append(('single_step', -1, 0))
+        for mode, pages_per_step, step_pause_ms in modes:
+            manager = BackupManager(db.db_path, os.path.join(temp_dir, mode), keep=1,
+                                    pages_per_step=pages_per_step, step_pause_ms=step_pause_ms,
+                                    compress_level=1)
+            backup, reads, writes = run_with_load(manager, project_ids, args.interval_ms)
+            results[mode] = {
+                'steps': backup.steps,
+                'restarts': backup.restarts,
+                'max_step_ms': backup.max_step_ms,
+                'seconds': backup.seconds,
+                'compressed_mb': round(backup.backup_bytes / 1024 / 1024, 1),
+                'concurrent_reads': reads,
+                'concurrent_writes': writes,
+            }
+
+        started = time.perf_counter()
+        manager.restore(backup.path, os.path.join(temp_dir, 'restored.db'))
+        results['restore_seconds'] = round(time.perf_counter() - started, 1)
+        db.disconnect()
+    report('backup', results)
+
+
+if __name__ == '__main__':
+    main()
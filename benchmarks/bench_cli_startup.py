@@ -0,0 +1,99 @@
+# benchmarks/bench_cli_startup.py
+"""Mide el arranque en frío de la línea de comandos y la exportación por streaming.
+
+Cada medición es un proceso nuevo de Python (como en una tarea programada):
+el arranque de 'projects' refleja el costo fijo (intérprete, imports,
+apertura de la base y verificación del esquema) y 'flows' la exportación
+completa de la base a un archivo JSON Lines o CSV.
+
+Uso:
+    python -m benchmarks.bench_cli_startup --flows 100000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from benchmarks.common import report, summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, 'cli.py')
+
+
+def run_cli(args, repeat: int):
+    """Ejecuta el CLI en procesos nuevos y devuelve las estadísticas de tiempo"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, CLI, *args], check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, 'bench.db')
+        Database._instance = None
+        db = Database(db_path)
+        DatabaseSchema.create_tables()
+        created_at = datetime(2024, 1, 1).isoformat()
+        db.execute("INSERT INTO projects (name, created_at, status) VALUES ('Proyecto', ?, 'active')", (created_at,))
+        db.execute_many(
+            """
+            INSERT INTO flows (project_id, name, recurrence, created_at, owner, status)
+            VALUES (1, ?, 'Diaria', ?, 'owner', 'active')
+            """,
+            [(f"Flujo {index}", created_at) for index in range(args.flows)]
+        )
+        db.disconnect()
+
+        baseline = summarize([
+            _timed([sys.executable, '-c', 'pass']) for _ in range(args.repeat)
+        ])
+        # Módulos cargados al importar el CLI y ejecutar un comando (sin PyQt)
+        probe = subprocess.run(
+            [sys.executable, '-c',
+             "import sys; from app.presentation.cli import main; "
+             f"main(['--db', {db_path!r}, 'projects']); "
+             "print(len(sys.modules), 'PyQt6' in sys.modules, file=sys.stderr)"],
+            cwd=ROOT, check=True, capture_output=True, text=True
+        )
+        modules, qt_loaded = probe.stderr.split()
+
+        output = os.path.join(temp_dir, 'flujos')
+        jsonl = run_cli(['--db', db_path, 'flows', '--output', output + '.jsonl'], max(3, args.repeat // 3))
+        csv_export = run_cli(['--db', db_path, 'flows', '-f', 'csv', '--output', output + '.csv'],
+                             max(3, args.repeat // 3))
+
+        results = {
+            'flows': args.flows,
+            'python_baseline': baseline,
+            'cold_start_projects': run_cli(['--db', db_path, 'projects'], args.repeat),
+            'modules_loaded': int(modules),
+            'qt_loaded': qt_loaded == 'True',
+            'export_jsonl': jsonl,
+            'export_jsonl_rows_per_second': round(args.flows / (jsonl['p50_ms'] / 1000)),
+            'export_csv': csv_export,
+            'export_csv_mb': round(os.path.getsize(output + '.csv') / (1024 * 1024), 2),
+        }
+        report('cli_startup', results)
+
+
+def _timed(command) -> float:
+    started = time.perf_counter()
+    subprocess.run(command, check=True)
+    return (time.perf_counter() - started) * 1000
+
+
+if __name__ == '__main__':
+    main()
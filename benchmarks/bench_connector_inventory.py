@@ -0,0 +1,174 @@
+# benchmarks/bench_connector_inventory.py
+"""Mide el inventario de conectores sobre una base con muchos flujos.
+
+Genera definiciones sintéticas (acciones de SharePoint, Teams, Outlook,
+etc., algunas anidadas en condiciones y bucles), asigna una a cada flujo
+y mide la indexación completa, la reindexación incremental y las
+consultas por conector.
+
+Uso:
+    python -m benchmarks.bench_connector_inventory --flows 100000 --definitions 2000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.application.services.flow_service import FlowService
+from app.domain.entities.flow_definition import canonical_definition
+from app.domain.entities.flow_inventory import ComponentKind
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_inventory_repository import SQLiteFlowInventoryRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import measure, report
+
+# Conector -> operaciones, con un peso relativo de uso
+CATALOG = {
+    'sharepointonline': (['GetItems', 'PostItem', 'PatchItem', 'CreateFile'], 30),
+    'teams': (['PostMessageToConversation', 'PostCardToConversation'], 20),
+    'office365': (['SendEmailV2', 'GetEmailsV3'], 20),
+    'excelonlinebusiness': (['AddRowV2', 'GetItems'], 8),
+    'approvals': (['StartAndWaitForAnApproval'], 5),
+    'sql': (['ExecutePassThroughNativeQuery_V2'], 3),
+    'onedriveforbusiness': (['CreateFile'], 3),
+    'commondataserviceforapps': (['ListRecords', 'CreateRecord'], 2),
+}
+TRIGGERS = [
+    ('Recurrence', None, None),
+    ('manual', None, None),
+    ('When_an_item_is_created', 'sharepointonline', 'GetOnNewItems'),
+    ('When_a_new_email_arrives', 'office365', 'OnNewEmailV3'),
+]
+BUILTIN = ('Compose', 'InitializeVariable', 'SetVariable', 'Http', 'ParseJson')
+
+
+def _connector_action(rng: random.Random, connectors) -> dict:
+    connector = rng.choice(connectors)
+    return {'type': 'OpenApiConnection', 'inputs': {'host': {
+        'connectionName': f'shared_{connector}',
+        'operationId': rng.choice(CATALOG[connector][0]),
+        'apiId': f'/providers/Microsoft.PowerApps/apis/shared_{connector}'
+    }}}
+
+
+def random_definition(rng: random.Random) -> dict:
+    """Definición con 1-3 conectores y 5-30 acciones; parte de ellas en una condición o un bucle"""
+    catalog = list(CATALOG)
+    connectors = set()
+    while len(connectors) < rng.randint(1, 3):
+        connectors.add(rng.choices(catalog, weights=[CATALOG[name][1] for name in catalog])[0])
+    connectors = sorted(connectors)
+    name, connector, operation = rng.choice(TRIGGERS)
+    if connector:
+        trigger = {'type': 'OpenApiConnectionWebhook', 'inputs': {'host': {
+            'connectionName': f'shared_{connector}', 'operationId': operation}}}
+    else:
+        trigger = {'type': name.capitalize() if name == 'manual' else 'Recurrence'}
+
+    def actions(count: int) -> dict:
+        return {
+            f'Accion_{index}': (_connector_action(rng, connectors) if rng.random() < 0.6 else {'type': rng.choice(BUILTIN)})
+            for index in range(count)
+        }
+
+    top = actions(rng.randint(4, 20))
+    if rng.random() < 0.5:
+        top['Condicion'] = {'type': 'If', 'actions': actions(rng.randint(1, 5)),
+                            'else': {'actions': actions(rng.randint(1, 3))}}
+    if rng.random() < 0.3:
+        top['Para_cada'] = {'type': 'Foreach', 'actions': actions(rng.randint(1, 4))}
+    return {'triggers': {name: trigger}, 'actions': top}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=100_000)
+    parser.add_argument('--definitions', type=int, default=2000)
+    parser.add_argument('--projects', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+
+        project_repository = SQLiteProjectRepository()
+        project_ids = [project_repository.create(Project(name=f"Proyecto {index}")).id
+                       for index in range(args.projects)]
+
+        definition_repository = SQLiteFlowDefinitionRepository()
+        texts = [canonical_definition(random_definition(rng)) for _ in range(args.definitions)]
+        hashes = definition_repository.save_many(texts)
+
+        # Muchos flujos son clones: las definiciones se reparten con sesgo (Zipf aproximado)
+        weights = [1 / (rank + 1) for rank in range(len(hashes))]
+        assigned = rng.choices(hashes, weights=weights, k=args.flows)
+        created_at = datetime(2024, 1, 1).isoformat()
+        db.execute_many(
+            """
+            INSERT INTO flows (project_id, name, recurrence, created_at, owner, status, definition_hash)
+            VALUES (?, ?, 'Diaria', ?, ?, ?, ?)
+            """,
+            [
+                (rng.choice(project_ids), f"Flujo {index}", created_at, f"owner{index % 300}",
+                 'active' if index % 10 else 'inactive', definition_hash)
+                for index, definition_hash in enumerate(assigned)
+            ]
+        )
+
+        inventory_repository = SQLiteFlowInventoryRepository()
+        inventory_service = FlowInventoryService(definition_repository, inventory_repository)
+        flow_service = FlowService(SQLiteFlowRepository(), definition_repository, inventory_repository)
+
+        started = time.perf_counter()
+        indexed = inventory_service.refresh()
+        full_seconds = time.perf_counter() - started
+
+        # 100 flujos cambian a definiciones nuevas (como al reimportar): solo esas se analizan
+        changed = rng.sample(range(1, args.flows + 1), 100)
+        new_texts = [canonical_definition(random_definition(rng)) for _ in changed]
+        new_hashes = definition_repository.save_many(new_texts)
+        db.execute_many("UPDATE flows SET definition_hash = ? WHERE id = ?", list(zip(new_hashes, changed)))
+        started = time.perf_counter()
+        reindexed = inventory_service.refresh(dict(zip(new_hashes, new_texts)))
+        incremental_ms = (time.perf_counter() - started) * 1000
+        noop = measure(inventory_service.refresh, repeat=5)
+
+        counts = flow_service.get_connector_counts()
+        rare = counts[-1].connector
+        results = {
+            'flows': args.flows,
+            'distinct_definitions': len(set(assigned)),
+            'full_index_seconds': round(full_seconds, 3),
+            'indexed_definitions': indexed,
+            'incremental_indexed': reindexed,
+            'incremental_ms': round(incremental_ms, 3),
+            'noop_refresh': noop,
+            'connectors': {usage.connector: usage.flows for usage in counts},
+            'connector_counts': measure(flow_service.get_connector_counts, repeat=20),
+            'find_sharepoint': measure(lambda: flow_service.find_by_connector('sharepointonline'), repeat=10),
+            'find_sharepoint_rows': len(flow_service.find_by_connector('sharepointonline')),
+            'find_teams_message': measure(
+                lambda: flow_service.find_by_connector('shared_teams', 'PostMessageToConversation',
+                                                       ComponentKind.ACTION), repeat=10),
+            'find_rare': measure(lambda: flow_service.find_by_connector(rare), repeat=20),
+            'find_sharepoint_page': measure(
+                lambda: flow_service.find_by_connector('sharepointonline', limit=100), repeat=20),
+            'find_in_project': measure(
+                lambda: flow_service.find_by_connector('teams', project_id=project_ids[0]), repeat=20),
+            'database_mb': round(os.path.getsize(os.path.join(temp_dir, 'bench.db')) / (1024 * 1024), 2),
+        }
+        report('connector_inventory', results)
+
+
+if __name__ == '__main__':
+    main()
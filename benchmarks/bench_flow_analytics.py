@@ -0,0 +1,89 @@
+# benchmarks/bench_flow_analytics.py
+"""Mide la expansión vectorizada de recurrencias, los histogramas de carga y
+la búsqueda de intervalos congestionados.
+
+Uso:
+    python -m benchmarks.bench_flow_analytics --flows 100000 --days 30
+"""
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from app.application.services.concurrency_analyzer import find_congested_windows
+from app.application.services.flow_analytics_service import build_load_timeline, expand_occurrences
+from app.domain.entities.schedule import ScheduledFlow
+from benchmarks.common import measure, report
+
+CRON_TEMPLATES = [
+    "*/30 8-18 * * 1-5",
+    "0 */2 * * *",
+    "15 9,13,17 * * *",
+    "0 7 1,15 * *",
+    "*/10 9-12 * * 1",
+]
+
+
+def synthetic_schedules(count: int, owners: int, seed: int = 42):
+    """Genera programaciones sintéticas con una mezcla realista de recurrencias"""
+    rng = random.Random(seed)
+    flows = []
+    for flow_id in range(1, count + 1):
+        kind = rng.random()
+        if kind < 0.6:
+            recurrence, weekdays, month_day, cron = "Diaria", "", None, ""
+        elif kind < 0.8:
+            recurrence, month_day, cron = "Semanal", None, ""
+            weekdays = ",".join(str(day) for day in sorted(rng.sample(range(7), rng.randint(1, 3))))
+        elif kind < 0.9:
+            recurrence, weekdays, month_day, cron = "Mensual", "", rng.randint(1, 31), ""
+        else:
+            recurrence, weekdays, month_day, cron = "Personalizada", "", None, rng.choice(CRON_TEMPLATES)
+        flows.append(ScheduledFlow(
+            id=flow_id,
+            project_id=flow_id % 500 + 1,
+            owner=f"owner{rng.randrange(owners)}",
+            recurrence=recurrence,
+            time_of_day=f"{rng.randrange(24):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+            weekdays=weekdays,
+            month_day=month_day,
+            cron=cron,
+            connection=f"connection{rng.randrange(20)}",
+            estimated_duration=rng.randint(1, 60)
+        ))
+    return flows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=100_000)
+    parser.add_argument('--owners', type=int, default=1_000)
+    parser.add_argument('--days', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    flows = synthetic_schedules(args.flows, args.owners)
+    start = datetime(2024, 3, 1)
+    end = start + timedelta(days=args.days)
+    timeline = build_load_timeline(flows, start, args.days)
+    occurrences = expand_occurrences(flows, start, end)
+
+    report('flow_analytics', {
+        'flows': args.flows,
+        'days': args.days,
+        'occurrences': timeline.total_runs,
+        'peak_hour_runs': timeline.peak_hour[1],
+        'peak_minute_runs': timeline.peak_minute_runs,
+        'expand': measure(lambda: expand_occurrences(flows, start, end), repeat=args.repeat),
+        'load_timeline': measure(lambda: build_load_timeline(flows, start, args.days), repeat=args.repeat),
+        'congestion': {
+            group_by: measure(
+                lambda: find_congested_windows(flows, occurrences, start, group_by, threshold=50, top_k=20),
+                repeat=args.repeat
+            )
+            for group_by in ('owner', 'connection', 'project')
+        },
+    })
+
+
+if __name__ == '__main__':
+    main()
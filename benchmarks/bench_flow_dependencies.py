@@ -0,0 +1,105 @@
+# benchmarks/bench_flow_dependencies.py
+"""Mide el análisis de impacto sobre un grafo grande de dependencias entre flujos.
+
+Genera un grafo mayormente acíclico (cada flujo depende de flujos con ID
+menor, casi siempre cercanos, como en cadenas de procesos) con algunas
+aristas hacia atrás que forman ciclos, y mide el alta de las aristas, los
+recorridos upstream/downstream con CTE recursivas y el orden topológico
+(calculado y en caché).
+
+Uso:
+    python -m benchmarks.bench_flow_dependencies --flows 20000 --edges 50000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.domain.entities.flow_dependency import DependencyKind, FlowDependency
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import measure, report
+
+KINDS = list(DependencyKind)
+
+
+def random_edges(rng: random.Random, flows: int, edges: int, back_edges: int):
+    """Aristas (source, target) únicas: hacia adelante y cercanas, más unas pocas hacia atrás"""
+    result = set()
+    while len(result) < edges - back_edges:
+        target = rng.randint(2, flows)
+        distance = min(target - 1, int(rng.expovariate(1 / 40)) + 1)
+        result.add((target - distance, target))
+    while len(result) < edges:
+        source = rng.randint(2, flows)
+        result.add((source, max(1, source - rng.randint(20, 200))))
+    return sorted(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=20_000)
+    parser.add_argument('--edges', type=int, default=50_000)
+    parser.add_argument('--back-edges', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+
+        project_ids = [SQLiteProjectRepository().create(Project(name=f"Proyecto {index}")).id
+                       for index in range(100)]
+        created_at = datetime(2024, 1, 1).isoformat()
+        db.execute_many(
+            """
+            INSERT INTO flows (project_id, name, recurrence, created_at, owner, status)
+            VALUES (?, ?, 'Diaria', ?, 'owner', 'active')
+            """,
+            [(rng.choice(project_ids), f"Flujo {index}", created_at) for index in range(args.flows)]
+        )
+
+        repository = SQLiteFlowDependencyRepository()
+        service = FlowDependencyService(repository, SQLiteFlowRepository())
+        edges = random_edges(rng, args.flows, args.edges, args.back_edges)
+
+        started = time.perf_counter()
+        service.add_dependencies([FlowDependency(source, target, rng.choice(KINDS)) for source, target in edges])
+        insert_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        order = service.get_topological_order()
+        order_ms = (time.perf_counter() - started) * 1000
+
+        root, middle, leaf = 1, args.flows // 2, args.flows
+        results = {
+            'flows': args.flows,
+            'edges': len(edges),
+            'insert_seconds': round(insert_seconds, 3),
+            'downstream_root_flows': len(repository.get_downstream([root])),
+            'downstream_root': measure(lambda: repository.get_downstream([root]), repeat=5),
+            'downstream_middle_flows': len(repository.get_downstream([middle])),
+            'downstream_middle': measure(lambda: repository.get_downstream([middle]), repeat=5),
+            'upstream_leaf_flows': len(repository.get_upstream([leaf])),
+            'upstream_leaf': measure(lambda: repository.get_upstream([leaf]), repeat=5),
+            'direct_neighbours': measure(lambda: repository.get_for_flows([middle]), repeat=20),
+            'topological_order_ms': round(order_ms, 3),
+            'topological_order_cached': measure(service.get_topological_order, repeat=20),
+            'cycles': len(order.cycles),
+            'flows_in_cycles': len(order.cyclic_flows()),
+            'database_mb': round(os.path.getsize(os.path.join(temp_dir, 'bench.db')) / (1024 * 1024), 2),
+        }
+        report('flow_dependencies', results)
+
+
+if __name__ == '__main__':
+    main()
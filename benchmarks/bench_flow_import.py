@@ -0,0 +1,167 @@
+# benchmarks/bench_flow_import.py
+"""Mide la importación de una exportación de tenant de Power Automate.
+
+Genera archivos .zip sintéticos, cada uno con paquetes de flujo y soluciones
+anidados, y los importa sobre una base temporal. Luego repite la
+importación para medir el camino de actualización (upsert). La mayoría de
+los flujos son clones de unas pocas plantillas, como en un tenant real,
+para medir la deduplicación del almacén de definiciones.
+
+Uso:
+    python -m benchmarks.bench_flow_import --flows 2000 --files 4
+"""
+import argparse
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import zipfile
+
+from app.application.services.flow_import_service import FlowImportService
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.importers.flow_package_reader import read_flow_packages
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import report
+
+FREQUENCIES = ('Minute', 'Hour', 'Day', 'Week', 'Month')
+CONNECTORS = ('shared_sharepointonline', 'shared_office365', 'shared_teams', 'shared_sql')
+
+# Plantillas distintas y proporción de flujos modificados después de clonarlos
+TEMPLATES = 40
+CUSTOMIZED_SHARE = 0.2
+
+
+def _definition(rng: random.Random, flow_id: str, name: str) -> dict:
+    """Definición clonada de una plantilla (recurrencia y acciones de relleno)"""
+    template = rng.randrange(TEMPLATES)
+    customized = rng.random() < CUSTOMIZED_SHARE
+    rng_template = random.Random(rng.random() if customized else template)
+    frequency = rng_template.choice(FREQUENCIES)
+    recurrence = {'frequency': frequency,
+                  'interval': rng_template.choice((1, 1, 2, 15)) if frequency == 'Minute' else 1,
+                  'schedule': {'hours': [rng_template.randrange(24)], 'minutes': [rng_template.randrange(60)]}}
+    if frequency == 'Week':
+        recurrence['schedule']['weekDays'] = rng_template.sample(['Monday', 'Tuesday', 'Friday'], 2)
+    actions = {
+        f'Accion_{index}': {'type': 'OpenApiConnection',
+                            'inputs': {'body': f"plantilla {template}: " + 'x' * rng_template.randrange(100, 400)}}
+        for index in range(20)
+    }
+    return {
+        'name': flow_id,
+        'properties': {
+            'displayName': name,
+            'state': 'Started' if rng.random() < 0.9 else 'Stopped',
+            'definition': {'triggers': {'Recurrence': {'type': 'Recurrence', 'recurrence': recurrence}},
+                           'actions': actions},
+            'connectionReferences': {rng.choice(CONNECTORS): {'id': '/apis/x'}}
+        }
+    }
+
+
+def _zip_bytes(files: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def write_tenant_export(path: str, file_index: int, flows: int, rng: random.Random) -> None:
+    """Exportación con la mitad de los flujos en paquetes sueltos y el resto en soluciones de 50"""
+    members = {}
+    loose = flows // 2
+    for index in range(loose):
+        flow_id = f'{file_index:04d}{index:08d}-0000-0000-0000-000000000000'
+        name = f'Flujo {file_index}-{index}'
+        members[f'flows/{flow_id}.zip'] = _zip_bytes({
+            'manifest.json': json.dumps({'details': {'displayName': name, 'creator': 'bench@contoso.com'}}),
+            f'Microsoft.Flow/flows/{flow_id}/definition.json': json.dumps(_definition(rng, flow_id, name)),
+        })
+
+    for solution, start in enumerate(range(loose, flows, 50)):
+        unique_name = f'solucion_{file_index}_{solution}'
+        files = {'solution.xml': (
+            f'<ImportExportXml><SolutionManifest><UniqueName>{unique_name}</UniqueName>'
+            '</SolutionManifest></ImportExportXml>'
+        )}
+        workflows = []
+        for index in range(start, min(start + 50, flows)):
+            guid = f'{file_index:04d}{index:04d}-1111-1111-1111-111111111111'
+            json_name = f'Workflows/Flujo{index}-{guid}.json'
+            workflows.append(
+                f'<Workflow WorkflowId="{{{guid}}}" Name="Flujo {file_index}-{index}">'
+                f'<JsonFileName>/{json_name}</JsonFileName><StateCode>1</StateCode></Workflow>'
+            )
+            files[json_name] = json.dumps(_definition(rng, guid, ''))
+        files['customizations.xml'] = f'<ImportExportXml><Workflows>{"".join(workflows)}</Workflows></ImportExportXml>'
+        members[f'solutions/{unique_name}.zip'] = _zip_bytes(files)
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=2000)
+    parser.add_argument('--files', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+
+        per_file = args.flows // args.files
+        paths = []
+        for file_index in range(args.files):
+            path = os.path.join(temp_dir, f'tenant_{file_index}.zip')
+            write_tenant_export(path, file_index, per_file, rng)
+            paths.append(path)
+        size_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+
+        definition_repository = SQLiteFlowDefinitionRepository()
+        service = FlowImportService(
+            SQLiteProjectRepository(), SQLiteFlowRepository(), definition_repository, read_flow_packages
+        )
+
+        started = time.perf_counter()
+        first = service.import_packages(paths, workers=args.workers)
+        first_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        second = service.import_packages(paths, workers=args.workers)
+        second_seconds = time.perf_counter() - started
+
+        stats = definition_repository.get_storage_stats()
+        report('flow_import', {
+            'files': len(paths),
+            'archive_mb': round(size_mb, 2),
+            'cpus': os.cpu_count(),
+            'projects': first.projects,
+            'flows_created': first.flows_created,
+            'import_seconds': round(first_seconds, 3),
+            'flows_updated': second.flows_updated,
+            'reimport_seconds': round(second_seconds, 3),
+            'definition_blobs': stats.blobs,
+            'definition_references': stats.references,
+            'definitions_raw_mb': round(stats.referenced_bytes / (1024 * 1024), 2),
+            'definitions_stored_mb': round(stats.stored_bytes / (1024 * 1024), 3),
+            'compression_ratio': round(stats.compression_ratio, 1),
+            'savings_ratio': round(stats.savings_ratio, 1),
+            'database_mb': round(os.path.getsize(os.path.join(temp_dir, 'bench.db')) / (1024 * 1024), 2),
+            'errors': first.errors + second.errors,
+        })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# benchmarks/bench_group_commit.py
+"""Compara escrituras concurrentes directas contra el hilo escritor con group commit.
+
+Varios hilos crean flujos a la vez:
+
+- directo: cada hilo escribe con su propia conexión (diario rollback, como
+  antes del hilo escritor) y hace un commit por flujo; los hilos compiten
+  por el bloqueo de escritura y pueden recibir 'database is locked'.
+- escritor: los hilos usan SQLiteFlowRepository.create, que encola la
+  escritura en el hilo escritor; las que llegan juntas comparten commit.
+
+Uso:
+    python -m benchmarks.bench_group_commit --threads 8 --writes 500
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from app.domain.entities.flow import Flow
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from benchmarks.common import report, summarize
+
+INSERT = """
+    INSERT INTO flows (project_id, name, recurrence, created_at, owner, status)
+    VALUES (1, ?, 'Diaria', ?, 'owner', 'active')
+"""
+
+
+def create_database(path: str) -> None:
+    Database._instance = None
+    db = Database(path)
+    DatabaseSchema.create_tables()
+    db.execute("INSERT INTO projects (name, created_at, status) VALUES ('Proyecto', ?, 'active')",
+               (datetime(2024, 1, 1).isoformat(),))
+    db.disconnect()
+
+
+def run_threads(threads: int, writes: int, write_one):
+    """Ejecuta write_one(hilo, índice) desde varios hilos; devuelve segundos, latencias y errores"""
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    def worker(thread_index):
+        local_latencies = []
+        for index in range(writes):
+            started = time.perf_counter()
+            try:
+                write_one(thread_index, index)
+            except sqlite3.OperationalError as e:
+                with lock:
+                    errors.append(str(e))
+            local_latencies.append((time.perf_counter() - started) * 1000)
+        with lock:
+            latencies.extend(local_latencies)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    return time.perf_counter() - started, latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--writes', type=int, default=500, help="Escrituras por hilo")
+    parser.add_argument('--timeout', type=float, default=5.0,
+                        help="Espera ante bloqueo de las conexiones directas (segundos)")
+    args = parser.parse_args()
+    total = args.threads * args.writes
+    created_at = datetime(2024, 1, 1).isoformat()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Directo: una conexión por hilo, un commit por escritura
+        direct_path = os.path.join(temp_dir, 'direct.db')
+        create_database(direct_path)
+        local = threading.local()
+
+        def direct_write(thread_index, index):
+            if not hasattr(local, 'conn'):
+                local.conn = sqlite3.connect(direct_path, timeout=args.timeout)
+            with local.conn:
+                local.conn.execute(INSERT, (f"Flujo {thread_index}-{index}", created_at))
+
+        direct_seconds, direct_latencies, direct_errors = run_threads(args.threads, args.writes, direct_write)
+
+        # Hilo escritor con commits agrupados
+        writer_path = os.path.join(temp_dir, 'writer.db')
+        create_database(writer_path)
+        db = Database(writer_path)
+        repository = SQLiteFlowRepository()
+
+        def writer_write(thread_index, index):
+            repository.create(Flow(project_id=1, name=f"Flujo {thread_index}-{index}"))
+
+        writer_seconds, writer_latencies, writer_errors = run_threads(args.threads, args.writes, writer_write)
+        writer = db.writer
+        commits, jobs = writer.commits, writer.jobs
+        db.disconnect()
+
+        results = {
+            'threads': args.threads,
+            'writes': total,
+            'direct_writes_per_second': round((total - len(direct_errors)) / direct_seconds, 1),
+            'direct_latency': summarize(direct_latencies),
+            'direct_lock_errors': len(direct_errors),
+            'writer_writes_per_second': round((total - len(writer_errors)) / writer_seconds, 1),
+            'writer_latency': summarize(writer_latencies),
+            'writer_lock_errors': len(writer_errors),
+            'writer_commits': commits,
+            'writer_writes_per_commit': round(jobs / max(1, commits), 1),
+        }
+        report('group_commit', results)
+
+
+if __name__ == '__main__':
+    main()
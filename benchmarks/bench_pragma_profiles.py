@@ -0,0 +1,92 @@
+# benchmarks/bench_pragma_profiles.py
+"""Compara el rendimiento de lectura y escritura de cada perfil de PRAGMA.
+
+Para cada perfil de config.DATABASE['profiles'] crea una base nueva y mide:
+
+- importación: upsert_many por lotes, como FlowImportService;
+- escrituras sueltas: SQLiteFlowRepository.create de a un flujo (un commit
+  cada una, que es donde más pesa 'synchronous');
+- lecturas: recorrido completo con iter_records, páginas de flujos de un
+  proyecto y búsquedas por ID.
+
+Uso:
+    python -m benchmarks.bench_pragma_profiles --flows 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from app.config import DATABASE
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import measure, report
+
+
+def run_profile(path: str, profile: str, flows: int, single_writes: int, batch_size: int, seed: int):
+    Database._instance = None
+    db = Database(path, profile)
+    DatabaseSchema.create_tables()
+    rng = random.Random(seed)
+    project_ids = [SQLiteProjectRepository().create(Project(name=f"Proyecto {index}")).id
+                   for index in range(50)]
+    repository = SQLiteFlowRepository()
+
+    batch = []
+    started = time.perf_counter()
+    for index in range(flows):
+        batch.append(Flow(project_id=project_ids[index % len(project_ids)], name=f"Flujo {index}",
+                          external_id=f"ext-{index}"))
+        if len(batch) == batch_size:
+            repository.upsert_many(batch)
+            batch = []
+    repository.upsert_many(batch)
+    import_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for index in range(single_writes):
+        repository.create(Flow(project_id=project_ids[0], name=f"Suelto {index}"))
+    single_seconds = time.perf_counter() - started
+
+    scan = measure(lambda: sum(1 for _ in repository.iter_records()), repeat=3)
+    lookups = [rng.randint(1, flows) for _ in range(2000)]
+    by_id = measure(lambda: [repository.get_by_id(flow_id) for flow_id in lookups], repeat=3)
+    page = measure(lambda: repository.get_page_by_project(rng.choice(project_ids), 500, 50), repeat=20)
+
+    result = {
+        'import_rows_per_second': round(flows / import_seconds),
+        'single_writes_per_second': round(single_writes / single_seconds),
+        'scan_rows_per_second': round(flows / (scan['p50_ms'] / 1000)),
+        'lookups_per_second': round(len(lookups) / (by_id['p50_ms'] / 1000)),
+        'project_page': page,
+        'journal_mode': db.fetch_tuples("PRAGMA journal_mode")[0][0],
+    }
+    db.disconnect()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=100_000)
+    parser.add_argument('--single-writes', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--profiles', nargs='*', default=list(DATABASE['profiles']))
+    args = parser.parse_args()
+
+    results = {'flows': args.flows, 'single_writes': args.single_writes}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for profile in args.profiles:
+            path = os.path.join(temp_dir, f"{profile}.db")
+            results[profile] = run_profile(path, profile, args.flows, args.single_writes,
+                                           args.batch_size, args.seed)
+    report('pragma_profiles', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+# benchmarks/bench_project_cards.py
+"""Mide la construcción de las tarjetas del listado de proyectos.
+
+Crea N tarjetas (ProjectCard) en una grilla de 3 columnas dentro de una
+ventana con el tema de la aplicación aplicado (Qt offscreen) e informa:
+
+- construct: creación de las tarjetas y su alta en la grilla;
+- shown: lo anterior más ponerlas en la ventana y procesar los eventos
+  pendientes (pulido de estilos, layout y pintura).
+
+Uso:
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_project_cards --cards 500
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication, QGridLayout, QScrollArea, QVBoxLayout, QWidget
+
+from app.presentation import theme
+from app.presentation.views.project_list_view import MAX_COLUMNS, ProjectCard
+from benchmarks.common import summarize, report
+
+
+def build_projects(count: int) -> list:
+    return [
+        {'id': index, 'name': f"Proyecto {index}", 'created_at': '01/01/2024',
+         'status': 'active' if index % 3 else 'inactive', 'is_active': bool(index % 3)}
+        for index in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    theme.apply(app)
+    projects = build_projects(args.cards)
+
+    window = QWidget()
+    window.resize(1200, 800)
+    scroll_area = QScrollArea()
+    scroll_area.setWidgetResizable(True)
+    QVBoxLayout(window).addWidget(scroll_area)
+    window.show()
+    app.processEvents()
+
+    def run_once():
+        container = QWidget()
+        grid = QGridLayout(container)
+        started = time.perf_counter()
+        for index, project in enumerate(projects):
+            grid.addWidget(ProjectCard(project), index // MAX_COLUMNS, index % MAX_COLUMNS)
+        built = time.perf_counter()
+        scroll_area.setWidget(container)  # La grilla anterior se destruye aquí
+        app.processEvents()
+        shown = time.perf_counter()
+        return (built - started) * 1000, (shown - started) * 1000
+
+    run_once()  # Calentamiento
+    samples = [run_once() for _ in range(args.repeat)]
+    report('project_cards', {
+        'cards': args.cards,
+        'construct': summarize([construct for construct, _ in samples]),
+        'shown': summarize([shown for _, shown in samples]),
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_run_ingestion.py
+"""Mide la importación de historiales de ejecución y la consulta de salud.
+
+Genera un CSV sintético, lo importa en lotes sobre una base temporal y
+consulta la salud del proyecto desde los resúmenes diarios.
+
+Uso:
+    python -m benchmarks.bench_run_ingestion --flows 200 --runs 500000
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from app.application.services.flow_run_service import FlowRunService
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.importers.run_history_reader import read_run_history
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_run_repository import SQLiteFlowRunRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import measure, report
+
+
+def write_history(path: str, flow_names, runs: int, days: int, seed: int = 42):
+    """Escribe un historial sintético con ~5% de fallos y duraciones log-normales"""
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(['Flow', 'Start time', 'Duration', 'Status'])
+        for _ in range(runs):
+            started_at = start + timedelta(seconds=rng.randrange(days * 86400))
+            writer.writerow([
+                rng.choice(flow_names),
+                started_at.isoformat(),
+                f"{rng.lognormvariate(1.5, 0.8):.3f}",
+                'Failed' if rng.random() < 0.05 else 'Succeeded'
+            ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=500_000)
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+
+        project = SQLiteProjectRepository().create(Project(name="Benchmark"))
+        flow_repository = SQLiteFlowRepository()
+        names = []
+        for index in range(args.flows):
+            flow = flow_repository.create(Flow(project_id=project.id, name=f"Flujo {index}", owner="Owner"))
+            names.append(flow.name)
+
+        history_path = os.path.join(temp_dir, 'history.csv')
+        write_history(history_path, names, args.runs, args.days)
+
+        service = FlowRunService(SQLiteFlowRunRepository(), flow_repository)
+        started = time.perf_counter()
+        summary = service.import_runs(read_run_history(history_path), project.id, batch_size=args.batch_size)
+        elapsed = time.perf_counter() - started
+
+        today = datetime(2024, 1, 1) + timedelta(days=args.days)
+        report('run_ingestion', {
+            'flows': args.flows,
+            'runs': summary.imported,
+            'batches': summary.batches,
+            'import_seconds': round(elapsed, 3),
+            'runs_per_second': round(summary.imported / elapsed),
+            'project_health': measure(lambda: service.get_project_health(project.id, 30, today)),
+        })
+        Database().disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_scroll_fps.py
+"""Mide los cuadros por segundo al desplazarse por el listado de proyectos.
+
+Arma una base sintética con N proyectos, muestra ProjectListView (Qt
+offscreen, 1200x800) con todas sus tarjetas y recorre la lista moviendo la
+barra de desplazamiento de a --step píxeles; cada cuadro es mover la barra y
+procesar la pintura pendiente. Se repite para cada calidad de dibujo
+(UI['render_quality']): con 'high' todas las tarjetas llevan sombra, con
+'auto' se quitan por encima de UI['shadow_max_cards'] tarjetas.
+
+Uso:
+    python -m benchmarks.bench_scroll_fps --projects 1000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt6.QtWidgets import QApplication
+
+from app.config import UI
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data
+from app.presentation import theme
+from benchmarks.common import summarize, report
+
+
+def scroll_frames(app, view, step: int, max_frames: int) -> list:
+    """Recorre la lista hacia abajo y devuelve la duración de cada cuadro (ms)"""
+    bar = view.scroll_area.verticalScrollBar()
+    bar.setValue(0)
+    app.processEvents()
+    samples = []
+    value = 0
+    while value < bar.maximum() and len(samples) < max_frames:
+        value += step
+        started = time.perf_counter()
+        bar.setValue(value)
+        app.processEvents()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--step', type=int, default=60, help="Píxeles por cuadro")
+    parser.add_argument('--frames', type=int, default=300, help="Cuadros como máximo por calidad")
+    parser.add_argument('--quality', nargs='+', default=['high', 'auto'], choices=['high', 'auto', 'low'])
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    theme.apply(app)
+    UI['warm_start'] = False
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+        generate_synthetic_data(SyntheticDataSpec(projects=args.projects, flows=args.projects))
+
+        from app.presentation.views.project_list_view import ProjectListView
+        for quality in args.quality:
+            UI['render_quality'] = quality
+            view = ProjectListView()
+            view.resize(1200, 800)
+            view.show()
+            view.refresh_projects()  # Crea todas las tarjetas de una vez
+            app.processEvents()
+            scroll_frames(app, view, args.step, 10)  # Calentamiento
+            samples = scroll_frames(app, view, args.step, args.frames)
+            stats = summarize(samples)
+            results[quality] = {
+                'fps': round(1000 / stats['mean_ms'], 1),
+                'shadows': view._card_shadows,
+                'frame': stats,
+            }
+            view.close()
+            view.deleteLater()
+            app.processEvents()
+        db.disconnect()
+
+    report('scroll_fps', {'projects': args.projects, 'step_px': args.step, 'quality': results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_startup.py
+"""Mide el arranque en frío de la aplicación por etapa.
+
+Cada corrida es un proceso nuevo (Qt offscreen) que arranca la aplicación
+como run.py sobre una base sintética y se cierra cuando el informe de
+arranque (app/utils/startup_timing.py) se completa: ventana pintada y
+proyectos cargados. Informa la mediana y los percentiles de cada etapa:
+
+- imports: importación de la aplicación (PyQt, vistas y capas inferiores);
+- qt_application, database (verificación o creación del esquema), main_window;
+- first_cards (primer lote de tarjetas creado), first_paint y projects_loaded
+  (la carga de proyectos es asíncrona).
+
+Con --cold-schema se borra la versión del esquema antes de cada corrida,
+para medir el arranque que todavía ejecuta el DDL. --snapshot elige el
+estado de la copia del listado de proyectos (ProjectListSnapshot): al día
+(fresh, por defecto), desactualizada por un cambio entre corridas (stale,
+se pinta y se concilia) o inexistente (none, se espera a la consulta).
+
+Uso:
+    python -m benchmarks.bench_startup --runs 10 --projects 200
+"""
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.project_list_snapshot import ProjectListSnapshot
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data
+from benchmarks.common import summarize, report
+
+# Proceso hijo: arranca la aplicación y termina al completarse el informe de arranque
+_CHILD = '''
+import json, sys
+from app.utils.startup_timing import startup
+from app.config import BACKUP
+BACKUP['dir'] = sys.argv[2]  # las copias de seguridad programadas no van a data/
+
+def done(report):
+    print(json.dumps(report))
+    from PyQt6.QtWidgets import QApplication
+    QApplication.instance().quit()
+
+startup.on_complete(done)
+from app.infrastructure.database.connection import Database
+Database(sys.argv[1])
+from app.presentation.main import start_app
+start_app()
+'''
+
+
+def run_once(db_path: str, backup_dir: str, root: str) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM='offscreen', PA_STARTUP_REPORT='0')
+    output = subprocess.run(
+        [sys.executable, '-c', _CHILD, db_path, backup_dir], cwd=root, env=env,
+        capture_output=True, text=True, timeout=120, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--projects', type=int, default=200)
+    parser.add_argument('--flows', type=int, default=20_000)
+    parser.add_argument('--cold-schema', action='store_true',
+                        help="Borra la versión del esquema antes de cada corrida (arranque con DDL)")
+    parser.add_argument('--snapshot', choices=['fresh', 'stale', 'none'], default='fresh')
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, 'bench.db')
+        Database._instance = None
+        db = Database(db_path)
+        DatabaseSchema.create_tables()
+        generate_synthetic_data(SyntheticDataSpec(projects=args.projects, flows=args.flows))
+        db.disconnect()
+
+        snapshot = ProjectListSnapshot(db_path)
+        backup_dir = os.path.join(temp_dir, 'backups')
+        run_once(db_path, backup_dir, root)  # deja guardada la copia del listado
+
+        samples = {}
+        for run in range(args.runs):
+            if args.cold_schema:
+                with sqlite3.connect(db_path) as conn:
+                    conn.execute('PRAGMA user_version = 0')
+            if args.snapshot == 'none':
+                snapshot.clear()
+            elif args.snapshot == 'stale':
+                with sqlite3.connect(db_path) as conn:
+                    conn.execute("UPDATE projects SET name = ? WHERE id = 1", (f"Renombrado {run}",))
+            startup_report = run_once(db_path, backup_dir, root)
+            for stage in startup_report['stages']:
+                samples.setdefault(stage['stage'], []).append(stage['ms'])
+            samples.setdefault('total', []).append(startup_report['total_ms'])
+
+    report('startup', {
+        'runs': args.runs,
+        'projects': args.projects,
+        'cold_schema': args.cold_schema,
+        'snapshot': args.snapshot,
+        'stages': {stage: summarize(values) for stage, values in samples.items()},
+    })
+
+
+if __name__ == '__main__':
+    main()
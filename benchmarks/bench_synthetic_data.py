@@ -0,0 +1,47 @@
+# benchmarks/bench_synthetic_data.py
+"""Mide cuánto tarda el generador de datos sintéticos.
+
+Genera --flows flujos en una base nueva (1 millón por defecto) y reporta el
+tiempo total, las filas por segundo y el tamaño de la base resultante.
+
+Uso:
+    python -m benchmarks.bench_synthetic_data --flows 1000000 --projects 1000
+"""
+import argparse
+import os
+import tempfile
+
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data
+from benchmarks.common import report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=1_000_000)
+    parser.add_argument('--projects', type=int, default=1000)
+    parser.add_argument('--profile', default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'), args.profile)
+        DatabaseSchema.create_tables()
+        summary = generate_synthetic_data(
+            SyntheticDataSpec(projects=args.projects, flows=args.flows, seed=args.seed)
+        )
+        db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        results = {
+            'profile': db.profile,
+            **summary,
+            'rows_per_second': round(args.flows / summary['seconds']),
+            'database_mb': round(os.path.getsize(db.db_path) / 1024 / 1024),
+        }
+        db.disconnect()
+    report('synthetic_data', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_tracing.py
+"""Mide el costo de la instrumentación de app/utils/tracing.py.
+
+- por llamada: una función vacía sin decorar, decorada con las trazas
+  desactivadas y decorada con las trazas activadas;
+- de punta a punta: FlowUseCases.list_flows_by_project sobre un proyecto
+  con muchos flujos (controlador → caso de uso → repositorio → SQLite),
+  con las trazas desactivadas y activadas.
+
+Uso:
+    python -m benchmarks.bench_tracing --flows 2000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from app.application.services.flow_service import FlowService
+from app.application.use_cases.flow_use_cases import FlowUseCases
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.utils.tracing import traced, tracer
+from benchmarks.common import measure, report
+
+
+def per_call_ns(func, calls: int) -> float:
+    started = time.perf_counter_ns()
+    for _ in range(calls):
+        func()
+    return round((time.perf_counter_ns() - started) / calls, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--flows', type=int, default=2000)
+    parser.add_argument('--calls', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    def plain():
+        pass
+
+    decorated = traced('bench.noop')(plain)
+    results = {'per_call_ns': {
+        'plain': per_call_ns(plain, args.calls),
+        'disabled': per_call_ns(decorated, args.calls),
+    }}
+    tracer.enable()
+    results['per_call_ns']['enabled'] = per_call_ns(decorated, args.calls // 10)
+    tracer.disable()
+    tracer.reset()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+        project = SQLiteProjectRepository().create(Project(name="Ventas"))
+        SQLiteFlowRepository().upsert_many([
+            Flow(project_id=project.id, name=f"Flujo {index}", external_id=f"ext-{index}")
+            for index in range(args.flows)
+        ])
+        use_cases = FlowUseCases(FlowService(SQLiteFlowRepository()))
+
+        results['list_flows_disabled'] = measure(lambda: use_cases.list_flows_by_project(project.id), repeat=20)
+        tracer.enable()
+        results['list_flows_enabled'] = measure(lambda: use_cases.list_flows_by_project(project.id), repeat=20)
+        results['spans_per_call'] = len(tracer.events) // 21
+        tracer.disable()
+        db.disconnect()
+    report('tracing', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# benchmarks/common.py
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+
+def measure(func: Callable[[], Any], repeat: int = 5, warmup: int = 1) -> Dict[str, float]:
+    """Ejecuta una función varias veces y devuelve estadísticas de tiempo en milisegundos"""
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Resume una lista de tiempos (ms) en mínimo, media y percentiles"""
+    ordered = sorted(samples)
+    return {
+        'runs': len(ordered),
+        'min_ms': round(ordered[0], 3),
+        'mean_ms': round(statistics.fmean(ordered), 3),
+        'p50_ms': round(percentile(ordered, 50), 3),
+        'p95_ms': round(percentile(ordered, 95), 3),
+        'max_ms': round(ordered[-1], 3),
+    }
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Percentil por interpolación lineal sobre una lista ya ordenada"""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def report(name: str, results: Dict[str, Any]) -> None:
+    """Imprime el resultado de un benchmark como JSON"""
+    print(json.dumps({'benchmark': name, **results}, indent=2, ensure_ascii=False))
@@ -0,0 +1,211 @@
+# benchmarks/suite.py
+"""Suite de benchmarks de las rutas calientes, con comparación contra una línea base.
+
+Genera una base sintética (app/infrastructure/database/synthetic_data.py)
+del tamaño pedido y mide:
+
+- repositorios: get_all_by_project del proyecto más grande, get_all de
+  proyectos y _map_to_entity sobre filas ya leídas;
+- casos de uso: _format_flow sobre entidades ya construidas;
+- vistas (Qt con la plataforma offscreen): ProjectDetailView.refresh_flows
+  y ProjectListView.refresh_projects;
+- diagramas: build_project_diagram y, si Graphviz está instalado,
+  generate_project_diagram (incluye el render a SVG).
+
+Cada caso reporta percentiles y elementos por segundo en JSON. Con una línea
+base guardada (--save-baseline) se compara la mediana de cada caso y se
+marca como regresión la que empeora más que --tolerance; en ese caso el
+proceso termina con código 1. Las líneas base solo se comparan si se
+generaron con el mismo conjunto de datos.
+
+Uso:
+    python -m benchmarks.suite --flows 50000 --save-baseline
+    python -m benchmarks.suite --flows 50000 --output resultado.json
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from app.application.services.flow_service import FlowService
+from app.application.use_cases.flow_use_cases import FlowUseCases
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data, zipf_counts
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from benchmarks.common import measure
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+
+class Suite:
+    """Casos de la suite sobre una base sintética ya generada"""
+
+    def __init__(self, spec: SyntheticDataSpec, repeat: int, view_flows: int):
+        self.spec = spec
+        self.repeat = repeat
+        self.cases: Dict[str, Dict[str, Any]] = {}
+        counts = zipf_counts(spec.flows, spec.projects, spec.project_skew)
+        # Los IDs de proyecto siguen el orden del reparto (el 1 es el más grande)
+        self.largest_project = 1
+        self.view_project = min(range(len(counts)), key=lambda index: abs(counts[index] - view_flows)) + 1
+        self.counts = {index + 1: count for index, count in enumerate(counts)}
+        self.flow_repository = SQLiteFlowRepository()
+        self.project_repository = SQLiteProjectRepository()
+        self.use_cases = FlowUseCases(FlowService(self.flow_repository))
+
+    def run_case(self, name: str, func: Callable[[], Any], items: int, repeat: Optional[int] = None) -> None:
+        stats = measure(func, repeat=repeat or self.repeat)
+        stats['items'] = items
+        stats['items_per_second'] = round(items / (stats['p50_ms'] / 1000)) if stats['p50_ms'] else None
+        self.cases[name] = stats
+        print(f"  {name}: p50 {stats['p50_ms']} ms ({items} elementos)", file=sys.stderr)
+
+    def run_repositories(self) -> None:
+        largest = self.largest_project
+        self.run_case('repository.get_all_by_project',
+                      lambda: self.flow_repository.get_all_by_project(largest), self.counts[largest])
+        self.run_case('repository.projects_get_all', self.project_repository.get_all, self.spec.projects)
+
+        rows = Database().fetch_all("SELECT * FROM flows WHERE project_id = ?", (largest,))
+        map_to_entity = self.flow_repository._map_to_entity
+        self.run_case('repository.map_to_entity', lambda: [map_to_entity(row) for row in rows], len(rows))
+
+    def run_use_cases(self) -> None:
+        flows = self.flow_repository.get_all_by_project(self.largest_project)
+        format_flow = self.use_cases._format_flow
+        self.run_case('use_case.format_flow', lambda: [format_flow(flow) for flow in flows], len(flows))
+
+    def run_views(self) -> None:
+        from PyQt6.QtWidgets import QApplication
+        from app.presentation.views.project_detail_view import ProjectDetailView
+        from app.presentation.views.project_list_view import ProjectListView
+        app = QApplication.instance() or QApplication([])
+
+        detail = ProjectDetailView()
+        detail.current_project_id = self.view_project
+
+        def refresh_flows():
+            detail.refresh_flows()
+            app.processEvents()
+        self.run_case('view.refresh_flows', refresh_flows, self.counts[self.view_project])
+
+        project_list = ProjectListView()
+
+        def refresh_projects():
+            project_list.refresh_projects()
+            app.processEvents()  # Incluye la destrucción de las tarjetas anteriores (deleteLater)
+        self.run_case('view.refresh_projects', refresh_projects, self.spec.projects)
+
+    def run_diagrams(self, work_dir: str) -> None:
+        from app.utils.diagram_generator import build_project_diagram, generate_project_diagram
+        project_id = self.view_project
+        self.run_case('diagram.build_project_diagram',
+                      lambda: build_project_diagram(project_id), self.counts[project_id])
+        if shutil.which('dot') is None:
+            print("  diagram.generate_project_diagram: omitido (Graphviz no está instalado)", file=sys.stderr)
+            return
+        # render escribe en diagrams/ relativo al directorio actual
+        current = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            self.run_case('diagram.generate_project_diagram',
+                          lambda: generate_project_diagram(project_id), self.counts[project_id],
+                          repeat=max(3, self.repeat // 3))
+        finally:
+            os.chdir(current)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Dict[str, Any]:
+    """Compara la mediana de cada caso con la línea base"""
+    if baseline.get('dataset') != results['dataset']:
+        return {'skipped': "La línea base se generó con otro conjunto de datos"}
+    comparison = {}
+    for name, stats in results['cases'].items():
+        reference = baseline['cases'].get(name)
+        if not reference:
+            continue
+        ratio = stats['p50_ms'] / reference['p50_ms'] if reference['p50_ms'] else 1.0
+        if ratio > 1 + tolerance:
+            status = 'regression'
+        elif ratio < 1 - tolerance:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        comparison[name] = {
+            'baseline_p50_ms': reference['p50_ms'],
+            'p50_ms': stats['p50_ms'],
+            'ratio': round(ratio, 3),
+            'status': status,
+        }
+    return comparison
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--flows', type=int, default=50_000)
+    parser.add_argument('--projects', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--view-flows', type=int, default=500,
+                        help="Tamaño aproximado del proyecto que se muestra en las vistas y diagramas")
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--cases', nargs='*', default=['repositories', 'use_cases', 'views', 'diagrams'],
+                        choices=['repositories', 'use_cases', 'views', 'diagrams'])
+    parser.add_argument('--output', help="Archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Línea base para comparar")
+    parser.add_argument('--save-baseline', action='store_true', help="Guarda los resultados como línea base")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Empeoramiento relativo de la mediana que se considera regresión")
+    args = parser.parse_args()
+
+    spec = SyntheticDataSpec(projects=args.projects, flows=args.flows, seed=args.seed)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        Database._instance = None
+        db = Database(os.path.join(temp_dir, 'bench.db'))
+        DatabaseSchema.create_tables()
+        print(f"Generando {args.flows} flujos en {args.projects} proyectos...", file=sys.stderr)
+        generate_synthetic_data(spec)
+
+        suite = Suite(spec, args.repeat, args.view_flows)
+        for group in args.cases:
+            getattr(suite, f"run_{group}")(*([temp_dir] if group == 'diagrams' else []))
+        db.disconnect()
+
+    results = {
+        'benchmark': 'suite',
+        'dataset': {'flows': args.flows, 'projects': args.projects, 'seed': args.seed,
+                    'view_flows': args.view_flows},
+        'cases': suite.cases,
+    }
+    regressions = []
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as output:
+            json.dump(results, output, indent=2, ensure_ascii=False)
+            output.write('\n')
+        print(f"Línea base guardada en {args.baseline}", file=sys.stderr)
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as source:
+            results['comparison'] = compare(results, json.load(source), args.tolerance)
+        regressions = [name for name, item in results['comparison'].items()
+                       if isinstance(item, dict) and item['status'] == 'regression']
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+    if regressions:
+        print(f"Regresiones: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
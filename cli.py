@@ -0,0 +1,13 @@
+#!/usr/bin/env python
+# cli.py - Punto de entrada de la línea de comandos (sin interfaz gráfica)
+
+import sys
+import os
+
+# Agregar el directorio actual al path para importar módulos correctamente
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from app.presentation.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,9 @@ import os
 # Agregar el directorio actual al path para importar módulos correctamente
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
+# Primero el registro de tiempos del arranque: su origen es el comienzo de las importaciones
+from app.utils.startup_timing import startup
+
 # Importar la función principal de la aplicación
 from app.presentation.main import start_app
 
@@ -0,0 +1,121 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.application.services.concurrency_analyzer import find_congested_windows
+from app.application.services.flow_analytics_service import Occurrences, expand_occurrences
+from app.domain.entities.schedule import ScheduledFlow
+
+def scheduled(flow_id, at, owner="Ana", connection="", duration=5, project_id=1):
+    return ScheduledFlow(flow_id, project_id, owner, "Diaria", at, "", None, "",
+                         f"Flujo {flow_id}", connection, duration)
+
+class TestConcurrencyAnalyzer(unittest.TestCase):
+    """Pruebas para la búsqueda de intervalos congestionados"""
+
+    start = datetime(2024, 3, 4, 0, 0)
+
+    def _windows(self, flows, days=1, **kwargs):
+        occurrences = expand_occurrences(flows, self.start, self.start + timedelta(days=days))
+        return find_congested_windows(flows, occurrences, self.start, **kwargs)
+
+    def test_overlapping_runs(self):
+        """Prueba el intervalo y el pico de ejecuciones superpuestas"""
+        flows = [
+            scheduled(1, "08:00", duration=30),
+            scheduled(2, "08:10", duration=10),
+            scheduled(3, "08:15", duration=20),
+            scheduled(4, "09:00", duration=5),
+        ]
+
+        windows = self._windows(flows, threshold=2)
+
+        self.assertEqual(len(windows), 1)
+        window = windows[0]
+        self.assertEqual(window.key, "Ana")
+        self.assertEqual(window.start, datetime(2024, 3, 4, 8, 10))
+        self.assertEqual(window.end, datetime(2024, 3, 4, 8, 30))
+        self.assertEqual(window.peak_concurrency, 3)
+        self.assertEqual(window.peak_at, datetime(2024, 3, 4, 8, 15))
+        self.assertEqual(window.flow_ids, [1, 2, 3])
+
+    def test_back_to_back_runs_do_not_overlap(self):
+        """Prueba que una ejecución que termina cuando otra empieza no se solapa"""
+        flows = [scheduled(1, "08:00", duration=10), scheduled(2, "08:10", duration=10)]
+
+        self.assertEqual(self._windows(flows, threshold=2), [])
+
+    def test_handoff_keeps_window_continuous(self):
+        """Prueba que las ejecuciones que se relevan en el mismo minuto no parten la ventana"""
+        flows = [
+            scheduled(1, "08:00", duration=60),
+            scheduled(2, "08:00", duration=60),
+            scheduled(3, "09:00", duration=60),
+            scheduled(4, "09:00", duration=60),
+        ]
+
+        windows = self._windows(flows, threshold=2)
+
+        self.assertEqual(len(windows), 1)
+        self.assertEqual(windows[0].start, datetime(2024, 3, 4, 8, 0))
+        self.assertEqual(windows[0].end, datetime(2024, 3, 4, 10, 0))
+        self.assertEqual(windows[0].peak_concurrency, 2)
+
+    def test_groups_and_top_k(self):
+        """Prueba la agrupación por conexión y el orden de los resultados"""
+        flows = [
+            scheduled(1, "08:00", owner="Ana", connection="SharePoint"),
+            scheduled(2, "08:00", owner="Luis", connection="SharePoint"),
+            scheduled(3, "08:01", owner="Eva", connection="SharePoint"),
+            scheduled(4, "10:00", owner="Ana", connection="Outlook"),
+            scheduled(5, "10:00", owner="Ana", connection="Outlook"),
+            scheduled(6, "10:00", owner="Ana"),
+        ]
+
+        windows = self._windows(flows, group_by='connection', threshold=2)
+        self.assertEqual([(w.key, w.peak_concurrency) for w in windows],
+                         [("SharePoint", 3), ("Outlook", 2)])
+
+        top = self._windows(flows, days=2, group_by='connection', threshold=2, top_k=1)
+        self.assertEqual(len(top), 1)
+        self.assertEqual(top[0].key, "SharePoint")
+
+        by_owner = self._windows(flows, group_by='owner', threshold=3)
+        self.assertEqual([(w.key, w.flow_ids) for w in by_owner], [("Ana", [4, 5, 6])])
+
+    def test_matches_brute_force(self):
+        """Prueba el pico de cada grupo contra un conteo minuto a minuto"""
+        rng = np.random.default_rng(7)
+        flows = [
+            scheduled(i, f"{rng.integers(6, 9):02d}:{rng.integers(0, 60):02d}",
+                      owner=f"owner{i % 3}", duration=int(rng.integers(1, 45)))
+            for i in range(60)
+        ]
+        occurrences = expand_occurrences(flows, self.start, self.start + timedelta(days=1))
+
+        windows = find_congested_windows(flows, occurrences, self.start, threshold=1, top_k=1000)
+
+        for owner in ("owner0", "owner1", "owner2"):
+            load = np.zeros(24 * 60 + 60, dtype=int)
+            for index, minute in zip(occurrences.flow_index, occurrences.minute):
+                if flows[index].owner == owner:
+                    load[minute:minute + flows[index].estimated_duration] += 1
+            peak = max(w.peak_concurrency for w in windows if w.key == owner)
+            self.assertEqual(peak, load.max())
+
+            # Ventanas = tramos de minutos consecutivos con alguna ejecución
+            edges = np.flatnonzero(np.diff(np.concatenate([[0], load > 0, [0]]).astype(int)))
+            expected = [(int(a), int(b)) for a, b in zip(edges[::2], edges[1::2])]
+            actual = sorted(
+                (int((w.start - self.start).total_seconds() // 60),
+                 int((w.end - self.start).total_seconds() // 60))
+                for w in windows if w.key == owner
+            )
+            self.assertEqual(actual, expected)
+
+    def test_invalid_group(self):
+        """Prueba que se rechazan criterios de agrupación desconocidos"""
+        occurrences = Occurrences(np.array([0]), np.array([0]))
+        with self.assertRaises(ValueError):
+            find_congested_windows([scheduled(1, "00:00")], occurrences, self.start, group_by='color')
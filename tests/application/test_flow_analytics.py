@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime, time, timedelta
+
+from app.application.services.flow_analytics_service import build_load_timeline, expand_occurrences
+from app.domain.entities.schedule import Schedule, ScheduledFlow
+
+def scheduled(flow_id, recurrence, at="08:00", weekdays="", month_day=None, cron="", owner="Owner"):
+    return ScheduledFlow(flow_id, 1, owner, recurrence, at, weekdays, month_day, cron)
+
+class TestFlowAnalytics(unittest.TestCase):
+    """Pruebas para la expansión vectorizada de recurrencias"""
+
+    def _expected(self, flow, start, end):
+        """Ejecuciones calculadas una a una con el motor de programación"""
+        schedule = Schedule(
+            time_of_day=time.fromisoformat(flow.time_of_day),
+            weekdays=[int(day) for day in flow.weekdays.split(',') if day],
+            month_day=flow.month_day,
+            cron=flow.cron
+        )
+        runs = []
+        current = schedule.next_after(flow.recurrence, start - timedelta(minutes=1))
+        while current is not None and current < end:
+            runs.append(int((current - start).total_seconds() // 60))
+            current = schedule.next_after(flow.recurrence, current)
+        return runs
+
+    def test_expand_matches_schedule_engine(self):
+        """Prueba que la expansión coincide con el cálculo de próximas ejecuciones"""
+        flows = [
+            scheduled(1, "Diaria", "00:00"),
+            scheduled(2, "Semanal", "13:45", weekdays="0,4"),
+            scheduled(3, "Mensual", "06:00", month_day=31),
+            scheduled(4, "Personalizada", cron="*/20 9-11 * * 1-5"),
+            scheduled(5, "Personalizada", cron="0 0 1 * 0"),
+        ]
+        start = datetime(2024, 1, 30, 10, 30)
+        end = start + timedelta(days=40)
+
+        occurrences = expand_occurrences(flows, start, end)
+
+        for index, flow in enumerate(flows):
+            actual = sorted(occurrences.minute[occurrences.flow_index == index].tolist())
+            self.assertEqual(actual, self._expected(flow, start, end), flow.recurrence)
+
+    def test_load_timeline_histograms(self):
+        """Prueba los histogramas por hora y por propietario"""
+        flows = [
+            scheduled(1, "Diaria", "08:00", owner="Ana"),
+            scheduled(2, "Diaria", "08:30", owner="Ana"),
+            scheduled(3, "Diaria", "08:30", owner="Luis"),
+        ]
+
+        timeline = build_load_timeline(flows, datetime(2024, 3, 4, 0, 0), days=2)
+
+        self.assertEqual(timeline.total_runs, 6)
+        self.assertEqual(timeline.hourly_counts[8], 3)
+        self.assertEqual(timeline.hourly_counts[32], 3)
+        self.assertEqual(timeline.peak_hour, (datetime(2024, 3, 4, 8, 0), 3))
+        self.assertEqual(timeline.peak_minute, datetime(2024, 3, 4, 8, 30))
+        self.assertEqual(timeline.peak_minute_runs, 2)
+        self.assertEqual(timeline.owner_totals(), {"Ana": 4, "Luis": 2})
+        self.assertEqual(timeline.owner_peak_hours(), {"Ana": 2, "Luis": 1})
+
+    def test_empty(self):
+        """Prueba el análisis sin flujos"""
+        timeline = build_load_timeline([], datetime(2024, 3, 4), days=1)
+
+        self.assertEqual(timeline.total_runs, 0)
+        self.assertEqual(timeline.peak_hour, (None, 0))
+        self.assertEqual(timeline.owner_totals(), {})
@@ -0,0 +1,120 @@
+import unittest
+from datetime import datetime, time
+
+from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+from app.domain.entities.schedule import CronExpression, Schedule
+
+class TestCronExpression(unittest.TestCase):
+    """Pruebas para las expresiones cron"""
+
+    def test_parse_fields(self):
+        """Prueba la interpretación de listas, rangos y pasos"""
+        cron = CronExpression("*/15 8-10 1,15 * 1-5")
+
+        self.assertEqual(cron.minutes, [0, 15, 30, 45])
+        self.assertEqual(cron.hours, [8, 9, 10])
+        self.assertEqual(cron.month_days, [1, 15])
+        self.assertEqual(cron.weekdays, [0, 1, 2, 3, 4])
+
+    def test_invalid_expression(self):
+        """Prueba que se rechazan expresiones inválidas"""
+        for expression in ["* * * *", "60 * * * *", "*/0 * * * *", "a * * * *"]:
+            with self.assertRaises(ValueError):
+                CronExpression(expression)
+
+    def test_next_after_same_day(self):
+        """Prueba la siguiente ejecución dentro del mismo día"""
+        cron = CronExpression("*/15 8-18 * * *")
+
+        self.assertEqual(
+            cron.next_after(datetime(2024, 3, 4, 9, 7, 30)),
+            datetime(2024, 3, 4, 9, 15)
+        )
+        self.assertEqual(
+            cron.next_after(datetime(2024, 3, 4, 18, 45)),
+            datetime(2024, 3, 5, 8, 0)
+        )
+
+    def test_next_after_weekdays(self):
+        """Prueba que se respetan los días de la semana (0 y 7 son domingo)"""
+        cron = CronExpression("0 9 * * 0")
+
+        # 2024-03-04 es lunes; el siguiente domingo es 2024-03-10
+        self.assertEqual(
+            cron.next_after(datetime(2024, 3, 4, 10, 0)),
+            datetime(2024, 3, 10, 9, 0)
+        )
+        self.assertEqual(CronExpression("0 9 * * 7").weekdays, cron.weekdays)
+
+    def test_next_after_day_of_month_or_weekday(self):
+        """Prueba que con día del mes y día de la semana basta con uno"""
+        cron = CronExpression("0 0 15 * 1")
+
+        # Desde el martes 5, el lunes 11 llega antes que el día 15
+        self.assertEqual(
+            cron.next_after(datetime(2024, 3, 5, 12, 0)),
+            datetime(2024, 3, 11, 0, 0)
+        )
+
+    def test_next_after_leap_day(self):
+        """Prueba expresiones que solo ocurren en años bisiestos"""
+        cron = CronExpression("0 0 29 2 *")
+
+        self.assertEqual(
+            cron.next_after(datetime(2024, 3, 1)),
+            datetime(2028, 2, 29, 0, 0)
+        )
+
+class TestSchedule(unittest.TestCase):
+    """Pruebas para la programación de los flujos"""
+
+    def test_daily(self):
+        """Prueba la programación diaria"""
+        schedule = Schedule(time_of_day=time(8, 30))
+
+        self.assertEqual(
+            schedule.next_after("Diaria", datetime(2024, 3, 4, 8, 0)),
+            datetime(2024, 3, 4, 8, 30)
+        )
+        self.assertEqual(
+            schedule.next_after("Diaria", datetime(2024, 3, 4, 8, 30)),
+            datetime(2024, 3, 5, 8, 30)
+        )
+
+    def test_weekly(self):
+        """Prueba la programación semanal"""
+        schedule = Schedule(time_of_day=time(7, 0), weekdays=[2, 4])
+
+        self.assertEqual(
+            schedule.next_after("Semanal", datetime(2024, 3, 4, 12, 0)),
+            datetime(2024, 3, 6, 7, 0)
+        )
+
+    def test_monthly_clamps_to_last_day(self):
+        """Prueba que el día del mes se ajusta en meses más cortos"""
+        schedule = Schedule(time_of_day=time(6, 0), month_day=31)
+
+        self.assertEqual(
+            schedule.next_after("Mensual", datetime(2024, 4, 1)),
+            datetime(2024, 4, 30, 6, 0)
+        )
+
+    def test_custom_without_cron(self):
+        """Prueba que una recurrencia personalizada sin cron no se ejecuta"""
+        self.assertIsNone(Schedule().next_after("Personalizada", datetime(2024, 3, 4)))
+
+    def test_flow_reschedule(self):
+        """Prueba que los flujos inactivos no tienen próxima ejecución"""
+        flow = Flow(
+            name="Test Flow",
+            recurrence=RecurrenceType.CUSTOM,
+            schedule=Schedule(cron="0 12 * * *"),
+            status=FlowStatus.ACTIVE
+        )
+
+        flow.reschedule(datetime(2024, 3, 4, 9, 0))
+        self.assertEqual(flow.next_run_at, datetime(2024, 3, 4, 12, 0))
+
+        flow.deactivate()
+        flow.reschedule(datetime(2024, 3, 4, 9, 0))
+        self.assertIsNone(flow.next_run_at)
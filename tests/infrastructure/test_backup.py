@@ -0,0 +1,80 @@
+import unittest
+import gzip
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.backup import BackupManager
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestBackupManager(unittest.TestCase):
+    """Pruebas para las copias de seguridad en línea"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        Database._instance = None  # Reset singleton
+        self.db = Database(self.db_path)
+        DatabaseSchema.create_tables()
+        self.project_repository = SQLiteProjectRepository()
+        self.flow_repository = SQLiteFlowRepository()
+        self.project = self.project_repository.create(Project(name="Ventas"))
+        self.flow_repository.upsert_many([
+            Flow(project_id=self.project.id, name=f"Flujo {index}", external_id=f"ext-{index}")
+            for index in range(500)
+        ])
+        self.manager = BackupManager(self.db_path, os.path.join(self.temp_dir.name, 'backups'),
+                                     keep=2, pages_per_step=4, step_pause_ms=0)
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_backup_in_steps_and_restore(self):
+        """Prueba que la copia avanza por pasos y que restaurarla recupera los datos"""
+        result = self.manager.create_backup()
+        self.assertGreater(result.steps, 1)
+        self.assertEqual(result.restarts, 0)
+        self.assertTrue(os.path.exists(result.path))
+        self.assertLess(result.backup_bytes, result.database_bytes)
+
+        # Cambios posteriores a la copia
+        self.flow_repository.delete(1)
+        self.project_repository.create(Project(name="Finanzas"))
+
+        self.manager.restore(result.path)
+        self.assertEqual(self.db.fetch_tuples("SELECT COUNT(*) FROM flows")[0][0], 500)
+        self.assertEqual(self.db.fetch_tuples("SELECT name FROM projects"), [('Ventas',)])
+        # La base restaurada sigue aceptando escrituras
+        self.flow_repository.create(Flow(project_id=self.project.id, name="Nuevo"))
+
+    def test_restore_rejects_corrupt_backup(self):
+        """Prueba que una copia dañada no sobrescribe la base"""
+        result = self.manager.create_backup()
+        with gzip.open(result.path, 'rb') as source:
+            content = bytearray(source.read())
+        content[4096:8192] = b'\xff' * 4096  # Página dañada
+        with gzip.open(result.path, 'wb') as target:
+            target.write(bytes(content))
+
+        with self.assertRaises(ValueError):
+            self.manager.restore(result.path)
+        self.assertEqual(self.db.fetch_tuples("SELECT COUNT(*) FROM flows")[0][0], 500)
+
+    def test_rotation_and_schedule(self):
+        """Prueba que se conservan las copias más recientes y cuándo corresponde una nueva"""
+        self.assertTrue(self.manager.is_due(24))
+        paths = [self.manager.create_backup().path for _ in range(3)]
+
+        self.assertEqual([backup.path for backup in self.manager.list_backups()], paths[:0:-1])
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertFalse(self.manager.is_due(24))
+        self.assertTrue(self.manager.is_due(24, now=datetime.now() + timedelta(hours=25)))
+
+if __name__ == '__main__':
+    unittest.main()
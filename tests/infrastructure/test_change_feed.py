@@ -0,0 +1,160 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+
+from app.application.services.change_feed_service import ChangeFeedService
+from app.domain.entities.change import ChangeOperation
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_change_log_repository import SQLiteChangeLogRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestChangeFeed(unittest.TestCase):
+    """Pruebas para el registro de cambios y su lectura incremental"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        Database._instance = None  # Reset singleton
+        self.db = Database(self.db_path)
+        DatabaseSchema.create_tables()
+        self.project_repository = SQLiteProjectRepository()
+        self.flow_repository = SQLiteFlowRepository()
+        self.feed = ChangeFeedService(SQLiteChangeLogRepository(), batch_size=2)
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_triggers_record_changes_after_cursor(self):
+        """Prueba que altas, modificaciones y bajas quedan registradas en orden desde el cursor"""
+        project = self.project_repository.create(Project(name="Ventas"))
+        cursor = self.feed.current_cursor()
+
+        flow = self.flow_repository.create(Flow(project_id=project.id, name="Pedido"))
+        flow.name = "Pedido diario"
+        self.flow_repository.update(flow)
+        other = self.flow_repository.create(Flow(project_id=project.id, name="Factura"))
+        self.flow_repository.delete(other.id)
+        self.project_repository.update(project)
+
+        batch = self.feed.read_since(cursor)
+        self.assertEqual(
+            [(change.entity, change.entity_id, change.operation) for change in batch.changes],
+            [('flow', flow.id, 'insert'), ('flow', flow.id, 'update'), ('flow', other.id, 'insert'),
+             ('flow', other.id, 'delete'), ('project', project.id, 'update')]
+        )
+        self.assertEqual(batch.cursor, self.feed.current_cursor())
+        self.assertTrue(all(change.project_id == project.id for change in batch.changes))
+
+        # Alta + modificación sigue siendo alta; alta + baja desaparece
+        self.assertEqual(batch.flows(project.id), {flow.id: ChangeOperation.INSERT})
+        self.assertEqual(batch.projects(), {project.id: ChangeOperation.UPDATE})
+
+        # La poda conserva el último cambio: el cursor no retrocede
+        self.assertEqual(self.feed.prune(batch.cursor), len(batch.changes))  # todos salvo el último, más el alta previa
+        self.assertEqual(self.feed.read_since(cursor).cursor, batch.cursor)
+        self.assertEqual(self.feed.current_cursor(), batch.cursor)
+
+    def test_poll_detects_commits_from_other_connections(self):
+        """Prueba que poll solo lee el registro cuando otra conexión confirmó cambios"""
+        cursor = self.feed.current_cursor()
+        self.assertIsNone(self.feed.poll(cursor))
+        self.assertIsNone(self.feed.poll(cursor))
+
+        # Otra instancia de la aplicación escribe en la misma base
+        other = sqlite3.connect(self.db_path)
+        with other:
+            other.execute("INSERT INTO projects (name, created_at, status) VALUES ('Finanzas', '2024-01-01', 'active')")
+        other.close()
+
+        batch = self.feed.poll(cursor)
+        self.assertEqual([(change.entity, change.operation) for change in batch.changes], [('project', 'insert')])
+        self.assertIsNone(self.feed.poll(batch.cursor))
+
+    def test_poll_skips_own_changes(self):
+        """Prueba que poll salta los cambios de esta instancia y entrega los de las demás"""
+        cursor = self.feed.current_cursor()
+        for index in range(3):
+            self.project_repository.create(Project(name=f"Propio {index}"))
+        batch = self.feed.poll(cursor)
+        self.assertEqual(batch.changes, [])
+        self.assertEqual(batch.cursor, self.feed.current_cursor())
+
+        other = sqlite3.connect(self.db_path)
+        with other:
+            other.execute("INSERT INTO projects (name, created_at, status) VALUES ('Finanzas', '2024-01-01', 'active')")
+        other.close()
+        self.project_repository.create(Project(name="Propio 3"))
+
+        batch = self.feed.poll(batch.cursor)
+        self.assertEqual([(change.entity, change.operation) for change in batch.changes], [('project', 'insert')])
+        self.assertEqual(batch.cursor, self.feed.current_cursor())
+
+    def test_poll_asks_for_full_refresh_above_limit(self):
+        """Prueba que con más cambios ajenos que max_changes poll pide recargar en vez de devolverlos"""
+        feed = ChangeFeedService(SQLiteChangeLogRepository(), batch_size=2, max_changes=3)
+        cursor = feed.current_cursor()
+        other = sqlite3.connect(self.db_path)
+        with other:
+            other.executemany(
+                "INSERT INTO projects (name, created_at, status) VALUES (?, '2024-01-01', 'active')",
+                [(f"Proyecto {index}",) for index in range(5)]
+            )
+        other.close()
+
+        batch = feed.poll(cursor)
+        self.assertTrue(batch.full_refresh)
+        self.assertEqual(batch.changes, [])
+        self.assertEqual(batch.cursor, feed.current_cursor())
+
+        # Una carga masiva de otra instancia deja un solo cambio REFRESH
+        other = sqlite3.connect(self.db_path)
+        with other:
+            other.execute("INSERT INTO change_log (entity, entity_id, project_id, operation) VALUES ('*', 0, 0, 'refresh')")
+        other.close()
+        refresh = feed.poll(batch.cursor)
+        self.assertTrue(refresh.full_refresh)
+        self.assertEqual(refresh.cursor, feed.current_cursor())
+
+    def test_next_run_updates_are_not_recorded(self):
+        """Prueba que recalcular la próxima ejecución o reimportar sin cambios no registra nada"""
+        project = self.project_repository.create(Project(name="Ventas"))
+        flow = self.flow_repository.create(Flow(project_id=project.id, name="Pedido", external_id="ext-1"))
+        cursor = self.feed.current_cursor()
+
+        self.flow_repository.update_next_runs([(flow.id, datetime(2024, 3, 5, 8, 0))])
+        flow.next_run_at = datetime(2024, 3, 6, 8, 0)
+        self.flow_repository.upsert_many([flow])
+        self.assertEqual(self.feed.read_since(cursor).changes, [])
+
+        flow.name = "Pedido diario"
+        self.flow_repository.upsert_many([flow])
+        self.assertEqual([change.operation for change in self.feed.read_since(cursor).changes], ['update'])
+
+    def test_upgrade_replaces_unconditional_update_trigger(self):
+        """Prueba que una base de la versión 1 recibe el trigger de UPDATE con condición"""
+        self.db.execute('DROP TRIGGER trg_flows_update_change_log')
+        self.db.execute('''
+            CREATE TRIGGER trg_flows_update_change_log AFTER UPDATE ON flows
+            BEGIN
+                INSERT INTO change_log (entity, entity_id, project_id, operation)
+                VALUES ('flow', NEW.id, NEW.project_id, 'update');
+            END
+        ''')
+        self.db.execute('PRAGMA user_version = 1')
+        DatabaseSchema.create_tables()
+
+        project = self.project_repository.create(Project(name="Ventas"))
+        flow = self.flow_repository.create(Flow(project_id=project.id, name="Pedido"))
+        cursor = self.feed.current_cursor()
+        self.flow_repository.update_next_runs([(flow.id, datetime(2024, 3, 5, 8, 0))])
+        self.assertEqual(self.feed.read_since(cursor).changes, [])
+
+if __name__ == '__main__':
+    unittest.main()
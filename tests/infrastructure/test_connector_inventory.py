@@ -0,0 +1,155 @@
+import unittest
+import os
+import tempfile
+
+from app.application.services.flow_inventory_service import FlowInventoryService
+from app.application.services.flow_service import FlowService
+from app.domain.entities.flow import Flow
+from app.domain.entities.flow_definition import canonical_definition, definition_hash
+from app.domain.entities.flow_inventory import (
+    BUILTIN_CONNECTOR, ComponentKind, FlowComponent, extract_components, normalize_connector
+)
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_inventory_repository import SQLiteFlowInventoryRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+def connector_action(connector, operation):
+    """Acción de conector como la exportan las soluciones"""
+    return {
+        'type': 'OpenApiConnection',
+        'inputs': {'host': {
+            'apiId': f'/providers/Microsoft.PowerApps/apis/shared_{connector}', 'operationId': operation
+        }}
+    }
+
+def definition(*teams_operations):
+    """Definición con desencadenador de SharePoint, una condición y un bucle anidado"""
+    return {
+        'triggers': {
+            'When_an_item_is_created': {
+                'type': 'OpenApiConnectionWebhook',
+                'inputs': {'host': {'connectionName': 'shared_sharepointonline', 'operationId': 'GetOnNewItems'}}
+            }
+        },
+        'actions': {
+            'Condition': {
+                'type': 'If',
+                'actions': {
+                    'For_each': {
+                        'type': 'Foreach',
+                        'actions': {f'Post_{index}': connector_action('teams', operation)
+                                    for index, operation in enumerate(teams_operations)}
+                    }
+                },
+                'else': {'actions': {'Compose': {'type': 'Compose'}}}
+            }
+        }
+    }
+
+class TestComponentExtraction(unittest.TestCase):
+    """Pruebas para la extracción de conectores de una definición"""
+
+    def test_normalize_connector(self):
+        """Prueba que las referencias de conexión se reducen al nombre del conector"""
+        self.assertEqual(normalize_connector('/providers/Microsoft.PowerApps/apis/shared_teams'), 'teams')
+        self.assertEqual(normalize_connector('shared_SharePointOnline_1'), 'sharepointonline')
+        self.assertEqual(normalize_connector('office365'), 'office365')
+
+    def test_nested_actions_and_legacy_connections(self):
+        """Prueba las acciones anidadas en switch y las conexiones de paquetes antiguos"""
+        components = extract_components({
+            'triggers': {'manual': {'type': 'Request'}},
+            'actions': {
+                'Switch': {
+                    'type': 'Switch',
+                    'cases': {'Alta': {'actions': {'Send': {
+                        'type': 'ApiConnection',
+                        'inputs': {'host': {'connection': {
+                            'name': "@parameters('$connections')['office365']['connectionId']"
+                        }}}
+                    }}}},
+                    'default': {'actions': {'Post': connector_action('teams', 'PostMessageToConversation')}}
+                },
+                'Post_again': connector_action('teams', 'PostMessageToConversation')
+            }
+        })
+
+        self.assertEqual(set(components), {
+            FlowComponent(ComponentKind.TRIGGER, BUILTIN_CONNECTOR, 'Request'),
+            FlowComponent(ComponentKind.ACTION, BUILTIN_CONNECTOR, 'Switch'),
+            FlowComponent(ComponentKind.ACTION, 'office365', 'ApiConnection'),
+            FlowComponent(ComponentKind.ACTION, 'teams', 'PostMessageToConversation', occurrences=2),
+        })
+
+class TestFlowInventory(unittest.TestCase):
+    """Pruebas para el índice de conectores y su actualización incremental"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.flow_repository = SQLiteFlowRepository()
+        self.definition_repository = SQLiteFlowDefinitionRepository()
+        self.inventory_repository = SQLiteFlowInventoryRepository()
+        self.inventory_service = FlowInventoryService(self.definition_repository, self.inventory_repository)
+        self.flow_service = FlowService(self.flow_repository, self.definition_repository, self.inventory_repository)
+        self.project = SQLiteProjectRepository().create(Project(name="Ventas"))
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def _create_flow(self, name, definition_document):
+        text = canonical_definition(definition_document)
+        self.definition_repository.save_many([text])
+        return self.flow_repository.create(Flow(
+            project_id=self.project.id, name=name, definition_hash=definition_hash(text)
+        ))
+
+    def test_clones_share_an_indexed_definition(self):
+        """Prueba que los flujos clonados se indexan una vez y cuentan por separado"""
+        for name in ('Aviso 1', 'Aviso 2', 'Aviso 3'):
+            self._create_flow(name, definition('PostMessageToConversation'))
+        self._create_flow('Chat', definition('PostMessageToConversation', 'PostCardToConversation'))
+
+        self.assertEqual(self.inventory_service.refresh(), 2)
+
+        usage = {item.connector: item for item in self.flow_service.get_connector_counts()}
+        self.assertEqual((usage['sharepointonline'].flows, usage['sharepointonline'].triggers), (4, 4))
+        self.assertEqual((usage['teams'].flows, usage['teams'].actions), (4, 5))
+        self.assertEqual(usage[BUILTIN_CONNECTOR].flows, 4)
+
+        matches = self.flow_service.find_by_connector('shared_teams', 'PostCardToConversation')
+        self.assertEqual([(match.name, match.project_name) for match in matches], [('Chat', 'Ventas')])
+        self.assertEqual(len(self.flow_service.find_by_connector('teams', limit=2)), 2)
+        self.assertEqual(
+            self.flow_service.get_connector_operations('teams')[0],
+            ('action', 'PostMessageToConversation', 4)
+        )
+
+    def test_refresh_is_incremental(self):
+        """Prueba que solo se analizan las definiciones nuevas"""
+        flow = self._create_flow('Aviso', definition('PostMessageToConversation'))
+        self.assertEqual(self.inventory_service.refresh(), 1)
+        self.assertEqual(self.inventory_service.refresh(), 0)
+
+        # Reimportar con otra definición deja al flujo con otro hash, el único que se analiza
+        text = canonical_definition(definition('PostCardToConversation'))
+        self.definition_repository.save_many([text])
+        flow.definition_hash = definition_hash(text)
+        self.db.execute("UPDATE flows SET definition_hash = ? WHERE id = ?", (flow.definition_hash, flow.id))
+
+        self.assertEqual(self.inventory_service.refresh({flow.definition_hash: text}), 1)
+        self.assertEqual(
+            [match.name for match in self.flow_service.find_by_connector('teams', 'PostCardToConversation')],
+            ['Aviso']
+        )
+        self.assertEqual(self.flow_service.find_by_connector('teams', 'PostMessageToConversation'), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import os
+import tempfile
+
+from app.config import DATABASE
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+
+class TestDatabaseProfiles(unittest.TestCase):
+    """Pruebas para los perfiles de PRAGMA de la base de datos"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        Database._instance = None  # Reset singleton
+
+    def tearDown(self):
+        if Database._instance is not None:
+            Database().disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _pragma(self, db, name):
+        return db.fetch_tuples(f"PRAGMA {name}")[0][0]
+
+    def test_profile_is_applied_to_readers_and_writer(self):
+        """Prueba que las conexiones de lectura y el hilo escritor usan el perfil"""
+        db = Database(self.db_path, 'shared')
+        DatabaseSchema.create_tables()
+        db.write(lambda conn: conn.execute(
+            "INSERT INTO projects (name, created_at, status) VALUES ('Ventas', '2024-01-01', 'active')"
+        )).result()
+
+        profile = DATABASE['profiles']['shared']
+        self.assertEqual(self._pragma(db, 'journal_mode'), 'delete')
+        self.assertEqual(self._pragma(db, 'synchronous'), 2)  # FULL
+        self.assertEqual(self._pragma(db, 'busy_timeout'), profile['busy_timeout'])
+        self.assertEqual(self._pragma(db, 'cache_size'), profile['cache_size'])
+        self.assertEqual(self._pragma(db, 'temp_store'), 2)  # MEMORY
+        self.assertEqual(db.fetch_tuples("SELECT name FROM projects"), [('Ventas',)])
+
+    def test_default_and_unknown_profiles(self):
+        """Prueba el perfil por defecto y el error ante un perfil inexistente"""
+        with self.assertRaises(ValueError):
+            Database(self.db_path, 'turbo')
+
+        Database._instance = None
+        db = Database(self.db_path)
+        self.assertEqual(db.profile, DATABASE['profile'])
+        self.assertEqual(self._pragma(db, 'journal_mode'), 'wal')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.writer import DatabaseWriter
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestDatabaseWriter(unittest.TestCase):
+    """Pruebas para el hilo escritor con commits agrupados"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.project = SQLiteProjectRepository().create(Project(name="Ventas"))
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_concurrent_writes_are_grouped(self):
+        """Prueba que las escrituras de varios hilos se confirman en menos commits, sin bloqueos"""
+        repository = SQLiteFlowRepository()
+        writer = self.db.writer
+        jobs_before, commits_before = writer.jobs, writer.commits
+
+        def create(index):
+            return repository.create(Flow(project_id=self.project.id, name=f"Flujo {index}")).id
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(create, range(400)))
+
+        self.assertEqual(len(set(ids)), 400)
+        self.assertEqual(len(repository.get_all_by_project(self.project.id)), 400)
+        self.assertEqual(writer.jobs - jobs_before, 400)
+        self.assertLess(writer.commits - commits_before, 400)
+        self.assertEqual(self.db.fetch_tuples("PRAGMA journal_mode")[0][0], 'wal')
+
+    def test_failed_write_only_rolls_back_itself(self):
+        """Prueba que una escritura fallida no deshace las demás del mismo lote"""
+        started, release = threading.Event(), threading.Event()
+
+        def block(conn):
+            # Retiene el hilo escritor para que las siguientes escrituras formen un lote
+            started.set()
+            return release.wait(5)
+
+        blocker = self.db.write(block)
+        started.wait(5)
+
+        insert = "INSERT INTO projects (name, created_at, status) VALUES (?, '2024-01-01', 'active')"
+        first = self.db.write(lambda conn: conn.execute(insert, ("Finanzas",)).lastrowid)
+        failing = self.db.write(lambda conn: conn.execute("INSERT INTO tabla_inexistente VALUES (1)"))
+        last = self.db.write(lambda conn: conn.execute(insert, ("Cobranzas",)).lastrowid)
+        commits_before = self.db.writer.commits
+        release.set()
+
+        self.assertTrue(blocker.result(5))
+        with self.assertRaises(sqlite3.OperationalError):
+            failing.result(5)
+        self.assertEqual(last.result(5), first.result(5) + 1)
+        self.assertEqual(self.db.writer.commits - commits_before, 2)  # el del bloqueo y el del lote
+        names = [project.name for project in SQLiteProjectRepository().get_all()]
+        self.assertEqual(sorted(names), ["Cobranzas", "Finanzas", "Ventas"])
+
+    def test_connection_error_reaches_the_caller(self):
+        """Prueba que si el hilo escritor no puede abrir la base el constructor falla en vez de quedarse esperando"""
+        missing = os.path.join(self.temp_dir.name, 'no_existe', 'test.db')
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(DatabaseWriter, missing)
+            with self.assertRaises(sqlite3.OperationalError):
+                pending.result(5)
+
+if __name__ == '__main__':
+    unittest.main()
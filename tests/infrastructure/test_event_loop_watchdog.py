@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from app.utils.event_loop_watchdog import EventLoopWatchdog
+
+# Acción de un controlador de mentira: el detector reconoce los controladores por su módulo
+_CONTROLLER_SOURCE = '''
+class FlowController:
+    def load_flows(self, seconds):
+        time.sleep(seconds)
+'''
+
+
+def _fake_controller():
+    namespace = {'__name__': 'app.presentation.controllers.fake_controller', 'time': time}
+    exec(compile(_CONTROLLER_SOURCE, 'fake_controller.py', 'exec'), namespace)
+    return namespace['FlowController']()
+
+
+class TestEventLoopWatchdog(unittest.TestCase):
+    """Pruebas para el detector de bloqueos del bucle de eventos"""
+
+    def setUp(self):
+        self.watchdog = EventLoopWatchdog(interval_ms=10, stall_ms=100, check_ms=10)
+        self.watchdog.start()
+
+    def tearDown(self):
+        self.watchdog.stop()
+
+    def test_stall_records_action_and_stack(self):
+        """Prueba que un bloqueo guarda la acción del controlador y la pila"""
+        self.watchdog.beat()
+        _fake_controller().load_flows(0.3)
+        self.watchdog.beat()
+
+        stalls = self.watchdog.recent_stalls()
+        self.assertEqual(len(stalls), 1)
+        self.assertGreaterEqual(stalls[0].duration_ms, 250)
+        self.assertTrue(stalls[0].action.endswith('FlowController.load_flows'))
+        self.assertTrue(any('load_flows' in line for line in stalls[0].stack))
+        self.assertEqual(self.watchdog.top_actions()[0].count, 1)
+
+    def test_regular_beats_are_not_stalls(self):
+        """Prueba que los latidos a tiempo solo alimentan el histograma de latencia"""
+        for _ in range(5):
+            self.watchdog.beat()
+            time.sleep(0.01)
+
+        summary = self.watchdog.summary()
+        self.assertEqual(summary['stalls'], 0)
+        self.assertEqual(summary['latency']['count'], 5)
+
+    def test_export_writes_json(self):
+        """Prueba que se exportan el resumen y los bloqueos"""
+        self.watchdog.beat()
+        time.sleep(0.2)
+        self.watchdog.beat()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'stalls.json')
+            self.watchdog.export(path)
+            with open(path, encoding='utf-8') as source:
+                data = json.load(source)
+
+        self.assertEqual(data['stalls'], 1)
+        self.assertEqual(len(data['recent_stalls']), 1)
+        self.assertIn('p99_ms', data['latency'])
+
+
+if __name__ == '__main__':
+    unittest.main()
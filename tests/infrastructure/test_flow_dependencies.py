@@ -0,0 +1,125 @@
+import unittest
+import os
+import tempfile
+
+from app.application.services.flow_dependency_service import FlowDependencyService
+from app.domain.entities.flow import Flow
+from app.domain.entities.flow_dependency import (
+    DependencyKind, child_flow_references, topological_order
+)
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_dependency_repository import SQLiteFlowDependencyRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.utils.diagram_generator import build_project_diagram
+
+class TestDependencyGraph(unittest.TestCase):
+    """Pruebas para el orden topológico y la detección de flujos secundarios"""
+
+    def test_topological_order_and_cycles(self):
+        """Prueba que cada flujo queda después de los que lo desencadenan y se detectan los ciclos"""
+        result = topological_order([(1, 2), (2, 3), (1, 3), (4, 5), (5, 4), (5, 6), (7, 7)])
+
+        position = {flow_id: index for index, flow_id in enumerate(result.order)}
+        self.assertEqual(set(position), {1, 2, 3, 4, 5, 6, 7})
+        self.assertLess(position[1], position[2])
+        self.assertLess(position[2], position[3])
+        self.assertLess(position[5], position[6])
+        self.assertEqual(sorted(result.cycles), [[4, 5], [7]])
+
+        self.assertFalse(topological_order([(1, 2)]).has_cycles)
+
+    def test_child_flow_references(self):
+        """Prueba que se encuentran las acciones Workflow anidadas"""
+        definition = {'actions': {'Scope': {'type': 'Scope', 'actions': {
+            'Run_child': {'type': 'Workflow', 'inputs': {'host': {
+                'workflowReferenceName': '{AAAA-1111}'
+            }}},
+            'Compose': {'type': 'Compose'}
+        }}}}
+
+        self.assertEqual(child_flow_references(definition), ['aaaa-1111'])
+
+class TestFlowDependencies(unittest.TestCase):
+    """Pruebas para el repositorio de dependencias y el análisis de impacto"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.flow_repository = SQLiteFlowRepository()
+        self.repository = SQLiteFlowDependencyRepository()
+        self.service = FlowDependencyService(self.repository, self.flow_repository)
+
+        project_repository = SQLiteProjectRepository()
+        self.ventas = project_repository.create(Project(name="Ventas"))
+        self.finanzas = project_repository.create(Project(name="Finanzas"))
+        self.flows = {
+            name: self.flow_repository.create(Flow(project_id=project.id, name=name)).id
+            for name, project in (
+                ('Pedido', self.ventas), ('Factura', self.ventas),
+                ('Cobro', self.finanzas), ('Reporte', self.finanzas)
+            )
+        }
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def _link(self, source, target, kind=DependencyKind.CHILD_FLOW):
+        return self.service.add_dependency(self.flows[source], self.flows[target], kind)
+
+    def test_impact_follows_transitive_dependencies(self):
+        """Prueba el recorrido hacia arriba y hacia abajo con dependencias indirectas"""
+        self._link('Pedido', 'Factura')
+        self._link('Factura', 'Cobro', DependencyKind.HTTP)
+        self._link('Cobro', 'Reporte', DependencyKind.SHARED_DATA)
+        self.assertFalse(self._link('Pedido', 'Factura'))  # repetida
+
+        impact = self.service.get_impact(self.flows['Factura'])
+        self.assertEqual([(flow.name, flow.direct) for flow in impact.upstream], [('Pedido', True)])
+        self.assertEqual(
+            [(flow.name, flow.project_name, flow.direct) for flow in impact.downstream],
+            [('Cobro', 'Finanzas', True), ('Reporte', 'Finanzas', False)]
+        )
+
+        with self.assertRaises(ValueError):
+            self._link('Pedido', 'Pedido')
+
+    def test_cycles_terminate_and_order_is_cached(self):
+        """Prueba que un ciclo no repite flujos y que el orden se recalcula al cambiar el grafo"""
+        self._link('Pedido', 'Factura')
+        self._link('Factura', 'Cobro')
+
+        first = self.service.get_topological_order()
+        self.assertIs(self.service.get_topological_order(), first)
+        self.assertFalse(first.has_cycles)
+
+        self._link('Cobro', 'Pedido')
+        second = self.service.get_topological_order()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.cycles, [sorted(self.flows[name] for name in ('Pedido', 'Factura', 'Cobro'))])
+
+        downstream = self.service.get_impact(self.flows['Pedido']).downstream
+        self.assertEqual(sorted(flow.name for flow in downstream), ['Cobro', 'Factura'])
+
+        # Eliminar un flujo elimina sus dependencias (y cambia la revisión)
+        self.flow_repository.delete(self.flows['Cobro'])
+        self.assertFalse(self.service.get_topological_order().has_cycles)
+        self.assertEqual(len(self.repository.get_edges()), 1)
+
+    def test_diagram_includes_dependencies(self):
+        """Prueba que el diagrama dibuja las dependencias y los flujos de otros proyectos"""
+        self._link('Factura', 'Cobro', DependencyKind.HTTP)
+
+        source = build_project_diagram(self.ventas.id).source
+
+        self.assertIn(f"flow_{self.flows['Factura']} -> flow_{self.flows['Cobro']}", source)
+        self.assertIn("Cobro\\n(Finanzas)", source)
+        self.assertNotIn("HTTP", build_project_diagram(self.ventas.id, include_dependencies=False).source)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import unittest
+import io
+import json
+import os
+import tempfile
+import zipfile
+from datetime import time
+
+from app.application.services.flow_import_service import FlowImportService
+from app.application.services.flow_service import FlowService
+from app.domain.entities.flow import FlowStatus, RecurrenceType
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.importers.flow_package_reader import read_flow_packages, schedule_from_definition
+from app.infrastructure.repositories.sqlite_flow_definition_repository import SQLiteFlowDefinitionRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+def legacy_package(flow_id, name, recurrence=None, state="Started"):
+    """Paquete de flujo con manifest.json y una definición"""
+    triggers = {'Recurrence': {'type': 'Recurrence', 'recurrence': recurrence}} if recurrence else {
+        'When_an_item_is_created': {'type': 'OpenApiConnection'}
+    }
+    definition = {
+        'name': flow_id,
+        'properties': {
+            'displayName': name,
+            'state': state,
+            'definition': {'triggers': triggers, 'actions': {}},
+            'connectionReferences': {
+                'shared_sharepointonline': {'id': '/providers/Microsoft.PowerApps/apis/shared_sharepointonline'}
+            }
+        }
+    }
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('manifest.json', json.dumps({'details': {'displayName': name, 'creator': 'Ana'}}))
+        archive.writestr(f'Microsoft.Flow/flows/{flow_id}/definition.json', json.dumps(definition))
+    return buffer.getvalue()
+
+def solution_package():
+    """Solución con dos flujos, uno de ellos desactivado"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as archive:
+        archive.writestr('solution.xml', (
+            '<ImportExportXml><SolutionManifest><UniqueName>ventas</UniqueName>'
+            '<LocalizedNames><LocalizedName description="Ventas" languagecode="1033" /></LocalizedNames>'
+            '</SolutionManifest></ImportExportXml>'
+        ))
+        archive.writestr('customizations.xml', (
+            '<ImportExportXml><Workflows>'
+            '<Workflow WorkflowId="{11111111-1111-1111-1111-111111111111}" Name="Cierre diario">'
+            '<JsonFileName>/Workflows/Cierre-11111111-1111-1111-1111-111111111111.json</JsonFileName>'
+            '<StateCode>1</StateCode></Workflow>'
+            '<Workflow WorkflowId="{22222222-2222-2222-2222-222222222222}" Name="Aviso">'
+            '<JsonFileName>/Workflows/Aviso-22222222-2222-2222-2222-222222222222.json</JsonFileName>'
+            '<StateCode>0</StateCode></Workflow>'
+            '</Workflows></ImportExportXml>'
+        ))
+        daily = {'frequency': 'Day', 'interval': 1, 'schedule': {'hours': ['18'], 'minutes': [30]}}
+        for stem, recurrence in (
+            ('Cierre-11111111-1111-1111-1111-111111111111', daily),
+            ('Aviso-22222222-2222-2222-2222-222222222222', None),
+        ):
+            triggers = {'Recurrence': {'recurrence': recurrence}} if recurrence else {}
+            archive.writestr(f'Workflows/{stem}.json', json.dumps({
+                'properties': {
+                    'definition': {'triggers': triggers},
+                    'connectionReferences': {'ref': {'api': {'name': 'shared_teams'}}}
+                }
+            }))
+    return buffer.getvalue()
+
+class TestFlowPackageReader(unittest.TestCase):
+    """Pruebas para la lectura de paquetes exportados"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_schedule_from_definition(self):
+        """Prueba la traducción de recurrencias de Power Automate"""
+        def trigger(recurrence):
+            return {'triggers': {'Recurrence': {'recurrence': recurrence}}}
+
+        self.assertEqual(
+            schedule_from_definition(trigger({'frequency': 'Week', 'interval': 1, 'schedule': {
+                'weekDays': ['Monday', 'Friday'], 'hours': ['9'], 'minutes': [15]}})),
+            (RecurrenceType.WEEKLY, schedule_from_definition(trigger({
+                'frequency': 'Week', 'schedule': {'weekDays': ['Friday', 'Monday'], 'hours': [9], 'minutes': [15]}
+            }))[1])
+        )
+        recurrence, schedule = schedule_from_definition(trigger({'frequency': 'Minute', 'interval': 15}))
+        self.assertEqual((recurrence, schedule.cron), (RecurrenceType.CUSTOM, "*/15 * * * *"))
+
+        recurrence, schedule = schedule_from_definition(trigger({
+            'frequency': 'Month', 'interval': 1, 'startTime': '2024-01-05T07:00:00'
+        }))
+        self.assertEqual((recurrence, schedule.month_day, schedule.time_of_day),
+                         (RecurrenceType.MONTHLY, 5, time(7, 0)))
+
+        self.assertEqual(schedule_from_definition({'triggers': {'manual': {}}})[0], RecurrenceType.CUSTOM)
+
+    def test_nested_tenant_export(self):
+        """Prueba un archivo con paquetes sueltos y una solución anidados"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            archive.writestr('flows/a.zip', legacy_package('aaa', 'Reporte', {'frequency': 'Day', 'interval': 1}))
+            archive.writestr('flows/b.zip', legacy_package('bbb', 'Alerta', state='Stopped'))
+            archive.writestr('solutions/ventas.zip', solution_package())
+        path = self._write('tenant.zip', buffer.getvalue())
+
+        packages = sorted(read_flow_packages(path), key=lambda package: package.project.name)
+
+        self.assertEqual([package.project.name for package in packages], ['Ventas', 'tenant'])
+        solution, tenant = packages
+        self.assertEqual(solution.project.external_id, 'solution:ventas')
+        self.assertEqual(
+            [(flow.name, flow.status, flow.recurrence, flow.connection) for flow in solution.flows],
+            [('Cierre diario', FlowStatus.ACTIVE, RecurrenceType.DAILY, 'teams'),
+             ('Aviso', FlowStatus.INACTIVE, RecurrenceType.CUSTOM, 'teams')]
+        )
+        self.assertEqual(solution.flows[0].schedule.time_of_day, time(18, 30))
+        self.assertEqual({flow.external_id for flow in tenant.flows}, {'aaa', 'bbb'})
+        self.assertEqual({flow.owner for flow in tenant.flows}, {'Ana'})
+        self.assertEqual(tenant.flows[0].connection, 'sharepointonline')
+
+class TestFlowImportService(unittest.TestCase):
+    """Pruebas para la importación de paquetes a la base de datos"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.flow_repository = SQLiteFlowRepository()
+        self.definition_repository = SQLiteFlowDefinitionRepository()
+        self.service = FlowImportService(
+            SQLiteProjectRepository(), self.flow_repository, self.definition_repository, read_flow_packages
+        )
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_reimport_updates_instead_of_duplicating(self):
+        """Prueba que reimportar un paquete actualiza los flujos existentes"""
+        path = os.path.join(self.temp_dir.name, 'ventas.zip')
+        with open(path, 'wb') as file:
+            file.write(solution_package())
+
+        first = self.service.import_packages([path], batch_size=1)
+        self.assertEqual((first.projects, first.flows_created, first.flows_updated), (1, 2, 0))
+
+        # Cambios hechos en la aplicación que la reimportación debe conservar
+        flow = self.flow_repository.get_all_by_project(1)[0]
+        flow.owner = "Luis"
+        self.flow_repository.update(flow)
+
+        second = self.service.import_packages([path])
+        self.assertEqual((second.flows_created, second.flows_updated), (0, 2))
+        self.assertEqual(self.db.fetch_one("SELECT COUNT(*) AS total FROM projects")['total'], 1)
+        self.assertEqual(self.flow_repository.get_by_id(flow.id).owner, "Luis")
+
+        daily = next(f for f in self.flow_repository.get_all_by_project(1) if f.name == 'Cierre diario')
+        self.assertIsNotNone(daily.next_run_at)
+
+    def test_definitions_are_deduplicated_and_versioned(self):
+        """Prueba que los clones comparten un blob y que cada cambio agrega una versión"""
+        recurrence = {'frequency': 'Day', 'interval': 1}
+        paths = []
+        for index, flow_id in enumerate(('aaa', 'bbb')):
+            path = os.path.join(self.temp_dir.name, f'clon{index}.zip')
+            with open(path, 'wb') as file:
+                file.write(legacy_package(flow_id, f'Clon {index}', recurrence))
+            paths.append(path)
+
+        self.service.import_packages(paths)
+
+        stats = self.definition_repository.get_storage_stats()
+        self.assertEqual((stats.blobs, stats.references), (1, 2))
+        self.assertLess(stats.stored_bytes, stats.raw_bytes)
+
+        # Reimportar el primer paquete con otra recurrencia crea una versión nueva
+        with open(paths[0], 'wb') as file:
+            file.write(legacy_package('aaa', 'Clon 0', {'frequency': 'Hour', 'interval': 2}))
+        self.service.import_packages(paths[:1])
+
+        flows = {
+            flow.external_id: flow
+            for project_id in (1, 2) for flow in self.flow_repository.get_all_by_project(project_id)
+        }
+        self.assertNotEqual(flows['aaa'].definition_hash, flows['bbb'].definition_hash)
+        self.assertIsNone(flows['aaa'].definition)  # las lecturas no traen la definición
+        self.assertEqual(len(self.definition_repository.get_versions(flows['aaa'].id)), 2)
+        self.assertEqual(self.definition_repository.get_storage_stats().blobs, 2)
+
+        flow_service = FlowService(self.flow_repository, self.definition_repository)
+        definition = json.loads(flow_service.get_flow_definition(flows['aaa'].id))
+        self.assertEqual(definition['triggers']['Recurrence']['recurrence']['frequency'], 'Hour')
+
+    def test_invalid_file_is_reported(self):
+        """Prueba que un archivo inválido no detiene la importación"""
+        path = os.path.join(self.temp_dir.name, 'roto.zip')
+        with open(path, 'wb') as file:
+            file.write(b'no es un zip')
+
+        summary = self.service.import_packages([path])
+
+        self.assertEqual(summary.files, 1)
+        self.assertEqual(len(summary.errors), 1)
+        self.assertIn('roto.zip', summary.errors[0])
+
+if __name__ == '__main__':
+    unittest.main()
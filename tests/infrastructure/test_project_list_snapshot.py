@@ -0,0 +1,50 @@
+import json
+import os
+import tempfile
+import unittest
+
+from app.infrastructure.database.project_list_snapshot import ProjectListSnapshot
+
+class TestProjectListSnapshot(unittest.TestCase):
+    """Pruebas para la copia local del listado de proyectos"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.snapshot = ProjectListSnapshot(os.path.join(self.temp_dir.name, 'test.db'))
+        self.projects = [{'id': 1, 'name': 'Ventas', 'created_at': '01/01/2024',
+                          'status': 'active', 'is_active': True}]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_save_and_load(self):
+        """Prueba que se recupera el listado con su versión de datos"""
+        self.assertIsNone(self.snapshot.load())
+        self.snapshot.save(self.projects, 42)
+
+        snapshot = self.snapshot.load()
+        self.assertEqual(snapshot.change_seq, 42)
+        self.assertEqual(snapshot.projects, self.projects)
+        self.assertFalse(os.path.exists(self.snapshot.path + '.tmp'))
+
+    def test_other_schema_version_is_ignored(self):
+        """Prueba que una copia de otra versión del esquema no se usa"""
+        self.snapshot.save(self.projects, 42)
+        with open(self.snapshot.path, encoding='utf-8') as source:
+            data = json.load(source)
+        data['schema_version'] += 1
+        with open(self.snapshot.path, 'w', encoding='utf-8') as output:
+            json.dump(data, output)
+
+        self.assertIsNone(self.snapshot.load())
+
+    def test_corrupt_file_is_ignored(self):
+        """Prueba que un archivo dañado no impide arrancar"""
+        with open(self.snapshot.path, 'w', encoding='utf-8') as output:
+            output.write('{"format": 1, "proj')
+
+        self.assertIsNone(self.snapshot.load())
+
+
+if __name__ == '__main__':
+    unittest.main()
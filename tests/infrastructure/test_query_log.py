@@ -0,0 +1,78 @@
+import unittest
+import json
+import os
+import tempfile
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.query_log import QueryLog
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestQueryLog(unittest.TestCase):
+    """Pruebas para el registro de consultas y la captura de planes"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.project = SQLiteProjectRepository().create(Project(name="Ventas"))
+        self.flow_repository = SQLiteFlowRepository()
+        self.flow_repository.upsert_many([
+            Flow(project_id=self.project.id, name=f"Flujo {index}", external_id=f"ext-{index}")
+            for index in range(20)
+        ])
+        self.log_file = os.path.join(self.temp_dir.name, 'logs', 'queries.log')
+
+    def tearDown(self):
+        self.db.disable_query_log()
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_records_statements_and_flags_full_scans(self):
+        """Prueba que se registran las sentencias y que el plan marca los recorridos completos"""
+        query_log = self.db.enable_query_log(QueryLog(slow_ms=0, log_file=self.log_file))
+        flows = self.flow_repository.get_all_by_project(self.project.id)
+        self.db.fetch_tuples("SELECT COUNT(*) FROM flows WHERE owner = ?", ('ana@yape.com',))
+
+        by_sql = {stats.sql: stats for stats in query_log.top()}
+        listing = by_sql["SELECT * FROM flows WHERE project_id = ? ORDER BY created_at DESC"]
+        self.assertEqual((listing.count, listing.rows), (1, len(flows)))
+        self.assertEqual(listing.full_scans, [])  # usa idx_flows_project_created
+        self.assertEqual(by_sql["SELECT COUNT(*) FROM flows WHERE owner = ?"].full_scans, ['flows'])
+
+        slow = query_log.recent_slow()[0]
+        self.assertEqual((slow.params, slow.rows), ('(str)', 1))
+        self.assertTrue(any(step.startswith('SCAN flows') for step in slow.plan))
+
+        with open(self.log_file, encoding='utf-8') as log:
+            entries = [json.loads(line) for line in log]
+        self.assertEqual(entries[-1]['full_scans'], ['flows'])
+        self.assertNotIn('ana@yape.com', json.dumps(entries))  # solo la forma de los parámetros
+
+    def test_records_writes_from_writer_thread(self):
+        """Prueba que las escrituras que pasan por el hilo escritor también quedan registradas"""
+        query_log = self.db.enable_query_log(QueryLog(slow_ms=0, log_file=None))
+        project_repository = SQLiteProjectRepository()
+        project = project_repository.create(Project(name="Finanzas"))
+        project_repository.delete(project.id)
+
+        statements = [stats for stats in query_log.top() if stats.sql.startswith(('INSERT INTO projects', 'DELETE FROM projects'))]
+        self.assertEqual(sorted((stats.sql.split()[0], stats.count, stats.rows) for stats in statements),
+                         [('DELETE', 1, 1), ('INSERT', 1, 1)])
+        self.assertTrue(all(record.thread == 'db-writer' for record in query_log.recent_slow()
+                            if record.sql in {stats.sql for stats in statements}))
+
+    def test_plan_only_above_threshold(self):
+        """Prueba que las consultas rápidas no piden EXPLAIN QUERY PLAN"""
+        query_log = self.db.enable_query_log(QueryLog(slow_ms=10_000, log_file=None))
+        self.flow_repository.get_by_id(1)
+        self.assertEqual(query_log.recent_slow(), [])
+        self.assertEqual(sum(stats.slow for stats in query_log.top()), 0)
+        self.assertGreater(sum(stats.count for stats in query_log.top()), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
 import unittest
 import os
 import tempfile
-from datetime import datetime
+from datetime import datetime, time
 
+from app.application.services.flow_service import FlowService
 from app.domain.entities.project import Project, ProjectStatus
 from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+from app.domain.entities.schedule import Schedule
 from app.infrastructure.database.connection import Database
 from app.infrastructure.database.schema import DatabaseSchema
 from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
@@ -52,6 +54,14 @@ class TestSQLiteRepositories(unittest.TestCase):
         self.assertEqual(created_project.name, "Test Project")
         self.assertEqual(created_project.status, ProjectStatus.ACTIVE)
     
+    def test_project_repository_upsert_by_external_id(self):
+        """Prueba que reimportar un proyecto actualiza el existente y devuelve su ID"""
+        first = self.project_repository.upsert_by_external_id(Project(name="Ventas", external_id="env-1"))
+        second = self.project_repository.upsert_by_external_id(Project(name="Ventas LATAM", external_id="env-1"))
+        
+        self.assertEqual(second.id, first.id)
+        self.assertEqual(self.project_repository.get_by_id(first.id).name, "Ventas LATAM")
+    
     def test_project_repository_get_by_id(self):
         """Prueba obtener un proyecto por su ID"""
         project = Project(name="Test Project", status=ProjectStatus.ACTIVE)
@@ -261,4 +271,95 @@ class TestSQLiteRepositories(unittest.TestCase):
         self.assertIsNone(self.flow_repository.get_by_id(created_flow.id))
 
 # tests/infrastructure/__init__.py
-# Archivo vacío para permitir importaciones
\ No newline at end of file
+# Archivo vacío para permitir importaciones
+    
+    def test_flow_repository_schedule_round_trip(self):
+        """Prueba que la programación y la próxima ejecución se guardan"""
+        project = self.project_repository.create(Project(name="Test Project"))
+        flow = Flow(
+            project_id=project.id,
+            name="Scheduled Flow",
+            recurrence=RecurrenceType.WEEKLY,
+            owner="Test Owner",
+            schedule=Schedule(time_of_day=time(7, 30), weekdays=[0, 3]),
+            next_run_at=datetime(2024, 3, 7, 7, 30)
+        )
+        created_flow = self.flow_repository.create(flow)
+        
+        retrieved_flow = self.flow_repository.get_by_id(created_flow.id)
+        self.assertEqual(retrieved_flow.schedule.time_of_day, time(7, 30))
+        self.assertEqual(retrieved_flow.schedule.weekdays, [0, 3])
+        self.assertEqual(retrieved_flow.next_run_at, datetime(2024, 3, 7, 7, 30))
+    
+    def test_flow_repository_get_due_between(self):
+        """Prueba la consulta de flujos por rango de próxima ejecución"""
+        project = self.project_repository.create(Project(name="Test Project"))
+        for hour, status in [(9, FlowStatus.ACTIVE), (10, FlowStatus.ACTIVE),
+                             (10, FlowStatus.INACTIVE), (12, FlowStatus.ACTIVE)]:
+            self.flow_repository.create(Flow(
+                project_id=project.id,
+                name=f"Flow {hour}",
+                owner="Test Owner",
+                status=status,
+                next_run_at=datetime(2024, 3, 4, hour, 0)
+            ))
+        
+        due = self.flow_repository.get_due_between(
+            datetime(2024, 3, 4, 9, 30), datetime(2024, 3, 4, 11, 0)
+        )
+        
+        self.assertEqual([f.name for f in due], ["Flow 10"])
+    
+    def test_flow_repository_update_next_runs(self):
+        """Prueba la actualización en bloque de las próximas ejecuciones"""
+        project = self.project_repository.create(Project(name="Test Project"))
+        flow = self.flow_repository.create(Flow(
+            project_id=project.id, name="Flow", owner="Test Owner"
+        ))
+        
+        self.assertEqual(
+            [f.id for f in self.flow_repository.get_pending_schedule(datetime(2024, 3, 4))],
+            [flow.id]
+        )
+        
+        self.flow_repository.update_next_runs([(flow.id, datetime(2024, 3, 5, 0, 0))])
+        
+        self.assertEqual(self.flow_repository.get_pending_schedule(datetime(2024, 3, 4)), [])
+        self.assertEqual(
+            self.flow_repository.get_by_id(flow.id).next_run_at, datetime(2024, 3, 5, 0, 0)
+        )
+    
+    def test_refresh_next_runs_in_batches(self):
+        """Prueba que se recalculan por bloques solo los flujos vencidos o sin calcular"""
+        project = self.project_repository.create(Project(name="Test Project"))
+        now = datetime(2024, 3, 4, 12, 0)
+        for index in range(5):
+            self.flow_repository.create(Flow(
+                project_id=project.id, name=f"Flow {index}", owner="Test Owner",
+                schedule=Schedule(time_of_day=time(8, 0)),
+                next_run_at=datetime(2024, 3, 1, 8, 0) if index % 2 else None
+            ))
+        upcoming = self.flow_repository.create(Flow(
+            project_id=project.id, name="Upcoming", owner="Test Owner",
+            next_run_at=datetime(2024, 3, 4, 18, 0)
+        ))
+        # Desencadenado por un evento: nunca tiene próxima ejecución
+        self.flow_repository.create(Flow(
+            project_id=project.id, name="Event", owner="Test Owner", recurrence=RecurrenceType.CUSTOM
+        ))
+        service = FlowService(self.flow_repository)
+        
+        self.assertTrue(self.flow_repository.has_pending_schedule(now))
+        self.assertEqual(service.refresh_next_runs(now, batch_size=2), 5)
+        
+        commits = self.db.writer.commits
+        self.assertFalse(self.flow_repository.has_pending_schedule(now))
+        self.assertEqual(service.refresh_next_runs(now), 0)
+        self.assertEqual(self.db.writer.commits, commits)
+        next_runs = {flow.name: flow.next_run_at for flow in self.flow_repository.get_all_by_project(project.id)}
+        self.assertIsNone(next_runs.pop("Event"))
+        self.assertEqual(next_runs.pop("Upcoming"), upcoming.next_run_at)
+        self.assertEqual(set(next_runs.values()), {datetime(2024, 3, 5, 8, 0)})
+        
+        with self.assertRaises(ValueError):
+            service.create_flow(project.id, "Sin cron", RecurrenceType.CUSTOM, "Test Owner")
@@ -0,0 +1,183 @@
+import unittest
+import os
+import json
+import tempfile
+from datetime import datetime
+
+from app.application.services.flow_run_service import FlowRunService
+from app.domain.entities.flow import Flow, FlowStatus, RecurrenceType
+from app.domain.entities.flow_run import FlowRun, RunStatus
+from app.domain.entities.project import Project, ProjectStatus
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.importers.run_history_reader import parse_duration_ms, read_run_history
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_flow_run_repository import SQLiteFlowRunRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestRunHistoryReader(unittest.TestCase):
+    """Pruebas para la lectura de historiales exportados"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_read_csv(self):
+        """Prueba la lectura de un CSV con encabezados de Power Automate"""
+        path = self._write('runs.csv', (
+            "Flow,Start time,Duration,Status\n"
+            "Reporte,2024-03-04T08:00:00,00:00:05.5,Succeeded\n"
+            "Reporte,04/03/2024 09:00,PT1M,Failed\n"
+        ))
+
+        runs = list(read_run_history(path))
+
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(runs[0].flow_name, "Reporte")
+        self.assertEqual(runs[0].started_at, datetime(2024, 3, 4, 8, 0))
+        self.assertEqual(runs[0].duration_ms, 5500)
+        self.assertEqual(runs[1].started_at, datetime(2024, 3, 4, 9, 0))
+        self.assertEqual(runs[1].duration_ms, 60000)
+        self.assertEqual(runs[1].status, RunStatus.FAILED)
+
+    def test_read_json_array_in_chunks(self):
+        """Prueba que un arreglo JSON se recorre por bloques sin perder elementos"""
+        items = [
+            {'flow_id': 1, 'properties': {
+                'startTime': f'2024-03-04T08:{minute:02d}:00',
+                'endTime': f'2024-03-04T08:{minute:02d}:02',
+                'status': 'Succeeded'
+            }}
+            for minute in range(60)
+        ]
+        path = self._write('runs.json', json.dumps(items, indent=2))
+
+        from app.infrastructure.importers import run_history_reader
+        original = run_history_reader.JSON_CHUNK_SIZE
+        run_history_reader.JSON_CHUNK_SIZE = 100
+        try:
+            runs = list(read_run_history(path))
+        finally:
+            run_history_reader.JSON_CHUNK_SIZE = original
+
+        self.assertEqual(len(runs), 60)
+        self.assertEqual(runs[-1].started_at, datetime(2024, 3, 4, 8, 59))
+        self.assertTrue(all(run.duration_ms == 2000 and run.flow_id == 1 for run in runs))
+
+    def test_invalid_row(self):
+        """Prueba que un registro inválido indica su posición"""
+        path = self._write('runs.jsonl', '{"start": "2024-03-04T08:00:00", "status": "Unknown"}\n')
+
+        with self.assertRaisesRegex(ValueError, "Registro 1"):
+            list(read_run_history(path))
+
+    def test_parse_duration(self):
+        """Prueba los formatos de duración"""
+        self.assertEqual(parse_duration_ms("1.25"), 1250)
+        self.assertEqual(parse_duration_ms("350", "duration_ms"), 350)
+        self.assertEqual(parse_duration_ms("01:02:03"), 3723000)
+        self.assertEqual(parse_duration_ms("PT1H0.5S"), 3600500)
+
+class TestFlowRunRepository(unittest.TestCase):
+    """Pruebas para el historial de ejecuciones particionado"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Configuración inicial para las pruebas"""
+        cls.temp_db_fd, cls.temp_db_path = tempfile.mkstemp()
+        Database._instance = None  # Reset singleton
+        cls.db = Database(cls.temp_db_path)
+        DatabaseSchema.create_tables()
+
+        cls.project_repository = SQLiteProjectRepository()
+        cls.flow_repository = SQLiteFlowRepository()
+        cls.run_repository = SQLiteFlowRunRepository()
+        cls.run_service = FlowRunService(cls.run_repository, cls.flow_repository)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Limpieza después de las pruebas"""
+        cls.db.disconnect()
+        os.close(cls.temp_db_fd)
+        os.unlink(cls.temp_db_path)
+
+    def setUp(self):
+        """Configuración para cada prueba"""
+        DatabaseSchema.drop_tables()
+        DatabaseSchema.create_tables()
+        project = self.project_repository.create(Project(name="Test Project", status=ProjectStatus.ACTIVE))
+        self.project_id = project.id
+        self.flow = self.flow_repository.create(Flow(
+            project_id=project.id,
+            name="Reporte",
+            recurrence=RecurrenceType.DAILY,
+            owner="Owner",
+            status=FlowStatus.ACTIVE
+        ))
+
+    def _run(self, started_at, duration_ms=1000, status=RunStatus.SUCCEEDED):
+        return FlowRun(flow_id=self.flow.id, started_at=started_at, duration_ms=duration_ms, status=status)
+
+    def test_runs_are_partitioned_by_month(self):
+        """Prueba que cada mes se guarda en su partición y la vista las une"""
+        self.run_repository.add_runs([
+            self._run(datetime(2024, 2, 29, 23, 0)),
+            self._run(datetime(2024, 3, 1, 0, 30)),
+        ])
+
+        tables = {row['name'] for row in self.db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'flow_runs_%'"
+        )}
+        self.assertEqual(tables, {'flow_runs_202402', 'flow_runs_202403'})
+        self.assertEqual(self.db.fetch_one("SELECT COUNT(*) AS total FROM flow_runs")['total'], 2)
+
+        runs = self.run_repository.get_runs(self.flow.id, datetime(2024, 2, 15), datetime(2024, 3, 2))
+        self.assertEqual([run.started_at for run in runs],
+                         [datetime(2024, 2, 29, 23, 0), datetime(2024, 3, 1, 0, 30)])
+
+    def test_daily_rollups_are_incremental(self):
+        """Prueba que los resúmenes diarios se actualizan con cada lote"""
+        day = datetime(2024, 3, 4)
+        self.run_repository.add_runs([
+            self._run(day.replace(hour=hour), duration_ms=hour * 1000) for hour in range(1, 11)
+        ])
+        # Segundo lote: una ejecución nueva fallida y una reimportada (se reemplaza)
+        self.run_repository.add_runs([
+            self._run(day.replace(hour=12), duration_ms=60000, status=RunStatus.FAILED),
+            self._run(day.replace(hour=1), duration_ms=1000),
+        ])
+
+        rollup = self.db.fetch_one("SELECT * FROM flow_run_daily WHERE flow_id = ?", (self.flow.id,))
+        self.assertEqual(rollup['runs'], 11)
+        self.assertEqual(rollup['failures'], 1)
+        self.assertEqual(rollup['p50_duration_ms'], 6000)
+        self.assertEqual(rollup['p95_duration_ms'], 60000)
+
+        health = self.run_service.get_project_health(self.project_id, days=7, today=day)
+        self.assertEqual(health[self.flow.id].runs, 11)
+        self.assertEqual(health[self.flow.id].level, "warning")
+        self.assertEqual(health[self.flow.id].last_run_at, day.replace(hour=12))
+
+    def test_import_resolves_flows_by_name(self):
+        """Prueba la importación por lotes resolviendo los flujos por nombre"""
+        runs = [
+            FlowRun(started_at=datetime(2024, 3, 4, minute // 60, minute % 60), flow_name="reporte")
+            for minute in range(25)
+        ] + [FlowRun(started_at=datetime(2024, 3, 4, 9, 0), flow_name="Otro flujo")]
+
+        summary = self.run_service.import_runs(runs, self.project_id, batch_size=10)
+
+        self.assertEqual(summary.imported, 25)
+        self.assertEqual(summary.skipped, 1)
+        self.assertEqual(summary.batches, 3)
+
+if __name__ == '__main__':
+    unittest.main()
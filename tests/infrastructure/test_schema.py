@@ -0,0 +1,54 @@
+import unittest
+import os
+import tempfile
+
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema, SCHEMA_VERSION
+
+class TestDatabaseSchema(unittest.TestCase):
+    """Pruebas para la versión del esquema y el arranque sin DDL"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+
+    def tearDown(self):
+        self.db.disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _index_exists(self, name):
+        return bool(self.db.fetch_tuples(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+        ))
+
+    def test_create_tables_records_version(self):
+        """Prueba que crear el esquema guarda su versión"""
+        self.assertEqual(DatabaseSchema.schema_version(), 0)
+        DatabaseSchema.create_tables()
+        self.assertEqual(DatabaseSchema.schema_version(), SCHEMA_VERSION)
+
+    def test_current_version_skips_ddl(self):
+        """Prueba que con la versión al día no se vuelve a ejecutar el DDL"""
+        DatabaseSchema.create_tables()
+        self.db.execute("DROP INDEX idx_flows_next_run_at")
+
+        DatabaseSchema.create_tables()
+        self.assertFalse(self._index_exists('idx_flows_next_run_at'))
+
+        # Otra versión (p. ej. una base anterior) vuelve a pasar por el DDL
+        self.db.execute("PRAGMA user_version = 0")
+        DatabaseSchema.create_tables()
+        self.assertTrue(self._index_exists('idx_flows_next_run_at'))
+
+    def test_drop_tables_resets_version(self):
+        """Prueba que después de borrar las tablas se vuelven a crear"""
+        DatabaseSchema.create_tables()
+        DatabaseSchema.drop_tables()
+        DatabaseSchema.create_tables()
+        self.assertEqual(self.db.fetch_tuples("SELECT COUNT(*) FROM projects")[0][0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
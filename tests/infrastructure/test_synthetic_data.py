@@ -0,0 +1,89 @@
+import unittest
+import os
+import tempfile
+
+from app.application.services.change_feed_service import ChangeFeedService
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.database.synthetic_data import SyntheticDataSpec, generate_synthetic_data, zipf_counts
+from app.infrastructure.repositories.sqlite_change_log_repository import SQLiteChangeLogRepository
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+class TestSyntheticData(unittest.TestCase):
+    """Pruebas para el generador de datos sintéticos"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+
+    def tearDown(self):
+        Database().disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _generate(self, name, spec):
+        Database._instance = None
+        db = Database(os.path.join(self.temp_dir.name, name))
+        DatabaseSchema.create_tables()
+        generate_synthetic_data(spec)
+        rows = db.fetch_tuples("SELECT * FROM flows ORDER BY id")
+        db.disconnect()
+        return rows
+
+    def test_zipf_counts(self):
+        """Prueba que el reparto suma exacto y decrece con el rango"""
+        counts = zipf_counts(1000, 10, 1.2)
+        self.assertEqual(sum(counts), 1000)
+        self.assertEqual(counts, sorted(counts, reverse=True))
+        self.assertGreater(counts[0], 5 * counts[-1])
+        self.assertEqual(zipf_counts(10, 5, 0), [2, 2, 2, 2, 2])
+
+    def test_reproducible_and_consistent(self):
+        """Prueba que la misma semilla genera los mismos datos y que son coherentes"""
+        spec = SyntheticDataSpec(projects=20, flows=3000, owners=40, seed=7)
+        first = self._generate('a.db', spec)
+        self.assertEqual(first, self._generate('b.db', spec))
+        self.assertNotEqual(first, self._generate('c.db', SyntheticDataSpec(projects=20, flows=3000, seed=8)))
+
+        Database._instance = None
+        db = Database(os.path.join(self.temp_dir.name, 'a.db'))
+        self.assertEqual(db.fetch_tuples("SELECT COUNT(*), COUNT(DISTINCT owner) FROM flows")[0], (3000, 40))
+        active = db.fetch_tuples("SELECT AVG(status = 'active') FROM flows")[0][0]
+        self.assertAlmostEqual(active, spec.active_ratio, delta=0.05)
+        # Programación según la recurrencia; solo los activos tienen próxima ejecución
+        self.assertEqual(db.fetch_tuples("""
+            SELECT COUNT(*) FROM flows
+            WHERE (recurrence = 'Semanal') != (schedule_weekdays != '')
+               OR (recurrence = 'Mensual') != (schedule_month_day IS NOT NULL)
+               OR (recurrence = 'Personalizada') != (schedule_cron != '')
+               OR (status = 'active') != (next_run_at IS NOT NULL)
+        """)[0][0], 0)
+        # Los índices de flows se recrearon tras la carga y las filas se leen como entidades
+        indexes = {row[0] for row in db.fetch_tuples("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'flows'")}
+        self.assertIn('idx_flows_project_created', indexes)
+        flows, total = SQLiteFlowRepository().get_page_by_project(1, 0, 10)
+        self.assertEqual(total, zipf_counts(3000, 20, spec.project_skew)[0])
+        self.assertEqual(len(flows), 10)
+
+    def test_bulk_load_logs_a_single_refresh(self):
+        """Prueba que la carga no registra un cambio por fila sino un único REFRESH, y que los triggers vuelven"""
+        Database._instance = None
+        db = Database(os.path.join(self.temp_dir.name, 'log.db'))
+        DatabaseSchema.create_tables()
+        feed = ChangeFeedService(SQLiteChangeLogRepository())
+        cursor = feed.current_cursor()
+        triggers = db.fetch_tuples("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' ORDER BY name")
+
+        generate_synthetic_data(SyntheticDataSpec(projects=5, flows=200))
+        changes = feed.read_since(cursor).changes
+        self.assertEqual([(change.entity, change.operation) for change in changes], [('*', 'refresh')])
+        self.assertEqual(db.fetch_tuples("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' ORDER BY name"),
+                         triggers)
+
+        SQLiteProjectRepository().create(Project(name="Después de la carga"))
+        self.assertEqual([change.operation for change in feed.read_since(changes[-1].seq).changes], ['insert'])
+
+if __name__ == '__main__':
+    unittest.main()
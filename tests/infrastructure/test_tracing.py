@@ -0,0 +1,85 @@
+import unittest
+import json
+import os
+import tempfile
+
+from app.application.services.flow_service import FlowService
+from app.application.use_cases.flow_use_cases import FlowUseCases
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.utils.tracing import LatencyHistogram, span, tracer
+
+class TestTracing(unittest.TestCase):
+    """Pruebas para las trazas de las rutas calientes"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.project = SQLiteProjectRepository().create(Project(name="Ventas"))
+        self.use_cases = FlowUseCases(FlowService(SQLiteFlowRepository()))
+        tracer.reset()
+
+    def tearDown(self):
+        tracer.disable()
+        tracer.reset()
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def test_disabled_records_nothing(self):
+        """Prueba que sin activar las trazas no se guarda ningún span"""
+        self.use_cases.add_new_flow(self.project.id, "Pedido", "Diaria", "ana@yape.com")
+        self.use_cases.list_flows_by_project(self.project.id)
+        self.assertEqual(len(tracer.events), 0)
+        self.assertEqual(tracer.histograms, {})
+
+    def test_spans_are_nested_across_layers_and_threads(self):
+        """Prueba que los spans se enlazan con su padre, también en el hilo escritor"""
+        tracer.enable()
+        with span('prueba.abrir_proyecto', project_id=self.project.id):
+            self.use_cases.add_new_flow(self.project.id, "Pedido", "Diaria", "ana@yape.com")
+            self.use_cases.list_flows_by_project(self.project.id)
+
+        events = {}
+        for name, category, _, _, tid, span_id, parent_id, args in tracer.events:
+            events.setdefault(name, []).append((category, tid, span_id, parent_id, args))
+        root_id = events['prueba.abrir_proyecto'][0][2]
+
+        listing = events['FlowUseCases.list_flows_by_project'][0]
+        self.assertEqual(listing[3], root_id)
+        self.assertEqual(listing[0], 'use_case')
+        self.assertIn('FlowUseCases._format_flow', events)
+        self.assertIn('SQLiteFlowRepository._map_to_entity', events)
+        queries = [args['sql'] for spans in events.values() for category, _, _, _, args in spans
+                   if category == 'sqlite' and args and 'sql' in args]
+        self.assertTrue(any(sql.startswith('SELECT') for sql in queries))
+
+        # La escritura corre en el hilo escritor pero cuelga del caso de uso que la pidió
+        create = events['SQLiteFlowRepository.create'][0]
+        job = events['Database.write_job'][0]
+        self.assertEqual(job[3], create[2])
+        self.assertNotEqual(job[1], create[1])
+
+        trace = tracer.chrome_trace()['traceEvents']
+        json.dumps(trace)
+        self.assertTrue(all(event['ph'] in ('X', 'M') for event in trace))
+        self.assertEqual(tracer.summary()['FlowUseCases.list_flows_by_project']['count'], 1)
+
+    def test_histogram_percentiles(self):
+        """Prueba los percentiles aproximados del histograma de latencias"""
+        histogram = LatencyHistogram()
+        for ms in [0.3] * 90 + [7.0] * 9 + [120.0]:
+            histogram.add(ms)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['p50_ms'], 0.5)
+        self.assertEqual(summary['p95_ms'], 10)
+        self.assertEqual(summary['max_ms'], 120.0)
+        self.assertEqual(summary['buckets'], {'<=0.5ms': 90, '<=10ms': 9, '<=250ms': 1})
+
+if __name__ == '__main__':
+    unittest.main()
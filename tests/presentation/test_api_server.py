@@ -0,0 +1,120 @@
+import unittest
+import asyncio
+import gzip
+import http.client
+import json
+import os
+import tempfile
+import threading
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.presentation.api_server import create_api_server
+
+class TestApiServer(unittest.TestCase):
+    """Pruebas para el servidor HTTP/JSON"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.project = SQLiteProjectRepository().create(Project(name="Ventas"))
+        flow_repository = SQLiteFlowRepository()
+        for index in range(30):
+            flow_repository.create(Flow(project_id=self.project.id, name=f"Flujo {index}"))
+
+        # El servidor corre en su propio bucle de eventos, en otro hilo
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.server = create_api_server(workers=2, page_size=10, gzip_min_size=512)
+            self.address = self.loop.run_until_complete(self.server.start('127.0.0.1', 0))
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait(5)
+        self.client = http.client.HTTPConnection(*self.address, timeout=5)
+
+    def tearDown(self):
+        self.client.close()
+        asyncio.run_coroutine_threadsafe(self.server.stop(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def _request(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        self.client.request(method, path, body=data, headers=headers or {})
+        response = self.client.getresponse()
+        raw = response.read()
+        if response.getheader('Content-Encoding') == 'gzip':
+            raw = gzip.decompress(raw)
+        return response, json.loads(raw) if raw else None
+
+    def test_paginated_flows_with_etag_and_gzip(self):
+        """Prueba la paginación, la respuesta 304 con If-None-Match y la compresión"""
+        response, page = self._request('GET', f'/api/projects/{self.project.id}/flows?page=3')
+        self.assertEqual(response.status, 200)
+        self.assertEqual((page['total'], page['pages'], len(page['items'])), (30, 3, 10))
+        self.assertEqual(page['items'][-1]['name'], "Flujo 0")
+        self.assertIsNone(response.getheader('Content-Encoding'))
+
+        etag = response.getheader('ETag')
+        response, body = self._request('GET', f'/api/projects/{self.project.id}/flows?page=3',
+                                       headers={'If-None-Match': etag, 'Accept-Encoding': 'gzip'})
+        self.assertEqual((response.status, body), (304, None))
+
+        # Misma conexión (keep-alive): el contenido comprimido conserva el ETag
+        response, page = self._request('GET', f'/api/projects/{self.project.id}/flows?page=3',
+                                       headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(response.getheader('ETag'), etag)
+        self.assertEqual(len(page['items']), 10)
+
+        self.assertEqual(self._request('GET', '/api/projects?page_size=1000')[0].status, 400)
+
+    def test_paginated_projects(self):
+        """Prueba la paginación de proyectos y la comparación débil del ETag"""
+        repository = SQLiteProjectRepository()
+        for index in range(11):
+            repository.create(Project(name=f"Proyecto {index}"))
+
+        response, page = self._request('GET', '/api/projects?page=2')
+        self.assertEqual((page['total'], page['pages'], len(page['items'])), (12, 2, 2))
+        self.assertEqual([item['name'] for item in page['items']], ["Proyecto 0", "Ventas"])
+
+        strong = response.getheader('ETag')[2:]
+        response, _ = self._request('GET', '/api/projects?page=2', headers={'If-None-Match': strong})
+        self.assertEqual(response.status, 304)
+
+    def test_write_endpoints_and_errors(self):
+        """Prueba la creación y el cambio de estado, y los errores 404/405"""
+        response, flow = self._request('POST', f'/api/projects/{self.project.id}/flows',
+                                       {'name': "Nuevo", 'recurrence': "Diaria", 'owner': "ana"})
+        self.assertEqual((response.status, flow['name'], flow['is_active']), (201, "Nuevo", True))
+
+        response, flow = self._request('POST', f"/api/flows/{flow['id']}/toggle")
+        self.assertEqual((response.status, flow['is_active']), (200, False))
+
+        response, projects = self._request('GET', '/api/projects')
+        self.assertEqual([project['name'] for project in projects['items']], ["Ventas"])
+
+        self.assertEqual(self._request('GET', '/api/flows/999')[0].status, 404)
+        self.assertEqual(self._request('DELETE', '/api/projects')[0].status, 405)
+        response, error = self._request('POST', '/api/projects', {})
+        self.assertEqual(response.status, 400)
+        self.assertIn('name', error['error'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import unittest
+from PyQt6.QtWidgets import QApplication
+
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.presentation.controllers.change_feed_controller import ChangeFeedController
+
+class TestChangeFeedController(unittest.TestCase):
+    """Pruebas para la poda del registro de cambios desde el controlador"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.repository = SQLiteProjectRepository()
+
+    def tearDown(self):
+        self.db.disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _logged(self):
+        return self.db.fetch_tuples("SELECT COUNT(*) FROM change_log")[0][0]
+
+    def test_prunes_on_start_and_as_cursor_advances(self):
+        """Prueba que se conservan los últimos 'keep' cambios al iniciar y al avanzar el cursor"""
+        for index in range(10):
+            self.repository.create(Project(name=f"Proyecto {index}"))
+
+        controller = ChangeFeedController(keep=4)
+        controller.start()
+        controller.stop()
+        self.assertEqual(self._logged(), 4)
+
+        # Se podó hasta el cambio 6: la próxima poda llega con el cursor en 6 + 2 × keep
+        for index in range(3):
+            self.repository.create(Project(name=f"Nuevo {index}"))
+        controller.poll()
+        self.assertEqual(self._logged(), 7)
+
+        self.repository.create(Project(name="Uno más"))
+        controller.poll()
+        self.assertEqual(self._logged(), 4)
+        self.assertEqual(controller.cursor, controller.change_feed_service.current_cursor())
+
+
+if __name__ == '__main__':
+    unittest.main()
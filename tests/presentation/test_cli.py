@@ -0,0 +1,85 @@
+import unittest
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stdout
+
+from app.domain.entities.flow import Flow
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_flow_repository import SQLiteFlowRepository
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.presentation.cli import main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class TestCli(unittest.TestCase):
+    """Pruebas para la línea de comandos sin interfaz gráfica"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'test.db')
+        Database._instance = None  # Reset singleton
+        self.db = Database(self.db_path)
+        DatabaseSchema.create_tables()
+        flow_repository = SQLiteFlowRepository()
+        for project_name in ("Ventas", "Finanzas"):
+            project = SQLiteProjectRepository().create(Project(name=project_name))
+            for index in range(3):
+                flow_repository.create(Flow(project_id=project.id, name=f"{project_name} {index}"))
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.temp_dir.cleanup()
+
+    def _run(self, *args):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            code = main(['--db', self.db_path, *args])
+        return code, output.getvalue()
+
+    def test_export_flows_as_jsonl_and_csv(self):
+        """Prueba la exportación filtrada en los dos formatos"""
+        code, output = self._run('flows', '--project', '2')
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(code, 0)
+        self.assertEqual([record['name'] for record in records], ['Finanzas 0', 'Finanzas 1', 'Finanzas 2'])
+
+        code, output = self._run('flows', '--format', 'csv')
+        rows = list(csv.DictReader(io.StringIO(output)))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[0]['status'], 'active')
+
+    def test_bulk_status_change(self):
+        """Prueba que se desactivan en bloque los flujos de un proyecto y flujos sueltos"""
+        code, output = self._run('deactivate', '--project', '1')
+        self.assertEqual((code, json.loads(output)), (0, {'changed': 3}))
+
+        self._run('activate', '2')
+        code, output = self._run('flows', '--status', 'inactive', '-f', 'csv')
+        self.assertEqual([row['name'] for row in csv.DictReader(io.StringIO(output))], ['Ventas 0', 'Ventas 2'])
+
+        # Sin flujos ni proyecto es un error
+        self.assertEqual(self._run('activate')[0], 1)
+
+    def test_cli_does_not_import_qt(self):
+        """Prueba que la línea de comandos no carga PyQt"""
+        script = (
+            "import sys\n"
+            "from app.presentation.cli import main\n"
+            f"main(['--db', {self.db_path!r}, 'flows'])\n"
+            "print('PyQt6' in sys.modules, file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(len(result.stdout.splitlines()), 6)
+        self.assertEqual(result.stderr.strip(), 'False')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import time
+import unittest
+from unittest import mock
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from app.presentation.views import diagram_viewer_view
+from app.presentation.views.diagram_viewer_view import (
+    TileCache, TiledSvgWidget, TILE_SIZE, level_for_zoom, visible_tiles
+)
+
+class TestDiagramViewerTiles(unittest.TestCase):
+    """Pruebas para el cálculo y la caché de tiles del visor de diagramas"""
+
+    def test_level_for_zoom(self):
+        """Prueba que se elige el nivel que no pierde resolución"""
+        self.assertEqual(level_for_zoom(0.1), 0.25)
+        self.assertEqual(level_for_zoom(0.5), 0.5)
+        self.assertEqual(level_for_zoom(0.75), 1.0)
+        self.assertEqual(level_for_zoom(10), 4.0)
+
+    def test_visible_tiles_only_cover_viewport(self):
+        """Prueba que solo se piden los tiles que intersectan el viewport"""
+        viewport = QRectF(0, 0, TILE_SIZE * 2, TILE_SIZE)
+        tiles = visible_tiles(viewport, 1.0, 1.0, 5000, 5000)
+
+        self.assertEqual(tiles, [(0, 0), (1, 0)])
+
+    def test_visible_tiles_clipped_to_document(self):
+        """Prueba que no se piden tiles fuera del documento"""
+        viewport = QRectF(0, 0, 4000, 4000)
+        tiles = visible_tiles(viewport, 1.0, 1.0, TILE_SIZE, TILE_SIZE)
+
+        self.assertEqual(tiles, [(0, 0)])
+
+    def test_tile_cache_evicts_least_recently_used(self):
+        """Prueba que la caché descarta los tiles menos usados"""
+        image = QImage(TILE_SIZE, TILE_SIZE, QImage.Format.Format_ARGB32_Premultiplied)
+        cache = TileCache(max_bytes=image.sizeInBytes() * 2)
+
+        cache.put((1.0, 0, 0), image)
+        cache.put((1.0, 1, 0), image)
+        cache.get((1.0, 0, 0))
+        cache.put((1.0, 2, 0), image)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIn((1.0, 0, 0), cache)
+        self.assertNotIn((1.0, 1, 0), cache)
+        self.assertEqual(cache.used_bytes, image.sizeInBytes() * 2)
+
+
+class TestTiledSvgWidget(unittest.TestCase):
+    """Pruebas para las tareas de render del visor de diagramas"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_failed_tile_can_be_requested_again(self):
+        """Prueba que un tile cuyo render falla deja de figurar como pendiente"""
+        widget = TiledSvgWidget()
+        widget._content = b'<svg/>'
+        key = (1.0, 0, 0)
+        failing = mock.Mock(side_effect=RuntimeError("render"))
+        try:
+            with mock.patch.object(diagram_viewer_view, '_render_tile', failing):
+                widget._request_tile(key)
+                deadline = time.monotonic() + 5
+                while key in widget._pending and time.monotonic() < deadline:
+                    self.app.processEvents()
+                    time.sleep(0.01)
+                self.assertNotIn(key, widget._pending)
+
+                widget._request_tile(key)
+                self.assertIn(key, widget._pending)
+        finally:
+            widget.shutdown()
+            self.app.processEvents()
+            widget.deleteLater()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from PyQt6.QtWidgets import QApplication
+
+from app.domain.entities.project import Project
+from app.infrastructure.database.connection import Database
+from app.infrastructure.database.schema import DatabaseSchema
+from app.infrastructure.repositories.sqlite_project_repository import SQLiteProjectRepository
+from app.presentation.views.project_list_view import ProjectListView
+
+class TestProjectListViewWarmStart(unittest.TestCase):
+    """Pruebas para el arranque con la copia guardada del listado de proyectos"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.repository = SQLiteProjectRepository()
+        self.ventas = self.repository.create(Project(name="Ventas"))
+        self.repository.create(Project(name="Finanzas"))
+
+    def tearDown(self):
+        self.db.disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _wait_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            self.assertLess(time.monotonic(), deadline, "La vista no terminó de cargar")
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def _card_names(self, view):
+        return sorted(card.project_data['name'] for card in view._cards.values())
+
+    def test_snapshot_is_shown_and_reconciled(self):
+        """Prueba que se pinta la copia al crear la vista y luego se concilia con la base"""
+        first = ProjectListView()
+        self._wait_until(lambda: len(first._cards) == 2)
+        self.assertIsNotNone(first.snapshot.load())
+
+        self.ventas.name = "Ventas LATAM"
+        self.repository.update(self.ventas)
+
+        view = ProjectListView()
+        # Sin procesar eventos: las tarjetas salen de la copia guardada
+        self.assertEqual(self._card_names(view), ["Finanzas", "Ventas"])
+
+        self._wait_until(lambda: "Ventas LATAM" in self._card_names(view))
+        self.assertEqual(self._card_names(view), ["Finanzas", "Ventas LATAM"])
+        self.assertEqual(view.snapshot.load().change_seq,
+                         view.change_log_repository.get_cursor())
+
+
+class TestProjectListViewRefresh(unittest.TestCase):
+    """Pruebas para la recarga del listado con tarjetas reutilizadas"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        Database._instance = None  # Reset singleton
+        self.db = Database(os.path.join(self.temp_dir.name, 'test.db'))
+        DatabaseSchema.create_tables()
+        self.repository = SQLiteProjectRepository()
+        for index in range(30):
+            self.repository.create(Project(name=f"Proyecto {index}"))
+        self.view = ProjectListView()
+        self.view.refresh_projects()
+
+    def tearDown(self):
+        self.view.deleteLater()
+        self.app.processEvents()
+        self.db.disconnect()
+        Database._instance = None
+        self.temp_dir.cleanup()
+
+    def _refresh(self, times):
+        for _ in range(times):
+            self.view.refresh_projects()
+            self.app.processEvents()  # Destruye lo que se haya quitado con deleteLater
+
+    def test_refresh_reuses_cards(self):
+        """Prueba que recargar vuelve a mostrar las mismas tarjetas con los datos nuevos"""
+        cards = set(self.view._cards.values())
+        project = self.repository.get_all()[0]
+        project.name = "Renombrado"
+        self.repository.update(project)
+
+        self._refresh(1)
+        self.assertEqual(set(self.view._cards.values()), cards)
+        self.assertEqual(self.view._cards[project.id].name_label.text(), "Renombrado")
+
+    def test_deleted_card_leaves_no_gap(self):
+        """Prueba que al quitar la tarjeta de un proyecto borrado las siguientes ocupan su lugar"""
+        deleted = self.view._projects[4]['id']
+        self.repository.delete(deleted)
+        self.view.update_project(deleted)
+
+        self.assertNotIn(deleted, self.view._cards)
+        self.assertEqual(len(self.view._cards), 29)
+        layout = self.view.projects_layout
+        positions = [layout.getItemPosition(layout.indexOf(self.view._cards[project['id']]))[:2]
+                     for project in self.view._projects]
+        self.assertEqual(positions, [(index // 3, index % 3) for index in range(29)])
+
+    def test_repeated_refresh_does_not_leak(self):
+        """Prueba que recargar muchas veces no aumenta los widgets ni la memoria"""
+        tracemalloc.start()
+        try:
+            self._refresh(5)
+            widgets = len(QApplication.allWidgets())
+            before = tracemalloc.take_snapshot()
+            self._refresh(30)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(len(QApplication.allWidgets()), widgets)
+        growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        self.assertLess(growth, 64 * 1024)
+
+        # Un proyecto menos: su tarjeta queda guardada para la próxima recarga
+        self.repository.delete(self.repository.get_all()[0].id)
+        self._refresh(1)
+        self.assertEqual(len(self.view._cards), 29)
+        self.assertEqual(len(self.view._card_pool), 1)
+        self.assertEqual(len(QApplication.allWidgets()), widgets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication, QLabel
+
+from app.config import UI
+from app.presentation import theme
+
+class TestTheme(unittest.TestCase):
+    """Pruebas para la hoja de estilos de la aplicación"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_stylesheet_replaces_every_color(self):
+        """Prueba que la hoja compilada no deja colores sin reemplazar"""
+        self.assertNotRegex(theme.stylesheet(), r'@[a-z]')
+        self.assertEqual(theme.compile_stylesheet("QLabel { color: @error; }"), "QLabel { color: #f44336; }")
+        with self.assertRaises(KeyError):
+            theme.compile_stylesheet("QLabel { color: @rojo; }")
+
+    def test_set_state_restyles_widget(self):
+        """Prueba que cambiar el estado de un widget ya pulido cambia su estilo"""
+        label = QLabel("Activo")
+        label.setStyleSheet(theme.compile_stylesheet(
+            'QLabel[status="active"] { color: @success; } QLabel[status="inactive"] { color: @error; }'
+        ))
+        theme.set_state(label, "status", "active")
+        label.ensurePolished()
+        self.assertEqual(label.palette().windowText().color().name(), theme.PALETTE['success'])
+
+        theme.set_state(label, "status", "inactive")
+        self.assertEqual(label.palette().windowText().color().name(), theme.PALETTE['error'])
+
+    def test_shadows_follow_render_quality(self):
+        """Prueba que las sombras se quitan según la calidad de dibujo y el tamaño de la lista"""
+        with patch.dict(UI, {'render_quality': 'auto'}):
+            self.assertTrue(theme.use_shadows(10, 60))
+            self.assertFalse(theme.use_shadows(61, 60))
+        with patch.dict(UI, {'render_quality': 'high'}):
+            self.assertTrue(theme.use_shadows(1000, 60))
+        with patch.dict(UI, {'render_quality': 'low'}):
+            self.assertFalse(theme.use_shadows())
+
+        label = QLabel()
+        theme.set_shadow(label, True)
+        effect = label.graphicsEffect()
+        self.assertIsNotNone(effect)
+        theme.set_shadow(label, True)
+        self.assertIs(label.graphicsEffect(), effect)
+        theme.set_shadow(label, False)
+        self.assertIsNone(label.graphicsEffect())
+
+
+if __name__ == '__main__':
+    unittest.main()